@@ -0,0 +1,6 @@
+"""
+Benchmarks de geoanla: capas sintéticas por modelo (``benchmarks.synthetic``),
+la corrida de referencia de lectura, traducción, validación y validación
+cruzada (``python -m benchmarks.run``) y el presupuesto de tiempo de
+importación (``python -m benchmarks.imports``).
+"""
@@ -0,0 +1,177 @@
+"""
+Benchmark del tiempo de importación de geoanla.
+
+Cada módulo se importa en un intérprete nuevo (varias repeticiones, se
+reporta la mediana) y se comprueba:
+
+- que el tiempo quede dentro de su presupuesto (``PRESUPUESTOS``), y
+- que no se cargue ninguna dependencia pesada de ``PROHIBIDOS``: Pandas,
+  GeoPandas, pyarrow, shapely, pyogrio y los clientes de las APIs se
+  importan en su primer uso, no al importar los modelos.
+
+Uso::
+
+    python -m benchmarks.imports
+    python -m benchmarks.imports --repeticiones 9 --factor 1.5
+    python -m benchmarks.imports --detalle geoanla.models.TABLES
+
+El código de salida es 1 si algún módulo supera su presupuesto o carga una
+dependencia prohibida.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+import polars as pl
+
+# Módulo -> segundos de importación permitidos (mediana, intérprete nuevo)
+PRESUPUESTOS = {
+    "geoanla": 0.05,
+    "geoanla.catalog": 0.10,
+    "geoanla.catalog.municipios": 0.10,
+    "geoanla.core": 0.50,
+    "geoanla.models.TABLES": 0.60,
+    "geoanla.models.T_20_BIOTICO_CONTI_COSTE": 0.60,
+    "geoanla.utils.search": 0.20,
+}
+
+# Dependencias que importar un modelo no debe cargar
+PROHIBIDOS = (
+    "pandas", "geopandas", "pyarrow", "shapely", "pyogrio",
+    "pygbif", "requests", "dotenv",
+)
+
+# Se ejecuta en el intérprete hijo: mide la importación y lista lo prohibido
+# que quedó cargado
+_SONDA = """
+import json, sys, time
+inicio = time.perf_counter()
+import {modulo}
+segundos = time.perf_counter() - inicio
+cargados = [m for m in {prohibidos!r} if m in sys.modules]
+print(json.dumps({{"segundos": segundos, "cargados": cargados}}))
+"""
+
+
+def _environment() -> Dict[str, str]:
+    """
+    Entorno del hijo con ``src`` en el PYTHONPATH (árbol sin instalar) y
+    con caché de bytecode, como en una instalación: la primera repetición
+    compila y las demás leen los ``.pyc``.
+    """
+    entorno = dict(os.environ)
+    entorno.pop("PYTHONDONTWRITEBYTECODE", None)
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    src = os.path.join(raiz, "src")
+    entorno["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [src, entorno.get("PYTHONPATH")])
+    )
+    return entorno
+
+
+def measure_import(modulo: str, repeticiones: int = 5) -> Dict[str, object]:
+    """
+    Mediana del tiempo de importación de ``modulo`` y dependencias prohibidas
+    cargadas.
+    """
+    codigo = _SONDA.format(modulo=modulo, prohibidos=PROHIBIDOS)
+    tiempos, cargados = [], []
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, "-c", codigo],
+            capture_output=True, text=True, check=True, env=_environment(),
+        )
+        medicion = json.loads(salida.stdout.strip().splitlines()[-1])
+        tiempos.append(medicion["segundos"])
+        cargados = medicion["cargados"]
+    return {
+        "modulo": modulo,
+        "segundos": statistics.median(tiempos),
+        "minimo": min(tiempos),
+        "cargados": ", ".join(cargados),
+    }
+
+
+def import_detail(modulo: str, limite: int = 20) -> pl.DataFrame:
+    """Los ``limite`` módulos más costosos según ``python -X importtime``."""
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        capture_output=True, text=True, check=True, env=_environment(),
+    )
+    filas = []
+    for linea in salida.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, acumulado, nombre = linea.removeprefix("import time:").split("|")
+        filas.append({
+            "modulo": nombre.strip(),
+            "propio_ms": int(propio) / 1000,
+            "acumulado_ms": int(acumulado) / 1000,
+        })
+    return pl.DataFrame(filas).sort("acumulado_ms", descending=True).head(limite)
+
+
+def check_budgets(
+    modulos: Optional[List[str]] = None, repeticiones: int = 5, factor: float = 1.0
+) -> pl.DataFrame:
+    """
+    Mide cada módulo y lo compara con su presupuesto (multiplicado por
+    ``factor`` para máquinas más lentas). ``ok`` es False si se pasa del
+    presupuesto o carga una dependencia prohibida.
+    """
+    filas = []
+    for modulo in modulos or list(PRESUPUESTOS):
+        medicion = measure_import(modulo, repeticiones)
+        presupuesto = PRESUPUESTOS.get(modulo)
+        limite = presupuesto * factor if presupuesto is not None else None
+        dentro = limite is None or medicion["segundos"] <= limite
+        filas.append({
+            **medicion,
+            "presupuesto": limite,
+            "ok": dentro and not medicion["cargados"],
+        })
+    return pl.DataFrame(filas)
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Tiempo de importación de geoanla frente a su presupuesto."
+    )
+    parser.add_argument(
+        "--modulos", nargs="+",
+        help="Módulos a medir (por defecto los de PRESUPUESTOS).",
+    )
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument(
+        "--factor", type=float, default=1.0, help="Multiplica los presupuestos."
+    )
+    parser.add_argument(
+        "--detalle", help="Muestra los módulos más costosos al importar este."
+    )
+    args = parser.parse_args(argumentos)
+
+    if args.detalle:
+        with pl.Config(tbl_rows=-1, fmt_str_lengths=60):
+            print(import_detail(args.detalle))
+        return 0
+
+    tabla = check_budgets(args.modulos, args.repeticiones, args.factor)
+    with pl.Config(tbl_rows=-1, fmt_str_lengths=60):
+        print(tabla)
+    fallidos = tabla.filter(~pl.col("ok"))
+    if fallidos.height:
+        print(
+            f"⚠️ {fallidos.height} módulos fuera de presupuesto o con dependencias "
+            "pesadas al importar."
+        )
+        return 1
+    print("✅ Importaciones dentro del presupuesto.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
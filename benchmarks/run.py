@@ -0,0 +1,303 @@
+"""
+Corrida de benchmarks de geoanla.
+
+Para cada tamaño y formato se genera un conjunto de capas sintéticas
+relacionadas (``benchmarks.synthetic``) y se mide, por modelo y motor, la
+lectura, ``translate_data`` y la sesión de validación (tiempos de
+``RunMetrics``), además de ``cross_validator_entities`` sobre el archivo.
+Cada caso corre en un proceso nuevo para que el pico de memoria (RSS) sea
+solo suyo.
+
+Uso::
+
+    python -m benchmarks.run --filas 1000 10000 100000 --formato gdb
+    python -m benchmarks.run --filas 1000000 --modelos CoberturaTierra
+    python -m benchmarks.run --salida actual.parquet --referencia base.parquet
+
+Con ``--referencia`` se compara contra una corrida anterior y se marcan los
+casos cuya velocidad (filas por segundo) cae más que ``--tolerancia``.
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import polars as pl
+
+from benchmarks.synthetic import (
+    FORMATOS, find_model, generate_dataset, read_dataset_layer, write_dataset,
+)
+
+MODELOS_DEFECTO = [
+    "CoberturaTierra", "PuntoMuestreoFlora", "MuestreoFloraFustalTB", "MuestreoFaunaTB"
+]
+FILAS_DEFECTO = [1_000, 10_000, 100_000]
+MOTORES = ("columnar", "pydantic", "paralelo")
+TOLERANCIA_DEFECTO = 0.10
+
+# Nombre del caso de la validación cruzada en la tabla de resultados
+CASO_CRUZADO = "cross_validator_entities"
+
+
+# ==========================================
+# 1. CASOS (CADA UNO EN SU PROCESO)
+# ==========================================
+
+def _peak_rss_mb() -> float:
+    """
+    Pico de memoria residente en MB del proceso o, si fue mayor, de sus
+    trabajadores (motor paralelo). ``ru_maxrss`` está en KB en Linux.
+    """
+    pico = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return pico / 1024 ** 2 if sys.platform == "darwin" else pico / 1024
+
+
+def _validation_case(
+    ruta: str, formato: str, nombre: str, motor: str, instrumentar: bool
+) -> Dict[str, Any]:
+    """Lectura + traducción + validación de una capa."""
+    modelo = find_model(nombre)
+    medicion = modelo.enable_instrumentation() if instrumentar else None
+
+    inicio = time.perf_counter()
+    capa = read_dataset_layer(ruta, nombre, formato)
+    lectura = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    traducida = modelo.translate_data(capa)
+    traduccion = time.perf_counter() - inicio
+
+    sesion = modelo.session(
+        traducida, columnar=motor == "columnar", paralelo=motor == "paralelo",
+        formato_errores="tabla", formato_validos="mascara", verbose=False,
+    )
+    inicio = time.perf_counter()
+    sesion.run()
+    validacion = time.perf_counter() - inicio
+
+    total = lectura + traduccion + validacion
+    resultado = {
+        "segundos_lectura": lectura,
+        "segundos_traduccion": traduccion,
+        **{f"segundos_{fase}": s for fase, s in sesion.metricas.tiempos.items()},
+        "segundos_total": total,
+        "filas_por_segundo": capa.height / total if total else 0.0,
+        "aprobados": sesion.metricas.aprobados,
+        "rechazados": sesion.metricas.rechazados,
+        "rss_mb": _peak_rss_mb(),
+    }
+    if medicion is not None:
+        resultado["instrumentacion"] = medicion.to_dicts()
+    return resultado
+
+
+def _cross_case(ruta: str) -> Dict[str, Any]:
+    """Validación cruzada de llaves sobre la GDB/GPKG."""
+    from geoanla.utils.validators import cross_validator_entities
+
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        resumen, huerfanos = cross_validator_entities(ruta)
+    total = time.perf_counter() - inicio
+    return {
+        "segundos_total": total,
+        "rechazados": sum(len(ids) for ids in huerfanos.values()),
+        "relaciones": resumen.height,
+        "rss_mb": _peak_rss_mb(),
+    }
+
+
+def _isolated(funcion, *args) -> Dict[str, Any]:
+    """Ejecuta ``funcion`` en un proceso nuevo (spawn) y devuelve su resultado."""
+    contexto = multiprocessing.get_context("spawn")
+    with contexto.Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(funcion, args)
+
+
+# ==========================================
+# 2. CORRIDA
+# ==========================================
+
+def run_benchmarks(
+    filas: List[int],
+    modelos: List[str],
+    formatos: List[str],
+    motores: List[str],
+    fraccion_invalida: float = 0.05,
+    instrumentar: bool = False,
+    directorio: Optional[str] = None,
+    semilla: int = 0,
+) -> Tuple[pl.DataFrame, Optional[pl.DataFrame]]:
+    """
+    Corre todos los casos.
+
+    Returns:
+        Tuple (resultados, validadores): una fila por (filas, formato,
+        modelo, motor), con la validación cruzada como
+        ``modelo="cross_validator_entities"``, y las mediciones por
+        validador si se pidió ``instrumentar`` (None si no).
+    """
+    clases = [find_model(n) for n in modelos]
+    with contextlib.suppress(ValueError):
+        # Los registros multimedia alimentan la fase 2 de la validación cruzada
+        if "RegistrosMultimediaTB" not in modelos:
+            clases.append(find_model("RegistrosMultimediaTB"))
+
+    resultados, mediciones = [], []
+    with tempfile.TemporaryDirectory(dir=directorio) as temporal:
+        for n in filas:
+            inicio = time.perf_counter()
+            capas = generate_dataset(clases, n, fraccion_invalida, semilla)
+            generacion = time.perf_counter() - inicio
+            print(f"🧪 {n:,} filas x {len(capas)} capas generadas en {generacion:.2f}s")
+
+            for formato in formatos:
+                destino = os.path.join(temporal, f"bench_{n}")
+                ruta = write_dataset(capas, destino, formato)
+                base = {"filas": n, "formato": formato}
+                for nombre in modelos:
+                    for motor in motores:
+                        caso = _isolated(
+                            _validation_case, ruta, formato, nombre, motor,
+                            instrumentar,
+                        )
+                        for m in caso.pop("instrumentacion", []):
+                            mediciones.append({**base, "motor": motor, **m})
+                        resultados.append(
+                            {**base, "modelo": nombre, "motor": motor, **caso}
+                        )
+                        print(
+                            f"   ⏱️ {formato:<7} {nombre:<24} {motor:<9} "
+                            f"{caso['filas_por_segundo']:>12,.0f} filas/s  "
+                            f"{caso['rss_mb']:>8.0f} MB"
+                        )
+                if formato != "parquet":
+                    caso = _isolated(_cross_case, ruta)
+                    resultados.append(
+                        {**base, "modelo": CASO_CRUZADO, "motor": "polars", **caso}
+                    )
+                    print(
+                        f"   🔗 {formato:<7} {CASO_CRUZADO:<34} "
+                        f"{caso['segundos_total']:.2f}s"
+                    )
+            del capas
+
+    tabla = pl.DataFrame(resultados, infer_schema_length=None)
+    if not mediciones:
+        return tabla, None
+    return tabla, pl.DataFrame(mediciones, infer_schema_length=None)
+
+
+def compare(
+    actual: pl.DataFrame,
+    referencia: pl.DataFrame,
+    tolerancia: float = TOLERANCIA_DEFECTO,
+) -> pl.DataFrame:
+    """
+    Compara las velocidades contra una corrida de referencia. ``regresion``
+    es True cuando los segundos totales crecen más que ``tolerancia``.
+    """
+    llaves = ["filas", "formato", "modelo", "motor"]
+    anteriores = referencia.select(
+        *llaves, pl.col("segundos_total").alias("segundos_referencia")
+    )
+    return (
+        actual.select(*llaves, "segundos_total")
+        .join(anteriores, on=llaves)
+        .with_columns(
+            (pl.col("segundos_total") / pl.col("segundos_referencia")).alias("razon")
+        )
+        .with_columns((pl.col("razon") > 1 + tolerancia).alias("regresion"))
+    )
+
+
+def _write(tabla: pl.DataFrame, ruta: str):
+    if ruta.endswith(".csv"):
+        tabla.write_csv(ruta)
+    else:
+        tabla.write_parquet(ruta)
+
+
+def _read(ruta: str) -> pl.DataFrame:
+    return pl.read_csv(ruta) if ruta.endswith(".csv") else pl.read_parquet(ruta)
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks de lectura, traducción y validación de geoanla."
+    )
+    parser.add_argument(
+        "--filas", type=int, nargs="+", default=FILAS_DEFECTO,
+        help="Tamaños de capa (hasta 10M).",
+    )
+    parser.add_argument(
+        "--modelos", nargs="+", default=MODELOS_DEFECTO,
+        help="Modelos (nombres de capa).",
+    )
+    parser.add_argument(
+        "--formato", nargs="+", default=["gdb"], choices=FORMATOS,
+        help="Formatos de archivo.",
+    )
+    parser.add_argument(
+        "--motores", nargs="+", default=["columnar", "pydantic"], choices=MOTORES
+    )
+    parser.add_argument(
+        "--invalidas", type=float, default=0.05, help="Fracción de filas inválidas."
+    )
+    parser.add_argument(
+        "--instrumentar", action="store_true",
+        help="Mide cada validador (core.instrumentation).",
+    )
+    parser.add_argument("--salida", help="Archivo .parquet o .csv con los resultados.")
+    parser.add_argument(
+        "--referencia", help="Resultados anteriores contra los que comparar."
+    )
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_DEFECTO)
+    parser.add_argument(
+        "--directorio", help="Directorio para los archivos temporales."
+    )
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argumentos)
+
+    tabla, mediciones = run_benchmarks(
+        args.filas, args.modelos, args.formato, args.motores,
+        args.invalidas, args.instrumentar, args.directorio, args.semilla,
+    )
+    with pl.Config(tbl_rows=-1, tbl_cols=-1, fmt_str_lengths=40):
+        print(tabla.select(
+            "filas", "formato", "modelo", "motor",
+            "segundos_total", "filas_por_segundo", "rss_mb",
+        ))
+    if args.salida:
+        _write(tabla, args.salida)
+        if mediciones is not None:
+            raiz, extension = os.path.splitext(args.salida)
+            _write(mediciones, f"{raiz}_validadores{extension}")
+        print(f"💾 Resultados en {args.salida}")
+
+    if args.referencia:
+        comparacion = compare(tabla, _read(args.referencia), args.tolerancia)
+        with pl.Config(tbl_rows=-1):
+            print(comparacion)
+        regresiones = comparacion.filter("regresion").height
+        if regresiones:
+            print(
+                f"⚠️ {regresiones} casos más lentos que la referencia "
+                f"(tolerancia {args.tolerancia:.0%})."
+            )
+            return 1
+        print("✅ Sin regresiones frente a la referencia.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,542 @@
+"""
+Generadores de capas sintéticas para los modelos BaseEV / BaseEV_Geo.
+
+Cada campo se llena según su anotación y sus restricciones: los dominios
+Enum con sus códigos, los textos dentro de ``max_length``, los números
+dentro de ``ge``/``le``/``gt``/``lt`` y la geometría con el tipo que admite
+``GEOMETRIAS_PERMITIDAS``. Los modelos con jerarquía Corine Land Cover
+reciben cadenas de niveles coherentes, su NOMENCLAT y el texto oficial en el
+campo de leyenda, de modo que una capa "válida" pasa también esos
+validadores de modelo. Las demás reglas entre campos propias de cada modelo
+no se modelan: el benchmark reporta los rechazos reales.
+
+Con ``fraccion_invalida`` una parte de las filas recibe exactamente una
+violación (código fuera del dominio, texto largo, número fuera de rango,
+obligatorio nulo o geometría vacía).
+
+Todo se genera con NumPy, Polars y shapely en bloque, de modo que las capas
+de millones de filas se arman en segundos. La geometría sale en WKB
+(``pl.Binary``), igual que en ``core.frames``.
+"""
+import importlib
+import inspect
+import os
+import pkgutil
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import annotated_types
+import numpy as np
+import polars as pl
+import shapely
+from pyogrio import write_arrow
+
+from geoanla.catalog.hierarchy import NIVELES_CLC
+from geoanla.core.base import CATALOGO_CLC, COLUMNAS_IDENTIFICADOR, BaseEV
+from geoanla.core.columnar import _classify_type, _unwrap_optional
+from geoanla.core.frames import COLUMNA_GEOMETRIA
+from geoanla.utils.validators import MAPA_MULTIMEDIA, RELACIONES_ANLA, read_layer
+
+# Sistema de referencia de las capas generadas (Origen Nacional, Colombia)
+CRS_DEFECTO = "EPSG:9377"
+
+# Extensión aproximada del territorio en EPSG:9377 (x, y mínimos y máximos)
+EXTENSION = (4_300_000.0, 1_100_000.0, 5_700_000.0, 2_900_000.0)
+
+FECHA_BASE = date(2015, 1, 1)
+DIAS_RANGO = 3_650
+
+# Probabilidad de que un campo opcional llegue con valor en una fila válida
+PROBABILIDAD_OPCIONAL = 0.9
+
+VOCABULARIO = pl.Series([
+    "Bosque", "Rio Magdalena", "Vereda El Carmen", "Quebrada", "Sabana", "Humedal",
+    "Pastos limpios", "Estacion", "Cuenca alta", "Zona de vida",
+    "Observacion de campo",
+])
+
+FORMATOS = ("parquet", "gpkg", "gdb")
+DRIVERS = {"gpkg": "GPKG", "gdb": "OpenFileGDB"}
+EXTENSIONES = {"parquet": "", "gpkg": ".gpkg", "gdb": ".gdb"}
+
+
+# ==========================================
+# 1. CATÁLOGO DE MODELOS
+# ==========================================
+
+@lru_cache(maxsize=None)
+def model_catalog() -> Dict[str, Type]:
+    """Todas las clases BaseEV de ``geoanla.models`` por nombre de capa."""
+    import geoanla.models as paquete
+
+    catalogo = {}
+    for modulo in pkgutil.iter_modules(paquete.__path__):
+        contenido = importlib.import_module(f"geoanla.models.{modulo.name}")
+        for nombre, clase in inspect.getmembers(contenido, inspect.isclass):
+            if issubclass(clase, BaseEV) and clase.__module__ == contenido.__name__:
+                catalogo[nombre] = clase
+    return catalogo
+
+
+def find_model(nombre: str) -> Type:
+    """Clase del modelo ``nombre`` (nombre de la capa en la GDB)."""
+    try:
+        return model_catalog()[nombre]
+    except KeyError:
+        raise ValueError(f"❌ No existe un modelo llamado '{nombre}'.") from None
+
+
+# ==========================================
+# 2. REGLAS DE CADA CAMPO
+# ==========================================
+
+def _column(nombre: str, info: Any) -> str:
+    """Columna de la capa que lee el campo (alias de validación si lo hay)."""
+    return info.validation_alias if isinstance(info.validation_alias, str) else nombre
+
+
+def _limits(info: Any, minimo: float, maximo: float) -> Tuple[float, float]:
+    """Rango numérico del campo a partir de ``ge``/``gt``/``le``/``lt``."""
+    inferior, superior = minimo, None
+    for restriccion in info.metadata:
+        if isinstance(restriccion, annotated_types.Ge):
+            inferior = restriccion.ge
+        elif isinstance(restriccion, annotated_types.Gt):
+            inferior = restriccion.gt + 1
+        elif isinstance(restriccion, annotated_types.Le):
+            superior = restriccion.le
+        elif isinstance(restriccion, annotated_types.Lt):
+            superior = restriccion.lt - 1
+    if superior is None:
+        superior = inferior + (maximo - minimo)
+    return float(inferior), float(max(superior, inferior))
+
+
+def _max_length(info: Any) -> Optional[int]:
+    for restriccion in info.metadata:
+        if isinstance(restriccion, annotated_types.MaxLen):
+            return restriccion.max_length
+    return None
+
+
+def _has_bounds(info: Any) -> bool:
+    limites = (
+        annotated_types.Ge, annotated_types.Gt, annotated_types.Le, annotated_types.Lt
+    )
+    return any(isinstance(r, limites) for r in info.metadata)
+
+
+@lru_cache(maxsize=None)
+def clc_chains(
+    longitud_leyenda: Optional[int] = None
+) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Cadenas CLC coherentes (N1..Nk, k >= 3) en las que cada nivel existe en
+    su dominio. Con ``longitud_leyenda`` solo las de texto oficial que cabe
+    en el campo de leyenda.
+    """
+    from geoanla.catalog.corineland import DOMINIOS_CLC, clc_tree
+
+    arbol = clc_tree()
+    cadenas = []
+    for nivel, dominio in enumerate(DOMINIOS_CLC[2:], start=3):
+        for miembro in dominio:
+            codigo = int(miembro.value)
+            # Solo las cadenas completas: todos los niveles anteriores existen
+            linaje = arbol.ancestors(codigo) + (codigo,)
+            if len(linaje) != nivel:
+                continue
+            texto = CATALOGO_CLC.get(codigo)
+            if longitud_leyenda is not None and (
+                texto is None or len(texto) > longitud_leyenda
+            ):
+                continue
+            cadenas.append(tuple(float(c) for c in linaje))
+    return tuple(cadenas)
+
+
+# ==========================================
+# 3. GENERACIÓN DE COLUMNAS
+# ==========================================
+
+def _text_column(
+    nombre: str, info: Any, filas: int, generador: np.random.Generator
+) -> pl.Series:
+    """
+    Textos dentro de ``max_length``; identificadores únicos para las columnas
+    ID.
+    """
+    longitud = _max_length(info)
+    if nombre.startswith("ID_") or nombre in COLUMNAS_IDENTIFICADOR:
+        serie = pl.int_range(filas, eager=True).cast(pl.Utf8)
+        serie = ("E" + serie) if nombre == "EXPEDIENTE" else serie
+    else:
+        serie = VOCABULARIO.gather(generador.integers(0, len(VOCABULARIO), filas))
+    return serie.str.slice(0, longitud) if longitud is not None else serie
+
+
+def _geometry_column(
+    modelo: Type, filas: int, generador: np.random.Generator
+) -> np.ndarray:
+    """
+    Geometrías del primer tipo admitido por el modelo (polígono si no
+    restringe).
+    """
+    permitidas = getattr(modelo, "GEOMETRIAS_PERMITIDAS", None) or ("Polygon",)
+    return _geometries(permitidas[0], filas, generador)
+
+
+def _geometries(tipo: str, filas: int, generador: np.random.Generator) -> np.ndarray:
+    """``filas`` geometrías shapely de ``tipo`` repartidas por la extensión."""
+    xmin, ymin, xmax, ymax = EXTENSION
+    x = generador.uniform(xmin, xmax, filas)
+    y = generador.uniform(ymin, ymax, filas)
+    lado = generador.uniform(10.0, 500.0, filas)
+    base = tipo.removeprefix("Multi")
+    if base == "Point":
+        geometrias = shapely.points(x, y)
+    elif base == "LineString":
+        coordenadas = np.stack(
+            [np.column_stack([x, y]), np.column_stack([x + lado, y + lado])], axis=1
+        )
+        geometrias = shapely.linestrings(coordenadas)
+    else:
+        geometrias = shapely.box(x, y, x + lado, y + lado)
+    if tipo.startswith("Multi"):
+        indices = np.arange(filas)
+        constructores = {
+            "Point": shapely.multipoints, "LineString": shapely.multilinestrings
+        }
+        constructor = constructores.get(base, shapely.multipolygons)
+        geometrias = constructor(geometrias, indices=indices)
+    return geometrias
+
+
+def _field_column(
+    modelo: Type, nombre: str, info: Any, filas: int, generador: np.random.Generator
+) -> Optional[pl.Series]:
+    """Columna válida de un campo, o None si el tipo no se sabe generar."""
+    anotacion = _unwrap_optional(info.annotation)
+    tipo = _classify_type(anotacion)
+    columna = _column(nombre, info)
+    if tipo == "enum":
+        valores = pl.Series(columna, [m.value for m in anotacion])
+        return valores.gather(generador.integers(0, len(valores), filas))
+    if tipo == "str":
+        return _text_column(nombre, info, filas, generador).alias(columna)
+    if tipo == "int":
+        if nombre.startswith("ID_"):
+            return pl.int_range(1, filas + 1, eager=True).alias(columna)
+        inferior, superior = _limits(info, 0, 1_000)
+        valores = generador.integers(int(inferior), int(superior) + 1, filas)
+        return pl.Series(columna, valores)
+    if tipo == "float":
+        inferior, superior = _limits(info, 0.0, 1_000.0)
+        valores = generador.uniform(inferior, superior, filas)
+        return pl.Series(columna, np.round(valores, 3))
+    if tipo == "date":
+        dias = generador.integers(0, DIAS_RANGO, filas).astype("timedelta64[D]")
+        return pl.Series(columna, np.datetime64(FECHA_BASE, "D") + dias).cast(pl.Date)
+    if anotacion is bool:
+        return pl.Series(columna, generador.random(filas) < 0.5)
+    return None
+
+
+def _apply_clc(
+    modelo: Type,
+    columnas: Dict[str, pl.Series],
+    filas: int,
+    generador: np.random.Generator,
+):
+    """Jerarquía CLC coherente, NOMENCLAT y texto de leyenda oficial."""
+    campos = modelo.model_fields
+    if "NOMENCLAT" not in campos:
+        return
+    leyenda = getattr(modelo, "CAMPO_LEYENDA", None)
+    longitud = _max_length(campos[leyenda]) if leyenda in campos else None
+    cadenas = clc_chains(longitud)
+    eleccion = generador.integers(0, len(cadenas), filas)
+    detalle = np.array([c[-1] for c in cadenas])[eleccion]
+
+    columnas["NOMENCLAT"] = pl.Series(
+        _column("NOMENCLAT", campos["NOMENCLAT"]), detalle.astype(np.int64)
+    )
+    for k, nivel in enumerate(NIVELES_CLC):
+        if nivel in campos:
+            niveles = np.array([c[k] if k < len(c) else np.nan for c in cadenas])
+            columnas[nivel] = pl.Series(
+                _column(nivel, campos[nivel]), niveles[eleccion]
+            ).fill_nan(None)
+    if leyenda in campos:
+        textos = pl.Series(detalle.astype(np.int64)).replace_strict(
+            CATALOGO_CLC, return_dtype=pl.Utf8
+        )
+        columnas[leyenda] = textos.alias(_column(leyenda, campos[leyenda]))
+
+
+def _violations(modelo: Type) -> List[Tuple[str, str]]:
+    """(campo, tipo de violación) posibles para las filas inválidas."""
+    posibles = []
+    for nombre, info in modelo.model_fields.items():
+        if nombre == COLUMNA_GEOMETRIA:
+            # La violación generada es una geometría vacía
+            revisa_tipo = getattr(modelo, "GEOMETRIAS_PERMITIDAS", None)
+            if revisa_tipo and not getattr(modelo, "ADMITIR_VACIAS", False):
+                posibles.append((nombre, "geometria"))
+            continue
+        tipo = _classify_type(_unwrap_optional(info.annotation))
+        if tipo == "enum":
+            posibles.append((nombre, "dominio"))
+        elif tipo == "str" and _max_length(info) is not None:
+            posibles.append((nombre, "longitud"))
+        elif tipo in ("int", "float") and _has_bounds(info):
+            posibles.append((nombre, "rango"))
+        elif info.is_required() and tipo is not None:
+            posibles.append((nombre, "requerido"))
+    return posibles
+
+
+def _scatter(serie: pl.Series, posiciones: np.ndarray, valor: Any) -> pl.Series:
+    """
+    Escribe ``valor`` en ``posiciones``; un texto en columna numérica la pasa
+    a texto.
+    """
+    if valor is None:
+        return serie.scatter(posiciones, None)
+    if isinstance(valor, str) and serie.dtype != pl.Utf8:
+        serie = serie.cast(pl.Utf8)
+    elif isinstance(valor, float) and serie.dtype.is_integer():
+        serie = serie.cast(pl.Float64)
+    valores = pl.Series([valor] * len(posiciones)).cast(serie.dtype)
+    return serie.scatter(posiciones, valores)
+
+
+def _invalid_value(modelo: Type, nombre: str, violacion: str) -> Any:
+    info = modelo.model_fields[nombre]
+    if violacion == "dominio":
+        valores = [m.value for m in _unwrap_optional(info.annotation)]
+        return "NO_EXISTE" if isinstance(valores[0], str) else max(valores) + 99_991
+    if violacion == "longitud":
+        return "X" * (_max_length(info) + 5)
+    if violacion == "rango":
+        inferior, superior = _limits(info, 0.0, 1_000.0)
+        tiene_piso = any(
+            isinstance(r, (annotated_types.Ge, annotated_types.Gt))
+            for r in info.metadata
+        )
+        return inferior - 1 if tiene_piso else superior + 1
+    return None
+
+
+# ==========================================
+# 4. CAPAS Y CONJUNTOS DE CAPAS
+# ==========================================
+
+def generate_layer(
+    modelo: Type,
+    filas: int,
+    fraccion_invalida: float = 0.0,
+    semilla: Optional[int] = None,
+) -> pl.DataFrame:
+    """
+    Genera una capa sintética del modelo.
+
+    Args:
+        modelo: Clase BaseEV o BaseEV_Geo.
+        filas: Número de filas.
+        fraccion_invalida: Fracción de filas con exactamente una violación.
+        semilla: Semilla del generador (capas reproducibles).
+
+    Returns:
+        DataFrame de Polars con las columnas del modelo (alias incluidos) y,
+        si el modelo es geográfico, la geometría en WKB en ``geometry``.
+    """
+    generador = np.random.default_rng(semilla)
+    columnas: Dict[str, pl.Series] = {}
+    for nombre, info in modelo.model_fields.items():
+        if nombre == COLUMNA_GEOMETRIA:
+            continue
+        serie = _field_column(modelo, nombre, info, filas, generador)
+        if serie is None:
+            continue
+        opcional = not info.is_required() and not nombre.startswith("ID_")
+        if opcional and nombre not in NIVELES_CLC:
+            vacios = generador.random(filas) >= PROBABILIDAD_OPCIONAL
+            if vacios.any():
+                serie = serie.scatter(np.flatnonzero(vacios), None)
+        columnas[nombre] = serie
+    _apply_clc(modelo, columnas, filas, generador)
+
+    geometrias = None
+    if COLUMNA_GEOMETRIA in modelo.model_fields:
+        geometrias = _geometry_column(modelo, filas, generador)
+
+    posibles = _violations(modelo)
+    malas = int(round(fraccion_invalida * filas))
+    if malas and posibles:
+        filas_malas = np.sort(generador.choice(filas, size=malas, replace=False))
+        asignadas = generador.integers(0, len(posibles), malas)
+        for k, (nombre, violacion) in enumerate(posibles):
+            posiciones = filas_malas[asignadas == k]
+            if not len(posiciones):
+                continue
+            if violacion == "geometria":
+                # Vacía y no de otro tipo: la File Geodatabase no admite
+                # mezclar tipos en una capa
+                tipo = modelo.GEOMETRIAS_PERMITIDAS[0].upper()
+                geometrias[posiciones] = shapely.from_wkt(f"{tipo} EMPTY")
+                continue
+            if nombre not in columnas:
+                continue
+            invalido = _invalid_value(modelo, nombre, violacion)
+            columnas[nombre] = _scatter(columnas[nombre], posiciones, invalido)
+
+    series = list(columnas.values())
+    if geometrias is not None:
+        series.append(pl.Series(
+            COLUMNA_GEOMETRIA, shapely.to_wkb(geometrias).tolist(), dtype=pl.Binary
+        ))
+    # Los modelos solo con geometría traen la geometría como única columna; los
+    # modelos sin campos (tablas pendientes de definir) dan una capa vacía
+    return pl.DataFrame(series)
+
+
+def generate_dataset(
+    modelos: List[Type],
+    filas: int,
+    fraccion_invalida: float = 0.0,
+    semilla: Optional[int] = None,
+) -> Dict[str, pl.DataFrame]:
+    """
+    Genera varias capas relacionadas: las llaves de las tablas hijas de
+    ``RELACIONES_ANLA`` se toman de su capa padre (con ``fraccion_invalida``
+    de huérfanos) y, si se incluye ``RegistrosMultimediaTB``, sus registros
+    apuntan a las capas generadas.
+    """
+    generador = np.random.default_rng(semilla)
+    capas = {
+        m.__name__: generate_layer(
+            m, filas, fraccion_invalida, int(generador.integers(2**31))
+        )
+        for m in modelos
+    }
+    for padre, relacion in RELACIONES_ANLA.items():
+        if padre not in capas:
+            continue
+        llaves = capas[padre].get_column(relacion["llave_padre"])
+        for hija in relacion["hijos"]:
+            if hija not in capas or relacion["llave_hija"] not in capas[hija].columns:
+                continue
+            hijas = _foreign_keys(
+                llaves, capas[hija].height, fraccion_invalida, generador
+            )
+            capas[hija] = capas[hija].with_columns(
+                hijas.alias(relacion["llave_hija"])
+            )
+
+    if "RegistrosMultimediaTB" in capas:
+        destinos = [
+            (c, n) for c, n in MAPA_MULTIMEDIA.items()
+            if n in capas and n != "RegistrosMultimediaTB"
+        ]
+        if destinos:
+            multimedia = capas["RegistrosMultimediaTB"]
+            eleccion = generador.integers(0, len(destinos), multimedia.height)
+            codigos = np.array([c for c, _ in destinos])[eleccion]
+            ids = pl.Series("ID_REG_MUL", [None] * multimedia.height, dtype=pl.Utf8)
+            for k, (_, nombre) in enumerate(destinos):
+                columna = next(c for c in capas[nombre].columns if c.startswith("ID_"))
+                posiciones = np.flatnonzero(eleccion == k)
+                if len(posiciones):
+                    llaves = capas[nombre].get_column(columna).cast(pl.Utf8)
+                    ids = ids.scatter(posiciones, _foreign_keys(
+                        llaves, len(posiciones), fraccion_invalida, generador
+                    ))
+            capas["RegistrosMultimediaTB"] = multimedia.with_columns(
+                pl.Series("FEAT_CLASS", codigos), ids
+            )
+    return capas
+
+
+def _foreign_keys(
+    llaves: pl.Series,
+    filas: int,
+    fraccion_huerfana: float,
+    generador: np.random.Generator,
+) -> pl.Series:
+    """
+    Llaves tomadas de ``llaves``; una fracción apunta a registros
+    inexistentes.
+    """
+    elegidas = llaves.gather(generador.integers(0, len(llaves), filas))
+    huerfanas = np.flatnonzero(generador.random(filas) < fraccion_huerfana)
+    if len(huerfanas):
+        inexistentes = pl.Series([f"H{i}" for i in range(len(huerfanas))]).cast(
+            elegidas.dtype, strict=False
+        )
+        elegidas = elegidas.scatter(huerfanas, inexistentes)
+    return elegidas
+
+
+# ==========================================
+# 5. ESCRITURA
+# ==========================================
+
+def write_dataset(
+    capas: Dict[str, pl.DataFrame],
+    ruta: str,
+    formato: str = "gpkg",
+    crs: str = CRS_DEFECTO,
+) -> str:
+    """
+    Escribe las capas en ``ruta``: una GeoPackage o File Geodatabase con una
+    capa por modelo (escritura Arrow de pyogrio) o un directorio con un
+    Parquet por capa (geometría WKB).
+
+    Returns:
+        Ruta escrita (con la extensión del formato).
+    """
+    if formato not in FORMATOS:
+        raise ValueError(
+            f"❌ Formato '{formato}' no soportado ({', '.join(FORMATOS)})."
+        )
+    ruta = ruta if ruta.endswith(EXTENSIONES[formato]) else ruta + EXTENSIONES[formato]
+
+    if formato == "parquet":
+        os.makedirs(ruta, exist_ok=True)
+        for nombre, capa in capas.items():
+            capa.write_parquet(os.path.join(ruta, f"{nombre}.parquet"))
+        return ruta
+
+    opciones = {}
+    if formato == "gdb":
+        opciones = {"TARGET_ARCGIS_VERSION": "ARCGIS_PRO_3_2_OR_LATER"}
+    for nombre, capa in capas.items():
+        modelo = model_catalog().get(nombre)
+        tabla = capa.to_arrow(compat_level=pl.CompatLevel.oldest())
+        if COLUMNA_GEOMETRIA in capa.columns:
+            permitidas = getattr(modelo, "GEOMETRIAS_PERMITIDAS", None) or ("Polygon",)
+            write_arrow(
+                tabla, ruta, layer=nombre, driver=DRIVERS[formato],
+                geometry_name=COLUMNA_GEOMETRIA,
+                geometry_type="Unknown" if len(permitidas) > 1 else permitidas[0],
+                crs=crs, layer_options=opciones,
+            )
+        else:
+            write_arrow(
+                tabla, ruta, layer=nombre, driver=DRIVERS[formato], geometry_type=None,
+                geometry_name=None, layer_options=opciones,
+            )
+    return ruta
+
+
+def read_dataset_layer(ruta: str, nombre: str, formato: str) -> pl.DataFrame:
+    """
+    Lee una capa escrita por ``write_dataset`` como DataFrame de Polars
+    (geometría WKB).
+    """
+    if formato == "parquet":
+        return pl.read_parquet(os.path.join(ruta, f"{nombre}.parquet"))
+    capa, _ = read_layer(ruta, nombre)
+    return capa
@@ -3,8 +3,9 @@
 # 1. Importamos los dominios manuales (los que están en domains.py)
 from .domains import *
 
-# 2. Importamos el dominio dinámico de municipios
-from .municipios import Dom_Municipio
+# 2. El dominio de municipios (~1.100 miembros) se construye en el primer
+#    acceso a ``Dom_Municipio`` (ver __getattr__ al final): solo lo pagan
+#    los modelos que lo usan
 
 # 3. Importamos los niveles de Corine Land Cover
 from .corineland import (
@@ -27,4 +28,11 @@ __all__ = [
     "Dom_Nivel5_Cober",
     "Dom_Nivel6_Cober",
     # Agrega aquí los nombres de las clases de domains.py si quieres ser estricto
-]
\ No newline at end of file
+]
+
+
+def __getattr__(nombre):
+    if nombre == "Dom_Municipio":
+        from .municipios import Dom_Municipio
+        return Dom_Municipio
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
@@ -0,0 +1,1132 @@
+"""
+Catálogo DIVIPOLA de municipios generado desde data/municipios_codigos.csv.
+
+No editar a mano: regenerar con ``python -m geoanla.catalog.municipios``.
+"""
+ORIGEN_SHA256 = 'c2fffde1125f29d289eaed684cfec42f5d9e68d7f1c5347133626b365bfe8cbb'
+
+# (código DIVIPOLA, nombre oficial, clave del Enum, nombre normalizado)
+MUNICIPIOS = (
+    ('05002', 'ABEJORRAL', 'ABEJORRAL_05002', 'ABEJORRAL'),
+    ('54003', 'ÁBREGO', 'ABREGO_54003', 'ABREGO'),
+    ('05004', 'ABRIAQUÍ', 'ABRIAQUI_05004', 'ABRIAQUI'),
+    ('50006', 'ACACÍAS', 'ACACIAS_50006', 'ACACIAS'),
+    ('27006', 'ACANDÍ', 'ACANDI_27006', 'ACANDI'),
+    ('41006', 'ACEVEDO', 'ACEVEDO_41006', 'ACEVEDO'),
+    ('13006', 'ACHÍ', 'ACHI_13006', 'ACHI'),
+    ('41013', 'AGRADO', 'AGRADO_41013', 'AGRADO'),
+    ('25001', 'AGUA DE DIOS', 'AGUA_DE_DIOS_25001', 'AGUA_DE_DIOS'),
+    ('20011', 'AGUACHICA', 'AGUACHICA_20011', 'AGUACHICA'),
+    ('68013', 'AGUADA', 'AGUADA_68013', 'AGUADA'),
+    ('17013', 'AGUADAS', 'AGUADAS_17013', 'AGUADAS'),
+    ('85010', 'AGUAZUL', 'AGUAZUL_85010', 'AGUAZUL'),
+    ('20013', 'AGUSTÍN CODAZZI', 'AGUSTIN_CODAZZI_20013', 'AGUSTIN_CODAZZI'),
+    ('41016', 'AIPE', 'AIPE_41016', 'AIPE'),
+    ('25019', 'ALBÁN (Cundinamarca)', 'ALBAN_CUNDINAMARCA_25019', 'ALBAN_CUNDINAMARCA'),
+    ('52019', 'ALBÁN (Nariño)', 'ALBAN_NARINO_52019', 'ALBAN_NARINO'),
+    ('18029', 'ALBANIA (Caquetá)', 'ALBANIA_CAQUETA_18029', 'ALBANIA_CAQUETA'),
+    ('44035', 'ALBANIA (La Guajira)', 'ALBANIA_LA_GUAJIRA_44035', 'ALBANIA_LA_GUAJIRA'),
+    ('68020', 'ALBANIA (Santander)', 'ALBANIA_SANTANDER_68020', 'ALBANIA_SANTANDER'),
+    ('76020', 'ALCALÁ', 'ALCALA_76020', 'ALCALA'),
+    ('52022', 'ALDANA', 'ALDANA_52022', 'ALDANA'),
+    ('05021', 'ALEJANDRÍA', 'ALEJANDRIA_05021', 'ALEJANDRIA'),
+    ('47030', 'ALGARROBO', 'ALGARROBO_47030', 'ALGARROBO'),
+    ('41020', 'ALGECIRAS', 'ALGECIRAS_41020', 'ALGECIRAS'),
+    ('19022', 'ALMAGUER', 'ALMAGUER_19022', 'ALMAGUER'),
+    ('15022', 'ALMEIDA', 'ALMEIDA_15022', 'ALMEIDA'),
+    ('73024', 'ALPUJARRA', 'ALPUJARRA_73024', 'ALPUJARRA'),
+    ('41026', 'ALTAMIRA', 'ALTAMIRA_41026', 'ALTAMIRA'),
+    ('27025', 'ALTO BAUDÓ', 'ALTO_BAUDO_27025', 'ALTO_BAUDO'),
+    ('13030', 'ALTOS DEL ROSARIO', 'ALTOS_DEL_ROSARIO_13030', 'ALTOS_DEL_ROSARIO'),
+    ('73026', 'ALVARADO', 'ALVARADO_73026', 'ALVARADO'),
+    ('05030', 'AMAGÁ', 'AMAGA_05030', 'AMAGA'),
+    ('05031', 'AMALFI', 'AMALFI_05031', 'AMALFI'),
+    ('73030', 'AMBALEMA', 'AMBALEMA_73030', 'AMBALEMA'),
+    ('25035', 'ANAPOIMA', 'ANAPOIMA_25035', 'ANAPOIMA'),
+    ('52036', 'ANCUYÁ', 'ANCUYA_52036', 'ANCUYA'),
+    ('76036', 'ANDALUCÍA', 'ANDALUCIA_76036', 'ANDALUCIA'),
+    ('05034', 'ANDES', 'ANDES_05034', 'ANDES'),
+    ('05036', 'ANGELÓPOLIS', 'ANGELOPOLIS_05036', 'ANGELOPOLIS'),
+    ('05038', 'ANGOSTURA', 'ANGOSTURA_05038', 'ANGOSTURA'),
+    ('25040', 'ANOLAIMA', 'ANOLAIMA_25040', 'ANOLAIMA'),
+    ('05040', 'ANORÍ', 'ANORI_05040', 'ANORI'),
+    ('17042', 'ANSERMA', 'ANSERMA_17042', 'ANSERMA'),
+    ('76041', 'ANSERMANUEVO', 'ANSERMANUEVO_76041', 'ANSERMANUEVO'),
+    ('05044', 'ANZÁ', 'ANZA_05044', 'ANZA'),
+    ('73043', 'ANZOÁTEGUI', 'ANZOATEGUI_73043', 'ANZOATEGUI'),
+    ('05045', 'APARTADÓ', 'APARTADO_05045', 'APARTADO'),
+    ('66045', 'APÍA', 'APIA_66045', 'APIA'),
+    ('25599', 'APULO', 'APULO_25599', 'APULO'),
+    ('15047', 'AQUITANIA', 'AQUITANIA_15047', 'AQUITANIA'),
+    ('47053', 'ARACATACA', 'ARACATACA_47053', 'ARACATACA'),
+    ('17050', 'ARANZAZU', 'ARANZAZU_17050', 'ARANZAZU'),
+    ('68051', 'ARATOCA', 'ARATOCA_68051', 'ARATOCA'),
+    ('81001', 'ARAUCA', 'ARAUCA_81001', 'ARAUCA'),
+    ('81065', 'ARAUQUITA', 'ARAUQUITA_81065', 'ARAUQUITA'),
+    ('25053', 'ARBELÁEZ', 'ARBELAEZ_25053', 'ARBELAEZ'),
+    ('52051', 'ARBOLEDA', 'ARBOLEDA_52051', 'ARBOLEDA'),
+    ('54051', 'ARBOLEDAS', 'ARBOLEDAS_54051', 'ARBOLEDAS'),
+    ('05051', 'ARBOLETES', 'ARBOLETES_05051', 'ARBOLETES'),
+    ('15051', 'ARCABUCO', 'ARCABUCO_15051', 'ARCABUCO'),
+    ('13042', 'ARENAL', 'ARENAL_13042', 'ARENAL'),
+    ('05055', 'ARGELIA (Antioquia)', 'ARGELIA_ANTIOQUIA_05055', 'ARGELIA_ANTIOQUIA'),
+    ('19050', 'ARGELIA (Cauca)', 'ARGELIA_CAUCA_19050', 'ARGELIA_CAUCA'),
+    ('76054', 'ARGELIA (Valle del Cauca)', 'ARGELIA_VALLE_DEL_CAUCA_76054', 'ARGELIA_VALLE_DEL_CAUCA'),
+    ('47058', 'ARIGUANÍ', 'ARIGUANI_47058', 'ARIGUANI'),
+    ('13052', 'ARJONA', 'ARJONA_13052', 'ARJONA'),
+    ('05059', 'ARMENIA (Antioquia)', 'ARMENIA_ANTIOQUIA_05059', 'ARMENIA_ANTIOQUIA'),
+    ('63001', 'ARMENIA (Quindio)', 'ARMENIA_QUINDIO_63001', 'ARMENIA_QUINDIO'),
+    ('73055', 'ARMERO GUAYABAL', 'ARMERO_GUAYABAL_73055', 'ARMERO_GUAYABAL'),
+    ('13062', 'ARROYOHONDO', 'ARROYOHONDO_13062', 'ARROYOHONDO'),
+    ('20032', 'ASTREA', 'ASTREA_20032', 'ASTREA'),
+    ('73067', 'ATACO', 'ATACO_73067', 'ATACO'),
+    ('27050', 'ATRATO', 'ATRATO_27050', 'ATRATO'),
+    ('23068', 'AYAPEL', 'AYAPEL_23068', 'AYAPEL'),
+    ('27073', 'BAGADÓ', 'BAGADO_27073', 'BAGADO'),
+    ('27075', 'BAHÍA SOLANO', 'BAHIA_SOLANO_27075', 'BAHIA_SOLANO'),
+    ('27077', 'BAJO BAUDÓ', 'BAJO_BAUDO_27077', 'BAJO_BAUDO'),
+    ('19075', 'BALBOA (Cauca)', 'BALBOA_CAUCA_19075', 'BALBOA_CAUCA'),
+    ('66075', 'BALBOA (Risaralda)', 'BALBOA_RISARALDA_66075', 'BALBOA_RISARALDA'),
+    ('08078', 'BARANOA', 'BARANOA_08078', 'BARANOA'),
+    ('41078', 'BARAYA', 'BARAYA_41078', 'BARAYA'),
+    ('52079', 'BARBACOAS', 'BARBACOAS_52079', 'BARBACOAS'),
+    ('05079', 'BARBOSA (Antioquia)', 'BARBOSA_ANTIOQUIA_05079', 'BARBOSA_ANTIOQUIA'),
+    ('68077', 'BARBOSA (Santander)', 'BARBOSA_SANTANDER_68077', 'BARBOSA_SANTANDER'),
+    ('68079', 'BARICHARA', 'BARICHARA_68079', 'BARICHARA'),
+    ('50110', 'BARRANCA DE UPÍA', 'BARRANCA_DE_UPIA_50110', 'BARRANCA_DE_UPIA'),
+    ('68081', 'BARRANCABERMEJA', 'BARRANCABERMEJA_68081', 'BARRANCABERMEJA'),
+    ('44078', 'BARRANCAS', 'BARRANCAS_44078', 'BARRANCAS'),
+    ('13074', 'BARRANCO DE LOBA', 'BARRANCO_DE_LOBA_13074', 'BARRANCO_DE_LOBA'),
+    ('94343', 'BARRANCO MINAS', 'BARRANCO_MINAS_94343', 'BARRANCO_MINAS'),
+    ('08001', 'BARRANQUILLA', 'BARRANQUILLA_08001', 'BARRANQUILLA'),
+    ('20045', 'BECERRIL', 'BECERRIL_20045', 'BECERRIL'),
+    ('17088', 'BELALCÁZAR', 'BELALCAZAR_17088', 'BELALCAZAR'),
+    ('15087', 'BELÉN (Boyacá)', 'BELEN_BOYACA_15087', 'BELEN_BOYACA'),
+    ('52083', 'BELÉN (Nariño)', 'BELEN_NARINO_52083', 'BELEN_NARINO'),
+    ('18094', 'BELÉN DE LOS ANDAQUÍES', 'BELEN_DE_LOS_ANDAQUIES_18094', 'BELEN_DE_LOS_ANDAQUIES'),
+    ('66088', 'BELÉN DE UMBRÍA', 'BELEN_DE_UMBRIA_66088', 'BELEN_DE_UMBRIA'),
+    ('05088', 'BELLO', 'BELLO_05088', 'BELLO'),
+    ('05086', 'BELMIRA', 'BELMIRA_05086', 'BELMIRA'),
+    ('25086', 'BELTRÁN', 'BELTRAN_25086', 'BELTRAN'),
+    ('15090', 'BERBEO', 'BERBEO_15090', 'BERBEO'),
+    ('05091', 'BETANIA', 'BETANIA_05091', 'BETANIA'),
+    ('15092', 'BETÉITIVA', 'BETEITIVA_15092', 'BETEITIVA'),
+    ('05093', 'BETULIA (Antioquia)', 'BETULIA_ANTIOQUIA_05093', 'BETULIA_ANTIOQUIA'),
+    ('68092', 'BETULIA (Santander)', 'BETULIA_SANTANDER_68092', 'BETULIA_SANTANDER'),
+    ('25095', 'BITUIMA', 'BITUIMA_25095', 'BITUIMA'),
+    ('15097', 'BOAVITA', 'BOAVITA_15097', 'BOAVITA'),
+    ('54099', 'BOCHALEMA', 'BOCHALEMA_54099', 'BOCHALEMA'),
+    ('11001', 'BOGOTÁ, D.C.', 'BOGOTA_DC_11001', 'BOGOTA_DC'),
+    ('25099', 'BOJACÁ', 'BOJACA_25099', 'BOJACA'),
+    ('27099', 'BOJAYÁ', 'BOJAYA_27099', 'BOJAYA'),
+    ('19100', 'BOLÍVAR (Cauca)', 'BOLIVAR_CAUCA_19100', 'BOLIVAR_CAUCA'),
+    ('68101', 'BOLÍVAR (Santander)', 'BOLIVAR_SANTANDER_68101', 'BOLIVAR_SANTANDER'),
+    ('76100', 'BOLÍVAR (Valle del Cauca)', 'BOLIVAR_VALLE_DEL_CAUCA_76100', 'BOLIVAR_VALLE_DEL_CAUCA'),
+    ('20060', 'BOSCONIA', 'BOSCONIA_20060', 'BOSCONIA'),
+    ('15104', 'BOYACÁ', 'BOYACA_15104', 'BOYACA'),
+    ('05107', 'BRICEÑO (Antioquia)', 'BRICENO_ANTIOQUIA_05107', 'BRICENO_ANTIOQUIA'),
+    ('15106', 'BRICEÑO (Boyacá)', 'BRICENO_BOYACA_15106', 'BRICENO_BOYACA'),
+    ('68001', 'BUCARAMANGA', 'BUCARAMANGA_68001', 'BUCARAMANGA'),
+    ('54109', 'BUCARASICA', 'BUCARASICA_54109', 'BUCARASICA'),
+    ('76109', 'BUENAVENTURA', 'BUENAVENTURA_76109', 'BUENAVENTURA'),
+    ('15109', 'BUENAVISTA (Boyacá)', 'BUENAVISTA_BOYACA_15109', 'BUENAVISTA_BOYACA'),
+    ('23079', 'BUENAVISTA (Córdoba)', 'BUENAVISTA_CORDOBA_23079', 'BUENAVISTA_CORDOBA'),
+    ('63111', 'BUENAVISTA (Quindio)', 'BUENAVISTA_QUINDIO_63111', 'BUENAVISTA_QUINDIO'),
+    ('70110', 'BUENAVISTA (Sucre)', 'BUENAVISTA_SUCRE_70110', 'BUENAVISTA_SUCRE'),
+    ('19110', 'BUENOS AIRES', 'BUENOS_AIRES_19110', 'BUENOS_AIRES'),
+    ('52110', 'BUESACO', 'BUESACO_52110', 'BUESACO'),
+    ('76113', 'BUGALAGRANDE', 'BUGALAGRANDE_76113', 'BUGALAGRANDE'),
+    ('05113', 'BURITICÁ', 'BURITICA_05113', 'BURITICA'),
+    ('15114', 'BUSBANZÁ', 'BUSBANZA_15114', 'BUSBANZA'),
+    ('25120', 'CABRERA (Cundinamarca)', 'CABRERA_CUNDINAMARCA_25120', 'CABRERA_CUNDINAMARCA'),
+    ('68121', 'CABRERA (Santander)', 'CABRERA_SANTANDER_68121', 'CABRERA_SANTANDER'),
+    ('50124', 'CABUYARO', 'CABUYARO_50124', 'CABUYARO'),
+    ('94886', 'CACAHUAL', 'CACAHUAL_94886', 'CACAHUAL'),
+    ('05120', 'CÁCERES', 'CACERES_05120', 'CACERES'),
+    ('25123', 'CACHIPAY', 'CACHIPAY_25123', 'CACHIPAY'),
+    ('54128', 'CÁCHIRA', 'CACHIRA_54128', 'CACHIRA'),
+    ('54125', 'CÁCOTA', 'CACOTA_54125', 'CACOTA'),
+    ('05125', 'CAICEDO', 'CAICEDO_05125', 'CAICEDO'),
+    ('76122', 'CAICEDONIA', 'CAICEDONIA_76122', 'CAICEDONIA'),
+    ('70124', 'CAIMITO', 'CAIMITO_70124', 'CAIMITO'),
+    ('73124', 'CAJAMARCA', 'CAJAMARCA_73124', 'CAJAMARCA'),
+    ('19130', 'CAJIBÍO', 'CAJIBIO_19130', 'CAJIBIO'),
+    ('25126', 'CAJICÁ', 'CAJICA_25126', 'CAJICA'),
+    ('13140', 'CALAMAR (Bolívar)', 'CALAMAR_BOLIVAR_13140', 'CALAMAR_BOLIVAR'),
+    ('95015', 'CALAMAR (Guaviare)', 'CALAMAR_GUAVIARE_95015', 'CALAMAR_GUAVIARE'),
+    ('63130', 'CALARCÁ', 'CALARCA_63130', 'CALARCA'),
+    ('05129', 'CALDAS (Antioquia)', 'CALDAS_ANTIOQUIA_05129', 'CALDAS_ANTIOQUIA'),
+    ('15131', 'CALDAS (Boyacá)', 'CALDAS_BOYACA_15131', 'CALDAS_BOYACA'),
+    ('19137', 'CALDONO', 'CALDONO_19137', 'CALDONO'),
+    ('76001', 'CALI', 'CALI_76001', 'CALI'),
+    ('68132', 'CALIFORNIA', 'CALIFORNIA_68132', 'CALIFORNIA'),
+    ('76126', 'CALIMA', 'CALIMA_76126', 'CALIMA'),
+    ('19142', 'CALOTO', 'CALOTO_19142', 'CALOTO'),
+    ('05134', 'CAMPAMENTO', 'CAMPAMENTO_05134', 'CAMPAMENTO'),
+    ('08137', 'CAMPO DE LA CRUZ', 'CAMPO_DE_LA_CRUZ_08137', 'CAMPO_DE_LA_CRUZ'),
+    ('41132', 'CAMPOALEGRE', 'CAMPOALEGRE_41132', 'CAMPOALEGRE'),
+    ('15135', 'CAMPOHERMOSO', 'CAMPOHERMOSO_15135', 'CAMPOHERMOSO'),
+    ('23090', 'CANALETE', 'CANALETE_23090', 'CANALETE'),
+    ('05138', 'CAÑASGORDAS', 'CANASGORDAS_05138', 'CANASGORDAS'),
+    ('08141', 'CANDELARIA (Atlántico)', 'CANDELARIA_ATLANTICO_08141', 'CANDELARIA_ATLANTICO'),
+    ('76130', 'CANDELARIA (Valle del Cauca)', 'CANDELARIA_VALLE_DEL_CAUCA_76130', 'CANDELARIA_VALLE_DEL_CAUCA'),
+    ('13160', 'CANTAGALLO', 'CANTAGALLO_13160', 'CANTAGALLO'),
+    ('25148', 'CAPARRAPÍ', 'CAPARRAPI_25148', 'CAPARRAPI'),
+    ('68147', 'CAPITANEJO', 'CAPITANEJO_68147', 'CAPITANEJO'),
+    ('25151', 'CÁQUEZA', 'CAQUEZA_25151', 'CAQUEZA'),
+    ('05142', 'CARACOLÍ', 'CARACOLI_05142', 'CARACOLI'),
+    ('05145', 'CARAMANTA', 'CARAMANTA_05145', 'CARAMANTA'),
+    ('68152', 'CARCASÍ', 'CARCASI_68152', 'CARCASI'),
+    ('05147', 'CAREPA', 'CAREPA_05147', 'CAREPA'),
+    ('73148', 'CARMEN DE APICALÁ', 'CARMEN_DE_APICALA_73148', 'CARMEN_DE_APICALA'),
+    ('25154', 'CARMEN DE CARUPA', 'CARMEN_DE_CARUPA_25154', 'CARMEN_DE_CARUPA'),
+    ('27150', 'CARMEN DEL DARIÉN', 'CARMEN_DEL_DARIEN_27150', 'CARMEN_DEL_DARIEN'),
+    ('05150', 'CAROLINA', 'CAROLINA_05150', 'CAROLINA'),
+    ('13001', 'CARTAGENA DE INDIAS', 'CARTAGENA_DE_INDIAS_13001', 'CARTAGENA_DE_INDIAS'),
+    ('18150', 'CARTAGENA DEL CHAIRÁ', 'CARTAGENA_DEL_CHAIRA_18150', 'CARTAGENA_DEL_CHAIRA'),
+    ('76147', 'CARTAGO', 'CARTAGO_76147', 'CARTAGO'),
+    ('97161', 'CARURÚ', 'CARURU_97161', 'CARURU'),
+    ('73152', 'CASABIANCA', 'CASABIANCA_73152', 'CASABIANCA'),
+    ('50150', 'CASTILLA LA NUEVA', 'CASTILLA_LA_NUEVA_50150', 'CASTILLA_LA_NUEVA'),
+    ('05154', 'CAUCASIA', 'CAUCASIA_05154', 'CAUCASIA'),
+    ('68160', 'CEPITÁ', 'CEPITA_68160', 'CEPITA'),
+    ('23162', 'CERETÉ', 'CERETE_23162', 'CERETE'),
+    ('15162', 'CERINZA', 'CERINZA_15162', 'CERINZA'),
+    ('68162', 'CERRITO', 'CERRITO_68162', 'CERRITO'),
+    ('47161', 'CERRO DE SAN ANTONIO', 'CERRO_DE_SAN_ANTONIO_47161', 'CERRO_DE_SAN_ANTONIO'),
+    ('27160', 'CÉRTEGUI', 'CERTEGUI_27160', 'CERTEGUI'),
+    ('52240', 'CHACHAGÜÍ', 'CHACHAGUI_52240', 'CHACHAGUI'),
+    ('25168', 'CHAGUANÍ', 'CHAGUANI_25168', 'CHAGUANI'),
+    ('70230', 'CHALÁN', 'CHALAN_70230', 'CHALAN'),
+    ('85015', 'CHÁMEZA', 'CHAMEZA_85015', 'CHAMEZA'),
+    ('73168', 'CHAPARRAL', 'CHAPARRAL_73168', 'CHAPARRAL'),
+    ('68167', 'CHARALÁ', 'CHARALA_68167', 'CHARALA'),
+    ('68169', 'CHARTA', 'CHARTA_68169', 'CHARTA'),
+    ('25175', 'CHÍA', 'CHIA_25175', 'CHIA'),
+    ('05172', 'CHIGORODÓ', 'CHIGORODO_05172', 'CHIGORODO'),
+    ('68176', 'CHIMA', 'CHIMA_68176', 'CHIMA'),
+    ('23168', 'CHIMÁ', 'CHIMA_23168', 'CHIMA'),
+    ('20175', 'CHIMICHAGUA', 'CHIMICHAGUA_20175', 'CHIMICHAGUA'),
+    ('54172', 'CHINÁCOTA', 'CHINACOTA_54172', 'CHINACOTA'),
+    ('15172', 'CHINAVITA', 'CHINAVITA_15172', 'CHINAVITA'),
+    ('17174', 'CHINCHINÁ', 'CHINCHINA_17174', 'CHINCHINA'),
+    ('23182', 'CHINÚ', 'CHINU_23182', 'CHINU'),
+    ('25178', 'CHIPAQUE', 'CHIPAQUE_25178', 'CHIPAQUE'),
+    ('68179', 'CHIPATÁ', 'CHIPATA_68179', 'CHIPATA'),
+    ('15176', 'CHIQUINQUIRÁ', 'CHIQUINQUIRA_15176', 'CHIQUINQUIRA'),
+    ('15232', 'CHÍQUIZA', 'CHIQUIZA_15232', 'CHIQUIZA'),
+    ('20178', 'CHIRIGUANÁ', 'CHIRIGUANA_20178', 'CHIRIGUANA'),
+    ('15180', 'CHISCAS', 'CHISCAS_15180', 'CHISCAS'),
+    ('15183', 'CHITA', 'CHITA_15183', 'CHITA'),
+    ('54174', 'CHITAGÁ', 'CHITAGA_54174', 'CHITAGA'),
+    ('15185', 'CHITARAQUE', 'CHITARAQUE_15185', 'CHITARAQUE'),
+    ('15187', 'CHIVATÁ', 'CHIVATA_15187', 'CHIVATA'),
+    ('47170', 'CHIVOLO', 'CHIVOLO_47170', 'CHIVOLO'),
+    ('15236', 'CHIVOR', 'CHIVOR_15236', 'CHIVOR'),
+    ('25181', 'CHOACHÍ', 'CHOACHI_25181', 'CHOACHI'),
+    ('25183', 'CHOCONTÁ', 'CHOCONTA_25183', 'CHOCONTA'),
+    ('13188', 'CICUCO', 'CICUCO_13188', 'CICUCO'),
+    ('47189', 'CIÉNAGA', 'CIENAGA_47189', 'CIENAGA'),
+    ('23189', 'CIÉNAGA DE ORO', 'CIENAGA_DE_ORO_23189', 'CIENAGA_DE_ORO'),
+    ('15189', 'CIÉNEGA', 'CIENEGA_15189', 'CIENEGA'),
+    ('68190', 'CIMITARRA', 'CIMITARRA_68190', 'CIMITARRA'),
+    ('63190', 'CIRCASIA', 'CIRCASIA_63190', 'CIRCASIA'),
+    ('05190', 'CISNEROS', 'CISNEROS_05190', 'CISNEROS'),
+    ('05101', 'CIUDAD BOLÍVAR', 'CIUDAD_BOLIVAR_05101', 'CIUDAD_BOLIVAR'),
+    ('13222', 'CLEMENCIA', 'CLEMENCIA_13222', 'CLEMENCIA'),
+    ('05197', 'COCORNÁ', 'COCORNA_05197', 'COCORNA'),
+    ('73200', 'COELLO', 'COELLO_73200', 'COELLO'),
+    ('25200', 'COGUA', 'COGUA_25200', 'COGUA'),
+    ('41206', 'COLOMBIA', 'COLOMBIA_41206', 'COLOMBIA'),
+    ('52203', 'COLÓN (Nariño)', 'COLON_NARINO_52203', 'COLON_NARINO'),
+    ('86219', 'COLÓN (Putumayo)', 'COLON_PUTUMAYO_86219', 'COLON_PUTUMAYO'),
+    ('70204', 'COLOSÓ', 'COLOSO_70204', 'COLOSO'),
+    ('15204', 'CÓMBITA', 'COMBITA_15204', 'COMBITA'),
+    ('05206', 'CONCEPCIÓN (Antioquia)', 'CONCEPCION_ANTIOQUIA_05206', 'CONCEPCION_ANTIOQUIA'),
+    ('68207', 'CONCEPCIÓN (Santander)', 'CONCEPCION_SANTANDER_68207', 'CONCEPCION_SANTANDER'),
+    ('05209', 'CONCORDIA (Antioquia)', 'CONCORDIA_ANTIOQUIA_05209', 'CONCORDIA_ANTIOQUIA'),
+    ('47205', 'CONCORDIA (Magdalena)', 'CONCORDIA_MAGDALENA_47205', 'CONCORDIA_MAGDALENA'),
+    ('27205', 'CONDOTO', 'CONDOTO_27205', 'CONDOTO'),
+    ('68209', 'CONFINES', 'CONFINES_68209', 'CONFINES'),
+    ('52207', 'CONSACÁ', 'CONSACA_52207', 'CONSACA'),
+    ('52210', 'CONTADERO', 'CONTADERO_52210', 'CONTADERO'),
+    ('68211', 'CONTRATACIÓN', 'CONTRATACION_68211', 'CONTRATACION'),
+    ('54206', 'CONVENCIÓN', 'CONVENCION_54206', 'CONVENCION'),
+    ('05212', 'COPACABANA', 'COPACABANA_05212', 'COPACABANA'),
+    ('15212', 'COPER', 'COPER_15212', 'COPER'),
+    ('13212', 'CÓRDOBA (Bolívar)', 'CORDOBA_BOLIVAR_13212', 'CORDOBA_BOLIVAR'),
+    ('52215', 'CÓRDOBA (Nariño)', 'CORDOBA_NARINO_52215', 'CORDOBA_NARINO'),
+    ('63212', 'CÓRDOBA (Quindio)', 'CORDOBA_QUINDIO_63212', 'CORDOBA_QUINDIO'),
+    ('19212', 'CORINTO', 'CORINTO_19212', 'CORINTO'),
+    ('68217', 'COROMORO', 'COROMORO_68217', 'COROMORO'),
+    ('70215', 'COROZAL', 'COROZAL_70215', 'COROZAL'),
+    ('15215', 'CORRALES', 'CORRALES_15215', 'CORRALES'),
+    ('25214', 'COTA', 'COTA_25214', 'COTA'),
+    ('23300', 'COTORRA', 'COTORRA_23300', 'COTORRA'),
+    ('15218', 'COVARACHÍA', 'COVARACHIA_15218', 'COVARACHIA'),
+    ('70221', 'COVEÑAS', 'COVENAS_70221', 'COVENAS'),
+    ('73217', 'COYAIMA', 'COYAIMA_73217', 'COYAIMA'),
+    ('81220', 'CRAVO NORTE', 'CRAVO_NORTE_81220', 'CRAVO_NORTE'),
+    ('52224', 'CUASPÚD', 'CUASPUD_52224', 'CUASPUD'),
+    ('15223', 'CUBARÁ', 'CUBARA_15223', 'CUBARA'),
+    ('50223', 'CUBARRAL', 'CUBARRAL_50223', 'CUBARRAL'),
+    ('15224', 'CUCAITA', 'CUCAITA_15224', 'CUCAITA'),
+    ('25224', 'CUCUNUBÁ', 'CUCUNUBA_25224', 'CUCUNUBA'),
+    ('54001', 'CÚCUTA', 'CUCUTA_54001', 'CUCUTA'),
+    ('54223', 'CUCUTILLA', 'CUCUTILLA_54223', 'CUCUTILLA'),
+    ('15226', 'CUÍTIVA', 'CUITIVA_15226', 'CUITIVA'),
+    ('50226', 'CUMARAL', 'CUMARAL_50226', 'CUMARAL'),
+    ('99773', 'CUMARIBO', 'CUMARIBO_99773', 'CUMARIBO'),
+    ('52227', 'CUMBAL', 'CUMBAL_52227', 'CUMBAL'),
+    ('52233', 'CUMBITARA', 'CUMBITARA_52233', 'CUMBITARA'),
+    ('73226', 'CUNDAY', 'CUNDAY_73226', 'CUNDAY'),
+    ('18205', 'CURILLO', 'CURILLO_18205', 'CURILLO'),
+    ('68229', 'CURITÍ', 'CURITI_68229', 'CURITI'),
+    ('20228', 'CURUMANÍ', 'CURUMANI_20228', 'CURUMANI'),
+    ('05234', 'DABEIBA', 'DABEIBA_05234', 'DABEIBA'),
+    ('76233', 'DAGUA', 'DAGUA_76233', 'DAGUA'),
+    ('44090', 'DIBULLA', 'DIBULLA_44090', 'DIBULLA'),
+    ('44098', 'DISTRACCIÓN', 'DISTRACCION_44098', 'DISTRACCION'),
+    ('73236', 'DOLORES', 'DOLORES_73236', 'DOLORES'),
+    ('05237', 'DONMATÍAS', 'DONMATIAS_05237', 'DONMATIAS'),
+    ('66170', 'DOSQUEBRADAS', 'DOSQUEBRADAS_66170', 'DOSQUEBRADAS'),
+    ('15238', 'DUITAMA', 'DUITAMA_15238', 'DUITAMA'),
+    ('54239', 'DURANIA', 'DURANIA_54239', 'DURANIA'),
+    ('05240', 'EBÉJICO', 'EBEJICO_05240', 'EBEJICO'),
+    ('76243', 'EL ÁGUILA', 'EL_AGUILA_76243', 'EL_AGUILA'),
+    ('05250', 'EL BAGRE', 'EL_BAGRE_05250', 'EL_BAGRE'),
+    ('47245', 'EL BANCO', 'EL_BANCO_47245', 'EL_BANCO'),
+    ('76246', 'EL CAIRO', 'EL_CAIRO_76246', 'EL_CAIRO'),
+    ('50245', 'EL CALVARIO', 'EL_CALVARIO_50245', 'EL_CALVARIO'),
+    ('27135', 'EL CANTÓN DEL SAN PABLO', 'EL_CANTON_DEL_SAN_PABLO_27135', 'EL_CANTON_DEL_SAN_PABLO'),
+    ('54245', 'EL CARMEN', 'EL_CARMEN_54245', 'EL_CARMEN'),
+    ('27245', 'EL CARMEN DE ATRATO', 'EL_CARMEN_DE_ATRATO_27245', 'EL_CARMEN_DE_ATRATO'),
+    ('13244', 'EL CARMEN DE BOLÍVAR', 'EL_CARMEN_DE_BOLIVAR_13244', 'EL_CARMEN_DE_BOLIVAR'),
+    ('68235', 'EL CARMEN DE CHUCURÍ', 'EL_CARMEN_DE_CHUCURI_68235', 'EL_CARMEN_DE_CHUCURI'),
+    ('05148', 'EL CARMEN DE VIBORAL', 'EL_CARMEN_DE_VIBORAL_05148', 'EL_CARMEN_DE_VIBORAL'),
+    ('50251', 'EL CASTILLO', 'EL_CASTILLO_50251', 'EL_CASTILLO'),
+    ('76248', 'EL CERRITO', 'EL_CERRITO_76248', 'EL_CERRITO'),
+    ('52250', 'EL CHARCO', 'EL_CHARCO_52250', 'EL_CHARCO'),
+    ('15244', 'EL COCUY', 'EL_COCUY_15244', 'EL_COCUY'),
+    ('25245', 'EL COLEGIO', 'EL_COLEGIO_25245', 'EL_COLEGIO'),
+    ('20238', 'EL COPEY', 'EL_COPEY_20238', 'EL_COPEY'),
+    ('18247', 'EL DONCELLO', 'EL_DONCELLO_18247', 'EL_DONCELLO'),
+    ('50270', 'EL DORADO', 'EL_DORADO_50270', 'EL_DORADO'),
+    ('76250', 'EL DOVIO', 'EL_DOVIO_76250', 'EL_DOVIO'),
+    ('91263', 'EL ENCANTO', 'EL_ENCANTO_91263', 'EL_ENCANTO'),
+    ('15248', 'EL ESPINO', 'EL_ESPINO_15248', 'EL_ESPINO'),
+    ('68245', 'EL GUACAMAYO', 'EL_GUACAMAYO_68245', 'EL_GUACAMAYO'),
+    ('13248', 'EL GUAMO', 'EL_GUAMO_13248', 'EL_GUAMO'),
+    ('27250', 'EL LITORAL DEL SAN JUAN', 'EL_LITORAL_DEL_SAN_JUAN_27250', 'EL_LITORAL_DEL_SAN_JUAN'),
+    ('44110', 'EL MOLINO', 'EL_MOLINO_44110', 'EL_MOLINO'),
+    ('20250', 'EL PASO', 'EL_PASO_20250', 'EL_PASO'),
+    ('18256', 'EL PAUJÍL', 'EL_PAUJIL_18256', 'EL_PAUJIL'),
+    ('52254', 'EL PEÑOL', 'EL_PENOL_52254', 'EL_PENOL'),
+    ('13268', 'EL PEÑÓN (Bolívar)', 'EL_PENON_BOLIVAR_13268', 'EL_PENON_BOLIVAR'),
+    ('25258', 'EL PEÑÓN (Cundinamarca)', 'EL_PENON_CUNDINAMARCA_25258', 'EL_PENON_CUNDINAMARCA'),
+    ('68250', 'EL PEÑÓN (Santander)', 'EL_PENON_SANTANDER_68250', 'EL_PENON_SANTANDER'),
+    ('47258', 'EL PIÑÓN', 'EL_PINON_47258', 'EL_PINON'),
+    ('68255', 'EL PLAYÓN', 'EL_PLAYON_68255', 'EL_PLAYON'),
+    ('47268', 'EL RETÉN', 'EL_RETEN_47268', 'EL_RETEN'),
+    ('95025', 'EL RETORNO', 'EL_RETORNO_95025', 'EL_RETORNO'),
+    ('70233', 'EL ROBLE', 'EL_ROBLE_70233', 'EL_ROBLE'),
+    ('25260', 'EL ROSAL', 'EL_ROSAL_25260', 'EL_ROSAL'),
+    ('52256', 'EL ROSARIO', 'EL_ROSARIO_52256', 'EL_ROSARIO'),
+    ('05697', 'EL SANTUARIO', 'EL_SANTUARIO_05697', 'EL_SANTUARIO'),
+    ('52258', 'EL TABLÓN DE GÓMEZ', 'EL_TABLON_DE_GOMEZ_52258', 'EL_TABLON_DE_GOMEZ'),
+    ('19256', 'EL TAMBO (Cauca)', 'EL_TAMBO_CAUCA_19256', 'EL_TAMBO_CAUCA'),
+    ('52260', 'EL TAMBO (Nariño)', 'EL_TAMBO_NARINO_52260', 'EL_TAMBO_NARINO'),
+    ('54250', 'EL TARRA', 'EL_TARRA_54250', 'EL_TARRA'),
+    ('54261', 'EL ZULIA', 'EL_ZULIA_54261', 'EL_ZULIA'),
+    ('41244', 'ELÍAS', 'ELIAS_41244', 'ELIAS'),
+    ('68264', 'ENCINO', 'ENCINO_68264', 'ENCINO'),
+    ('68266', 'ENCISO', 'ENCISO_68266', 'ENCISO'),
+    ('05264', 'ENTRERRÍOS', 'ENTRERRIOS_05264', 'ENTRERRIOS'),
+    ('05266', 'ENVIGADO', 'ENVIGADO_05266', 'ENVIGADO'),
+    ('73268', 'ESPINAL', 'ESPINAL_73268', 'ESPINAL'),
+    ('25269', 'FACATATIVÁ', 'FACATATIVA_25269', 'FACATATIVA'),
+    ('73270', 'FALAN', 'FALAN_73270', 'FALAN'),
+    ('17272', 'FILADELFIA', 'FILADELFIA_17272', 'FILADELFIA'),
+    ('63272', 'FILANDIA', 'FILANDIA_63272', 'FILANDIA'),
+    ('15272', 'FIRAVITOBA', 'FIRAVITOBA_15272', 'FIRAVITOBA'),
+    ('73275', 'FLANDES', 'FLANDES_73275', 'FLANDES'),
+    ('18001', 'FLORENCIA (Caquetá)', 'FLORENCIA_CAQUETA_18001', 'FLORENCIA_CAQUETA'),
+    ('19290', 'FLORENCIA (Cauca)', 'FLORENCIA_CAUCA_19290', 'FLORENCIA_CAUCA'),
+    ('15276', 'FLORESTA', 'FLORESTA_15276', 'FLORESTA'),
+    ('68271', 'FLORIÁN', 'FLORIAN_68271', 'FLORIAN'),
+    ('76275', 'FLORIDA', 'FLORIDA_76275', 'FLORIDA'),
+    ('68276', 'FLORIDABLANCA', 'FLORIDABLANCA_68276', 'FLORIDABLANCA'),
+    ('25279', 'FÓMEQUE', 'FOMEQUE_25279', 'FOMEQUE'),
+    ('44279', 'FONSECA', 'FONSECA_44279', 'FONSECA'),
+    ('81300', 'FORTUL', 'FORTUL_81300', 'FORTUL'),
+    ('25281', 'FOSCA', 'FOSCA_25281', 'FOSCA'),
+    ('52520', 'FRANCISCO PIZARRO', 'FRANCISCO_PIZARRO_52520', 'FRANCISCO_PIZARRO'),
+    ('05282', 'FREDONIA', 'FREDONIA_05282', 'FREDONIA'),
+    ('73283', 'FRESNO', 'FRESNO_73283', 'FRESNO'),
+    ('05284', 'FRONTINO', 'FRONTINO_05284', 'FRONTINO'),
+    ('50287', 'FUENTE DE ORO', 'FUENTE_DE_ORO_50287', 'FUENTE_DE_ORO'),
+    ('47288', 'FUNDACIÓN', 'FUNDACION_47288', 'FUNDACION'),
+    ('52287', 'FUNES', 'FUNES_52287', 'FUNES'),
+    ('25286', 'FUNZA', 'FUNZA_25286', 'FUNZA'),
+    ('25288', 'FÚQUENE', 'FUQUENE_25288', 'FUQUENE'),
+    ('25290', 'FUSAGASUGÁ', 'FUSAGASUGA_25290', 'FUSAGASUGA'),
+    ('25293', 'GACHALÁ', 'GACHALA_25293', 'GACHALA'),
+    ('25295', 'GACHANCIPÁ', 'GACHANCIPA_25295', 'GACHANCIPA'),
+    ('15293', 'GACHANTIVÁ', 'GACHANTIVA_15293', 'GACHANTIVA'),
+    ('25297', 'GACHETÁ', 'GACHETA_25297', 'GACHETA'),
+    ('68296', 'GALÁN', 'GALAN_68296', 'GALAN'),
+    ('08296', 'GALAPA', 'GALAPA_08296', 'GALAPA'),
+    ('70235', 'GALERAS', 'GALERAS_70235', 'GALERAS'),
+    ('25299', 'GAMA', 'GAMA_25299', 'GAMA'),
+    ('20295', 'GAMARRA', 'GAMARRA_20295', 'GAMARRA'),
+    ('68298', 'GÁMBITA', 'GAMBITA_68298', 'GAMBITA'),
+    ('15296', 'GÁMEZA', 'GAMEZA_15296', 'GAMEZA'),
+    ('15299', 'GARAGOA', 'GARAGOA_15299', 'GARAGOA'),
+    ('41298', 'GARZÓN', 'GARZON_41298', 'GARZON'),
+    ('63302', 'GÉNOVA', 'GENOVA_63302', 'GENOVA'),
+    ('41306', 'GIGANTE', 'GIGANTE_41306', 'GIGANTE'),
+    ('76306', 'GINEBRA', 'GINEBRA_76306', 'GINEBRA'),
+    ('05306', 'GIRALDO', 'GIRALDO_05306', 'GIRALDO'),
+    ('25307', 'GIRARDOT', 'GIRARDOT_25307', 'GIRARDOT'),
+    ('05308', 'GIRARDOTA', 'GIRARDOTA_05308', 'GIRARDOTA'),
+    ('68307', 'GIRÓN', 'GIRON_68307', 'GIRON'),
+    ('05310', 'GÓMEZ PLATA', 'GOMEZ_PLATA_05310', 'GOMEZ_PLATA'),
+    ('20310', 'GONZÁLEZ', 'GONZALEZ_20310', 'GONZALEZ'),
+    ('54313', 'GRAMALOTE', 'GRAMALOTE_54313', 'GRAMALOTE'),
+    ('05313', 'GRANADA (Antioquia)', 'GRANADA_ANTIOQUIA_05313', 'GRANADA_ANTIOQUIA'),
+    ('25312', 'GRANADA (Cundinamarca)', 'GRANADA_CUNDINAMARCA_25312', 'GRANADA_CUNDINAMARCA'),
+    ('50313', 'GRANADA (Meta)', 'GRANADA_META_50313', 'GRANADA_META'),
+    ('68318', 'GUACA', 'GUACA_68318', 'GUACA'),
+    ('15317', 'GUACAMAYAS', 'GUACAMAYAS_15317', 'GUACAMAYAS'),
+    ('76318', 'GUACARÍ', 'GUACARI_76318', 'GUACARI'),
+    ('19300', 'GUACHENÉ', 'GUACHENE_19300', 'GUACHENE'),
+    ('25317', 'GUACHETÁ', 'GUACHETA_25317', 'GUACHETA'),
+    ('52317', 'GUACHUCAL', 'GUACHUCAL_52317', 'GUACHUCAL'),
+    ('76111', 'GUADALAJARA DE BUGA', 'GUADALAJARA_DE_BUGA_76111', 'GUADALAJARA_DE_BUGA'),
+    ('05315', 'GUADALUPE (Antioquia)', 'GUADALUPE_ANTIOQUIA_05315', 'GUADALUPE_ANTIOQUIA'),
+    ('41319', 'GUADALUPE (Huila)', 'GUADALUPE_HUILA_41319', 'GUADALUPE_HUILA'),
+    ('68320', 'GUADALUPE (Santander)', 'GUADALUPE_SANTANDER_68320', 'GUADALUPE_SANTANDER'),
+    ('25320', 'GUADUAS', 'GUADUAS_25320', 'GUADUAS'),
+    ('52320', 'GUAITARILLA', 'GUAITARILLA_52320', 'GUAITARILLA'),
+    ('52323', 'GUALMATÁN', 'GUALMATAN_52323', 'GUALMATAN'),
+    ('47318', 'GUAMAL (Magdalena)', 'GUAMAL_MAGDALENA_47318', 'GUAMAL_MAGDALENA'),
+    ('50318', 'GUAMAL (Meta)', 'GUAMAL_META_50318', 'GUAMAL_META'),
+    ('73319', 'GUAMO', 'GUAMO_73319', 'GUAMO'),
+    ('19318', 'GUAPÍ', 'GUAPI_19318', 'GUAPI'),
+    ('68322', 'GUAPOTÁ', 'GUAPOTA_68322', 'GUAPOTA'),
+    ('70265', 'GUARANDA', 'GUARANDA_70265', 'GUARANDA'),
+    ('05318', 'GUARNE', 'GUARNE_05318', 'GUARNE'),
+    ('25322', 'GUASCA', 'GUASCA_25322', 'GUASCA'),
+    ('05321', 'GUATAPÉ', 'GUATAPE_05321', 'GUATAPE'),
+    ('25324', 'GUATAQUÍ', 'GUATAQUI_25324', 'GUATAQUI'),
+    ('25326', 'GUATAVITA', 'GUATAVITA_25326', 'GUATAVITA'),
+    ('15322', 'GUATEQUE', 'GUATEQUE_15322', 'GUATEQUE'),
+    ('66318', 'GUÁTICA', 'GUATICA_66318', 'GUATICA'),
+    ('68324', 'GUAVATÁ', 'GUAVATA_68324', 'GUAVATA'),
+    ('25328', 'GUAYABAL DE SÍQUIMA', 'GUAYABAL_DE_SIQUIMA_25328', 'GUAYABAL_DE_SIQUIMA'),
+    ('25335', 'GUAYABETAL', 'GUAYABETAL_25335', 'GUAYABETAL'),
+    ('15325', 'GUAYATÁ', 'GUAYATA_15325', 'GUAYATA'),
+    ('68327', 'GÜEPSA', 'GUEPSA_68327', 'GUEPSA'),
+    ('15332', 'GÜICÁN', 'GUICAN_15332', 'GUICAN'),
+    ('25339', 'GUTIÉRREZ', 'GUTIERREZ_25339', 'GUTIERREZ'),
+    ('54344', 'HACARÍ', 'HACARI_54344', 'HACARI'),
+    ('13300', 'HATILLO DE LOBA', 'HATILLO_DE_LOBA_13300', 'HATILLO_DE_LOBA'),
+    ('68344', 'HATO', 'HATO_68344', 'HATO'),
+    ('85125', 'HATO COROZAL', 'HATO_COROZAL_85125', 'HATO_COROZAL'),
+    ('44378', 'HATONUEVO', 'HATONUEVO_44378', 'HATONUEVO'),
+    ('05347', 'HELICONIA', 'HELICONIA_05347', 'HELICONIA'),
+    ('54347', 'HERRÁN', 'HERRAN_54347', 'HERRAN'),
+    ('73347', 'HERVEO', 'HERVEO_73347', 'HERVEO'),
+    ('05353', 'HISPANIA', 'HISPANIA_05353', 'HISPANIA'),
+    ('41349', 'HOBO', 'HOBO_41349', 'HOBO'),
+    ('73349', 'HONDA', 'HONDA_73349', 'HONDA'),
+    ('73001', 'IBAGUÉ', 'IBAGUE_73001', 'IBAGUE'),
+    ('73352', 'ICONONZO', 'ICONONZO_73352', 'ICONONZO'),
+    ('52352', 'ILES', 'ILES_52352', 'ILES'),
+    ('52354', 'IMUÉS', 'IMUES_52354', 'IMUES'),
+    ('94001', 'INÍRIDA', 'INIRIDA_94001', 'INIRIDA'),
+    ('19355', 'INZÁ', 'INZA_19355', 'INZA'),
+    ('52356', 'IPIALES', 'IPIALES_52356', 'IPIALES'),
+    ('41357', 'ÍQUIRA', 'IQUIRA_41357', 'IQUIRA'),
+    ('41359', 'ISNOS', 'ISNOS_41359', 'ISNOS'),
+    ('27361', 'ISTMINA', 'ISTMINA_27361', 'ISTMINA'),
+    ('05360', 'ITAGÜÍ', 'ITAGUI_05360', 'ITAGUI'),
+    ('05361', 'ITUANGO', 'ITUANGO_05361', 'ITUANGO'),
+    ('15362', 'IZA', 'IZA_15362', 'IZA'),
+    ('19364', 'JAMBALÓ', 'JAMBALO_19364', 'JAMBALO'),
+    ('76364', 'JAMUNDÍ', 'JAMUNDI_76364', 'JAMUNDI'),
+    ('05364', 'JARDÍN', 'JARDIN_05364', 'JARDIN'),
+    ('15367', 'JENESANO', 'JENESANO_15367', 'JENESANO'),
+    ('05368', 'JERICÓ (Antioquia)', 'JERICO_ANTIOQUIA_05368', 'JERICO_ANTIOQUIA'),
+    ('15368', 'JERICÓ (Boyacá)', 'JERICO_BOYACA_15368', 'JERICO_BOYACA'),
+    ('25368', 'JERUSALÉN', 'JERUSALEN_25368', 'JERUSALEN'),
+    ('68368', 'JESÚS MARÍA', 'JESUS_MARIA_68368', 'JESUS_MARIA'),
+    ('68370', 'JORDÁN', 'JORDAN_68370', 'JORDAN'),
+    ('08372', 'JUAN DE ACOSTA', 'JUAN_DE_ACOSTA_08372', 'JUAN_DE_ACOSTA'),
+    ('25372', 'JUNÍN', 'JUNIN_25372', 'JUNIN'),
+    ('27372', 'JURADÓ', 'JURADO_27372', 'JURADO'),
+    ('23350', 'LA APARTADA', 'LA_APARTADA_23350', 'LA_APARTADA'),
+    ('41378', 'LA ARGENTINA', 'LA_ARGENTINA_41378', 'LA_ARGENTINA'),
+    ('68377', 'LA BELLEZA', 'LA_BELLEZA_68377', 'LA_BELLEZA'),
+    ('25377', 'LA CALERA', 'LA_CALERA_25377', 'LA_CALERA'),
+    ('15380', 'LA CAPILLA', 'LA_CAPILLA_15380', 'LA_CAPILLA'),
+    ('05376', 'LA CEJA', 'LA_CEJA_05376', 'LA_CEJA'),
+    ('66383', 'LA CELIA', 'LA_CELIA_66383', 'LA_CELIA'),
+    ('91405', 'LA CHORRERA', 'LA_CHORRERA_91405', 'LA_CHORRERA'),
+    ('52378', 'LA CRUZ', 'LA_CRUZ_52378', 'LA_CRUZ'),
+    ('76377', 'LA CUMBRE', 'LA_CUMBRE_76377', 'LA_CUMBRE'),
+    ('17380', 'LA DORADA', 'LA_DORADA_17380', 'LA_DORADA'),
+    ('54385', 'LA ESPERANZA', 'LA_ESPERANZA_54385', 'LA_ESPERANZA'),
+    ('05380', 'LA ESTRELLA', 'LA_ESTRELLA_05380', 'LA_ESTRELLA'),
+    ('52381', 'LA FLORIDA', 'LA_FLORIDA_52381', 'LA_FLORIDA'),
+    ('20383', 'LA GLORIA', 'LA_GLORIA_20383', 'LA_GLORIA'),
+    ('94885', 'LA GUADALUPE', 'LA_GUADALUPE_94885', 'LA_GUADALUPE'),
+    ('20400', 'LA JAGUA DE IBIRICO', 'LA_JAGUA_DE_IBIRICO_20400', 'LA_JAGUA_DE_IBIRICO'),
+    ('44420', 'LA JAGUA DEL PILAR', 'LA_JAGUA_DEL_PILAR_44420', 'LA_JAGUA_DEL_PILAR'),
+    ('52385', 'LA LLANADA', 'LA_LLANADA_52385', 'LA_LLANADA'),
+    ('50350', 'LA MACARENA', 'LA_MACARENA_50350', 'LA_MACARENA'),
+    ('17388', 'LA MERCED', 'LA_MERCED_17388', 'LA_MERCED'),
+    ('25386', 'LA MESA', 'LA_MESA_25386', 'LA_MESA'),
+    ('18410', 'LA MONTAÑITA', 'LA_MONTANITA_18410', 'LA_MONTANITA'),
+    ('25394', 'LA PALMA', 'LA_PALMA_25394', 'LA_PALMA'),
+    ('20621', 'LA PAZ (Cesar)', 'LA_PAZ_CESAR_20621', 'LA_PAZ_CESAR'),
+    ('68397', 'LA PAZ (Santander)', 'LA_PAZ_SANTANDER_68397', 'LA_PAZ_SANTANDER'),
+    ('91407', 'LA PEDRERA', 'LA_PEDRERA_91407', 'LA_PEDRERA'),
+    ('25398', 'LA PEÑA', 'LA_PENA_25398', 'LA_PENA'),
+    ('05390', 'LA PINTADA', 'LA_PINTADA_05390', 'LA_PINTADA'),
+    ('41396', 'LA PLATA', 'LA_PLATA_41396', 'LA_PLATA'),
+    ('54398', 'LA PLAYA', 'LA_PLAYA_54398', 'LA_PLAYA'),
+    ('99524', 'LA PRIMAVERA', 'LA_PRIMAVERA_99524', 'LA_PRIMAVERA'),
+    ('85136', 'LA SALINA', 'LA_SALINA_85136', 'LA_SALINA'),
+    ('19392', 'LA SIERRA', 'LA_SIERRA_19392', 'LA_SIERRA'),
+    ('63401', 'LA TEBAIDA', 'LA_TEBAIDA_63401', 'LA_TEBAIDA'),
+    ('52390', 'LA TOLA', 'LA_TOLA_52390', 'LA_TOLA'),
+    ('05400', 'LA UNIÓN (Antioquia)', 'LA_UNION_ANTIOQUIA_05400', 'LA_UNION_ANTIOQUIA'),
+    ('52399', 'LA UNIÓN (Nariño)', 'LA_UNION_NARINO_52399', 'LA_UNION_NARINO'),
+    ('70400', 'LA UNIÓN (Sucre)', 'LA_UNION_SUCRE_70400', 'LA_UNION_SUCRE'),
+    ('76400', 'LA UNIÓN (Valle del Cauca)', 'LA_UNION_VALLE_DEL_CAUCA_76400', 'LA_UNION_VALLE_DEL_CAUCA'),
+    ('15403', 'LA UVITA', 'LA_UVITA_15403', 'LA_UVITA'),
+    ('19397', 'LA VEGA (Cauca)', 'LA_VEGA_CAUCA_19397', 'LA_VEGA_CAUCA'),
+    ('25402', 'LA VEGA (Cundinamarca)', 'LA_VEGA_CUNDINAMARCA_25402', 'LA_VEGA_CUNDINAMARCA'),
+    ('91430', 'LA VICTORIA (Amazonas)', 'LA_VICTORIA_AMAZONAS_91430', 'LA_VICTORIA_AMAZONAS'),
+    ('15401', 'LA VICTORIA (Boyacá)', 'LA_VICTORIA_BOYACA_15401', 'LA_VICTORIA_BOYACA'),
+    ('76403', 'LA VICTORIA (Valle del Cauca)', 'LA_VICTORIA_VALLE_DEL_CAUCA_76403', 'LA_VICTORIA_VALLE_DEL_CAUCA'),
+    ('66400', 'LA VIRGINIA', 'LA_VIRGINIA_66400', 'LA_VIRGINIA'),
+    ('54377', 'LABATECA', 'LABATECA_54377', 'LABATECA'),
+    ('15377', 'LABRANZAGRANDE', 'LABRANZAGRANDE_15377', 'LABRANZAGRANDE'),
+    ('68385', 'LANDÁZURI', 'LANDAZURI_68385', 'LANDAZURI'),
+    ('68406', 'LEBRIJA', 'LEBRIJA_68406', 'LEBRIJA'),
+    ('52405', 'LEIVA', 'LEIVA_52405', 'LEIVA'),
+    ('50400', 'LEJANÍAS', 'LEJANIAS_50400', 'LEJANIAS'),
+    ('25407', 'LENGUAZAQUE', 'LENGUAZAQUE_25407', 'LENGUAZAQUE'),
+    ('73408', 'LÉRIDA', 'LERIDA_73408', 'LERIDA'),
+    ('91001', 'LETICIA', 'LETICIA_91001', 'LETICIA'),
+    ('73411', 'LÍBANO', 'LIBANO_73411', 'LIBANO'),
+    ('05411', 'LIBORINA', 'LIBORINA_05411', 'LIBORINA'),
+    ('52411', 'LINARES', 'LINARES_52411', 'LINARES'),
+    ('27413', 'LLORÓ', 'LLORO_27413', 'LLORO'),
+    ('19418', 'LÓPEZ DE MICAY', 'LOPEZ_DE_MICAY_19418', 'LOPEZ_DE_MICAY'),
+    ('23417', 'LORICA', 'LORICA_23417', 'LORICA'),
+    ('52418', 'LOS ANDES', 'LOS_ANDES_52418', 'LOS_ANDES'),
+    ('23419', 'LOS CÓRDOBAS', 'LOS_CORDOBAS_23419', 'LOS_CORDOBAS'),
+    ('70418', 'LOS PALMITOS', 'LOS_PALMITOS_70418', 'LOS_PALMITOS'),
+    ('54405', 'LOS PATIOS', 'LOS_PATIOS_54405', 'LOS_PATIOS'),
+    ('68418', 'LOS SANTOS', 'LOS_SANTOS_68418', 'LOS_SANTOS'),
+    ('54418', 'LOURDES', 'LOURDES_54418', 'LOURDES'),
+    ('08421', 'LURUACO', 'LURUACO_08421', 'LURUACO'),
+    ('15425', 'MACANAL', 'MACANAL_15425', 'MACANAL'),
+    ('68425', 'MACARAVITA', 'MACARAVITA_68425', 'MACARAVITA'),
+    ('05425', 'MACEO', 'MACEO_05425', 'MACEO'),
+    ('25426', 'MACHETÁ', 'MACHETA_25426', 'MACHETA'),
+    ('25430', 'MADRID', 'MADRID_25430', 'MADRID'),
+    ('13430', 'MAGANGUÉ', 'MAGANGUE_13430', 'MAGANGUE'),
+    ('52427', 'MAGÜÍ', 'MAGUI_52427', 'MAGUI'),
+    ('13433', 'MAHATES', 'MAHATES_13433', 'MAHATES'),
+    ('44430', 'MAICAO', 'MAICAO_44430', 'MAICAO'),
+    ('70429', 'MAJAGUAL', 'MAJAGUAL_70429', 'MAJAGUAL'),
+    ('68432', 'MÁLAGA', 'MALAGA_68432', 'MALAGA'),
+    ('08433', 'MALAMBO', 'MALAMBO_08433', 'MALAMBO'),
+    ('52435', 'MALLAMA', 'MALLAMA_52435', 'MALLAMA'),
+    ('08436', 'MANATÍ', 'MANATI_08436', 'MANATI'),
+    ('44560', 'MANAURE', 'MANAURE_44560', 'MANAURE'),
+    ('20443', 'MANAURE BALCÓN DEL CESAR', 'MANAURE_BALCON_DEL_CESAR_20443', 'MANAURE_BALCON_DEL_CESAR'),
+    ('85139', 'MANÍ', 'MANI_85139', 'MANI'),
+    ('17001', 'MANIZALES', 'MANIZALES_17001', 'MANIZALES'),
+    ('25436', 'MANTA', 'MANTA_25436', 'MANTA'),
+    ('17433', 'MANZANARES', 'MANZANARES_17433', 'MANZANARES'),
+    ('50325', 'MAPIRIPÁN', 'MAPIRIPAN_50325', 'MAPIRIPAN'),
+    ('94663', 'MAPIRIPANA', 'MAPIRIPANA_94663', 'MAPIRIPANA'),
+    ('13440', 'MARGARITA', 'MARGARITA_13440', 'MARGARITA'),
+    ('13442', 'MARÍA LA BAJA', 'MARIA_LA_BAJA_13442', 'MARIA_LA_BAJA'),
+    ('05440', 'MARINILLA', 'MARINILLA_05440', 'MARINILLA'),
+    ('15442', 'MARIPÍ', 'MARIPI_15442', 'MARIPI'),
+    ('17442', 'MARMATO', 'MARMATO_17442', 'MARMATO'),
+    ('17444', 'MARQUETALIA', 'MARQUETALIA_17444', 'MARQUETALIA'),
+    ('66440', 'MARSELLA', 'MARSELLA_66440', 'MARSELLA'),
+    ('17446', 'MARULANDA', 'MARULANDA_17446', 'MARULANDA'),
+    ('68444', 'MATANZA', 'MATANZA_68444', 'MATANZA'),
+    ('05001', 'MEDELLÍN', 'MEDELLIN_05001', 'MEDELLIN'),
+    ('25438', 'MEDINA', 'MEDINA_25438', 'MEDINA'),
+    ('27425', 'MEDIO ATRATO', 'MEDIO_ATRATO_27425', 'MEDIO_ATRATO'),
+    ('27430', 'MEDIO BAUDÓ', 'MEDIO_BAUDO_27430', 'MEDIO_BAUDO'),
+    ('27450', 'MEDIO SAN JUAN', 'MEDIO_SAN_JUAN_27450', 'MEDIO_SAN_JUAN'),
+    ('73449', 'MELGAR', 'MELGAR_73449', 'MELGAR'),
+    ('19450', 'MERCADERES', 'MERCADERES_19450', 'MERCADERES'),
+    ('50330', 'MESETAS', 'MESETAS_50330', 'MESETAS'),
+    ('18460', 'MILÁN', 'MILAN_18460', 'MILAN'),
+    ('15455', 'MIRAFLORES (Boyacá)', 'MIRAFLORES_BOYACA_15455', 'MIRAFLORES_BOYACA'),
+    ('95200', 'MIRAFLORES (Guaviare)', 'MIRAFLORES_GUAVIARE_95200', 'MIRAFLORES_GUAVIARE'),
+    ('19455', 'MIRANDA', 'MIRANDA_19455', 'MIRANDA'),
+    ('91460', 'MIRITÍ - PARANÁ', 'MIRITI___PARANA_91460', 'MIRITI___PARANA'),
+    ('66456', 'MISTRATÓ', 'MISTRATO_66456', 'MISTRATO'),
+    ('97001', 'MITÚ', 'MITU_97001', 'MITU'),
+    ('86001', 'MOCOA', 'MOCOA_86001', 'MOCOA'),
+    ('68464', 'MOGOTES', 'MOGOTES_68464', 'MOGOTES'),
+    ('68468', 'MOLAGAVITA', 'MOLAGAVITA_68468', 'MOLAGAVITA'),
+    ('23464', 'MOMIL', 'MOMIL_23464', 'MOMIL'),
+    ('13468', 'MOMPÓS', 'MOMPOS_13468', 'MOMPOS'),
+    ('15464', 'MONGUA', 'MONGUA_15464', 'MONGUA'),
+    ('15466', 'MONGUÍ', 'MONGUI_15466', 'MONGUI'),
+    ('15469', 'MONIQUIRÁ', 'MONIQUIRA_15469', 'MONIQUIRA'),
+    ('23500', 'MOÑITOS', 'MONITOS_23500', 'MONITOS'),
+    ('05467', 'MONTEBELLO', 'MONTEBELLO_05467', 'MONTEBELLO'),
+    ('13458', 'MONTECRISTO', 'MONTECRISTO_13458', 'MONTECRISTO'),
+    ('23466', 'MONTELÍBANO', 'MONTELIBANO_23466', 'MONTELIBANO'),
+    ('63470', 'MONTENEGRO', 'MONTENEGRO_63470', 'MONTENEGRO'),
+    ('23001', 'MONTERÍA', 'MONTERIA_23001', 'MONTERIA'),
+    ('85162', 'MONTERREY', 'MONTERREY_85162', 'MONTERREY'),
+    ('13473', 'MORALES (Bolívar)', 'MORALES_BOLIVAR_13473', 'MORALES_BOLIVAR'),
+    ('19473', 'MORALES (Cauca)', 'MORALES_CAUCA_19473', 'MORALES_CAUCA'),
+    ('18479', 'MORELIA', 'MORELIA_18479', 'MORELIA'),
+    ('94888', 'MORICHAL', 'MORICHAL_94888', 'MORICHAL'),
+    ('70473', 'MORROA', 'MORROA_70473', 'MORROA'),
+    ('25473', 'MOSQUERA (Cundinamarca)', 'MOSQUERA_CUNDINAMARCA_25473', 'MOSQUERA_CUNDINAMARCA'),
+    ('52473', 'MOSQUERA (Nariño)', 'MOSQUERA_NARINO_52473', 'MOSQUERA_NARINO'),
+    ('15476', 'MOTAVITA', 'MOTAVITA_15476', 'MOTAVITA'),
+    ('73461', 'MURILLO', 'MURILLO_73461', 'MURILLO'),
+    ('05475', 'MURINDÓ', 'MURINDO_05475', 'MURINDO'),
+    ('05480', 'MUTATÁ', 'MUTATA_05480', 'MUTATA'),
+    ('54480', 'MUTISCUA', 'MUTISCUA_54480', 'MUTISCUA'),
+    ('15480', 'MUZO', 'MUZO_15480', 'MUZO'),
+    ('05483', 'NARIÑO (Antioquia)', 'NARINO_ANTIOQUIA_05483', 'NARINO_ANTIOQUIA'),
+    ('25483', 'NARIÑO (Cundinamarca)', 'NARINO_CUNDINAMARCA_25483', 'NARINO_CUNDINAMARCA'),
+    ('52480', 'NARIÑO (Nariño)', 'NARINO_NARINO_52480', 'NARINO_NARINO'),
+    ('41483', 'NÁTAGA', 'NATAGA_41483', 'NATAGA'),
+    ('73483', 'NATAGAIMA', 'NATAGAIMA_73483', 'NATAGAIMA'),
+    ('05495', 'NECHÍ', 'NECHI_05495', 'NECHI'),
+    ('05490', 'NECOCLÍ', 'NECOCLI_05490', 'NECOCLI'),
+    ('17486', 'NEIRA', 'NEIRA_17486', 'NEIRA'),
+    ('41001', 'NEIVA', 'NEIVA_41001', 'NEIVA'),
+    ('25486', 'NEMOCÓN', 'NEMOCON_25486', 'NEMOCON'),
+    ('25488', 'NILO', 'NILO_25488', 'NILO'),
+    ('25489', 'NIMAIMA', 'NIMAIMA_25489', 'NIMAIMA'),
+    ('15491', 'NOBSA', 'NOBSA_15491', 'NOBSA'),
+    ('25491', 'NOCAIMA', 'NOCAIMA_25491', 'NOCAIMA'),
+    ('17495', 'NORCASIA', 'NORCASIA_17495', 'NORCASIA'),
+    ('13490', 'NOROSÍ', 'NOROSI_13490', 'NOROSI'),
+    ('27491', 'NÓVITA', 'NOVITA_27491', 'NOVITA'),
+    ('47460', 'NUEVA GRANADA', 'NUEVA_GRANADA_47460', 'NUEVA_GRANADA'),
+    ('15494', 'NUEVO COLÓN', 'NUEVO_COLON_15494', 'NUEVO_COLON'),
+    ('85225', 'NUNCHÍA', 'NUNCHIA_85225', 'NUNCHIA'),
+    ('27495', 'NUQUÍ', 'NUQUI_27495', 'NUQUI'),
+    ('76497', 'OBANDO', 'OBANDO_76497', 'OBANDO'),
+    ('68498', 'OCAMONTE', 'OCAMONTE_68498', 'OCAMONTE'),
+    ('54498', 'OCAÑA', 'OCANA_54498', 'OCANA'),
+    ('68500', 'OIBA', 'OIBA_68500', 'OIBA'),
+    ('15500', 'OICATÁ', 'OICATA_15500', 'OICATA'),
+    ('05501', 'OLAYA', 'OLAYA_05501', 'OLAYA'),
+    ('52490', 'OLAYA HERRERA', 'OLAYA_HERRERA_52490', 'OLAYA_HERRERA'),
+    ('68502', 'ONZAGA', 'ONZAGA_68502', 'ONZAGA'),
+    ('41503', 'OPORAPA', 'OPORAPA_41503', 'OPORAPA'),
+    ('86320', 'ORITO', 'ORITO_86320', 'ORITO'),
+    ('85230', 'OROCUÉ', 'OROCUE_85230', 'OROCUE'),
+    ('73504', 'ORTEGA', 'ORTEGA_73504', 'ORTEGA'),
+    ('52506', 'OSPINA', 'OSPINA_52506', 'OSPINA'),
+    ('15507', 'OTANCHE', 'OTANCHE_15507', 'OTANCHE'),
+    ('70508', 'OVEJAS', 'OVEJAS_70508', 'OVEJAS'),
+    ('15511', 'PACHAVITA', 'PACHAVITA_15511', 'PACHAVITA'),
+    ('25513', 'PACHO', 'PACHO_25513', 'PACHO'),
+    ('97511', 'PACOA', 'PACOA_97511', 'PACOA'),
+    ('17513', 'PÁCORA', 'PACORA_17513', 'PACORA'),
+    ('19513', 'PADILLA', 'PADILLA_19513', 'PADILLA'),
+    ('15514', 'PÁEZ (Boyacá)', 'PAEZ_BOYACA_15514', 'PAEZ_BOYACA'),
+    ('19517', 'PÁEZ (Cauca)', 'PAEZ_CAUCA_19517', 'PAEZ_CAUCA'),
+    ('41518', 'PAICOL', 'PAICOL_41518', 'PAICOL'),
+    ('20517', 'PAILITAS', 'PAILITAS_20517', 'PAILITAS'),
+    ('25518', 'PAIME', 'PAIME_25518', 'PAIME'),
+    ('15516', 'PAIPA', 'PAIPA_15516', 'PAIPA'),
+    ('15518', 'PAJARITO', 'PAJARITO_15518', 'PAJARITO'),
+    ('41524', 'PALERMO', 'PALERMO_41524', 'PALERMO'),
+    ('17524', 'PALESTINA (Caldas)', 'PALESTINA_CALDAS_17524', 'PALESTINA_CALDAS'),
+    ('41530', 'PALESTINA (Huila)', 'PALESTINA_HUILA_41530', 'PALESTINA_HUILA'),
+    ('68522', 'PALMAR', 'PALMAR_68522', 'PALMAR'),
+    ('08520', 'PALMAR DE VARELA', 'PALMAR_DE_VARELA_08520', 'PALMAR_DE_VARELA'),
+    ('68524', 'PALMAS DEL SOCORRO', 'PALMAS_DEL_SOCORRO_68524', 'PALMAS_DEL_SOCORRO'),
+    ('76520', 'PALMIRA', 'PALMIRA_76520', 'PALMIRA'),
+    ('70523', 'PALMITO', 'PALMITO_70523', 'PALMITO'),
+    ('73520', 'PALOCABILDO', 'PALOCABILDO_73520', 'PALOCABILDO'),
+    ('54518', 'PAMPLONA', 'PAMPLONA_54518', 'PAMPLONA'),
+    ('54520', 'PAMPLONITA', 'PAMPLONITA_54520', 'PAMPLONITA'),
+    ('94887', 'PANA PANA', 'PANA_PANA_94887', 'PANA_PANA'),
+    ('25524', 'PANDI', 'PANDI_25524', 'PANDI'),
+    ('15522', 'PANQUEBA', 'PANQUEBA_15522', 'PANQUEBA'),
+    ('97777', 'PAPUNAUA', 'PAPUNAUA_97777', 'PAPUNAUA'),
+    ('68533', 'PÁRAMO', 'PARAMO_68533', 'PARAMO'),
+    ('25530', 'PARATEBUENO', 'PARATEBUENO_25530', 'PARATEBUENO'),
+    ('25535', 'PASCA', 'PASCA_25535', 'PASCA'),
+    ('52001', 'PASTO', 'PASTO_52001', 'PASTO'),
+    ('19532', 'PATÍA', 'PATIA_19532', 'PATIA'),
+    ('15531', 'PAUNA', 'PAUNA_15531', 'PAUNA'),
+    ('15533', 'PAYA', 'PAYA_15533', 'PAYA'),
+    ('85250', 'PAZ DE ARIPORO', 'PAZ_DE_ARIPORO_85250', 'PAZ_DE_ARIPORO'),
+    ('15537', 'PAZ DE RÍO', 'PAZ_DE_RIO_15537', 'PAZ_DE_RIO'),
+    ('47541', 'PEDRAZA', 'PEDRAZA_47541', 'PEDRAZA'),
+    ('20550', 'PELAYA', 'PELAYA_20550', 'PELAYA'),
+    ('05541', 'PEÑOL', 'PENOL_05541', 'PENOL'),
+    ('17541', 'PENSILVANIA', 'PENSILVANIA_17541', 'PENSILVANIA'),
+    ('05543', 'PEQUE', 'PEQUE_05543', 'PEQUE'),
+    ('66001', 'PEREIRA', 'PEREIRA_66001', 'PEREIRA'),
+    ('15542', 'PESCA', 'PESCA_15542', 'PESCA'),
+    ('19533', 'PIAMONTE', 'PIAMONTE_19533', 'PIAMONTE'),
+    ('68547', 'PIEDECUESTA', 'PIEDECUESTA_68547', 'PIEDECUESTA'),
+    ('73547', 'PIEDRAS', 'PIEDRAS_73547', 'PIEDRAS'),
+    ('19548', 'PIENDAMÓ', 'PIENDAMO_19548', 'PIENDAMO'),
+    ('63548', 'PIJAO', 'PIJAO_63548', 'PIJAO'),
+    ('47545', 'PIJIÑO DEL CARMEN', 'PIJINO_DEL_CARMEN_47545', 'PIJINO_DEL_CARMEN'),
+    ('68549', 'PINCHOTE', 'PINCHOTE_68549', 'PINCHOTE'),
+    ('13549', 'PINILLOS', 'PINILLOS_13549', 'PINILLOS'),
+    ('08549', 'PIOJÓ', 'PIOJO_08549', 'PIOJO'),
+    ('15550', 'PISBA', 'PISBA_15550', 'PISBA'),
+    ('41548', 'PITAL', 'PITAL_41548', 'PITAL'),
+    ('41551', 'PITALITO', 'PITALITO_41551', 'PITALITO'),
+    ('47551', 'PIVIJAY', 'PIVIJAY_47551', 'PIVIJAY'),
+    ('73555', 'PLANADAS', 'PLANADAS_73555', 'PLANADAS'),
+    ('23555', 'PLANETA RICA', 'PLANETA_RICA_23555', 'PLANETA_RICA'),
+    ('47555', 'PLATO', 'PLATO_47555', 'PLATO'),
+    ('52540', 'POLICARPA', 'POLICARPA_52540', 'POLICARPA'),
+    ('08558', 'POLONUEVO', 'POLONUEVO_08558', 'POLONUEVO'),
+    ('08560', 'PONEDERA', 'PONEDERA_08560', 'PONEDERA'),
+    ('19001', 'POPAYÁN', 'POPAYAN_19001', 'POPAYAN'),
+    ('85263', 'PORE', 'PORE_85263', 'PORE'),
+    ('52560', 'POTOSÍ', 'POTOSI_52560', 'POTOSI'),
+    ('76563', 'PRADERA', 'PRADERA_76563', 'PRADERA'),
+    ('73563', 'PRADO', 'PRADO_73563', 'PRADO'),
+    ('88564', 'PROVIDENCIA (Archipiélago de San Andrés, Providencia y Santa Catalina)', 'PROVIDENCIA_ARCHIPIELAGO_DE_SAN_ANDRES_PROVIDENCIA_Y_SANTA_CATALINA_88564', 'PROVIDENCIA_ARCHIPIELAGO_DE_SAN_ANDRES_PROVIDENCIA_Y_SANTA_CATALINA'),
+    ('52565', 'PROVIDENCIA (Nariño)', 'PROVIDENCIA_NARINO_52565', 'PROVIDENCIA_NARINO'),
+    ('20570', 'PUEBLO BELLO', 'PUEBLO_BELLO_20570', 'PUEBLO_BELLO'),
+    ('23570', 'PUEBLO NUEVO', 'PUEBLO_NUEVO_23570', 'PUEBLO_NUEVO'),
+    ('66572', 'PUEBLO RICO', 'PUEBLO_RICO_66572', 'PUEBLO_RICO'),
+    ('05576', 'PUEBLORRICO', 'PUEBLORRICO_05576', 'PUEBLORRICO'),
+    ('47570', 'PUEBLOVIEJO', 'PUEBLOVIEJO_47570', 'PUEBLOVIEJO'),
+    ('68572', 'PUENTE NACIONAL', 'PUENTE_NACIONAL_68572', 'PUENTE_NACIONAL'),
+    ('52573', 'PUERRES', 'PUERRES_52573', 'PUERRES'),
+    ('91530', 'PUERTO ALEGRÍA', 'PUERTO_ALEGRIA_91530', 'PUERTO_ALEGRIA'),
+    ('91536', 'PUERTO ARICA', 'PUERTO_ARICA_91536', 'PUERTO_ARICA'),
+    ('86568', 'PUERTO ASÍS', 'PUERTO_ASIS_86568', 'PUERTO_ASIS'),
+    ('05579', 'PUERTO BERRÍO', 'PUERTO_BERRIO_05579', 'PUERTO_BERRIO'),
+    ('15572', 'PUERTO BOYACÁ', 'PUERTO_BOYACA_15572', 'PUERTO_BOYACA'),
+    ('86569', 'PUERTO CAICEDO', 'PUERTO_CAICEDO_86569', 'PUERTO_CAICEDO'),
+    ('99001', 'PUERTO CARREÑO', 'PUERTO_CARRENO_99001', 'PUERTO_CARRENO'),
+    ('08573', 'PUERTO COLOMBIA (Atlántico)', 'PUERTO_COLOMBIA_ATLANTICO_08573', 'PUERTO_COLOMBIA_ATLANTICO'),
+    ('94884', 'PUERTO COLOMBIA (Guainía)', 'PUERTO_COLOMBIA_GUAINIA_94884', 'PUERTO_COLOMBIA_GUAINIA'),
+    ('50450', 'PUERTO CONCORDIA', 'PUERTO_CONCORDIA_50450', 'PUERTO_CONCORDIA'),
+    ('23574', 'PUERTO ESCONDIDO', 'PUERTO_ESCONDIDO_23574', 'PUERTO_ESCONDIDO'),
+    ('50568', 'PUERTO GAITÁN', 'PUERTO_GAITAN_50568', 'PUERTO_GAITAN'),
+    ('86571', 'PUERTO GUZMÁN', 'PUERTO_GUZMAN_86571', 'PUERTO_GUZMAN'),
+    ('86573', 'PUERTO LEGUÍZAMO', 'PUERTO_LEGUIZAMO_86573', 'PUERTO_LEGUIZAMO'),
+    ('23580', 'PUERTO LIBERTADOR', 'PUERTO_LIBERTADOR_23580', 'PUERTO_LIBERTADOR'),
+    ('50577', 'PUERTO LLERAS', 'PUERTO_LLERAS_50577', 'PUERTO_LLERAS'),
+    ('50573', 'PUERTO LÓPEZ', 'PUERTO_LOPEZ_50573', 'PUERTO_LOPEZ'),
+    ('05585', 'PUERTO NARE', 'PUERTO_NARE_05585', 'PUERTO_NARE'),
+    ('91540', 'PUERTO NARIÑO', 'PUERTO_NARINO_91540', 'PUERTO_NARINO'),
+    ('68573', 'PUERTO PARRA', 'PUERTO_PARRA_68573', 'PUERTO_PARRA'),
+    ('18592', 'PUERTO RICO (Caquetá)', 'PUERTO_RICO_CAQUETA_18592', 'PUERTO_RICO_CAQUETA'),
+    ('50590', 'PUERTO RICO (Meta)', 'PUERTO_RICO_META_50590', 'PUERTO_RICO_META'),
+    ('81591', 'PUERTO RONDÓN', 'PUERTO_RONDON_81591', 'PUERTO_RONDON'),
+    ('25572', 'PUERTO SALGAR', 'PUERTO_SALGAR_25572', 'PUERTO_SALGAR'),
+    ('91669', 'PUERTO SANTANDER (Amazonas)', 'PUERTO_SANTANDER_AMAZONAS_91669', 'PUERTO_SANTANDER_AMAZONAS'),
+    ('54553', 'PUERTO SANTANDER (Norte de Santander)', 'PUERTO_SANTANDER_NORTE_DE_SANTANDER_54553', 'PUERTO_SANTANDER_NORTE_DE_SANTANDER'),
+    ('19573', 'PUERTO TEJADA', 'PUERTO_TEJADA_19573', 'PUERTO_TEJADA'),
+    ('05591', 'PUERTO TRIUNFO', 'PUERTO_TRIUNFO_05591', 'PUERTO_TRIUNFO'),
+    ('68575', 'PUERTO WILCHES', 'PUERTO_WILCHES_68575', 'PUERTO_WILCHES'),
+    ('25580', 'PULÍ', 'PULI_25580', 'PULI'),
+    ('52585', 'PUPIALES', 'PUPIALES_52585', 'PUPIALES'),
+    ('19585', 'PURACÉ', 'PURACE_19585', 'PURACE'),
+    ('73585', 'PURIFICACIÓN', 'PURIFICACION_73585', 'PURIFICACION'),
+    ('23586', 'PURÍSIMA DE LA CONCEPCIÓN', 'PURISIMA_DE_LA_CONCEPCION_23586', 'PURISIMA_DE_LA_CONCEPCION'),
+    ('25592', 'QUEBRADANEGRA', 'QUEBRADANEGRA_25592', 'QUEBRADANEGRA'),
+    ('25594', 'QUETAME', 'QUETAME_25594', 'QUETAME'),
+    ('27001', 'QUIBDÓ', 'QUIBDO_27001', 'QUIBDO'),
+    ('63594', 'QUIMBAYA', 'QUIMBAYA_63594', 'QUIMBAYA'),
+    ('66594', 'QUINCHÍA', 'QUINCHIA_66594', 'QUINCHIA'),
+    ('15580', 'QUÍPAMA', 'QUIPAMA_15580', 'QUIPAMA'),
+    ('25596', 'QUIPILE', 'QUIPILE_25596', 'QUIPILE'),
+    ('54599', 'RAGONVALIA', 'RAGONVALIA_54599', 'RAGONVALIA'),
+    ('15599', 'RAMIRIQUÍ', 'RAMIRIQUI_15599', 'RAMIRIQUI'),
+    ('15600', 'RÁQUIRA', 'RAQUIRA_15600', 'RAQUIRA'),
+    ('85279', 'RECETOR', 'RECETOR_85279', 'RECETOR'),
+    ('13580', 'REGIDOR', 'REGIDOR_13580', 'REGIDOR'),
+    ('05604', 'REMEDIOS', 'REMEDIOS_05604', 'REMEDIOS'),
+    ('47605', 'REMOLINO', 'REMOLINO_47605', 'REMOLINO'),
+    ('08606', 'REPELÓN', 'REPELON_08606', 'REPELON'),
+    ('50606', 'RESTREPO (Meta)', 'RESTREPO_META_50606', 'RESTREPO_META'),
+    ('76606', 'RESTREPO (Valle del Cauca)', 'RESTREPO_VALLE_DEL_CAUCA_76606', 'RESTREPO_VALLE_DEL_CAUCA'),
+    ('05607', 'RETIRO', 'RETIRO_05607', 'RETIRO'),
+    ('25612', 'RICAURTE (Cundinamarca)', 'RICAURTE_CUNDINAMARCA_25612', 'RICAURTE_CUNDINAMARCA'),
+    ('52612', 'RICAURTE (Nariño)', 'RICAURTE_NARINO_52612', 'RICAURTE_NARINO'),
+    ('20614', 'RÍO DE ORO', 'RIO_DE_ORO_20614', 'RIO_DE_ORO'),
+    ('27580', 'RÍO IRÓ', 'RIO_IRO_27580', 'RIO_IRO'),
+    ('27600', 'RÍO QUITO', 'RIO_QUITO_27600', 'RIO_QUITO'),
+    ('13600', 'RÍO VIEJO', 'RIO_VIEJO_13600', 'RIO_VIEJO'),
+    ('73616', 'RIOBLANCO', 'RIOBLANCO_73616', 'RIOBLANCO'),
+    ('76616', 'RIOFRÍO', 'RIOFRIO_76616', 'RIOFRIO'),
+    ('44001', 'RIOHACHA', 'RIOHACHA_44001', 'RIOHACHA'),
+    ('05615', 'RIONEGRO (Antioquia)', 'RIONEGRO_ANTIOQUIA_05615', 'RIONEGRO_ANTIOQUIA'),
+    ('68615', 'RIONEGRO (Santander)', 'RIONEGRO_SANTANDER_68615', 'RIONEGRO_SANTANDER'),
+    ('17614', 'RIOSUCIO (Caldas)', 'RIOSUCIO_CALDAS_17614', 'RIOSUCIO_CALDAS'),
+    ('27615', 'RIOSUCIO (Chocó)', 'RIOSUCIO_CHOCO_27615', 'RIOSUCIO_CHOCO'),
+    ('17616', 'RISARALDA', 'RISARALDA_17616', 'RISARALDA'),
+    ('41615', 'RIVERA', 'RIVERA_41615', 'RIVERA'),
+    ('52621', 'ROBERTO PAYÁN', 'ROBERTO_PAYAN_52621', 'ROBERTO_PAYAN'),
+    ('76622', 'ROLDANILLO', 'ROLDANILLO_76622', 'ROLDANILLO'),
+    ('73622', 'RONCESVALLES', 'RONCESVALLES_73622', 'RONCESVALLES'),
+    ('15621', 'RONDÓN', 'RONDON_15621', 'RONDON'),
+    ('19622', 'ROSAS', 'ROSAS_19622', 'ROSAS'),
+    ('73624', 'ROVIRA', 'ROVIRA_73624', 'ROVIRA'),
+    ('68655', 'SABANA DE TORRES', 'SABANA_DE_TORRES_68655', 'SABANA_DE_TORRES'),
+    ('08634', 'SABANAGRANDE', 'SABANAGRANDE_08634', 'SABANAGRANDE'),
+    ('05628', 'SABANALARGA (Antioquia)', 'SABANALARGA_ANTIOQUIA_05628', 'SABANALARGA_ANTIOQUIA'),
+    ('08638', 'SABANALARGA (Atlántico)', 'SABANALARGA_ATLANTICO_08638', 'SABANALARGA_ATLANTICO'),
+    ('85300', 'SABANALARGA (Casanare)', 'SABANALARGA_CASANARE_85300', 'SABANALARGA_CASANARE'),
+    ('47660', 'SABANAS DE SAN ÁNGEL', 'SABANAS_DE_SAN_ANGEL_47660', 'SABANAS_DE_SAN_ANGEL'),
+    ('05631', 'SABANETA', 'SABANETA_05631', 'SABANETA'),
+    ('15632', 'SABOYÁ', 'SABOYA_15632', 'SABOYA'),
+    ('85315', 'SÁCAMA', 'SACAMA_85315', 'SACAMA'),
+    ('15638', 'SÁCHICA', 'SACHICA_15638', 'SACHICA'),
+    ('23660', 'SAHAGÚN', 'SAHAGUN_23660', 'SAHAGUN'),
+    ('41660', 'SALADOBLANCO', 'SALADOBLANCO_41660', 'SALADOBLANCO'),
+    ('17653', 'SALAMINA (Caldas)', 'SALAMINA_CALDAS_17653', 'SALAMINA_CALDAS'),
+    ('47675', 'SALAMINA (Magdalena)', 'SALAMINA_MAGDALENA_47675', 'SALAMINA_MAGDALENA'),
+    ('54660', 'SALAZAR', 'SALAZAR_54660', 'SALAZAR'),
+    ('73671', 'SALDAÑA', 'SALDANA_73671', 'SALDANA'),
+    ('63690', 'SALENTO', 'SALENTO_63690', 'SALENTO'),
+    ('05642', 'SALGAR', 'SALGAR_05642', 'SALGAR'),
+    ('15646', 'SAMACÁ', 'SAMACA_15646', 'SAMACA'),
+    ('17662', 'SAMANÁ', 'SAMANA_17662', 'SAMANA'),
+    ('52678', 'SAMANIEGO', 'SAMANIEGO_52678', 'SAMANIEGO'),
+    ('70670', 'SAMPUÉS', 'SAMPUES_70670', 'SAMPUES'),
+    ('41668', 'SAN AGUSTÍN', 'SAN_AGUSTIN_41668', 'SAN_AGUSTIN'),
+    ('20710', 'SAN ALBERTO', 'SAN_ALBERTO_20710', 'SAN_ALBERTO'),
+    ('88001', 'SAN ANDRÉS (Archipiélago de San Andrés, Providencia y Santa Catalina)', 'SAN_ANDRES_ARCHIPIELAGO_DE_SAN_ANDRES_PROVIDENCIA_Y_SANTA_CATALINA_88001', 'SAN_ANDRES_ARCHIPIELAGO_DE_SAN_ANDRES_PROVIDENCIA_Y_SANTA_CATALINA'),
+    ('68669', 'SAN ANDRÉS (Santander)', 'SAN_ANDRES_SANTANDER_68669', 'SAN_ANDRES_SANTANDER'),
+    ('05647', 'SAN ANDRÉS DE CUERQUÍA', 'SAN_ANDRES_DE_CUERQUIA_05647', 'SAN_ANDRES_DE_CUERQUIA'),
+    ('23670', 'SAN ANDRÉS DE SOTAVENTO', 'SAN_ANDRES_DE_SOTAVENTO_23670', 'SAN_ANDRES_DE_SOTAVENTO'),
+    ('52835', 'SAN ANDRÉS DE TUMACO', 'SAN_ANDRES_DE_TUMACO_52835', 'SAN_ANDRES_DE_TUMACO'),
+    ('23672', 'SAN ANTERO', 'SAN_ANTERO_23672', 'SAN_ANTERO'),
+    ('73675', 'SAN ANTONIO', 'SAN_ANTONIO_73675', 'SAN_ANTONIO'),
+    ('25645', 'SAN ANTONIO DEL TEQUENDAMA', 'SAN_ANTONIO_DEL_TEQUENDAMA_25645', 'SAN_ANTONIO_DEL_TEQUENDAMA'),
+    ('68673', 'SAN BENITO', 'SAN_BENITO_68673', 'SAN_BENITO'),
+    ('70678', 'SAN BENITO ABAD', 'SAN_BENITO_ABAD_70678', 'SAN_BENITO_ABAD'),
+    ('25649', 'SAN BERNARDO (Cundinamarca)', 'SAN_BERNARDO_CUNDINAMARCA_25649', 'SAN_BERNARDO_CUNDINAMARCA'),
+    ('52685', 'SAN BERNARDO (Nariño)', 'SAN_BERNARDO_NARINO_52685', 'SAN_BERNARDO_NARINO'),
+    ('23675', 'SAN BERNARDO DEL VIENTO', 'SAN_BERNARDO_DEL_VIENTO_23675', 'SAN_BERNARDO_DEL_VIENTO'),
+    ('54670', 'SAN CALIXTO', 'SAN_CALIXTO_54670', 'SAN_CALIXTO'),
+    ('05649', 'SAN CARLOS (Antioquia)', 'SAN_CARLOS_ANTIOQUIA_05649', 'SAN_CARLOS_ANTIOQUIA'),
+    ('23678', 'SAN CARLOS (Córdoba)', 'SAN_CARLOS_CORDOBA_23678', 'SAN_CARLOS_CORDOBA'),
+    ('50680', 'SAN CARLOS DE GUAROA', 'SAN_CARLOS_DE_GUAROA_50680', 'SAN_CARLOS_DE_GUAROA'),
+    ('25653', 'SAN CAYETANO (Cundinamarca)', 'SAN_CAYETANO_CUNDINAMARCA_25653', 'SAN_CAYETANO_CUNDINAMARCA'),
+    ('54673', 'SAN CAYETANO (Norte de Santander)', 'SAN_CAYETANO_NORTE_DE_SANTANDER_54673', 'SAN_CAYETANO_NORTE_DE_SANTANDER'),
+    ('13620', 'SAN CRISTÓBAL', 'SAN_CRISTOBAL_13620', 'SAN_CRISTOBAL'),
+    ('20750', 'SAN DIEGO', 'SAN_DIEGO_20750', 'SAN_DIEGO'),
+    ('15660', 'SAN EDUARDO', 'SAN_EDUARDO_15660', 'SAN_EDUARDO'),
+    ('13647', 'SAN ESTANISLAO', 'SAN_ESTANISLAO_13647', 'SAN_ESTANISLAO'),
+    ('94883', 'SAN FELIPE', 'SAN_FELIPE_94883', 'SAN_FELIPE'),
+    ('13650', 'SAN FERNANDO', 'SAN_FERNANDO_13650', 'SAN_FERNANDO'),
+    ('05652', 'SAN FRANCISCO (Antioquia)', 'SAN_FRANCISCO_ANTIOQUIA_05652', 'SAN_FRANCISCO_ANTIOQUIA'),
+    ('25658', 'SAN FRANCISCO (Cundinamarca)', 'SAN_FRANCISCO_CUNDINAMARCA_25658', 'SAN_FRANCISCO_CUNDINAMARCA'),
+    ('86755', 'SAN FRANCISCO (Putumayo)', 'SAN_FRANCISCO_PUTUMAYO_86755', 'SAN_FRANCISCO_PUTUMAYO'),
+    ('68679', 'SAN GIL', 'SAN_GIL_68679', 'SAN_GIL'),
+    ('13654', 'SAN JACINTO', 'SAN_JACINTO_13654', 'SAN_JACINTO'),
+    ('13655', 'SAN JACINTO DEL CAUCA', 'SAN_JACINTO_DEL_CAUCA_13655', 'SAN_JACINTO_DEL_CAUCA'),
+    ('05656', 'SAN JERÓNIMO', 'SAN_JERONIMO_05656', 'SAN_JERONIMO'),
+    ('68682', 'SAN JOAQUÍN', 'SAN_JOAQUIN_68682', 'SAN_JOAQUIN'),
+    ('17665', 'SAN JOSÉ', 'SAN_JOSE_17665', 'SAN_JOSE'),
+    ('05658', 'SAN JOSÉ DE LA MONTAÑA', 'SAN_JOSE_DE_LA_MONTANA_05658', 'SAN_JOSE_DE_LA_MONTANA'),
+    ('68684', 'SAN JOSÉ DE MIRANDA', 'SAN_JOSE_DE_MIRANDA_68684', 'SAN_JOSE_DE_MIRANDA'),
+    ('15664', 'SAN JOSÉ DE PARE', 'SAN_JOSE_DE_PARE_15664', 'SAN_JOSE_DE_PARE'),
+    ('23682', 'SAN JOSÉ DE URÉ', 'SAN_JOSE_DE_URE_23682', 'SAN_JOSE_DE_URE'),
+    ('18610', 'SAN JOSÉ DEL FRAGUA', 'SAN_JOSE_DEL_FRAGUA_18610', 'SAN_JOSE_DEL_FRAGUA'),
+    ('95001', 'SAN JOSÉ DEL GUAVIARE', 'SAN_JOSE_DEL_GUAVIARE_95001', 'SAN_JOSE_DEL_GUAVIARE'),
+    ('27660', 'SAN JOSÉ DEL PALMAR', 'SAN_JOSE_DEL_PALMAR_27660', 'SAN_JOSE_DEL_PALMAR'),
+    ('50683', 'SAN JUAN DE ARAMA', 'SAN_JUAN_DE_ARAMA_50683', 'SAN_JUAN_DE_ARAMA'),
+    ('70702', 'SAN JUAN DE BETULIA', 'SAN_JUAN_DE_BETULIA_70702', 'SAN_JUAN_DE_BETULIA'),
+    ('25662', 'SAN JUAN DE RIOSECO', 'SAN_JUAN_DE_RIOSECO_25662', 'SAN_JUAN_DE_RIOSECO'),
+    ('05659', 'SAN JUAN DE URABÁ', 'SAN_JUAN_DE_URABA_05659', 'SAN_JUAN_DE_URABA'),
+    ('44650', 'SAN JUAN DEL CESAR', 'SAN_JUAN_DEL_CESAR_44650', 'SAN_JUAN_DEL_CESAR'),
+    ('13657', 'SAN JUAN NEPOMUCENO', 'SAN_JUAN_NEPOMUCENO_13657', 'SAN_JUAN_NEPOMUCENO'),
+    ('50686', 'SAN JUANITO', 'SAN_JUANITO_50686', 'SAN_JUANITO'),
+    ('52687', 'SAN LORENZO', 'SAN_LORENZO_52687', 'SAN_LORENZO'),
+    ('05660', 'SAN LUIS (Antioquia)', 'SAN_LUIS_ANTIOQUIA_05660', 'SAN_LUIS_ANTIOQUIA'),
+    ('73678', 'SAN LUIS (Tolima)', 'SAN_LUIS_TOLIMA_73678', 'SAN_LUIS_TOLIMA'),
+    ('15667', 'SAN LUIS DE GACENO', 'SAN_LUIS_DE_GACENO_15667', 'SAN_LUIS_DE_GACENO'),
+    ('85325', 'SAN LUIS DE PALENQUE', 'SAN_LUIS_DE_PALENQUE_85325', 'SAN_LUIS_DE_PALENQUE'),
+    ('70742', 'SAN LUIS DE SINCÉ', 'SAN_LUIS_DE_SINCE_70742', 'SAN_LUIS_DE_SINCE'),
+    ('70708', 'SAN MARCOS', 'SAN_MARCOS_70708', 'SAN_MARCOS'),
+    ('20770', 'SAN MARTÍN (Cesar)', 'SAN_MARTIN_CESAR_20770', 'SAN_MARTIN_CESAR'),
+    ('50689', 'SAN MARTÍN (Meta)', 'SAN_MARTIN_META_50689', 'SAN_MARTIN_META'),
+    ('13667', 'SAN MARTÍN DE LOBA', 'SAN_MARTIN_DE_LOBA_13667', 'SAN_MARTIN_DE_LOBA'),
+    ('15673', 'SAN MATEO', 'SAN_MATEO_15673', 'SAN_MATEO'),
+    ('86757', 'SAN MIGUEL (Putumayo)', 'SAN_MIGUEL_PUTUMAYO_86757', 'SAN_MIGUEL_PUTUMAYO'),
+    ('68686', 'SAN MIGUEL (Santander)', 'SAN_MIGUEL_SANTANDER_68686', 'SAN_MIGUEL_SANTANDER'),
+    ('15676', 'SAN MIGUEL DE SEMA', 'SAN_MIGUEL_DE_SEMA_15676', 'SAN_MIGUEL_DE_SEMA'),
+    ('70713', 'SAN ONOFRE', 'SAN_ONOFRE_70713', 'SAN_ONOFRE'),
+    ('13670', 'SAN PABLO (Bolívar)', 'SAN_PABLO_BOLIVAR_13670', 'SAN_PABLO_BOLIVAR'),
+    ('52693', 'SAN PABLO (Nariño)', 'SAN_PABLO_NARINO_52693', 'SAN_PABLO_NARINO'),
+    ('15681', 'SAN PABLO DE BORBUR', 'SAN_PABLO_DE_BORBUR_15681', 'SAN_PABLO_DE_BORBUR'),
+    ('70717', 'SAN PEDRO (Sucre)', 'SAN_PEDRO_SUCRE_70717', 'SAN_PEDRO_SUCRE'),
+    ('76670', 'SAN PEDRO (Valle del Cauca)', 'SAN_PEDRO_VALLE_DEL_CAUCA_76670', 'SAN_PEDRO_VALLE_DEL_CAUCA'),
+    ('52694', 'SAN PEDRO DE CARTAGO', 'SAN_PEDRO_DE_CARTAGO_52694', 'SAN_PEDRO_DE_CARTAGO'),
+    ('05664', 'SAN PEDRO DE LOS MILAGROS', 'SAN_PEDRO_DE_LOS_MILAGROS_05664', 'SAN_PEDRO_DE_LOS_MILAGROS'),
+    ('05665', 'SAN PEDRO DE URABÁ', 'SAN_PEDRO_DE_URABA_05665', 'SAN_PEDRO_DE_URABA'),
+    ('23686', 'SAN PELAYO', 'SAN_PELAYO_23686', 'SAN_PELAYO'),
+    ('05667', 'SAN RAFAEL', 'SAN_RAFAEL_05667', 'SAN_RAFAEL'),
+    ('05670', 'SAN ROQUE', 'SAN_ROQUE_05670', 'SAN_ROQUE'),
+    ('19693', 'SAN SEBASTIÁN', 'SAN_SEBASTIAN_19693', 'SAN_SEBASTIAN'),
+    ('47692', 'SAN SEBASTIÁN DE BUENAVISTA', 'SAN_SEBASTIAN_DE_BUENAVISTA_47692', 'SAN_SEBASTIAN_DE_BUENAVISTA'),
+    ('73443', 'SAN SEBASTIÁN DE MARIQUITA', 'SAN_SEBASTIAN_DE_MARIQUITA_73443', 'SAN_SEBASTIAN_DE_MARIQUITA'),
+    ('68689', 'SAN VICENTE DE CHUCURÍ', 'SAN_VICENTE_DE_CHUCURI_68689', 'SAN_VICENTE_DE_CHUCURI'),
+    ('18753', 'SAN VICENTE DEL CAGUÁN', 'SAN_VICENTE_DEL_CAGUAN_18753', 'SAN_VICENTE_DEL_CAGUAN'),
+    ('05674', 'SAN VICENTE FERRER', 'SAN_VICENTE_FERRER_05674', 'SAN_VICENTE_FERRER'),
+    ('47703', 'SAN ZENÓN', 'SAN_ZENON_47703', 'SAN_ZENON'),
+    ('52683', 'SANDONÁ', 'SANDONA_52683', 'SANDONA'),
+    ('47707', 'SANTA ANA', 'SANTA_ANA_47707', 'SANTA_ANA'),
+    ('05679', 'SANTA BÁRBARA (Antioquia)', 'SANTA_BARBARA_ANTIOQUIA_05679', 'SANTA_BARBARA_ANTIOQUIA'),
+    ('52696', 'SANTA BÁRBARA (Nariño)', 'SANTA_BARBARA_NARINO_52696', 'SANTA_BARBARA_NARINO'),
+    ('68705', 'SANTA BÁRBARA (Santander)', 'SANTA_BARBARA_SANTANDER_68705', 'SANTA_BARBARA_SANTANDER'),
+    ('47720', 'SANTA BÁRBARA DE PINTO', 'SANTA_BARBARA_DE_PINTO_47720', 'SANTA_BARBARA_DE_PINTO'),
+    ('13673', 'SANTA CATALINA', 'SANTA_CATALINA_13673', 'SANTA_CATALINA'),
+    ('05042', 'SANTA FÉ DE ANTIOQUIA', 'SANTA_FE_DE_ANTIOQUIA_05042', 'SANTA_FE_DE_ANTIOQUIA'),
+    ('68720', 'SANTA HELENA DEL OPÓN', 'SANTA_HELENA_DEL_OPON_68720', 'SANTA_HELENA_DEL_OPON'),
+    ('73686', 'SANTA ISABEL', 'SANTA_ISABEL_73686', 'SANTA_ISABEL'),
+    ('08675', 'SANTA LUCÍA', 'SANTA_LUCIA_08675', 'SANTA_LUCIA'),
+    ('15690', 'SANTA MARÍA (Boyacá)', 'SANTA_MARIA_BOYACA_15690', 'SANTA_MARIA_BOYACA'),
+    ('41676', 'SANTA MARÍA (Huila)', 'SANTA_MARIA_HUILA_41676', 'SANTA_MARIA_HUILA'),
+    ('47001', 'SANTA MARTA', 'SANTA_MARTA_47001', 'SANTA_MARTA'),
+    ('13683', 'SANTA ROSA (Bolívar)', 'SANTA_ROSA_BOLIVAR_13683', 'SANTA_ROSA_BOLIVAR'),
+    ('19701', 'SANTA ROSA (Cauca)', 'SANTA_ROSA_CAUCA_19701', 'SANTA_ROSA_CAUCA'),
+    ('66682', 'SANTA ROSA DE CABAL', 'SANTA_ROSA_DE_CABAL_66682', 'SANTA_ROSA_DE_CABAL'),
+    ('05686', 'SANTA ROSA DE OSOS', 'SANTA_ROSA_DE_OSOS_05686', 'SANTA_ROSA_DE_OSOS'),
+    ('15693', 'SANTA ROSA DE VITERBO', 'SANTA_ROSA_DE_VITERBO_15693', 'SANTA_ROSA_DE_VITERBO'),
+    ('13688', 'SANTA ROSA DEL SUR', 'SANTA_ROSA_DEL_SUR_13688', 'SANTA_ROSA_DEL_SUR'),
+    ('99624', 'SANTA ROSALÍA', 'SANTA_ROSALIA_99624', 'SANTA_ROSALIA'),
+    ('15696', 'SANTA SOFÍA', 'SANTA_SOFIA_15696', 'SANTA_SOFIA'),
+    ('52699', 'SANTACRUZ', 'SANTACRUZ_52699', 'SANTACRUZ'),
+    ('15686', 'SANTANA', 'SANTANA_15686', 'SANTANA'),
+    ('19698', 'SANTANDER DE QUILICHAO', 'SANTANDER_DE_QUILICHAO_19698', 'SANTANDER_DE_QUILICHAO'),
+    ('54680', 'SANTIAGO (Norte de Santander)', 'SANTIAGO_NORTE_DE_SANTANDER_54680', 'SANTIAGO_NORTE_DE_SANTANDER'),
+    ('86760', 'SANTIAGO (Putumayo)', 'SANTIAGO_PUTUMAYO_86760', 'SANTIAGO_PUTUMAYO'),
+    ('70820', 'SANTIAGO DE TOLÚ', 'SANTIAGO_DE_TOLU_70820', 'SANTIAGO_DE_TOLU'),
+    ('05690', 'SANTO DOMINGO', 'SANTO_DOMINGO_05690', 'SANTO_DOMINGO'),
+    ('08685', 'SANTO TOMÁS', 'SANTO_TOMAS_08685', 'SANTO_TOMAS'),
+    ('66687', 'SANTUARIO', 'SANTUARIO_66687', 'SANTUARIO'),
+    ('52720', 'SAPUYES', 'SAPUYES_52720', 'SAPUYES'),
+    ('81736', 'SARAVENA', 'SARAVENA_81736', 'SARAVENA'),
+    ('54720', 'SARDINATA', 'SARDINATA_54720', 'SARDINATA'),
+    ('25718', 'SASAIMA', 'SASAIMA_25718', 'SASAIMA'),
+    ('15720', 'SATIVANORTE', 'SATIVANORTE_15720', 'SATIVANORTE'),
+    ('15723', 'SATIVASUR', 'SATIVASUR_15723', 'SATIVASUR'),
+    ('05736', 'SEGOVIA', 'SEGOVIA_05736', 'SEGOVIA'),
+    ('25736', 'SESQUILÉ', 'SESQUILE_25736', 'SESQUILE'),
+    ('76736', 'SEVILLA', 'SEVILLA_76736', 'SEVILLA'),
+    ('15740', 'SIACHOQUE', 'SIACHOQUE_15740', 'SIACHOQUE'),
+    ('25740', 'SIBATÉ', 'SIBATE_25740', 'SIBATE'),
+    ('86749', 'SIBUNDOY', 'SIBUNDOY_86749', 'SIBUNDOY'),
+    ('54743', 'SILOS', 'SILOS_54743', 'SILOS'),
+    ('25743', 'SILVANIA', 'SILVANIA_25743', 'SILVANIA'),
+    ('19743', 'SILVIA', 'SILVIA_19743', 'SILVIA'),
+    ('68745', 'SIMACOTA', 'SIMACOTA_68745', 'SIMACOTA'),
+    ('25745', 'SIMIJACA', 'SIMIJACA_25745', 'SIMIJACA'),
+    ('13744', 'SIMITÍ', 'SIMITI_13744', 'SIMITI'),
+    ('70001', 'SINCELEJO', 'SINCELEJO_70001', 'SINCELEJO'),
+    ('27745', 'SIPÍ', 'SIPI_27745', 'SIPI'),
+    ('47745', 'SITIONUEVO', 'SITIONUEVO_47745', 'SITIONUEVO'),
+    ('25754', 'SOACHA', 'SOACHA_25754', 'SOACHA'),
+    ('15753', 'SOATÁ', 'SOATA_15753', 'SOATA'),
+    ('15757', 'SOCHA', 'SOCHA_15757', 'SOCHA'),
+    ('68755', 'SOCORRO', 'SOCORRO_68755', 'SOCORRO'),
+    ('15755', 'SOCOTÁ', 'SOCOTA_15755', 'SOCOTA'),
+    ('15759', 'SOGAMOSO', 'SOGAMOSO_15759', 'SOGAMOSO'),
+    ('18756', 'SOLANO', 'SOLANO_18756', 'SOLANO'),
+    ('08758', 'SOLEDAD', 'SOLEDAD_08758', 'SOLEDAD'),
+    ('18785', 'SOLITA', 'SOLITA_18785', 'SOLITA'),
+    ('15761', 'SOMONDOCO', 'SOMONDOCO_15761', 'SOMONDOCO'),
+    ('05756', 'SONSÓN', 'SONSON_05756', 'SONSON'),
+    ('05761', 'SOPETRÁN', 'SOPETRAN_05761', 'SOPETRAN'),
+    ('13760', 'SOPLAVIENTO', 'SOPLAVIENTO_13760', 'SOPLAVIENTO'),
+    ('25758', 'SOPÓ', 'SOPO_25758', 'SOPO'),
+    ('15762', 'SORA', 'SORA_15762', 'SORA'),
+    ('15764', 'SORACÁ', 'SORACA_15764', 'SORACA'),
+    ('15763', 'SOTAQUIRÁ', 'SOTAQUIRA_15763', 'SOTAQUIRA'),
+    ('19760', 'SOTARA', 'SOTARA_19760', 'SOTARA'),
+    ('68770', 'SUAITA', 'SUAITA_68770', 'SUAITA'),
+    ('08770', 'SUAN', 'SUAN_08770', 'SUAN'),
+    ('19780', 'SUÁREZ (Cauca)', 'SUAREZ_CAUCA_19780', 'SUAREZ_CAUCA'),
+    ('73770', 'SUÁREZ (Tolima)', 'SUAREZ_TOLIMA_73770', 'SUAREZ_TOLIMA'),
+    ('41770', 'SUAZA', 'SUAZA_41770', 'SUAZA'),
+    ('25769', 'SUBACHOQUE', 'SUBACHOQUE_25769', 'SUBACHOQUE'),
+    ('19785', 'SUCRE (Cauca)', 'SUCRE_CAUCA_19785', 'SUCRE_CAUCA'),
+    ('68773', 'SUCRE (Santander)', 'SUCRE_SANTANDER_68773', 'SUCRE_SANTANDER'),
+    ('70771', 'SUCRE (Sucre)', 'SUCRE_SUCRE_70771', 'SUCRE_SUCRE'),
+    ('25772', 'SUESCA', 'SUESCA_25772', 'SUESCA'),
+    ('25777', 'SUPATÁ', 'SUPATA_25777', 'SUPATA'),
+    ('17777', 'SUPÍA', 'SUPIA_17777', 'SUPIA'),
+    ('68780', 'SURATÁ', 'SURATA_68780', 'SURATA'),
+    ('25779', 'SUSA', 'SUSA_25779', 'SUSA'),
+    ('15774', 'SUSACÓN', 'SUSACON_15774', 'SUSACON'),
+    ('15776', 'SUTAMARCHÁN', 'SUTAMARCHAN_15776', 'SUTAMARCHAN'),
+    ('25781', 'SUTATAUSA', 'SUTATAUSA_25781', 'SUTATAUSA'),
+    ('15778', 'SUTATENZA', 'SUTATENZA_15778', 'SUTATENZA'),
+    ('25785', 'TABIO', 'TABIO_25785', 'TABIO'),
+    ('27787', 'TADÓ', 'TADO_27787', 'TADO'),
+    ('13780', 'TALAIGUA NUEVO', 'TALAIGUA_NUEVO_13780', 'TALAIGUA_NUEVO'),
+    ('20787', 'TAMALAMEQUE', 'TAMALAMEQUE_20787', 'TAMALAMEQUE'),
+    ('85400', 'TÁMARA', 'TAMARA_85400', 'TAMARA'),
+    ('81794', 'TAME', 'TAME_81794', 'TAME'),
+    ('05789', 'TÁMESIS', 'TAMESIS_05789', 'TAMESIS'),
+    ('52786', 'TAMINANGO', 'TAMINANGO_52786', 'TAMINANGO'),
+    ('52788', 'TANGUA', 'TANGUA_52788', 'TANGUA'),
+    ('97666', 'TARAIRA', 'TARAIRA_97666', 'TARAIRA'),
+    ('91798', 'TARAPACÁ', 'TARAPACA_91798', 'TARAPACA'),
+    ('05790', 'TARAZÁ', 'TARAZA_05790', 'TARAZA'),
+    ('41791', 'TARQUI', 'TARQUI_41791', 'TARQUI'),
+    ('05792', 'TARSO', 'TARSO_05792', 'TARSO'),
+    ('15790', 'TASCO', 'TASCO_15790', 'TASCO'),
+    ('85410', 'TAURAMENA', 'TAURAMENA_85410', 'TAURAMENA'),
+    ('25793', 'TAUSA', 'TAUSA_25793', 'TAUSA'),
+    ('41799', 'TELLO', 'TELLO_41799', 'TELLO'),
+    ('25797', 'TENA', 'TENA_25797', 'TENA'),
+    ('47798', 'TENERIFE', 'TENERIFE_47798', 'TENERIFE'),
+    ('25799', 'TENJO', 'TENJO_25799', 'TENJO'),
+    ('15798', 'TENZA', 'TENZA_15798', 'TENZA'),
+    ('54800', 'TEORAMA', 'TEORAMA_54800', 'TEORAMA'),
+    ('41801', 'TERUEL', 'TERUEL_41801', 'TERUEL'),
+    ('41797', 'TESALIA', 'TESALIA_41797', 'TESALIA'),
+    ('25805', 'TIBACUY', 'TIBACUY_25805', 'TIBACUY'),
+    ('15804', 'TIBANÁ', 'TIBANA_15804', 'TIBANA'),
+    ('15806', 'TIBASOSA', 'TIBASOSA_15806', 'TIBASOSA'),
+    ('25807', 'TIBIRITA', 'TIBIRITA_25807', 'TIBIRITA'),
+    ('54810', 'TIBÚ', 'TIBU_54810', 'TIBU'),
+    ('23807', 'TIERRALTA', 'TIERRALTA_23807', 'TIERRALTA'),
+    ('41807', 'TIMANÁ', 'TIMANA_41807', 'TIMANA'),
+    ('19807', 'TIMBÍO', 'TIMBIO_19807', 'TIMBIO'),
+    ('19809', 'TIMBIQUÍ', 'TIMBIQUI_19809', 'TIMBIQUI'),
+    ('15808', 'TINJACÁ', 'TINJACA_15808', 'TINJACA'),
+    ('15810', 'TIPACOQUE', 'TIPACOQUE_15810', 'TIPACOQUE'),
+    ('13810', 'TIQUISIO', 'TIQUISIO_13810', 'TIQUISIO'),
+    ('05809', 'TITIRIBÍ', 'TITIRIBI_05809', 'TITIRIBI'),
+    ('15814', 'TOCA', 'TOCA_15814', 'TOCA'),
+    ('25815', 'TOCAIMA', 'TOCAIMA_25815', 'TOCAIMA'),
+    ('25817', 'TOCANCIPÁ', 'TOCANCIPA_25817', 'TOCANCIPA'),
+    ('15816', 'TOGÜÍ', 'TOGUI_15816', 'TOGUI'),
+    ('05819', 'TOLEDO (Antioquia)', 'TOLEDO_ANTIOQUIA_05819', 'TOLEDO_ANTIOQUIA'),
+    ('54820', 'TOLEDO (Norte de Santander)', 'TOLEDO_NORTE_DE_SANTANDER_54820', 'TOLEDO_NORTE_DE_SANTANDER'),
+    ('70823', 'TOLÚ VIEJO', 'TOLU_VIEJO_70823', 'TOLU_VIEJO'),
+    ('68820', 'TONA', 'TONA_68820', 'TONA'),
+    ('15820', 'TÓPAGA', 'TOPAGA_15820', 'TOPAGA'),
+    ('25823', 'TOPAIPÍ', 'TOPAIPI_25823', 'TOPAIPI'),
+    ('19821', 'TORIBÍO', 'TORIBIO_19821', 'TORIBIO'),
+    ('76823', 'TORO', 'TORO_76823', 'TORO'),
+    ('15822', 'TOTA', 'TOTA_15822', 'TOTA'),
+    ('19824', 'TOTORÓ', 'TOTORO_19824', 'TOTORO'),
+    ('85430', 'TRINIDAD', 'TRINIDAD_85430', 'TRINIDAD'),
+    ('76828', 'TRUJILLO', 'TRUJILLO_76828', 'TRUJILLO'),
+    ('08832', 'TUBARÁ', 'TUBARA_08832', 'TUBARA'),
+    ('23815', 'TUCHÍN', 'TUCHIN_23815', 'TUCHIN'),
+    ('76834', 'TULUÁ', 'TULUA_76834', 'TULUA'),
+    ('15001', 'TUNJA', 'TUNJA_15001', 'TUNJA'),
+    ('15832', 'TUNUNGUÁ', 'TUNUNGUA_15832', 'TUNUNGUA'),
+    ('52838', 'TÚQUERRES', 'TUQUERRES_52838', 'TUQUERRES'),
+    ('13836', 'TURBACO', 'TURBACO_13836', 'TURBACO'),
+    ('13838', 'TURBANÁ', 'TURBANA_13838', 'TURBANA'),
+    ('05837', 'TURBO', 'TURBO_05837', 'TURBO'),
+    ('15835', 'TURMEQUÉ', 'TURMEQUE_15835', 'TURMEQUE'),
+    ('15837', 'TUTA', 'TUTA_15837', 'TUTA'),
+    ('15839', 'TUTAZÁ', 'TUTAZA_15839', 'TUTAZA'),
+    ('25839', 'UBALÁ', 'UBALA_25839', 'UBALA'),
+    ('25841', 'UBAQUE', 'UBAQUE_25841', 'UBAQUE'),
+    ('76845', 'ULLOA', 'ULLOA_76845', 'ULLOA'),
+    ('15842', 'ÚMBITA', 'UMBITA_15842', 'UMBITA'),
+    ('25845', 'UNE', 'UNE_25845', 'UNE'),
+    ('27800', 'UNGUÍA', 'UNGUIA_27800', 'UNGUIA'),
+    ('27810', 'UNIÓN PANAMERICANA', 'UNION_PANAMERICANA_27810', 'UNION_PANAMERICANA'),
+    ('05842', 'URAMITA', 'URAMITA_05842', 'URAMITA'),
+    ('50370', 'URIBE', 'URIBE_50370', 'URIBE'),
+    ('44847', 'URIBIA', 'URIBIA_44847', 'URIBIA'),
+    ('05847', 'URRAO', 'URRAO_05847', 'URRAO'),
+    ('44855', 'URUMITA', 'URUMITA_44855', 'URUMITA'),
+    ('08849', 'USIACURÍ', 'USIACURI_08849', 'USIACURI'),
+    ('25851', 'ÚTICA', 'UTICA_25851', 'UTICA'),
+    ('05854', 'VALDIVIA', 'VALDIVIA_05854', 'VALDIVIA'),
+    ('23855', 'VALENCIA', 'VALENCIA_23855', 'VALENCIA'),
+    ('68855', 'VALLE DE SAN JOSÉ', 'VALLE_DE_SAN_JOSE_68855', 'VALLE_DE_SAN_JOSE'),
+    ('73854', 'VALLE DE SAN JUAN', 'VALLE_DE_SAN_JUAN_73854', 'VALLE_DE_SAN_JUAN'),
+    ('86865', 'VALLE DEL GUAMUEZ', 'VALLE_DEL_GUAMUEZ_86865', 'VALLE_DEL_GUAMUEZ'),
+    ('20001', 'VALLEDUPAR', 'VALLEDUPAR_20001', 'VALLEDUPAR'),
+    ('05856', 'VALPARAÍSO (Antioquia)', 'VALPARAISO_ANTIOQUIA_05856', 'VALPARAISO_ANTIOQUIA'),
+    ('18860', 'VALPARAÍSO (Caquetá)', 'VALPARAISO_CAQUETA_18860', 'VALPARAISO_CAQUETA'),
+    ('05858', 'VEGACHÍ', 'VEGACHI_05858', 'VEGACHI'),
+    ('68861', 'VÉLEZ', 'VELEZ_68861', 'VELEZ'),
+    ('73861', 'VENADILLO', 'VENADILLO_73861', 'VENADILLO'),
+    ('05861', 'VENECIA (Antioquia)', 'VENECIA_ANTIOQUIA_05861', 'VENECIA_ANTIOQUIA'),
+    ('25506', 'VENECIA (Cundinamarca)', 'VENECIA_CUNDINAMARCA_25506', 'VENECIA_CUNDINAMARCA'),
+    ('15861', 'VENTAQUEMADA', 'VENTAQUEMADA_15861', 'VENTAQUEMADA'),
+    ('25862', 'VERGARA', 'VERGARA_25862', 'VERGARA'),
+    ('76863', 'VERSALLES', 'VERSALLES_76863', 'VERSALLES'),
+    ('68867', 'VETAS', 'VETAS_68867', 'VETAS'),
+    ('25867', 'VIANÍ', 'VIANI_25867', 'VIANI'),
+    ('17867', 'VICTORIA', 'VICTORIA_17867', 'VICTORIA'),
+    ('05873', 'VIGÍA DEL FUERTE', 'VIGIA_DEL_FUERTE_05873', 'VIGIA_DEL_FUERTE'),
+    ('76869', 'VIJES', 'VIJES_76869', 'VIJES'),
+    ('54871', 'VILLA CARO', 'VILLA_CARO_54871', 'VILLA_CARO'),
+    ('15407', 'VILLA DE LEYVA', 'VILLA_DE_LEYVA_15407', 'VILLA_DE_LEYVA'),
+    ('25843', 'VILLA DE SAN DIEGO DE UBATÉ', 'VILLA_DE_SAN_DIEGO_DE_UBATE_25843', 'VILLA_DE_SAN_DIEGO_DE_UBATE'),
+    ('54874', 'VILLA DEL ROSARIO', 'VILLA_DEL_ROSARIO_54874', 'VILLA_DEL_ROSARIO'),
+    ('19845', 'VILLA RICA', 'VILLA_RICA_19845', 'VILLA_RICA'),
+    ('86885', 'VILLAGARZÓN', 'VILLAGARZON_86885', 'VILLAGARZON'),
+    ('25871', 'VILLAGÓMEZ', 'VILLAGOMEZ_25871', 'VILLAGOMEZ'),
+    ('73870', 'VILLAHERMOSA', 'VILLAHERMOSA_73870', 'VILLAHERMOSA'),
+    ('17873', 'VILLAMARÍA', 'VILLAMARIA_17873', 'VILLAMARIA'),
+    ('13873', 'VILLANUEVA (Bolívar)', 'VILLANUEVA_BOLIVAR_13873', 'VILLANUEVA_BOLIVAR'),
+    ('85440', 'VILLANUEVA (Casanare)', 'VILLANUEVA_CASANARE_85440', 'VILLANUEVA_CASANARE'),
+    ('44874', 'VILLANUEVA (La Guajira)', 'VILLANUEVA_LA_GUAJIRA_44874', 'VILLANUEVA_LA_GUAJIRA'),
+    ('68872', 'VILLANUEVA (Santander)', 'VILLANUEVA_SANTANDER_68872', 'VILLANUEVA_SANTANDER'),
+    ('25873', 'VILLAPINZÓN', 'VILLAPINZON_25873', 'VILLAPINZON'),
+    ('73873', 'VILLARRICA', 'VILLARRICA_73873', 'VILLARRICA'),
+    ('50001', 'VILLAVICENCIO', 'VILLAVICENCIO_50001', 'VILLAVICENCIO'),
+    ('41872', 'VILLAVIEJA', 'VILLAVIEJA_41872', 'VILLAVIEJA'),
+    ('25875', 'VILLETA', 'VILLETA_25875', 'VILLETA'),
+    ('25878', 'VIOTÁ', 'VIOTA_25878', 'VIOTA'),
+    ('15879', 'VIRACACHÁ', 'VIRACACHA_15879', 'VIRACACHA'),
+    ('50711', 'VISTAHERMOSA', 'VISTAHERMOSA_50711', 'VISTAHERMOSA'),
+    ('17877', 'VITERBO', 'VITERBO_17877', 'VITERBO'),
+    ('25885', 'YACOPÍ', 'YACOPI_25885', 'YACOPI'),
+    ('52885', 'YACUANQUER', 'YACUANQUER_52885', 'YACUANQUER'),
+    ('41885', 'YAGUARÁ', 'YAGUARA_41885', 'YAGUARA'),
+    ('05885', 'YALÍ', 'YALI_05885', 'YALI'),
+    ('05887', 'YARUMAL', 'YARUMAL_05887', 'YARUMAL'),
+    ('97889', 'YAVARATÉ', 'YAVARATE_97889', 'YAVARATE'),
+    ('05890', 'YOLOMBÓ', 'YOLOMBO_05890', 'YOLOMBO'),
+    ('05893', 'YONDÓ', 'YONDO_05893', 'YONDO'),
+    ('85001', 'YOPAL', 'YOPAL_85001', 'YOPAL'),
+    ('76890', 'YOTOCO', 'YOTOCO_76890', 'YOTOCO'),
+    ('76892', 'YUMBO', 'YUMBO_76892', 'YUMBO'),
+    ('13894', 'ZAMBRANO', 'ZAMBRANO_13894', 'ZAMBRANO'),
+    ('68895', 'ZAPATOCA', 'ZAPATOCA_68895', 'ZAPATOCA'),
+    ('47960', 'ZAPAYÁN', 'ZAPAYAN_47960', 'ZAPAYAN'),
+    ('05895', 'ZARAGOZA', 'ZARAGOZA_05895', 'ZARAGOZA'),
+    ('76895', 'ZARZAL', 'ZARZAL_76895', 'ZARZAL'),
+    ('15897', 'ZETAQUIRA', 'ZETAQUIRA_15897', 'ZETAQUIRA'),
+    ('25898', 'ZIPACÓN', 'ZIPACON_25898', 'ZIPACON'),
+    ('25899', 'ZIPAQUIRÁ', 'ZIPAQUIRA_25899', 'ZIPAQUIRA'),
+    ('47980', 'ZONA BANANERA', 'ZONA_BANANERA_47980', 'ZONA_BANANERA'),
+)
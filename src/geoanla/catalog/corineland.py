@@ -1,5 +1,7 @@
 from enum import Enum
 
+from geoanla.catalog.domains import _description_table
+
 class Dom_CateCober(float, Enum):
     """
     Dominio: Dom_CateCober
@@ -11,16 +13,13 @@ class Dom_CateCober(float, Enum):
     AREAS_HUMEDAS = 4.0
     SUPERFICIES_DE_AGUA = 5.0
 
-    @property
-    def description(self):
-        descripciones = {
-            1.0: "Territorios Artificializados",
-            2.0: "Territorios Agrícolas",
-            3.0: "Bosques y Áreas Seminaturales",
-            4.0: "Áreas Húmedas",
-            5.0: "Superficies de Agua"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1.0: "Territorios Artificializados",
+        2.0: "Territorios Agrícolas",
+        3.0: "Bosques y Áreas Seminaturales",
+        4.0: "Áreas Húmedas",
+        5.0: "Superficies de Agua"
+    })
 
 class Dom_SubcatCober(float, Enum):
     """
@@ -43,26 +42,23 @@ class Dom_SubcatCober(float, Enum):
     AGUAS_CONTINENTALES = 51.0
     AGUAS_MARITIMAS = 52.0
 
-    @property
-    def description(self):
-        descripciones = {
-            11.0: "Zonas urbanizadas",
-            12.0: "Zonas industriales o comerciales y redes de comunicación",
-            13.0: "Zonas de extracción minera y escombreras",
-            14.0: "Zonas verdes artificializadas, no agrícolas",
-            21.0: "Cultivos transitorios",
-            22.0: "Cultivos permanentes",
-            23.0: "Pastos",
-            24.0: "Áreas agrícolas heterogéneas",
-            31.0: "Bosques",
-            32.0: "Áreas con vegetación herbácea y/o arbustiva",
-            33.0: "Áreas abiertas, sin o con poca vegetación",
-            41.0: "Áreas húmedas continentales",
-            42.0: "Áreas húmedas costeras",
-            51.0: "Aguas continentales",
-            52.0: "Aguas marítimas"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        11.0: "Zonas urbanizadas",
+        12.0: "Zonas industriales o comerciales y redes de comunicación",
+        13.0: "Zonas de extracción minera y escombreras",
+        14.0: "Zonas verdes artificializadas, no agrícolas",
+        21.0: "Cultivos transitorios",
+        22.0: "Cultivos permanentes",
+        23.0: "Pastos",
+        24.0: "Áreas agrícolas heterogéneas",
+        31.0: "Bosques",
+        32.0: "Áreas con vegetación herbácea y/o arbustiva",
+        33.0: "Áreas abiertas, sin o con poca vegetación",
+        41.0: "Áreas húmedas continentales",
+        42.0: "Áreas húmedas costeras",
+        51.0: "Aguas continentales",
+        52.0: "Aguas marítimas"
+    })
 
 class Dom_Clas_Cober(float, Enum):
     """
@@ -125,66 +121,63 @@ class Dom_Clas_Cober(float, Enum):
     MARES_OCEANOS = 522.0
     ESTANQUES_ACUICULTURA_MARINA = 523.0
 
-    @property
-    def description(self):
-        descripciones = {
-            111.0: "Tejido urbano continuo",
-            112.0: "Tejido urbano discontinuo",
-            121.0: "Zonas industriales o comerciales",
-            122.0: "Red vial, ferroviaria y terrenos asociados",
-            123.0: "Zonas portuarias",
-            124.0: "Aeropuertos",
-            125.0: "Obras hidráulicas",
-            131.0: "Zonas de extracción minera",
-            132.0: "Zonas de disposición de residuos",
-            141.0: "Zonas verdes urbanas",
-            142.0: "Instalaciones recreativas",
-            211.0: "Otros cultivos transitorios",
-            212.0: "Cereales",
-            213.0: "Oleaginosas y leguminosas",
-            214.0: "Hortalizas",
-            215.0: "Tubérculos",
-            221.0: "Cultivos permanentes herbáceos",
-            222.0: "Cultivos permanentes arbustivos",
-            223.0: "Cultivos permanentes arbóreos",
-            224.0: "Cultivos agroforestales",
-            225.0: "Cultivos confinados",
-            231.0: "Pastos limpios",
-            232.0: "Pastos arbolados",
-            233.0: "Pastos enmalezados",
-            241.0: "Mosaico de cultivos",
-            242.0: "Mosaico de pastos y cultivos",
-            243.0: "Mosaico de cultivos, pastos y espacios naturales",
-            244.0: "Mosaico de pastos con espacios naturales",
-            245.0: "Mosaico de cultivos y espacios naturales",
-            311.0: "Bosque denso",
-            312.0: "Bosque abierto",
-            313.0: "Bosque fragmentado",
-            314.0: "Bosque de galería y/o ripario",
-            315.0: "Plantación forestal",
-            321.0: "Herbazal",
-            322.0: "Arbustal",
-            323.0: "Vegetación secundaria o en transición",
-            331.0: "Zonas arenosas naturales",
-            332.0: "Afloramientos rocosos",
-            333.0: "Tierras desnudas y degradadas",
-            334.0: "Zonas quemadas",
-            335.0: "Zonas glaciares y nivales",
-            411.0: "Zonas pantanosas",
-            412.0: "Turberas",
-            413.0: "Vegetación acuática sobre cuerpos de agua",
-            421.0: "Pantanos costeros",
-            422.0: "Salitral",
-            423.0: "Sedimentos expuestos en bajamar",
-            511.0: "Ríos (50 m)",
-            512.0: "Lagunas, lagos y ciénagas naturales",
-            513.0: "Canales",
-            514.0: "Cuerpos de agua artificiales",
-            521.0: "Lagunas costeras",
-            522.0: "Mares y océanos",
-            523.0: "Estanques para acuicultura marina"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        111.0: "Tejido urbano continuo",
+        112.0: "Tejido urbano discontinuo",
+        121.0: "Zonas industriales o comerciales",
+        122.0: "Red vial, ferroviaria y terrenos asociados",
+        123.0: "Zonas portuarias",
+        124.0: "Aeropuertos",
+        125.0: "Obras hidráulicas",
+        131.0: "Zonas de extracción minera",
+        132.0: "Zonas de disposición de residuos",
+        141.0: "Zonas verdes urbanas",
+        142.0: "Instalaciones recreativas",
+        211.0: "Otros cultivos transitorios",
+        212.0: "Cereales",
+        213.0: "Oleaginosas y leguminosas",
+        214.0: "Hortalizas",
+        215.0: "Tubérculos",
+        221.0: "Cultivos permanentes herbáceos",
+        222.0: "Cultivos permanentes arbustivos",
+        223.0: "Cultivos permanentes arbóreos",
+        224.0: "Cultivos agroforestales",
+        225.0: "Cultivos confinados",
+        231.0: "Pastos limpios",
+        232.0: "Pastos arbolados",
+        233.0: "Pastos enmalezados",
+        241.0: "Mosaico de cultivos",
+        242.0: "Mosaico de pastos y cultivos",
+        243.0: "Mosaico de cultivos, pastos y espacios naturales",
+        244.0: "Mosaico de pastos con espacios naturales",
+        245.0: "Mosaico de cultivos y espacios naturales",
+        311.0: "Bosque denso",
+        312.0: "Bosque abierto",
+        313.0: "Bosque fragmentado",
+        314.0: "Bosque de galería y/o ripario",
+        315.0: "Plantación forestal",
+        321.0: "Herbazal",
+        322.0: "Arbustal",
+        323.0: "Vegetación secundaria o en transición",
+        331.0: "Zonas arenosas naturales",
+        332.0: "Afloramientos rocosos",
+        333.0: "Tierras desnudas y degradadas",
+        334.0: "Zonas quemadas",
+        335.0: "Zonas glaciares y nivales",
+        411.0: "Zonas pantanosas",
+        412.0: "Turberas",
+        413.0: "Vegetación acuática sobre cuerpos de agua",
+        421.0: "Pantanos costeros",
+        422.0: "Salitral",
+        423.0: "Sedimentos expuestos en bajamar",
+        511.0: "Ríos (50 m)",
+        512.0: "Lagunas, lagos y ciénagas naturales",
+        513.0: "Canales",
+        514.0: "Cuerpos de agua artificiales",
+        521.0: "Lagunas costeras",
+        522.0: "Mares y océanos",
+        523.0: "Estanques para acuicultura marina"
+    })
 
 class Dom_Subclas_Cober(float, Enum):
     """
@@ -277,96 +270,93 @@ class Dom_Subclas_Cober(float, Enum):
     PRADERAS_PASTOS_MARINOS_SOMERAS = 5223.0
     FONDOS_SOMEROS_ARENAS_CASCAJO = 5224.0
 
-    @property
-    def description(self):
-        descripciones = {
-            1211.0: "Zonas industriales",
-            1212.0: "Zonas comerciales",
-            1221.0: "Red vial y territorios asociados",
-            1222.0: "Red ferroviaria y terrenos asociados",
-            1231.0: "Zonas portuarias fluviales",
-            1232.0: "Zonas portuarias marítimas",
-            1241.0: "Aeropuerto con infraestructura asociada",
-            1242.0: "Aeropuerto sin infraestructura asociada",
-            1311.0: "Otras explotaciones mineras",
-            1312.0: "Explotación de hidrocarburos",
-            1313.0: "Explotación de carbón",
-            1314.0: "Explotación de oro",
-            1315.0: "Explotación de materiales de construcción",
-            1316.0: "Explotación de sal",
-            1321.0: "Otros sitios de disposición de residuos a cielo abierto",
-            1322.0: "Escombreras",
-            1323.0: "Vertederos",
-            1324.0: "Relleno sanitario",
-            1411.0: "Otras zonas verdes urbanas",
-            1412.0: "Parques cementerios",
-            1413.0: "Jardines botánicos",
-            1414.0: "Zoológicos",
-            1415.0: "Parques urbanos",
-            1416.0: "Rondas de cuerpos de agua de zonas urbanas",
-            1421.0: "Áreas culturales",
-            1422.0: "Áreas deportivas",
-            1423.0: "Áreas turísticas",
-            2211.0: "Otros cultivos permanentes herbáceos",
-            2212.0: "Caña",
-            2213.0: "Plátano y banano",
-            2214.0: "Tabaco",
-            2215.0: "Papaya",
-            2216.0: "Amapola",
-            2221.0: "Otros cultivos permanentes arbustivos",
-            2222.0: "Café",
-            2223.0: "Cacao",
-            2224.0: "Viñedos",
-            2225.0: "Coca",
-            2231.0: "Otros cultivos permanentes arbóreos",
-            2232.0: "Palma de aceite",
-            2233.0: "Cítricos",
-            2234.0: "Mango",
-            2241.0: "Pastos y árboles plantados",
-            2242.0: "Cultivos y árboles plantados",
-            2121.0: "Arroz",
-            2122.0: "Maíz",
-            2123.0: "Sorgo",
-            2124.0: "Cebada",
-            2125.0: "Trigo",
-            2131.0: "Algodón",
-            2132.0: "Ajonjolí",
-            2133.0: "Fríjol",
-            2134.0: "Soya",
-            2135.0: "Maní",
-            2141.0: "Cebolla",
-            2142.0: "Zanahoria",
-            2143.0: "Remolacha",
-            2151.0: "Papa",
-            2152.0: "Yuca",
-            3111.0: "Bosque denso alto",
-            3112.0: "Bosque denso bajo",
-            3121.0: "Bosque abierto alto",
-            3122.0: "Bosque abierto bajo",
-            3131.0: "Bosque fragmentado con pastos y cultivos",
-            3132.0: "Bosque fragmentado con vegetación secundaria",
-            3151.0: "Plantación de coníferas",
-            3152.0: "Plantación de latifoliadas",
-            3211.0: "Herbazal denso",
-            3212.0: "Herbazal abierto",
-            3221.0: "Arbustal denso",
-            3222.0: "Arbustal abierto",
-            3231.0: "Vegetación secundaria alta",
-            3232.0: "Vegetación secundaria baja",
-            3311.0: "Playas",
-            3312.0: "Arenales",
-            3313.0: "Campos de dunas",
-            3351.0: "Zonas glaciares",
-            3352.0: "Zonas nivales",
-            5141.0: "Embalses",
-            5142.0: "Lagunas de oxidación",
-            5143.0: "Estanques para acuicultura continental",
-            5221.0: "Otros fondos",
-            5222.0: "Fondos coralinos someros",
-            5223.0: "Praderas de pastos marinos someras",
-            5224.0: "Fondos someros de arenas y cascajo"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1211.0: "Zonas industriales",
+        1212.0: "Zonas comerciales",
+        1221.0: "Red vial y territorios asociados",
+        1222.0: "Red ferroviaria y terrenos asociados",
+        1231.0: "Zonas portuarias fluviales",
+        1232.0: "Zonas portuarias marítimas",
+        1241.0: "Aeropuerto con infraestructura asociada",
+        1242.0: "Aeropuerto sin infraestructura asociada",
+        1311.0: "Otras explotaciones mineras",
+        1312.0: "Explotación de hidrocarburos",
+        1313.0: "Explotación de carbón",
+        1314.0: "Explotación de oro",
+        1315.0: "Explotación de materiales de construcción",
+        1316.0: "Explotación de sal",
+        1321.0: "Otros sitios de disposición de residuos a cielo abierto",
+        1322.0: "Escombreras",
+        1323.0: "Vertederos",
+        1324.0: "Relleno sanitario",
+        1411.0: "Otras zonas verdes urbanas",
+        1412.0: "Parques cementerios",
+        1413.0: "Jardines botánicos",
+        1414.0: "Zoológicos",
+        1415.0: "Parques urbanos",
+        1416.0: "Rondas de cuerpos de agua de zonas urbanas",
+        1421.0: "Áreas culturales",
+        1422.0: "Áreas deportivas",
+        1423.0: "Áreas turísticas",
+        2211.0: "Otros cultivos permanentes herbáceos",
+        2212.0: "Caña",
+        2213.0: "Plátano y banano",
+        2214.0: "Tabaco",
+        2215.0: "Papaya",
+        2216.0: "Amapola",
+        2221.0: "Otros cultivos permanentes arbustivos",
+        2222.0: "Café",
+        2223.0: "Cacao",
+        2224.0: "Viñedos",
+        2225.0: "Coca",
+        2231.0: "Otros cultivos permanentes arbóreos",
+        2232.0: "Palma de aceite",
+        2233.0: "Cítricos",
+        2234.0: "Mango",
+        2241.0: "Pastos y árboles plantados",
+        2242.0: "Cultivos y árboles plantados",
+        2121.0: "Arroz",
+        2122.0: "Maíz",
+        2123.0: "Sorgo",
+        2124.0: "Cebada",
+        2125.0: "Trigo",
+        2131.0: "Algodón",
+        2132.0: "Ajonjolí",
+        2133.0: "Fríjol",
+        2134.0: "Soya",
+        2135.0: "Maní",
+        2141.0: "Cebolla",
+        2142.0: "Zanahoria",
+        2143.0: "Remolacha",
+        2151.0: "Papa",
+        2152.0: "Yuca",
+        3111.0: "Bosque denso alto",
+        3112.0: "Bosque denso bajo",
+        3121.0: "Bosque abierto alto",
+        3122.0: "Bosque abierto bajo",
+        3131.0: "Bosque fragmentado con pastos y cultivos",
+        3132.0: "Bosque fragmentado con vegetación secundaria",
+        3151.0: "Plantación de coníferas",
+        3152.0: "Plantación de latifoliadas",
+        3211.0: "Herbazal denso",
+        3212.0: "Herbazal abierto",
+        3221.0: "Arbustal denso",
+        3222.0: "Arbustal abierto",
+        3231.0: "Vegetación secundaria alta",
+        3232.0: "Vegetación secundaria baja",
+        3311.0: "Playas",
+        3312.0: "Arenales",
+        3313.0: "Campos de dunas",
+        3351.0: "Zonas glaciares",
+        3352.0: "Zonas nivales",
+        5141.0: "Embalses",
+        5142.0: "Lagunas de oxidación",
+        5143.0: "Estanques para acuicultura continental",
+        5221.0: "Otros fondos",
+        5222.0: "Fondos coralinos someros",
+        5223.0: "Praderas de pastos marinos someras",
+        5224.0: "Fondos someros de arenas y cascajo"
+    })
 
 class Dom_Nivel5_Cober(float, Enum):
     """
@@ -388,25 +378,22 @@ class Dom_Nivel5_Cober(float, Enum):
     ARBUSTAL_ABIERTO_ESCLEROFILO = 32221.0
     ARBUSTAL_ABIERTO_MESOFILO = 32222.0
 
-    @property
-    def description(self):
-        descripciones = {
-            31111.0: "Bosque denso alto de tierra firme",
-            31112.0: "Bosque denso alto inundable",
-            31121.0: "Bosque denso bajo de tierra firme",
-            31122.0: "Bosque denso bajo inundable",
-            31211.0: "Bosque abierto alto de tierra firme",
-            31212.0: "Bosque abierto alto inundable",
-            31221.0: "Bosque abierto bajo de tierra firme",
-            31222.0: "Bosque abierto bajo inundable",
-            32111.0: "Herbazal denso de tierra firme",
-            32112.0: "Herbazal denso inundable",
-            32121.0: "Herbazal abierto arenoso",
-            32122.0: "Herbazal abierto rocoso",
-            32221.0: "Arbustal abierto esclerófilo",
-            32222.0: "Arbustal abierto mesófilo"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        31111.0: "Bosque denso alto de tierra firme",
+        31112.0: "Bosque denso alto inundable",
+        31121.0: "Bosque denso bajo de tierra firme",
+        31122.0: "Bosque denso bajo inundable",
+        31211.0: "Bosque abierto alto de tierra firme",
+        31212.0: "Bosque abierto alto inundable",
+        31221.0: "Bosque abierto bajo de tierra firme",
+        31222.0: "Bosque abierto bajo inundable",
+        32111.0: "Herbazal denso de tierra firme",
+        32112.0: "Herbazal denso inundable",
+        32121.0: "Herbazal abierto arenoso",
+        32122.0: "Herbazal abierto rocoso",
+        32221.0: "Arbustal abierto esclerófilo",
+        32222.0: "Arbustal abierto mesófilo"
+    })
 
 class Dom_Nivel6_Cober(float, Enum):
     """
@@ -424,18 +411,32 @@ class Dom_Nivel6_Cober(float, Enum):
     ARRACACHAL = 321123.0
     HELECHAL = 321124.0
 
-    @property
-    def description(self):
-        descripciones = {
-            311121.0: "Bosque denso alto inundable heterogéneo",
-            311122.0: "Manglar denso alto",
-            311123.0: "Palmares",
-            321111.0: "Herbazal denso de tierra firme no arbolado",
-            321112.0: "Herbazal denso de tierra firme arbolado",
-            321113.0: "Herbazal denso de tierra firme con arbustos",
-            321121.0: "Herbazal denso inundable no arbolado",
-            321122.0: "Herbazal denso inundable arbolado",
-            321123.0: "Arracachal",
-            321124.0: "Helechal"
-        }
-        return descripciones.get(self.value)
\ No newline at end of file
+    description = _description_table({
+        311121.0: "Bosque denso alto inundable heterogéneo",
+        311122.0: "Manglar denso alto",
+        311123.0: "Palmares",
+        321111.0: "Herbazal denso de tierra firme no arbolado",
+        321112.0: "Herbazal denso de tierra firme arbolado",
+        321113.0: "Herbazal denso de tierra firme con arbustos",
+        321121.0: "Herbazal denso inundable no arbolado",
+        321122.0: "Herbazal denso inundable arbolado",
+        321123.0: "Arracachal",
+        321124.0: "Helechal"
+    })
+
+
+# Dominios de los seis niveles, del más general al más detallado
+DOMINIOS_CLC = (
+    Dom_CateCober, Dom_SubcatCober, Dom_Clas_Cober,
+    Dom_Subclas_Cober, Dom_Nivel5_Cober, Dom_Nivel6_Cober
+)
+
+
+# El árbol de códigos (padres, ancestros, descendientes y sus variantes
+# vectorizadas) vive en ``catalog.hierarchy`` y usa NumPy: se importa en el
+# primer acceso a ``clc_tree`` o ``ClcTree``.
+def __getattr__(nombre):
+    if nombre in ("clc_tree", "ClcTree"):
+        from geoanla.catalog import hierarchy
+        return getattr(hierarchy, nombre)
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
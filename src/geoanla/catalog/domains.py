@@ -1,4 +1,20 @@
 from enum import Enum
+# Alias privado: ``from .domains import *`` en el catálogo no reexporta typing
+import typing as _t
+
+
+def _description_table(
+    descripciones: _t.Dict[_t.Any, str], defecto: _t.Optional[str] = None
+) -> property:
+    """
+    Propiedad ``description`` de un dominio a partir de su tabla
+    código -> descripción. La tabla se arma una sola vez, al definir la
+    clase, en lugar de reconstruir el diccionario en cada acceso.
+    """
+    def description(self):
+        return descripciones.get(self.value, defecto)
+    return property(description)
+
 
 class Dom_FC_Multimedia(float, Enum):
     """
@@ -21,25 +37,22 @@ class Dom_FC_Multimedia(float, Enum):
     TRANSECTO_MUESTREO_FAUNA = 2005.0
     APROVECHA_FORESTAL_PT = 2007.0
 
-    @property
-    def description(self):
-        descripciones = {
-            1107.0: "MaterialesConstruccionPT",
-            1108.0: "MaterialesConstruccionPG",
-            1502.0: "OcupacionCauce",
-            1503.0: "CaptacionAguaSuperPT",
-            1504.0: "CaptacionAguaSuperLN",
-            1505.0: "VertimientoPT",
-            1506.0: "VertimientoLN",
-            1507.0: "VertimientoVia",
-            1508.0: "VertimientoSuelo",
-            1509.0: "PuntoMuestreoAguaSuper",
-            2003.0: "PuntoMuestreoFlora",
-            2004.0: "PuntoMuestreoFauna",
-            2005.0: "TransectoMuestreoFauna",
-            2007.0: "AprovechaForestalPT"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1107.0: "MaterialesConstruccionPT",
+        1108.0: "MaterialesConstruccionPG",
+        1502.0: "OcupacionCauce",
+        1503.0: "CaptacionAguaSuperPT",
+        1504.0: "CaptacionAguaSuperLN",
+        1505.0: "VertimientoPT",
+        1506.0: "VertimientoLN",
+        1507.0: "VertimientoVia",
+        1508.0: "VertimientoSuelo",
+        1509.0: "PuntoMuestreoAguaSuper",
+        2003.0: "PuntoMuestreoFlora",
+        2004.0: "PuntoMuestreoFauna",
+        2005.0: "TransectoMuestreoFauna",
+        2007.0: "AprovechaForestalPT"
+    })
 
 class Dom_Departamento(str, Enum):
     """
@@ -81,44 +94,41 @@ class Dom_Departamento(str, Enum):
     VAUPES = "97"
     VICHADA = "99"
 
-    @property
-    def description(self):
-        descripciones = {
-            "91": "Amazonas",
-            "05": "Antioquia",
-            "81": "Arauca",
-            "88": "Archipiélago de San Andrés, Providencia y Santa Catalina",
-            "08": "Atlántico",
-            "11": "Bogotá, D.C.",
-            "13": "Bolívar",
-            "15": "Boyacá",
-            "17": "Caldas",
-            "18": "Caquetá",
-            "85": "Casanare",
-            "19": "Cauca",
-            "20": "Cesar",
-            "27": "Chocó",
-            "23": "Córdoba",
-            "25": "Cundinamarca",
-            "94": "Guainía",
-            "95": "Guaviare",
-            "41": "Huila",
-            "44": "La Guajira",
-            "47": "Magdalena",
-            "50": "Meta",
-            "52": "Nariño",
-            "54": "Norte de Santander",
-            "86": "Putumayo",
-            "63": "Quindio",
-            "66": "Risaralda",
-            "68": "Santander",
-            "70": "Sucre",
-            "73": "Tolima",
-            "76": "Valle del Cauca",
-            "97": "Vaupés",
-            "99": "Vichada"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        "91": "Amazonas",
+        "05": "Antioquia",
+        "81": "Arauca",
+        "88": "Archipiélago de San Andrés, Providencia y Santa Catalina",
+        "08": "Atlántico",
+        "11": "Bogotá, D.C.",
+        "13": "Bolívar",
+        "15": "Boyacá",
+        "17": "Caldas",
+        "18": "Caquetá",
+        "85": "Casanare",
+        "19": "Cauca",
+        "20": "Cesar",
+        "27": "Chocó",
+        "23": "Córdoba",
+        "25": "Cundinamarca",
+        "94": "Guainía",
+        "95": "Guaviare",
+        "41": "Huila",
+        "44": "La Guajira",
+        "47": "Magdalena",
+        "50": "Meta",
+        "52": "Nariño",
+        "54": "Norte de Santander",
+        "86": "Putumayo",
+        "63": "Quindio",
+        "66": "Risaralda",
+        "68": "Santander",
+        "70": "Sucre",
+        "73": "Tolima",
+        "76": "Valle del Cauca",
+        "97": "Vaupés",
+        "99": "Vichada"
+    })
 
 class Dom_Tenencia(float, Enum):
     """
@@ -134,18 +144,15 @@ class Dom_Tenencia(float, Enum):
     MEJORATARIO = 6.0
     USUFRUCTO_O_APARCERO = 7.0
 
-    @property
-    def description(self):
-        descripciones = {
-            1.0: "Propiedad privada",
-            2.0: "Propiedad colectiva",
-            3.0: "Posesión sin título (baldíos o ejidos)",
-            4.0: "Ocupante (bienes de uso público)",
-            5.0: "Arrendatario",
-            6.0: "Mejoratario",
-            7.0: "Usufructo o aparcero"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1.0: "Propiedad privada",
+        2.0: "Propiedad colectiva",
+        3.0: "Posesión sin título (baldíos o ejidos)",
+        4.0: "Ocupante (bienes de uso público)",
+        5.0: "Arrendatario",
+        6.0: "Mejoratario",
+        7.0: "Usufructo o aparcero"
+    })
 
 class Dom_TipoMuestreoFlo(float, Enum):
     """
@@ -156,14 +163,11 @@ class Dom_TipoMuestreoFlo(float, Enum):
     PARCELA = 312.0
     TRANSECTO = 313.0
 
-    @property
-    def description(self):
-        descripciones = {
-            311.0: "Puntual",
-            312.0: "Parcela",
-            313.0: "Transecto"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        311.0: "Puntual",
+        312.0: "Parcela",
+        313.0: "Transecto"
+    })
 
 class Dom_Temporada(float, Enum):
     """
@@ -175,15 +179,12 @@ class Dom_Temporada(float, Enum):
     MEDIO = 303.0
     TODO_EL_ANNIO = 304.0
 
-    @property
-    def description(self):
-        descripciones = {
-            301.0: "Seco",
-            302.0: "Húmedo",
-            303.0: "Medio",
-            304.0: "Todo el año"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        301.0: "Seco",
+        302.0: "Húmedo",
+        303.0: "Medio",
+        304.0: "Todo el año"
+    })
 
 class Dom_Apendice(float, Enum):
     """
@@ -196,15 +197,12 @@ class Dom_Apendice(float, Enum):
     APENDICE_III = 300.0
     NO_APLICA = 400.0
 
-    @property
-    def description(self):
-        descripciones = {
-            100.0: "Apendice I",
-            200.0: "Apendice II",
-            300.0: "Apendice III",
-            400.0: "No aplica"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        100.0: "Apendice I",
+        200.0: "Apendice II",
+        300.0: "Apendice III",
+        400.0: "No aplica"
+    })
 
 class Dom_Amenaza(float, Enum):
     """
@@ -222,21 +220,18 @@ class Dom_Amenaza(float, Enum):
     NO_EVALUADO = 329.0
     NO_APLICA = 330.0
 
-    @property
-    def description(self):
-        descripciones = {
-            321.0: "Preocupación Menor (LC)",
-            322.0: "Casi Amenazada (NT)",
-            323.0: "Vulnerable (VU)",
-            324.0: "Peligro (EN)",
-            325.0: "Peligro Crítico (CR)",
-            326.0: "Extinto en estado silvestre (EW)",
-            327.0: "Extinto (EX)",
-            328.0: "Datos insuficientes (DD)",
-            329.0: "No Evaluado (NE)",
-            330.0: "No aplica"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        321.0: "Preocupación Menor (LC)",
+        322.0: "Casi Amenazada (NT)",
+        323.0: "Vulnerable (VU)",
+        324.0: "Peligro (EN)",
+        325.0: "Peligro Crítico (CR)",
+        326.0: "Extinto en estado silvestre (EW)",
+        327.0: "Extinto (EX)",
+        328.0: "Datos insuficientes (DD)",
+        329.0: "No Evaluado (NE)",
+        330.0: "No aplica"
+    })
 
 class Dom_Tipo_Distribu(float, Enum):
     """
@@ -248,15 +243,12 @@ class Dom_Tipo_Distribu(float, Enum):
     CASI_ENDEMICA = 333.0
     ENDEMICA = 334.0
 
-    @property
-    def description(self):
-        descripciones = {
-            331.0: "Cosmopolita",
-            332.0: "Restringida",
-            333.0: "Casi endémica",
-            334.0: "Endémica"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        331.0: "Cosmopolita",
+        332.0: "Restringida",
+        333.0: "Casi endémica",
+        334.0: "Endémica"
+    })
 
 class Dom_EntidadVeda(float, Enum):
     """
@@ -319,58 +311,94 @@ class Dom_EntidadVeda(float, Enum):
     # Otros
     OTRA = 2046.0
 
-    @property
-    def description(self):
-        descripciones = {
-            2081.0: "AMVA - Área Metropolitana del Valle de Aburrá – Medellín",
-            2047.0: "CAM - Corporación Autónoma Regional del Alto Magdalena",
-            2048.0: "CAR - Corporación Autónoma Regional de Cundinamarca",
-            2049.0: "CARDER - Corporación Autónoma Regional de Risaralda",
-            2050.0: "CARDIQUE - Corporación Autónoma Regional del Canal Del Dique",
-            2051.0: "CARSUCRE - Corporación Autónoma Regional de Sucre",
-            2052.0: "CAS - Corporación Autónoma Regional de Santander",
-            2073.0: "CDA - Corporación para el Desarrollo Sostenible del Norte y el Oriente Amazónico",
-            2053.0: "CDMB - Corporación Autónoma Regional para la Defensa de la Meseta de Bucaramanga",
-            2074.0: "CODECHOCO - Corporación Autónoma Regional para el Desarrollo Sostenible del Chocó",
-            2075.0: "CORALINA - Corporación para el Desarrollo Sostenible del Archipiélago de San Andrés, Providencia y Santa Catalina",
-            2054.0: "CORANTIOQUIA - Corporación Autónoma Regional del Centro de Antioquia",
-            2076.0: "CORMACARENA - Corporación para el Desarrollo Sostenible del Área de Manejo Especial de La Macarena",
-            2055.0: "CORNARE - Corporación Autónoma Regional de las Cuencas de los Ríos Negro y Nare",
-            2056.0: "CORPAMAG - Corporación Autónoma Regional del Magdalena",
-            2077.0: "CORPOAMAZONIA - Corporación para el Desarrollo Sostenible del Sur de la Amazonia",
-            2057.0: "CORPOBOYACA - Corporación Autónoma Regional de Boyacá",
-            2058.0: "CORPOCALDAS - Corporación Autónoma Regional de Caldas",
-            2059.0: "CORPOCESAR - Corporación Autónoma Regional del Cesar",
-            2060.0: "CORPOCHIVOR - Corporación Autónoma Regional de Chivor",
-            2061.0: "CORPOGUAJIRA - Corporación Autónoma Regional de La Guajira",
-            2062.0: "CORPOGUAVIO - Corporación Autónoma Regional del Guavio",
-            2078.0: "CORPOMOJANA - Corporación para el Desarrollo Sostenible de La Mojana y El San Jorge",
-            2063.0: "CORPONARIÑO - Corporación Autónoma Regional de Nariño",
-            2064.0: "CORPONOR - Corporación Autónoma Regional de la Frontera Nororiental",
-            2065.0: "CORPORINOQUIA - Corporación Autónoma Regional de la Orinoquia",
-            2079.0: "CORPOURABA - Corporación para el Desarrollo Sostenible del Urabá",
-            2066.0: "CORTOLIMA - Corporación Autónoma Regional del Tolima",
-            2067.0: "CRA - Corporación Autónoma Regional del Atlántico",
-            2068.0: "CRC - Corporación Autónoma Regional del Cauca",
-            2069.0: "CRQ - Corporación Autónoma Regional del Quindío",
-            2070.0: "CSB - Corporación Autónoma Regional del Sur de Bolívar",
-            2071.0: "CVC - Corporación Autónoma Regional del Valle del Cauca",
-            2072.0: "CVS - Corporación Autónoma Regional de los Valles del Sinú y del San Jorge",
-            2084.0: "DADMA - Departamento Administrativo Distrital del Medio Ambiente de Santa Marta",
-            2082.0: "DAGMA - Departamento Administrativo de Gestión del Medio Ambiente – Cali",
-            2083.0: "DAMAB - Departamento Técnico Administrativo del Medio Ambiente de Barranquilla",
-            2085.0: "EPA - Establecimiento Público Ambiental – Cartagena",
-            2041.0: "INCODER - Instituto Colombiano de Desarrollo Rural",
-            2043.0: "INCORA - Instituto Colombiano de la Reforma Agraria",
-            2040.0: "INDERENA - Instituto Nacional de Recursos Naturales Renovables y del Ambiente",
-            2044.0: "INPA - Instituto Nacional de Pesca y Acuicultura",
-            2045.0: "MADR - MInisterio de Agricultura y Desarrollo Rural",
-            2042.0: "MADS - Ministerio de Ambiente y Desarrollo Sostenible",
-            2039.0: "MAVDT - Ministerio de Ambiente, Vivienda y Desarrollo Territorial",
-            2046.0: "Otra",
-            2080.0: "SDA - Secretaría Distrital de Ambiente – Bogotá"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        2081.0: "AMVA - Área Metropolitana del Valle de Aburrá – Medellín",
+        2047.0: "CAM - Corporación Autónoma Regional del Alto Magdalena",
+        2048.0: "CAR - Corporación Autónoma Regional de Cundinamarca",
+        2049.0: "CARDER - Corporación Autónoma Regional de Risaralda",
+        2050.0: "CARDIQUE - Corporación Autónoma Regional del Canal Del Dique",
+        2051.0: "CARSUCRE - Corporación Autónoma Regional de Sucre",
+        2052.0: "CAS - Corporación Autónoma Regional de Santander",
+        2073.0: (
+            "CDA - Corporación para el Desarrollo Sostenible del Norte y el Oriente "
+            "Amazónico"
+        ),
+        2053.0: (
+            "CDMB - Corporación Autónoma Regional para la Defensa de la Meseta de "
+            "Bucaramanga"
+        ),
+        2074.0: (
+            "CODECHOCO - Corporación Autónoma Regional para el Desarrollo Sostenible "
+            "del Chocó"
+        ),
+        2075.0: (
+            "CORALINA - Corporación para el Desarrollo Sostenible del Archipiélago "
+            "de San Andrés, Providencia y Santa Catalina"
+        ),
+        2054.0: "CORANTIOQUIA - Corporación Autónoma Regional del Centro de Antioquia",
+        2076.0: (
+            "CORMACARENA - Corporación para el Desarrollo Sostenible del Área de "
+            "Manejo Especial de La Macarena"
+        ),
+        2055.0: (
+            "CORNARE - Corporación Autónoma Regional de las Cuencas de los Ríos "
+            "Negro y Nare"
+        ),
+        2056.0: "CORPAMAG - Corporación Autónoma Regional del Magdalena",
+        2077.0: (
+            "CORPOAMAZONIA - Corporación para el Desarrollo Sostenible del Sur de la "
+            "Amazonia"
+        ),
+        2057.0: "CORPOBOYACA - Corporación Autónoma Regional de Boyacá",
+        2058.0: "CORPOCALDAS - Corporación Autónoma Regional de Caldas",
+        2059.0: "CORPOCESAR - Corporación Autónoma Regional del Cesar",
+        2060.0: "CORPOCHIVOR - Corporación Autónoma Regional de Chivor",
+        2061.0: "CORPOGUAJIRA - Corporación Autónoma Regional de La Guajira",
+        2062.0: "CORPOGUAVIO - Corporación Autónoma Regional del Guavio",
+        2078.0: (
+            "CORPOMOJANA - Corporación para el Desarrollo Sostenible de La Mojana y "
+            "El San Jorge"
+        ),
+        2063.0: "CORPONARIÑO - Corporación Autónoma Regional de Nariño",
+        2064.0: "CORPONOR - Corporación Autónoma Regional de la Frontera Nororiental",
+        2065.0: "CORPORINOQUIA - Corporación Autónoma Regional de la Orinoquia",
+        2079.0: "CORPOURABA - Corporación para el Desarrollo Sostenible del Urabá",
+        2066.0: "CORTOLIMA - Corporación Autónoma Regional del Tolima",
+        2067.0: "CRA - Corporación Autónoma Regional del Atlántico",
+        2068.0: "CRC - Corporación Autónoma Regional del Cauca",
+        2069.0: "CRQ - Corporación Autónoma Regional del Quindío",
+        2070.0: "CSB - Corporación Autónoma Regional del Sur de Bolívar",
+        2071.0: "CVC - Corporación Autónoma Regional del Valle del Cauca",
+        2072.0: (
+            "CVS - Corporación Autónoma Regional de los Valles del Sinú y del San "
+            "Jorge"
+        ),
+        2084.0: (
+            "DADMA - Departamento Administrativo Distrital del Medio Ambiente de "
+            "Santa Marta"
+        ),
+        2082.0: (
+            "DAGMA - Departamento Administrativo de Gestión del Medio Ambiente – "
+            "Cali"
+        ),
+        2083.0: (
+            "DAMAB - Departamento Técnico Administrativo del Medio Ambiente de "
+            "Barranquilla"
+        ),
+        2085.0: "EPA - Establecimiento Público Ambiental – Cartagena",
+        2041.0: "INCODER - Instituto Colombiano de Desarrollo Rural",
+        2043.0: "INCORA - Instituto Colombiano de la Reforma Agraria",
+        2040.0: (
+            "INDERENA - Instituto Nacional de Recursos Naturales Renovables y del "
+            "Ambiente"
+        ),
+        2044.0: "INPA - Instituto Nacional de Pesca y Acuicultura",
+        2045.0: "MADR - MInisterio de Agricultura y Desarrollo Rural",
+        2042.0: "MADS - Ministerio de Ambiente y Desarrollo Sostenible",
+        2039.0: "MAVDT - Ministerio de Ambiente, Vivienda y Desarrollo Territorial",
+        2046.0: "Otra",
+        2080.0: "SDA - Secretaría Distrital de Ambiente – Bogotá"
+    })
 
 class Dom_Vigencia(float, Enum):
     """
@@ -380,13 +408,10 @@ class Dom_Vigencia(float, Enum):
     TEMPORAL = 2030.0
     INDEFINIDA = 2031.0
 
-    @property
-    def description(self):
-        descripciones = {
-            2030.0: "Temporal",
-            2031.0: "Indefinida"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        2030.0: "Temporal",
+        2031.0: "Indefinida"
+    })
 
 class Dom_Uso_Flora(float, Enum):
     """
@@ -401,18 +426,15 @@ class Dom_Uso_Flora(float, Enum):
     HABITACION = 361.0
     OTRO = 362.0
 
-    @property
-    def description(self):
-        descripciones = {
-            351.0: "Actividades Productivas",
-            353.0: "Aseo",
-            355.0: "Uso Cultural",
-            356.0: "Cultivo",
-            359.0: "Subsistencia",
-            361.0: "Habitación",
-            362.0: "Otro"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        351.0: "Actividades Productivas",
+        353.0: "Aseo",
+        355.0: "Uso Cultural",
+        356.0: "Cultivo",
+        359.0: "Subsistencia",
+        361.0: "Habitación",
+        362.0: "Otro"
+    })
 
 
 class Dom_Habito(float, Enum):
@@ -431,21 +453,18 @@ class Dom_Habito(float, Enum):
     SUCULENTAS = 379.0
     OTRO = 380.0
 
-    @property
-    def description(self):
-        descripciones = {
-            371.0: "Arbol",
-            372.0: "Arbusto",
-            373.0: "Hierba",
-            374.0: "Sufrútice",
-            375.0: "Enredadera",
-            376.0: "Liana",
-            377.0: "Epífita",
-            378.0: "Hemiparásita",
-            379.0: "Suculentas",
-            380.0: "Otro"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        371.0: "Arbol",
+        372.0: "Arbusto",
+        373.0: "Hierba",
+        374.0: "Sufrútice",
+        375.0: "Enredadera",
+        376.0: "Liana",
+        377.0: "Epífita",
+        378.0: "Hemiparásita",
+        379.0: "Suculentas",
+        380.0: "Otro"
+    })
 
 class Dom_Veda(float, Enum):
     """
@@ -455,13 +474,10 @@ class Dom_Veda(float, Enum):
     NACIONAL = 341.0
     REGIONAL = 342.0
 
-    @property
-    def description(self):
-        descripciones = {
-            341.0: "Nacional",
-            342.0: "Regional"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        341.0: "Nacional",
+        342.0: "Regional"
+    })
 
 class Dom_TipoTransecto(int, Enum):
     """
@@ -472,14 +488,11 @@ class Dom_TipoTransecto(int, Enum):
     ANCHO_VARIABLE = 502
     OTRO = 503
 
-    @property
-    def description(self):
-        descripciones = {
-            501: "Ancho fijo",
-            502: "Ancho variable",
-            503: "Otro"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        501: "Ancho fijo",
+        502: "Ancho variable",
+        503: "Otro"
+    })
 
 # --- DOMINIOS DE ECOLOGÍA ---
 
@@ -496,21 +509,18 @@ class Dom_Tipo_Migra(int, Enum):
     LONGITUDINAL = 109
     ALTITUDINAL = 110
 
-    @property
-    def description(self):
-        descripciones = {
-            101: "Intrageneracional",
-            102: "Intergeneracional",
-            103: "Cíclica",
-            104: "Unidireccional",
-            105: "Estacional",
-            106: "Irrupción Poblacional",
-            107: "Nomadismo",
-            108: "Latitudinal",
-            109: "Longitudinal",
-            110: "Altitudinal"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        101: "Intrageneracional",
+        102: "Intergeneracional",
+        103: "Cíclica",
+        104: "Unidireccional",
+        105: "Estacional",
+        106: "Irrupción Poblacional",
+        107: "Nomadismo",
+        108: "Latitudinal",
+        109: "Longitudinal",
+        110: "Altitudinal"
+    })
 
 class Dom_Uso_Fauna(int, Enum):
     """Dominio para Uso de la Especie (USO)"""
@@ -520,16 +530,13 @@ class Dom_Uso_Fauna(int, Enum):
     SUBSISTENCIA = 304
     OTRO = 305
 
-    @property
-    def description(self):
-        descripciones = {
-            301: "Actividades Productivas",
-            302: "Mascotas",
-            303: "Uso Cultural",
-            304: "Subsistencia",
-            305: "Otro"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        301: "Actividades Productivas",
+        302: "Mascotas",
+        303: "Uso Cultural",
+        304: "Subsistencia",
+        305: "Otro"
+    })
 
 class Dom_Dieta(int, Enum):
     """
@@ -543,17 +550,14 @@ class Dom_Dieta(int, Enum):
     CARNIVORO = 405     # Carnivoro (Sin tilde en norma)
     OTRO = 406
 
-    @property
-    def description(self):
-        descripciones = {
-            401: "Frugívoro",  # Con tilde
-            402: "Herbívoro",  # Con tilde
-            403: "Insectivoro",
-            404: "Omnivoro",
-            405: "Carnivoro",
-            406: "Otro"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        401: "Frugívoro",  # Con tilde
+        402: "Herbívoro",  # Con tilde
+        403: "Insectivoro",
+        404: "Omnivoro",
+        405: "Carnivoro",
+        406: "Otro"
+    })
 
 class Dom_Sector(float, Enum):
     """
@@ -567,17 +571,14 @@ class Dom_Sector(float, Enum):
     AGROQUIMICOS = 105.0
     PROYECTOS_ESPECIALES = 106.0
 
-    @property
-    def description(self):
-        descripciones = {
-            101.0: "Hidrocarburos",
-            102.0: "Infraestructura",
-            103.0: "Minería",
-            104.0: "Energía",
-            105.0: "Agroquímicos",
-            106.0: "Proyectos Especiales"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        101.0: "Hidrocarburos",
+        102.0: "Infraestructura",
+        103.0: "Minería",
+        104.0: "Energía",
+        105.0: "Agroquímicos",
+        106.0: "Proyectos Especiales"
+    })
 
 
 class Dom_TipoTransecto(int, Enum):
@@ -589,15 +590,11 @@ class Dom_TipoTransecto(int, Enum):
     ANCHO_VARIABLE = 502
     OTRO = 503
 
-    @property
-    def description(self):
-        """Devuelve la descripción textual del código."""
-        descripciones = {
-            501: "Ancho fijo",
-            502: "Ancho variable",
-            503: "Otro"
-        }
-        return descripciones.get(self.value, "Desconocido")
+    description = _description_table({
+        501: "Ancho fijo",
+        502: "Ancho variable",
+        503: "Otro"
+    }, defecto="Desconocido")
 
 class Dom_Boolean(float, Enum):
     """
@@ -607,13 +604,10 @@ class Dom_Boolean(float, Enum):
     SI = 1.0
     NO = 2.0
 
-    @property
-    def description(self):
-        descripciones = {
-            1.0: "Sí",
-            2.0: "No"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1.0: "Sí",
+        2.0: "No"
+    })
 
 
 
@@ -625,13 +619,10 @@ class Dom_TipoMuestreoFau(float, Enum):
     PUNTUAL = 411.0
     PARCELA = 412.0
 
-    @property
-    def description(self):
-        descripciones = {
-            411.0: "Puntual",
-            412.0: "Parcela"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        411.0: "Puntual",
+        412.0: "Parcela"
+    })
 
 class Dom_Deter(float, Enum):
     """
@@ -647,19 +638,16 @@ class Dom_Deter(float, Enum):
     PELOS = 418.0
     OTRO = 419.0
 
-    @property
-    def description(self):
-        descripciones = {
-            411.0: "Captura de individuos",
-            413.0: "Observación",
-            414.0: "Marcas de Individuos",
-            415.0: "Detección auditiva",
-            416.0: "Huellas",
-            417.0: "Heces",
-            418.0: "Pelos",
-            419.0: "Otro"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        411.0: "Captura de individuos",
+        413.0: "Observación",
+        414.0: "Marcas de Individuos",
+        415.0: "Detección auditiva",
+        416.0: "Huellas",
+        417.0: "Heces",
+        418.0: "Pelos",
+        419.0: "Otro"
+    })
 
 class Dom_Regeneracion(int, Enum):
     """
@@ -671,14 +659,11 @@ class Dom_Regeneracion(int, Enum):
     BRINZAL = 2
     LATIZAL = 3
 
-    @property
-    def description(self):
-        descripciones = {
-            1: "Renuevo o plántula",
-            2: "Brinzal",
-            3: "Latizal"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1: "Renuevo o plántula",
+        2: "Brinzal",
+        3: "Latizal"
+    })
 
 class Dom_CAR(float, Enum):
     """
@@ -728,52 +713,49 @@ class Dom_CAR(float, Enum):
     MADS = 1040.0
     SPNN = 1041.0
 
-    @property
-    def description(self):
-        descripciones = {
-            1001.0: "AMVA",
-            1002.0: "CAM",
-            1003.0: "CAR",
-            1004.0: "CARDER",
-            1005.0: "CARDIQUE",
-            1006.0: "CARSUCRE",
-            1007.0: "CAS",
-            1008.0: "CDA",
-            1009.0: "CDMB",
-            1010.0: "CODECHOCO",
-            1011.0: "CORALINA",
-            1012.0: "CORANTIOQUIA",
-            1013.0: "CORMACARENA",
-            1014.0: "CORNARE",
-            1015.0: "CORPAMAG",
-            1016.0: "CORPOAMAZONIA",
-            1017.0: "CORPOBOYACA",
-            1018.0: "CORPOCALDAS",
-            1019.0: "CORPOCESAR",
-            1020.0: "CORPOCHIVOR",
-            1021.0: "CORPOGUAJIRA",
-            1022.0: "CORPOGUAVIO",
-            1023.0: "CORPOMOJANA",
-            1024.0: "CORPONARIÑO",
-            1025.0: "CORPONOR",
-            1026.0: "CORPORINOQUIA",
-            1027.0: "CORPOURABA",
-            1028.0: "CORTOLIMA",
-            1029.0: "CRA",
-            1030.0: "CRC",
-            1031.0: "CRQ",
-            1032.0: "CSB",
-            1033.0: "CVC",
-            1034.0: "CVS",
-            1035.0: "DADMA",
-            1036.0: "DAGMA",
-            1037.0: "DAMAB",
-            1038.0: "EPA",
-            1039.0: "SDA",
-            1040.0: "MADS",
-            1041.0: "SPNN"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1001.0: "AMVA",
+        1002.0: "CAM",
+        1003.0: "CAR",
+        1004.0: "CARDER",
+        1005.0: "CARDIQUE",
+        1006.0: "CARSUCRE",
+        1007.0: "CAS",
+        1008.0: "CDA",
+        1009.0: "CDMB",
+        1010.0: "CODECHOCO",
+        1011.0: "CORALINA",
+        1012.0: "CORANTIOQUIA",
+        1013.0: "CORMACARENA",
+        1014.0: "CORNARE",
+        1015.0: "CORPAMAG",
+        1016.0: "CORPOAMAZONIA",
+        1017.0: "CORPOBOYACA",
+        1018.0: "CORPOCALDAS",
+        1019.0: "CORPOCESAR",
+        1020.0: "CORPOCHIVOR",
+        1021.0: "CORPOGUAJIRA",
+        1022.0: "CORPOGUAVIO",
+        1023.0: "CORPOMOJANA",
+        1024.0: "CORPONARIÑO",
+        1025.0: "CORPONOR",
+        1026.0: "CORPORINOQUIA",
+        1027.0: "CORPOURABA",
+        1028.0: "CORTOLIMA",
+        1029.0: "CRA",
+        1030.0: "CRC",
+        1031.0: "CRQ",
+        1032.0: "CSB",
+        1033.0: "CVC",
+        1034.0: "CVS",
+        1035.0: "DADMA",
+        1036.0: "DAGMA",
+        1037.0: "DAMAB",
+        1038.0: "EPA",
+        1039.0: "SDA",
+        1040.0: "MADS",
+        1041.0: "SPNN"
+    })
 
 class Dom_Tipo_Actadmin(float, Enum):
     """
@@ -784,13 +766,10 @@ class Dom_Tipo_Actadmin(float, Enum):
     AUTO = 1.0
     RESOLUCION = 2.0
 
-    @property
-    def description(self):
-        descripciones = {
-            1.0: "Auto",
-            2.0: "Resolución"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1.0: "Auto",
+        2.0: "Resolución"
+    })
 
 class Dom_SubAct_Comp(float, Enum):
     """
@@ -810,22 +789,28 @@ class Dom_SubAct_Comp(float, Enum):
     AMPLIACION_RESTAURACION = 1210.0
     OTRA = 1211.0
 
-    @property
-    def description(self):
-        descripciones = {
-            1201.0: "Apoyo creación nuevas áreas protegidas publicas y su plan de manejo ambiental",
-            1202.0: "Crear nuevas áreas protegidas privadas y su plan de manejo ambiental",
-            1203.0: "Establecer acuerdos de conservación, servidumbre ecológicas, Incentivos para mantenimiento y conservación de las áreas",
-            1204.0: "Restauración ecológica",
-            1205.0: "Rehabilitación",
-            1206.0: "Recuperación",
-            1207.0: "Reforestación protectora",
-            1208.0: "Herramienta de manejo de paisaje, proyectos silvopastoriles, agroforestales, silviculturales, etc) en áreas agrícolas y ganaderas",
-            1209.0: "Saneamientos predial/restauración ecológica",
-            1210.0: "Ampliación y restauración ecológica",
-            1211.0: "Otra"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        1201.0: (
+            "Apoyo creación nuevas áreas protegidas publicas y su plan de manejo "
+            "ambiental"
+        ),
+        1202.0: "Crear nuevas áreas protegidas privadas y su plan de manejo ambiental",
+        1203.0: (
+            "Establecer acuerdos de conservación, servidumbre ecológicas, Incentivos "
+            "para mantenimiento y conservación de las áreas"
+        ),
+        1204.0: "Restauración ecológica",
+        1205.0: "Rehabilitación",
+        1206.0: "Recuperación",
+        1207.0: "Reforestación protectora",
+        1208.0: (
+            "Herramienta de manejo de paisaje, proyectos silvopastoriles, "
+            "agroforestales, silviculturales, etc) en áreas agrícolas y ganaderas"
+        ),
+        1209.0: "Saneamientos predial/restauración ecológica",
+        1210.0: "Ampliación y restauración ecológica",
+        1211.0: "Otra"
+    })
 
 
 class Dom_Otras_Comp(float, Enum):
@@ -849,25 +834,22 @@ class Dom_Otras_Comp(float, Enum):
     CAMBIO_COBERTURA_USO = 20114.0
     OTRA = 20115.0
 
-    @property
-    def description(self):
-        descripciones = {
-            20101.0: "Aprovechamiento forestal",
-            20102.0: "Concesión de aguas",
-            20103.0: "Contingencias",
-            20104.0: "Emisiones atmosféricas",
-            20105.0: "Levantamiento de vedas",
-            20106.0: "Multas o sanciones",
-            20107.0: "Ocupación de cauce",
-            20108.0: "Paisaje",
-            20110.0: "Permiso de tala y poda",
-            20111.0: "Permiso de vertimiento",
-            20112.0: "Residuos sólidos",
-            20113.0: "Sustracción de áreas en las reservas forestales (la Ley 2ª de 1959)",
-            20114.0: "Cambio de cobertura y uso del suelo",
-            20115.0: "Otra"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        20101.0: "Aprovechamiento forestal",
+        20102.0: "Concesión de aguas",
+        20103.0: "Contingencias",
+        20104.0: "Emisiones atmosféricas",
+        20105.0: "Levantamiento de vedas",
+        20106.0: "Multas o sanciones",
+        20107.0: "Ocupación de cauce",
+        20108.0: "Paisaje",
+        20110.0: "Permiso de tala y poda",
+        20111.0: "Permiso de vertimiento",
+        20112.0: "Residuos sólidos",
+        20113.0: "Sustracción de áreas en las reservas forestales (la Ley 2ª de 1959)",
+        20114.0: "Cambio de cobertura y uso del suelo",
+        20115.0: "Otra"
+    })
 
 class Dom_EstInver(float, Enum):
     """
@@ -883,18 +865,15 @@ class Dom_EstInver(float, Enum):
     NO_VIABLE = 35006.0
     MODIFICADO = 35007.0
 
-    @property
-    def description(self):
-        descripciones = {
-            35001.0: "Evaluación",
-            35002.0: "Aprobado por ejecutar",
-            35003.0: "Aprobado en ejecución",
-            35004.0: "Ejecutado",
-            35005.0: "No se ejecutó",
-            35006.0: "No viable",
-            35007.0: "Modificado"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        35001.0: "Evaluación",
+        35002.0: "Aprobado por ejecutar",
+        35003.0: "Aprobado en ejecución",
+        35004.0: "Ejecutado",
+        35005.0: "No se ejecutó",
+        35006.0: "No viable",
+        35007.0: "Modificado"
+    })
 
 class Dom_ModInterv(float, Enum):
     """
@@ -916,24 +895,21 @@ class Dom_ModInterv(float, Enum):
     BIOREMEDIACION = 21.0
     OTRA_ESTRATEGIA = 22.0
 
-    @property
-    def description(self):
-        descripciones = {
-            10.0: "Barrera viva",
-            11.0: "Agroforestal",
-            12.0: "Productora",
-            13.0: "Productora - Protectora",
-            14.0: "Protectora",
-            15.0: "Cortinas Rompevientos",
-            16.0: "Cercas vivas",
-            17.0: "Monocultivo (Plantación Protectora)",
-            18.0: "Corredor Biológico",
-            19.0: "Enriquecimiento",
-            20.0: "Regeneración Natural Asistida",
-            21.0: "Bioremediación",
-            22.0: "Otra estrategia"
-        }
-        return descripciones.get(self.value)
+    description = _description_table({
+        10.0: "Barrera viva",
+        11.0: "Agroforestal",
+        12.0: "Productora",
+        13.0: "Productora - Protectora",
+        14.0: "Protectora",
+        15.0: "Cortinas Rompevientos",
+        16.0: "Cercas vivas",
+        17.0: "Monocultivo (Plantación Protectora)",
+        18.0: "Corredor Biológico",
+        19.0: "Enriquecimiento",
+        20.0: "Regeneración Natural Asistida",
+        21.0: "Bioremediación",
+        22.0: "Otra estrategia"
+    })
 
 # ==============================================================================
 # NUEVOS DOMINIOS PENDIENTES DE DEFINICION
@@ -0,0 +1,314 @@
+"""
+Coherencia jerárquica de los códigos Corine Land Cover (CLC).
+
+Los códigos CLC se anidan por dígitos decimales: el código de un nivel
+empieza por el código del nivel anterior (3 -> 31 -> 311 -> 3111 ...). En vez
+de comparar textos fila a fila, el prefijo se comprueba con aritmética
+entera sobre arreglos de NumPy, de modo que la misma función sirve para una
+sola fila (validador de Pydantic) y para una capa completa (motor columnar).
+
+``ClcTree`` precalcula el árbol completo de los seis dominios CLC: padre,
+ancestros, hijos y descendientes de cada código en O(1), y sus variantes
+vectorizadas sobre columnas de NOMENCLAT (arreglos de NumPy o series de
+Polars) para validar o agregar capas enteras por nivel.
+"""
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from geoanla.catalog.corineland import DOMINIOS_CLC
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Columnas de los niveles CLC, del más general al más detallado
+NIVELES_CLC = (
+    'N1_COBERT', 'N2_COBERT', 'N3_COBERT', 'N4_COBERT', 'N5_COBERT', 'N6_COBERT'
+)
+
+# A partir de este nivel (1-based) la comparación solo aplica si el nivel y
+# todos los opcionales anteriores fueron reportados
+NIVEL_OPCIONAL_CLC = 4
+
+MENSAJES_JERARQUIA_CLC = {
+    2: "Nivel 2 ({hijo}) incoherente con Nivel 1 ({padre})",
+    3: "Nivel 3 ({hijo}) incoherente con Nivel 2 ({padre})",
+    4: "Nivel 4 ({hijo}) incoherente",
+    5: "Nivel 5 ({hijo}) incoherente",
+    6: "Nivel 6 ({hijo}) incoherente",
+}
+
+MENSAJE_NOMENCLATURA_CLC = (
+    "La NOMENCLAT ({codigo}) debe coincidir con el nivel reportado ({nivel})"
+)
+
+_POTENCIAS_10 = 10 ** np.arange(19, dtype=np.int64)
+
+
+def as_level_matrix(filas: Any) -> np.ndarray:
+    """Convierte los niveles a una matriz (n, 6) de float con NaN para los ausentes."""
+    return np.atleast_2d(np.asarray(filas, dtype=np.float64))
+
+
+def digit_count(codigos: np.ndarray) -> np.ndarray:
+    """Número de dígitos decimales de cada código entero positivo."""
+    return np.searchsorted(_POTENCIAS_10, codigos, side='right')
+
+
+def is_code_prefix(padre: np.ndarray, hijo: np.ndarray) -> np.ndarray:
+    """Equivalente vectorizado de ``str(hijo).startswith(str(padre))``."""
+    digitos_padre, digitos_hijo = digit_count(padre), digit_count(hijo)
+    salto = np.clip(digitos_hijo - digitos_padre, 0, None)
+    return (digitos_hijo >= digitos_padre) & (hijo // _POTENCIAS_10[salto] == padre)
+
+
+def hierarchy_breaks(niveles: Any) -> np.ndarray:
+    """
+    Primer nivel incoherente de cada fila.
+
+    Args:
+        niveles: Matriz (n, 6) con N1..N6 (NaN o None para los niveles ausentes).
+
+    Returns:
+        Arreglo int8 con el nivel (2..6) del primer quiebre, o 0 si la fila
+        es coherente.
+    """
+    niveles = as_level_matrix(niveles)
+    presentes = ~np.isnan(niveles)
+    # El truncamiento de astype equivale al int() del validador original
+    codigos = np.where(presentes, niveles, 0).astype(np.int64)
+
+    quiebres = np.zeros(len(niveles), dtype=np.int8)
+    activos = np.ones(len(niveles), dtype=bool)
+    for k in range(1, niveles.shape[1]):
+        nivel = k + 1
+        if nivel >= NIVEL_OPCIONAL_CLC:
+            activos &= presentes[:, k]
+        prefijo = is_code_prefix(codigos[:, k - 1], codigos[:, k])
+        falla = activos & (quiebres == 0) & ~prefijo
+        quiebres[falla] = nivel
+    return quiebres
+
+
+def hierarchy_message(fila: Sequence[float], nivel: int) -> str:
+    """Mensaje de error para el quiebre ``nivel`` de una fila de niveles."""
+    return MENSAJES_JERARQUIA_CLC[nivel].format(
+        hijo=int(fila[nivel - 1]), padre=int(fila[nivel - 2])
+    )
+
+
+def detail_codes(niveles: Any) -> np.ndarray:
+    """Código del nivel más detallado reportado entre N3 y N6 (NaN si ninguno)."""
+    niveles = as_level_matrix(niveles)
+    detalle = np.full(len(niveles), np.nan)
+    for k in range(2, niveles.shape[1]):
+        detalle = np.where(np.isnan(niveles[:, k]), detalle, niveles[:, k])
+    return detalle
+
+
+def nomenclature_mismatches(niveles: Any, nomenclat: Any) -> np.ndarray:
+    """Filas cuyo NOMENCLAT no coincide con el nivel más detallado reportado."""
+    detalle = detail_codes(niveles)
+    presentes = ~np.isnan(detalle)
+    codigos = np.where(presentes, detalle, 0).astype(np.int64)
+    return presentes & (codigos != np.asarray(nomenclat))
+
+
+# ==========================================
+# ÁRBOL CLC
+# ==========================================
+
+def _as_code_array(codigos: Any) -> np.ndarray:
+    """
+    Códigos como arreglo int64; los nulos, NaN y no enteros quedan en -1
+    (no existen en el árbol).
+    """
+    valores = np.atleast_1d(np.asarray(codigos, dtype=np.float64))
+    enteros = np.isfinite(valores) & (valores % 1 == 0)
+    return np.where(enteros, valores, -1).astype(np.int64)
+
+
+def _as_key(codigo: Any) -> Optional[int]:
+    """
+    Código escalar (int, float entero, texto "311" o miembro Enum) como int,
+    o None.
+    """
+    try:
+        valor = float(getattr(codigo, 'value', codigo))
+    except (TypeError, ValueError):
+        return None
+    return int(valor) if valor.is_integer() else None
+
+
+class ClcTree:
+    """
+    Árbol precalculado de los códigos Corine Land Cover.
+
+    Los códigos se guardan en preorden (orden de texto: 3, 31, 311, 3111,
+    312, ...), así los descendientes de un código son un tramo contiguo y
+    se enumeran sin recorrer el catálogo.
+
+    Atributos:
+        niveles: código -> nivel (1..6) según el dominio que lo declara.
+        padres: código -> código del nivel anterior (None en el nivel 1 o si
+            el prefijo no existe).
+        hijos: código -> códigos del nivel siguiente que lo tienen de padre.
+        ancestros: código -> cadena de ancestros, del nivel 1 al padre.
+    """
+
+    def __init__(self, dominios: Sequence[type]):
+        self.niveles: Dict[int, int] = {}
+        for nivel, dominio in enumerate(dominios, start=1):
+            for miembro in dominio:
+                self.niveles.setdefault(int(miembro.value), nivel)
+
+        self.padres: Dict[int, Optional[int]] = {}
+        self.hijos: Dict[int, Tuple[int, ...]] = {}
+        self.ancestros: Dict[int, Tuple[int, ...]] = {}
+        self._preorden = tuple(sorted(self.niveles, key=str))
+        self._posicion = {codigo: i for i, codigo in enumerate(self._preorden)}
+        self._fin: Dict[int, int] = {}
+
+        hijos: Dict[int, list] = {codigo: [] for codigo in self._preorden}
+        for codigo in self._preorden:
+            padre = codigo // 10
+            if self.niveles.get(padre) != self.niveles[codigo] - 1:
+                padre = None
+            self.padres[codigo] = padre
+            if padre is None:
+                self.ancestros[codigo] = ()
+            else:
+                self.ancestros[codigo] = self.ancestros[padre] + (padre,)
+                hijos[padre].append(codigo)
+        self.hijos = {codigo: tuple(h) for codigo, h in hijos.items()}
+
+        # Fin del tramo de descendientes de cada código en el preorden
+        for i in range(len(self._preorden) - 1, -1, -1):
+            codigo = self._preorden[i]
+            self._fin[codigo] = max(
+                [i + 1] + [self._fin[h] for h in self.hijos[codigo]]
+            )
+
+        # Versión en arreglos para las consultas vectorizadas (ordenados por valor)
+        self._ordenados = np.array(sorted(self.niveles), dtype=np.int64)
+        self._nivel_arr = np.array(
+            [self.niveles[c] for c in self._ordenados], dtype=np.int8
+        )
+        self._padre_arr = np.array([
+            np.nan if self.padres[c] is None else self.padres[c]
+            for c in self._ordenados.tolist()
+        ])
+        self._linaje = np.full((len(self._ordenados), len(dominios)), np.nan)
+        for fila, codigo in enumerate(self._ordenados):
+            for ancestro in self.ancestros[int(codigo)] + (int(codigo),):
+                self._linaje[fila, self.niveles[ancestro] - 1] = ancestro
+
+    def __len__(self) -> int:
+        return len(self.niveles)
+
+    def __contains__(self, codigo: Any) -> bool:
+        return _as_key(codigo) in self.niveles
+
+    # --- Consultas por código ---
+
+    def level(self, codigo: Any) -> Optional[int]:
+        """Nivel (1..6) del código, o None si no es un código CLC."""
+        return self.niveles.get(_as_key(codigo))
+
+    def parent(self, codigo: Any) -> Optional[int]:
+        """Código del nivel anterior, o None."""
+        return self.padres.get(_as_key(codigo))
+
+    def ancestors(self, codigo: Any) -> Tuple[int, ...]:
+        """Ancestros del código, del nivel 1 al padre (vacío si no existe)."""
+        return self.ancestros.get(_as_key(codigo), ())
+
+    def children(self, codigo: Any) -> Tuple[int, ...]:
+        """Códigos del nivel siguiente bajo ``codigo``."""
+        return self.hijos.get(_as_key(codigo), ())
+
+    def descendants(self, codigo: Any) -> Tuple[int, ...]:
+        """Todos los códigos bajo ``codigo`` (sin incluirlo), en preorden."""
+        clave = _as_key(codigo)
+        if clave not in self._posicion:
+            return ()
+        return self._preorden[self._posicion[clave] + 1:self._fin[clave]]
+
+    def is_ancestor(self, ancestro: Any, codigo: Any) -> bool:
+        """Indica si ``ancestro`` está en la cadena de ancestros de ``codigo``."""
+        return _as_key(ancestro) in self.ancestros.get(_as_key(codigo), ())
+
+    def leaves(self, nivel_minimo: int = 1) -> Tuple[int, ...]:
+        """Códigos sin hijos desde ``nivel_minimo``, en preorden."""
+        return tuple(
+            c for c in self._preorden
+            if not self.hijos[c] and self.niveles[c] >= nivel_minimo
+        )
+
+    # --- Variantes vectorizadas (columnas de NOMENCLAT) ---
+
+    def _lookup(self, codigos: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Posición de cada código en los arreglos del árbol y si existe."""
+        enteros = _as_code_array(codigos)
+        posiciones = np.searchsorted(self._ordenados, enteros)
+        posiciones = posiciones.clip(0, len(self._ordenados) - 1)
+        return posiciones, self._ordenados[posiciones] == enteros
+
+    def levels(self, codigos: Any) -> np.ndarray:
+        """Nivel de cada código (int8), 0 si no es un código CLC."""
+        posiciones, existe = self._lookup(codigos)
+        return np.where(existe, self._nivel_arr[posiciones], 0).astype(np.int8)
+
+    def lineage(self, codigos: Any) -> np.ndarray:
+        """
+        Matriz (n, 6) con N1..N6 de cada código: sus ancestros y él mismo en
+        su nivel, NaN en los niveles más detallados o si no existe.
+        """
+        posiciones, existe = self._lookup(codigos)
+        return np.where(existe[:, None], self._linaje[posiciones], np.nan)
+
+    def rollup(self, codigos: Any, nivel: int) -> np.ndarray:
+        """
+        Código de cada fila agregado a ``nivel`` (p. ej. 311121 -> 31 con
+        ``nivel=2``); NaN si el código no existe o es menos detallado.
+        """
+        posiciones, existe = self._lookup(codigos)
+        return np.where(existe, self._linaje[posiciones, nivel - 1], np.nan)
+
+    def parents(self, codigos: Any) -> np.ndarray:
+        """Padre de cada código (float, NaN en el nivel 1 o si no existe)."""
+        posiciones, existe = self._lookup(codigos)
+        return np.where(existe, self._padre_arr[posiciones], np.nan)
+
+    def is_descendant(self, codigos: Any, ancestro: Any) -> np.ndarray:
+        """Filas cuyo código está bajo ``ancestro`` (sin incluirlo)."""
+        nivel = self.level(ancestro)
+        if nivel is None:
+            return np.zeros(len(_as_code_array(codigos)), dtype=bool)
+        bajo_ancestro = self.rollup(codigos, nivel) == _as_key(ancestro)
+        return bajo_ancestro & (self.levels(codigos) > nivel)
+
+    def frame(self) -> "pl.DataFrame":
+        """
+        Tabla del árbol, una fila por código: ``NOMENCLAT``, ``NIVEL``,
+        ``PADRE`` y N1..N6 del linaje. Sirve para agregar una capa por nivel
+        con un join sobre NOMENCLAT.
+        """
+        import polars as pl
+
+        return pl.DataFrame({
+            'NOMENCLAT': pl.Series(self._ordenados, dtype=pl.Int64),
+            'NIVEL': pl.Series(self._nivel_arr, dtype=pl.Int8),
+            'PADRE': pl.Series(self._padre_arr).fill_nan(None).cast(pl.Int64),
+            **{
+                columna: pl.Series(self._linaje[:, k]).fill_nan(None).cast(pl.Int64)
+                for k, columna in enumerate(NIVELES_CLC)
+            },
+        })
+
+
+@lru_cache(maxsize=None)
+def clc_tree() -> ClcTree:
+    """Árbol CLC de los seis dominios, construido en el primer uso."""
+    return ClcTree(DOMINIOS_CLC)
@@ -1,7 +1,9 @@
-import pandas as pd
+import csv
+import hashlib
 from enum import Enum
 import unicodedata
 import os
+from typing import List, Optional, Union
 
 # ---------------------------------------------------------------------------
 # DOMINIO MUNICIPIO
@@ -23,36 +25,72 @@ def normalize_name(texto):
     return "".join(c for c in nombre_limpio if c.isalnum() or c == '_')
 
 
-# 2. Cargar datos del CSV (NUEVA LÓGICA)
+# 2. Fuente del catálogo: el CSV solo se lee al regenerar ``_municipios.py``
 DIR_BASE = os.path.dirname(os.path.abspath(__file__))
 # Ahora el archivo está en una subcarpeta 'data' dentro de 'catalog'
 RUTA_MUNICIPIOS = os.path.join(DIR_BASE, "data", "municipios_codigos.csv")
+RUTA_CATALOGO_GENERADO = os.path.join(DIR_BASE, "_municipios.py")
 
-if not os.path.exists(RUTA_MUNICIPIOS):
-    # Intentar una ruta alternativa por si acaso (para desarrollo local)
-    RUTA_MUN_ALT = os.path.join(
-        DIR_BASE, "..", "..", "..", "data", "raw", "municipios_codigos.csv"
-    )
-    if os.path.exists(RUTA_MUN_ALT):
-        RUTA_MUNICIPIOS = RUTA_MUN_ALT
-    else:
-        raise FileNotFoundError(
-            f"No se encontró el archivo en {RUTA_MUNICIPIOS}"
+
+def build_catalog(
+    ruta_csv: str = RUTA_MUNICIPIOS, ruta_salida: str = RUTA_CATALOGO_GENERADO
+) -> int:
+    """
+    Genera el módulo ``_municipios.py`` a partir del CSV DIVIPOLA: códigos
+    con ceros a la izquierda, nombre oficial, clave del Enum y nombre
+    normalizado, ya calculados. Se corre al actualizar el CSV::
+
+        python -m geoanla.catalog.municipios
+
+    Returns:
+        Número de municipios escritos.
+    """
+    if not os.path.exists(ruta_csv):
+        raise FileNotFoundError(f"No se encontró el archivo en {ruta_csv}")
+    with open(ruta_csv, 'rb') as archivo:
+        huella = hashlib.sha256(archivo.read()).hexdigest()
+    with open(ruta_csv, encoding='utf-8', newline='') as archivo:
+        # Rellenamos ceros a la izquierda (ej. 5001 -> 05001)
+        filas = [
+            (fila['id'].strip().zfill(5), fila['nombre'])
+            for fila in csv.DictReader(archivo)
+        ]
+
+    lineas = [
+        '"""',
+        'Catálogo DIVIPOLA de municipios generado desde data/municipios_codigos.csv.',
+        '',
+        'No editar a mano: regenerar con ``python -m geoanla.catalog.municipios``.',
+        '"""',
+        f'ORIGEN_SHA256 = {huella!r}',
+        '',
+        '# (código DIVIPOLA, nombre oficial, clave del Enum, nombre normalizado)',
+        'MUNICIPIOS = (',
+    ]
+    for codigo, nombre in filas:
+        normalizado = normalize_name(nombre)
+        clave = f"{normalizado}_{codigo}"
+        lineas.append(
+            f'    ({codigo!r}, {nombre!r}, {clave!r}, {normalizado!r}),'
         )
+    lineas.append(')')
+    with open(ruta_salida, 'w', encoding='utf-8') as archivo:
+        archivo.write('\n'.join(lineas) + '\n')
+    return len(filas)
 
-df_mun = pd.read_csv(RUTA_MUNICIPIOS, dtype={'id': str})
 
-# Rellenamos ceros a la izquierda (ej. 5001 -> 05001)
-df_mun['id'] = df_mun['id'].str.zfill(5)
+from geoanla.catalog._municipios import MUNICIPIOS  # noqa: E402
 
 # 3. Preparar Diccionarios para el Enum
-DICCIONARIO_DESC_MUNICIPIOS = dict(zip(df_mun['id'], df_mun['nombre']))
+DICCIONARIO_DESC_MUNICIPIOS = {codigo: nombre for codigo, nombre, _, _ in MUNICIPIOS}
 
 # MIEMBROS DEL ENUM: {NOMBRE_CLAVE: VALOR}
-miembros_enum = {}
-for _, fila in df_mun.iterrows():
-    nombre_clave = f"{normalize_name(fila['nombre'])}_{fila['id']}"
-    miembros_enum[nombre_clave] = fila['id']
+miembros_enum = {clave: codigo for codigo, _, clave, _ in MUNICIPIOS}
+
+# Nombre normalizado -> códigos (hay nombres repetidos entre departamentos)
+INDICE_NOMBRES = {}
+for codigo, _, _, normalizado in MUNICIPIOS:
+    INDICE_NOMBRES.setdefault(normalizado, []).append(codigo)
 
 
 # 4. Definir la Clase Base con la propiedad 'description'
@@ -64,4 +102,30 @@ class MunicipioBase(str, Enum):
 
 
 # 5. CREACIÓN MÁGICA DEL ENUM
-Dom_Municipio = Enum('Dom_Municipio', miembros_enum, type=MunicipioBase)
\ No newline at end of file
+Dom_Municipio = Enum('Dom_Municipio', miembros_enum, type=MunicipioBase)
+
+
+# 6. BÚSQUEDAS
+def find_municipio(codigo: Union[str, int, float]) -> Optional[Enum]:
+    """
+    Municipio por código DIVIPOLA ("05001", "5001", 5001 o 5001.0), o None
+    si el código no existe.
+    """
+    if isinstance(codigo, float) and codigo.is_integer():
+        codigo = int(codigo)
+    return Dom_Municipio._value2member_map_.get(str(codigo).strip().zfill(5))
+
+
+def search_municipio_name(nombre: str) -> List[Enum]:
+    """
+    Municipios cuyo nombre coincide sin importar tildes, mayúsculas ni
+    separadores ("bogota d.c." encuentra "BOGOTÁ, D.C."). Devuelve todos los
+    homónimos en el orden del catálogo.
+    """
+    codigos = INDICE_NOMBRES.get(normalize_name(nombre), [])
+    return [Dom_Municipio._value2member_map_[c] for c in codigos]
+
+
+if __name__ == "__main__":
+    total = build_catalog()
+    print(f"✅ {total} municipios escritos en {RUTA_CATALOGO_GENERADO}")
@@ -0,0 +1,446 @@
+"""
+Índices en memoria de los dominios (Enum) del catálogo.
+
+Cada Enum se indexa una sola vez por proceso, de forma perezosa, en tablas
+hash que permiten resolver en O(1) un código, una descripción o un nombre
+de miembro sin recorrer el Enum en cada consulta. Para la traducción
+columnar el mismo índice se expone como un marco de Polars (``lookup_frame``)
+y la normalización de textos tiene su versión en expresiones
+(``normalize_key_expr``), de modo que ambas rutas resuelven igual.
+
+El registro es el único lugar donde se arman los catálogos: cada dominio
+se expone como tabla columnar (``EnumIndex.table``) y como conjunto y
+serie de códigos, y los catálogos compuestos, como el CLC de seis niveles
+(``clc_catalog``, ``clc_codes``, ``clc_frame``), se construyen aquí una
+vez y los comparten los modelos, el motor columnar y las búsquedas. Para
+buscar por texto libre, ``TrigramIndex`` indexa las leyendas por trigramas
+(``clc_legend_index`` para el catálogo CLC).
+"""
+import difflib
+import re
+import unicodedata
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
+
+import polars as pl
+
+from geoanla.catalog import corineland, domains
+from geoanla.catalog.corineland import DOMINIOS_CLC
+
+# Tablas de ``EnumIndex`` que guarda la caché en disco (ver ``core.cache``)
+ESTADO_INDICE = ('por_descripcion', 'por_nombre', 'por_texto', 'descripciones')
+
+
+def normalize_key(valor: Any) -> str:
+    """
+    Normaliza un texto para buscarlo en los índices (sin espacios,
+    minúsculas, sin tildes).
+    """
+    texto = unicodedata.normalize('NFKD', str(valor).strip().lower())
+    return ''.join(c for c in texto if unicodedata.category(c) != 'Mn')
+
+
+def normalize_text(valor: Any) -> str:
+    """
+    ``normalize_key`` para texto libre: además colapsa la puntuación y los
+    espacios repetidos ("Bosque  de galería, ripario" -> "bosque de galeria ripario").
+    """
+    return re.sub(r'[\W_]+', ' ', normalize_key(valor)).strip()
+
+
+def normalize_key_expr(texto: pl.Expr) -> pl.Expr:
+    """Equivalente de ``normalize_key`` en expresiones de Polars (columna de texto)."""
+    return (
+        texto.str.strip_chars()
+        .str.to_lowercase()
+        .str.normalize('NFKD')
+        .str.replace_all(r'\p{Mn}', '')
+    )
+
+
+class EnumIndex:
+    """
+    Índice precalculado de un Enum del catálogo.
+
+    Atributos:
+        por_valor: código -> miembro del Enum.
+        por_descripcion: descripción normalizada -> código.
+        por_nombre: nombre de miembro normalizado -> código.
+        por_texto: descripción o nombre normalizado -> código, respetando el
+            orden de declaración (el primer miembro que coincide gana).
+        descripciones: código -> descripción oficial (o nombre si no tiene).
+        valores: Conjunto inmutable de códigos (pertenencia en O(1)).
+        dtype: Tipo de Polars de los códigos (Int64, Float64 o Utf8).
+
+    Con ``estado`` (las tablas de ``state()`` leídas de la caché en disco)
+    solo se recorren los miembros para ``por_valor``, sin normalizar textos.
+    """
+
+    def __init__(
+        self,
+        clase_enum: Type[Enum],
+        estado: Optional[Dict[str, Dict[Any, Any]]] = None,
+    ):
+        self.clase_enum = clase_enum
+        self.por_valor: Dict[Any, Enum] = {}
+        self.por_descripcion: Dict[str, Any] = {}
+        self.por_nombre: Dict[str, Any] = {}
+        self.por_texto: Dict[str, Any] = {}
+        self.descripciones: Dict[Any, str] = {}
+        self._marco: Optional[pl.DataFrame] = None
+        self._tabla: Optional[pl.DataFrame] = None
+        self._series: Dict[Any, pl.Series] = {}
+
+        if estado is not None:
+            for miembro in clase_enum:
+                self.por_valor.setdefault(miembro.value, miembro)
+            for nombre in ESTADO_INDICE:
+                setattr(self, nombre, estado[nombre])
+            self.valores: FrozenSet[Any] = frozenset(self.por_valor)
+            return
+
+        for miembro in clase_enum:
+            tiene_descripcion = hasattr(miembro, 'description')
+            descripcion = miembro.description if tiene_descripcion else None
+
+            self.por_valor.setdefault(miembro.value, miembro)
+            self.descripciones[miembro.value] = (
+                descripcion if tiene_descripcion else miembro.name
+            )
+
+            claves = []
+            if tiene_descripcion:
+                clave_desc = normalize_key(descripcion)
+                self.por_descripcion.setdefault(clave_desc, miembro.value)
+                claves.append(clave_desc)
+            clave_nombre = normalize_key(miembro.name)
+            self.por_nombre.setdefault(clave_nombre, miembro.value)
+            claves.append(clave_nombre)
+
+            for clave in claves:
+                self.por_texto.setdefault(clave, miembro.value)
+
+        self.valores = frozenset(self.por_valor)
+
+    def state(self) -> Dict[str, Dict[Any, Any]]:
+        """Tablas del índice que no dependen de los miembros (``ESTADO_INDICE``)."""
+        return {nombre: getattr(self, nombre) for nombre in ESTADO_INDICE}
+
+    @property
+    def dtype(self) -> pl.DataType:
+        """Tipo de Polars de los códigos, según el primer miembro del Enum."""
+        ejemplo = next(iter(self.por_valor))
+        if isinstance(ejemplo, int):
+            return pl.Int64
+        return pl.Float64 if isinstance(ejemplo, float) else pl.Utf8
+
+    @property
+    def codes(self) -> List[Any]:
+        """Códigos del Enum en orden de declaración."""
+        return list(self.por_valor)
+
+    @property
+    def integer_codes(self) -> List[float]:
+        """
+        Códigos numéricos de valor entero, como float (para comparar con
+        textos "1.0").
+        """
+        if self.dtype == pl.Utf8:
+            return []
+        return [float(c) for c in self.por_valor if float(c).is_integer()]
+
+    def lookup_frame(self) -> pl.DataFrame:
+        """
+        Marco ``clave -> codigo`` con las descripciones y nombres normalizados.
+        Se construye una sola vez y lo usan las expresiones de traducción.
+        """
+        if self._marco is None:
+            self._marco = pl.DataFrame({
+                'clave': pl.Series(list(self.por_texto.keys()), dtype=pl.Utf8),
+                'codigo': pl.Series(list(self.por_texto.values()), dtype=self.dtype),
+            })
+        return self._marco
+
+    def value_series(self, dtype: Optional[pl.DataType] = None) -> pl.Series:
+        """
+        Códigos del Enum como serie de Polars (por defecto en su ``dtype``),
+        lista para ``is_in``. Se arma una vez por tipo.
+        """
+        dtype = dtype or self.dtype
+        if dtype not in self._series:
+            serie = pl.Series('codigo', self.codes, dtype=self.dtype)
+            self._series[dtype] = serie.cast(dtype)
+        return self._series[dtype]
+
+    def table(self) -> pl.DataFrame:
+        """
+        Tabla columnar del dominio, una fila por miembro: ``codigo``,
+        ``descripcion``, ``nombre``, ``clave_descripcion`` y ``clave_nombre``
+        (las claves normalizadas con ``normalize_key``).
+        """
+        if self._tabla is None:
+            miembros = list(self.por_valor.values())
+            descripciones = [self.descripciones[m.value] for m in miembros]
+            nombres = [m.name for m in miembros]
+            claves_descripcion = [normalize_key(d) for d in descripciones]
+            claves_nombre = [normalize_key(n) for n in nombres]
+            self._tabla = pl.DataFrame({
+                'codigo': pl.Series([m.value for m in miembros], dtype=self.dtype),
+                'descripcion': pl.Series(descripciones, dtype=pl.Utf8),
+                'nombre': pl.Series(nombres, dtype=pl.Utf8),
+                'clave_descripcion': pl.Series(claves_descripcion, dtype=pl.Utf8),
+                'clave_nombre': pl.Series(claves_nombre, dtype=pl.Utf8),
+            })
+        return self._tabla
+
+    def has_value(self, valor: Any) -> bool:
+        """Indica si ``valor`` es un código del Enum."""
+        try:
+            return valor in self.por_valor
+        except TypeError:
+            return False
+
+    def lookup_text(self, texto: Any) -> Optional[Any]:
+        """Busca un código por descripción o nombre de miembro."""
+        return self.por_texto.get(normalize_key(texto))
+
+
+@lru_cache(maxsize=None)
+def get_enum_index(clase_enum: Type[Enum]) -> EnumIndex:
+    """
+    Devuelve el índice del Enum, construyéndolo en el primer uso (o con las
+    tablas de la caché en disco, si están guardadas).
+    """
+    from geoanla.core.cache import load_cached
+
+    return EnumIndex(clase_enum, load_cached('indices', clase_enum))
+
+
+# ==========================================
+# REGISTRO DE DOMINIOS DEL CATÁLOGO
+# ==========================================
+
+@lru_cache(maxsize=None)
+def catalog_domains() -> Dict[str, Type[Enum]]:
+    """
+    Dominios con miembros de ``domains`` y ``corineland``, por nombre. El de
+    municipios no se incluye: se pide por nombre en ``get_domain`` para no
+    construirlo si nadie lo usa.
+    """
+    dominios = {}
+    for modulo in (domains, corineland):
+        for nombre, valor in vars(modulo).items():
+            es_dominio = (
+                isinstance(valor, type) and issubclass(valor, Enum)
+                and valor is not Enum and len(valor)
+            )
+            if es_dominio:
+                dominios.setdefault(nombre, valor)
+    return dominios
+
+
+def get_domain(nombre: str) -> EnumIndex:
+    """Índice de un dominio del catálogo por su nombre (p. ej. ``"Dom_Amenaza"``)."""
+    if nombre == 'Dom_Municipio':
+        from geoanla.catalog.municipios import Dom_Municipio
+        return get_enum_index(Dom_Municipio)
+    clase_enum = catalog_domains().get(nombre)
+    if clase_enum is None:
+        raise KeyError(f"No existe el dominio '{nombre}' en el catálogo.")
+    return get_enum_index(clase_enum)
+
+
+@lru_cache(maxsize=None)
+def clc_catalog() -> Dict[int, str]:
+    """Catálogo CLC de los seis niveles: NOMENCLAT entero -> leyenda oficial."""
+    return {
+        int(codigo): descripcion
+        for dominio in DOMINIOS_CLC
+        for codigo, descripcion in get_enum_index(dominio).descripciones.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def clc_codes() -> FrozenSet[int]:
+    """Códigos NOMENCLAT válidos de cualquier nivel CLC."""
+    return frozenset(clc_catalog())
+
+
+@lru_cache(maxsize=None)
+def clc_frame() -> pl.DataFrame:
+    """
+    El catálogo CLC como tabla ``NOMENCLAT -> DESCRIPCION_CLC`` (para joins
+    columnares).
+    """
+    catalogo = clc_catalog()
+    return pl.DataFrame(
+        {
+            "NOMENCLAT": list(catalogo.keys()),
+            "DESCRIPCION_CLC": list(catalogo.values()),
+        },
+        schema={"NOMENCLAT": pl.Int64, "DESCRIPCION_CLC": pl.Utf8},
+    )
+
+
+# ==========================================
+# BÚSQUEDA DIFUSA POR TRIGRAMAS
+# ==========================================
+
+def _trigrams(texto: str) -> FrozenSet[str]:
+    """Trigramas de un texto ya normalizado, con un espacio de relleno a cada lado."""
+    relleno = f" {texto} "
+    return frozenset(relleno[i:i + 3] for i in range(len(relleno) - 2))
+
+
+class TrigramIndex:
+    """
+    Índice invertido de trigramas sobre textos de un catálogo (leyendas,
+    descripciones), insensible a tildes, mayúsculas y puntuación.
+
+    Las consultas solo comparan los textos que comparten trigramas con la
+    búsqueda: la subcadena se confirma sobre los candidatos que contienen
+    todos sus trigramas y la similitud difusa (``difflib``) solo se calcula
+    para los mejor puntuados por trigramas comunes.
+
+    Atributos:
+        codigos: Código de cada texto, en el orden del catálogo.
+        textos: Texto oficial de cada código.
+        normalizados: Texto normalizado con ``normalize_text``.
+        por_trigrama: trigrama -> posiciones de los textos que lo contienen.
+        por_normalizado: texto normalizado -> posición (el primero gana).
+    """
+
+    # Candidatos por trigramas comunes que pasan a la comparación con difflib
+    CANDIDATOS_DIFUSOS = 20
+
+    def __init__(self, entradas: Iterable[Tuple[Any, str]]):
+        self.codigos: List[Any] = []
+        self.textos: List[str] = []
+        self.normalizados: List[str] = []
+        self._trigramas: List[FrozenSet[str]] = []
+        self.por_normalizado: Dict[str, int] = {}
+        por_trigrama: Dict[str, List[int]] = {}
+
+        for posicion, (codigo, texto) in enumerate(entradas):
+            normalizado = normalize_text(texto)
+            trigramas = _trigrams(normalizado)
+            self.codigos.append(codigo)
+            self.textos.append(texto)
+            self.normalizados.append(normalizado)
+            self._trigramas.append(trigramas)
+            self.por_normalizado.setdefault(normalizado, posicion)
+            for trigrama in trigramas:
+                por_trigrama.setdefault(trigrama, []).append(posicion)
+        self.por_trigrama: Dict[str, Tuple[int, ...]] = {
+            t: tuple(p) for t, p in por_trigrama.items()
+        }
+        self._mejores: Dict[Tuple[str, float], Optional[Tuple[int, float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.codigos)
+
+    def exact(self, texto: Any) -> Optional[int]:
+        """Posición del texto que coincide tras normalizar, o None."""
+        return self.por_normalizado.get(normalize_text(texto))
+
+    def contains(self, texto: Any) -> List[int]:
+        """
+        Posiciones de los textos que contienen ``texto`` (normalizado), en
+        orden del catálogo.
+        """
+        consulta = normalize_text(texto)
+        if not consulta:
+            return []
+        if len(consulta) < 3:
+            candidatos: Iterable[int] = range(len(self))
+        else:
+            # Una subcadena contiene todos sus trigramas sin relleno
+            listas = sorted(
+                (
+                    self.por_trigrama.get(consulta[i:i + 3], ())
+                    for i in range(len(consulta) - 2)
+                ),
+                key=len,
+            )
+            candidatos = sorted(set(listas[0]).intersection(*listas[1:]))
+        return [p for p in candidatos if consulta in self.normalizados[p]]
+
+    def search(
+        self, texto: Any, limite: int = 5, minimo: float = 0.4
+    ) -> List[Tuple[int, float]]:
+        """
+        Coincidencias difusas ordenadas por similitud.
+
+        Args:
+            texto: Texto a buscar.
+            limite: Máximo de resultados.
+            minimo: Similitud mínima (0..1, la razón de ``difflib.SequenceMatcher``
+                sobre los textos normalizados).
+
+        Returns:
+            Lista de (posición, similitud), de mayor a menor similitud; los
+            empates conservan el orden del catálogo.
+        """
+        consulta = normalize_text(texto)
+        if not consulta:
+            return []
+        trigramas = _trigrams(consulta)
+        comunes: Dict[int, int] = {}
+        for trigrama in trigramas:
+            for posicion in self.por_trigrama.get(trigrama, ()):
+                comunes[posicion] = comunes.get(posicion, 0) + 1
+
+        # Preselección por coeficiente de Dice de trigramas
+        dice = {
+            p: 2 * c / (len(trigramas) + len(self._trigramas[p]))
+            for p, c in comunes.items()
+        }
+        ordenados = sorted(dice, key=lambda p: (-dice[p], p))
+        candidatos = ordenados[:self.CANDIDATOS_DIFUSOS]
+
+        comparador = difflib.SequenceMatcher(autojunk=False)
+        comparador.set_seq2(consulta)
+        puntajes: List[Tuple[int, float]] = []
+        umbral = minimo
+        for posicion in candidatos:
+            comparador.set_seq1(self.normalizados[posicion])
+            # Cotas superiores baratas antes de la razón exacta, como
+            # get_close_matches
+            if (
+                comparador.real_quick_ratio() < umbral
+                or comparador.quick_ratio() < umbral
+            ):
+                continue
+            similitud = comparador.ratio()
+            if similitud < umbral:
+                continue
+            puntajes.append((posicion, similitud))
+            puntajes.sort(key=lambda par: (-par[1], par[0]))
+            del puntajes[limite:]
+            if len(puntajes) == limite:
+                # Lo que no supere al último de los ``limite`` mejores ya no entra
+                umbral = max(minimo, puntajes[-1][1])
+        return puntajes
+
+    def best(self, texto: Any, minimo: float = 0.6) -> Optional[Tuple[int, float]]:
+        """
+        Mejor coincidencia de ``texto``: la exacta (similitud 1.0) o la
+        difusa más similar sobre ``minimo``. Se memoriza por texto normalizado.
+        """
+        consulta = normalize_text(texto)
+        llave = (consulta, minimo)
+        if llave not in self._mejores:
+            exacta = self.por_normalizado.get(consulta)
+            if exacta is not None:
+                self._mejores[llave] = (exacta, 1.0)
+            else:
+                encontrados = self.search(consulta, limite=1, minimo=minimo)
+                self._mejores[llave] = encontrados[0] if encontrados else None
+        return self._mejores[llave]
+
+
+@lru_cache(maxsize=None)
+def clc_legend_index() -> TrigramIndex:
+    """Índice de trigramas de las leyendas CLC (códigos NOMENCLAT enteros)."""
+    return TrigramIndex(clc_catalog().items())
@@ -1 +1,2 @@
-from .base import BaseEV, BaseEV_Geo
\ No newline at end of file
+from .base import BaseEV, BaseEV_Geo
+from .session import RunConfig, RunMetrics, ValidationRun
@@ -1,30 +1,82 @@
 import polars as pl
-import pandas as pd
-import geopandas as gpd
-import numpy as np
-from pydantic import BaseModel, ValidationError, ConfigDict, Field, model_validator
-from typing import Optional, List, Dict, Any, Union, ClassVar, get_type_hints, get_origin, get_args, Annotated
+from pydantic import (
+    BaseModel, ValidationError, ConfigDict, Field, field_validator, model_validator
+)
+from typing import (
+    TYPE_CHECKING, Optional, List, Dict, Any, Union, ClassVar, Tuple, get_type_hints,
+    get_origin, get_args, Annotated
+)
 from enum import Enum
+import time
 import types
-from geoanla.catalog import (
-    Dom_CateCober, Dom_SubcatCober, Dom_Clas_Cober,
-    Dom_Subclas_Cober, Dom_Nivel5_Cober, Dom_Nivel6_Cober
+from geoanla.catalog.registry import (
+    clc_catalog, clc_frame, get_enum_index, normalize_key_expr
+)
+from geoanla.core.cache import load_cached
+from geoanla.core.errors import ErrorTable
+from geoanla.core.frames import (
+    decode_geometry, is_pandas_frame, to_geodataframe, to_polars_frame
 )
+from geoanla.core.geometry import geometry_errors
+from geoanla.core.instrumentation import (
+    TIPO_FASE, Instrumentation, active as active_instrumentation, measure
+)
+
+# Pandas y GeoPandas se importan solo cuando llega una capa suya
+# (ver ``core.frames``)
+if TYPE_CHECKING:
+    import geopandas as gpd
+    import pandas as pd
 
 # === CATÁLOGO OFICIAL CLC (Nivel de módulo, fuera de Pydantic) ===
-CATALOGO_CLC = {
-    int(item.value): item.description
-    for dom in [
-        Dom_CateCober, Dom_SubcatCober, Dom_Clas_Cober,
-        Dom_Subclas_Cober, Dom_Nivel5_Cober, Dom_Nivel6_Cober
+# Compartido con el registro de dominios: se arma una sola vez por proceso
+CATALOGO_CLC = clc_catalog()
+
+# Mismo catálogo como tabla de búsqueda para la validación columnar
+# (un join por capa)
+CATALOGO_CLC_FRAME = clc_frame()
+
+MENSAJE_LEYENDA_CLC = (
+    "Inconsistencia CLC: El código NOMENCLAT '{codigo}' exige el texto exacto "
+    "'{descripcion}', pero en la columna '{campo}' se reportó '{texto}'."
+)
+
+# Columnas con las que se arma el identificador legible de cada fila
+COLUMNAS_IDENTIFICADOR = ['ID_MUEST', 'ID_MUES_PT', 'EXPEDIENTE']
+
+# Textos (ya normalizados) que en un campo de dominio equivalen a "sin código"
+VALORES_SIN_CODIGO = ['', 'nan', 'none', '0', '0.0']
+
+
+def _is_text_dtype(tipo: pl.DataType) -> bool:
+    """Tipos de Polars que Pydantic recibe como ``str``."""
+    return tipo in (pl.Utf8, pl.Categorical) or isinstance(tipo, pl.Enum)
+
+
+def _is_null_code(codigo: Any) -> bool:
+    """Llave nula de un dominio (None o NaN)."""
+    return codigo is None or codigo != codigo
+
+
+def build_row_identifier(datos_fila: Dict[str, Any], index: int) -> str:
+    """Identificador legible de una fila para los reportes de error."""
+    id_piezas = [
+        str(datos_fila.get(c)) for c in COLUMNAS_IDENTIFICADOR if datos_fila.get(c)
     ]
-    for item in dom
-}
+    return " ".join(id_piezas) if id_piezas else f"Registro {index}"
+
 
 class BaseEV(BaseModel):
     # Aceptamos explícitamente Polars, Pandas o GeoPandas
-    _data: Optional[Union[pl.DataFrame, pd.DataFrame, gpd.GeoDataFrame]] = None
+    _data: Optional[Union[pl.DataFrame, "pd.DataFrame", "gpd.GeoDataFrame"]] = None
     _dominios_externos: ClassVar[Dict[str, Dict[str, str]]] = {}
+    # Índice de dominios por clase (ver _domain_index), invalidado por register_domain
+    _cache_dominios: ClassVar[Dict[type, Dict[str, Dict[str, Any]]]] = {}
+    # Validadores de modelo con gemelo vectorizado: nombre -> classmethod que recibe
+    # los valores ya validados (pl.DataFrame) y devuelve el mensaje de error por fila
+    VALIDADORES_COLUMNARES: ClassVar[Dict[str, str]] = {
+        'validate_legend_nomenclature': 'legend_nomenclature_errors'
+    }
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -48,25 +100,185 @@ class BaseEV(BaseModel):
         codigo_nomenclat = self.NOMENCLAT
 
         # 3. Validamos contra el catálogo maestro
-        if texto_ingresado is not None and codigo_nomenclat is not None:
-            descripcion_oficial = CATALOGO_CLC.get(codigo_nomenclat)
-            
-            # Limpiamos strings (minúsculas, sin espacios extra) para hacer una comparación fuerte
-            if descripcion_oficial and texto_ingresado.strip().lower() != descripcion_oficial.lower():
-                raise ValueError(
-                    f"Inconsistencia CLC: El código NOMENCLAT '{codigo_nomenclat}' "
-                    f"exige el texto exacto '{descripcion_oficial}', "
-                    f"pero en la columna '{campo_texto}' se reportó '{texto_ingresado}'."
-                )
+        mensaje = self._legend_message(campo_texto, codigo_nomenclat, texto_ingresado)
+        if mensaje:
+            raise ValueError(mensaje)
         return self
 
+    @staticmethod
+    def _legend_message(
+        campo_texto: str, codigo_nomenclat: Any, texto_ingresado: Any
+    ) -> Optional[str]:
+        """Mensaje de ``validate_legend_nomenclature`` (None si coinciden)."""
+        if texto_ingresado is None or codigo_nomenclat is None:
+            return None
+        descripcion_oficial = CATALOGO_CLC.get(codigo_nomenclat)
+
+        # Limpiamos strings (minúsculas, sin espacios extra) para hacer una
+        # comparación fuerte
+        texto_limpio = texto_ingresado.strip().lower()
+        if descripcion_oficial and texto_limpio != descripcion_oficial.lower():
+            return MENSAJE_LEYENDA_CLC.format(
+                codigo=codigo_nomenclat, descripcion=descripcion_oficial,
+                campo=campo_texto, texto=texto_ingresado
+            )
+        return None
+
+    @classmethod
+    def legend_nomenclature_errors(cls, df: pl.DataFrame) -> pl.Series:
+        """
+        Gemelo vectorizado de ``validate_legend_nomenclature``: un join de
+        NOMENCLAT contra ``CATALOGO_CLC_FRAME`` y una comparación normalizada
+        del texto. Devuelve el mensaje de error por fila (nulo si es válida).
+
+        Las columnas se convierten como lo haría Pydantic (código entero,
+        leyenda texto); las filas cuyo valor no se deja convertir en bloque
+        pasan por la comparación del validador por fila.
+        """
+        campo_texto = getattr(cls, 'CAMPO_LEYENDA', None)
+        sin_error = pl.Series("leyenda", [None] * df.height, dtype=pl.Utf8)
+        if (not campo_texto or 'NOMENCLAT' not in df.columns
+                or campo_texto not in df.columns):
+            return sin_error
+        tipo_codigo, tipo_texto = df.schema['NOMENCLAT'], df.schema[campo_texto]
+        if tipo_codigo == pl.Null or tipo_texto == pl.Null:
+            return sin_error
+
+        codigo = pl.col('NOMENCLAT')
+        anotacion = cls.model_fields['NOMENCLAT'].annotation
+        anotacion_entera = anotacion in (int, Optional[int])
+        # etiqueta: el código tal como lo imprime el validador por fila
+        if tipo_codigo.is_numeric():
+            # Solo coinciden los códigos enteros, como en la búsqueda por dict
+            # del validador por fila
+            entero = codigo.cast(pl.Float64) % 1 == 0
+            llave = pl.when(entero).then(codigo.cast(pl.Int64, strict=False))
+            etiqueta = llave if anotacion_entera else codigo
+        elif _is_text_dtype(tipo_codigo) and anotacion_entera:
+            llave = codigo.cast(pl.Utf8).str.strip_chars().cast(pl.Int64, strict=False)
+            etiqueta = llave
+        else:
+            llave = etiqueta = pl.lit(None, pl.Int64)
+        es_texto = _is_text_dtype(tipo_texto)
+        if es_texto:
+            texto = pl.col(campo_texto).cast(pl.Utf8)
+        else:
+            texto = pl.lit(None, pl.Utf8)
+        # Sin conversión en bloque: códigos que Pydantic sí lee ("311.0") o
+        # leyendas que no son texto
+        pendiente = (codigo.is_not_null() & llave.is_null()) | (
+            pl.lit(not es_texto) & pl.col(campo_texto).is_not_null()
+        )
+
+        cruce = df.select(
+            etiqueta.alias('__codigo__'), texto.alias('__texto__'),
+            llave.alias('__llave__'), pendiente.alias('__pendiente__'),
+        ).join(
+            CATALOGO_CLC_FRAME.rename({'NOMENCLAT': '__llave__'}),
+            on='__llave__', how='left', maintain_order='left'
+        )
+        texto = pl.col('__texto__')
+        descripcion = pl.col('DESCRIPCION_CLC')
+        inconsistente = (
+            texto.is_not_null() & (descripcion.str.len_chars() > 0)
+            & (
+                texto.str.strip_chars().str.to_lowercase()
+                != descripcion.str.to_lowercase()
+            )
+        )
+        plantilla = MENSAJE_LEYENDA_CLC.format(
+            codigo="{}", descripcion="{}", campo=campo_texto, texto="{}"
+        )
+        mensaje = pl.when(inconsistente).then(
+            pl.format(plantilla, pl.col('__codigo__'), descripcion, texto)
+        )
+        mensajes = cruce.select(mensaje.alias("leyenda")).to_series()
+
+        pendientes = cruce.get_column('__pendiente__').arg_true().to_list()
+        if not pendientes:
+            return mensajes
+        return mensajes.scatter(
+            pendientes, cls._pending_legend_messages(df, campo_texto, pendientes)
+        )
+
+    @classmethod
+    def _pending_legend_messages(
+        cls, df: pl.DataFrame, campo_texto: str, filas: List[int]
+    ) -> List[Optional[str]]:
+        """
+        Convierte código y leyenda de las filas indicadas con los tipos del
+        modelo (reglas de Pydantic) y aplica la comparación del validador por
+        fila. Si un valor no se deja convertir, Pydantic rechaza el campo y el
+        validador de modelo no llega a ejecutarse: no hay mensaje.
+        """
+        from pydantic import TypeAdapter
+
+        adaptadores = [
+            TypeAdapter(cls.model_fields[c].annotation)
+            for c in ('NOMENCLAT', campo_texto)
+        ]
+        pares = zip(
+            df.get_column('NOMENCLAT').gather(filas).to_list(),
+            df.get_column(campo_texto).gather(filas).to_list(),
+        )
+        mensajes = []
+        for valores in pares:
+            try:
+                codigo, texto = (
+                    a.validate_python(v) for a, v in zip(adaptadores, valores)
+                )
+            except ValidationError:
+                mensajes.append(None)
+                continue
+            mensajes.append(cls._legend_message(campo_texto, codigo, texto))
+        return mensajes
+
     # --- 1. MÉTODOS DE INTELIGENCIA DE DOMINIOS ---
     @classmethod
     def register_domain(cls, nombre_campo: str, diccionario: Dict[Any, str]):
         cls._dominios_externos[nombre_campo] = diccionario
+        # Los dominios externos son compartidos: todas las cachés quedan obsoletas
+        cls.invalidate_domain_cache()
 
     @classmethod
-    def get_domains(cls) -> Dict[str, Any]:
+    def invalidate_domain_cache(cls):
+        """Descarta los índices de dominios memorizados de todas las clases."""
+        BaseEV._cache_dominios.clear()
+
+    @classmethod
+    def _domain_index(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Índice memorizado por clase:
+        {'campos': {campo: Enum}, 'enums': {NombreEnum: Enum}}.
+        Se construye de forma perezosa la primera vez que se usa el modelo.
+        """
+        indice = BaseEV._cache_dominios.get(cls)
+        if indice is not None:
+            return indice
+
+        dominios = dict(cls._annotated_domains())
+        for campo in cls._dominios_externos:
+            dominios[campo] = "Diccionario Externo"
+
+        enums = {}
+        for d in dominios.values():
+            if isinstance(d, type):
+                enums.setdefault(d.__name__, d)
+
+        indice = {'campos': dominios, 'enums': enums}
+        BaseEV._cache_dominios[cls] = indice
+        return indice
+
+    @classmethod
+    def _annotated_domains(cls) -> Dict[str, type]:
+        """
+        Campos cuya anotación incluye un Enum: {campo: Enum}. Se leen de la
+        caché en disco si están guardados (ver ``core.cache``).
+        """
+        dominios = load_cached('dominios', cls)
+        if dominios is not None:
+            return dominios
+
         dominios = {}
         try: type_hints = get_type_hints(cls, globalns=globals())
         except: type_hints = {k: f.annotation for k, f in cls.model_fields.items()}
@@ -85,141 +297,196 @@ class BaseEV(BaseModel):
             if nombre.startswith('_'): continue
             res = buscar_enum(tipo)
             if res: dominios[nombre] = res
-
-        for campo in cls._dominios_externos:
-            dominios[campo] = "Diccionario Externo"
         return dominios
 
     @classmethod
-    def get_enum_code(cls, valor: Any, referencia: Union[Any, str]) -> Optional[int]:
-        clase_enum = None
+    def get_domains(cls) -> Dict[str, Any]:
+        return dict(cls._domain_index()['campos'])
+
+    @classmethod
+    def _resolve_enum(cls, referencia: Union[Any, str]) -> Optional[type]:
+        """Resuelve un Enum por su clase, el nombre del campo o el nombre del Enum."""
         if isinstance(referencia, type) and issubclass(referencia, Enum):
-            clase_enum = referencia
-        elif isinstance(referencia, str):
-            dominios = cls.get_domains()
-            if referencia in dominios: clase_enum = dominios[referencia]
-            else:
-                for d in dominios.values():
-                    if isinstance(d, type) and d.__name__ == referencia:
-                        clase_enum = d; break
+            return referencia
+        if isinstance(referencia, str):
+            indice = cls._domain_index()
+            clase_enum = indice['campos'].get(referencia)
+            if clase_enum is not None:
+                return clase_enum
+            return indice['enums'].get(referencia)
+        return None
+
+    @classmethod
+    def get_enum_code(cls, valor: Any, referencia: Union[Any, str]) -> Optional[int]:
+        clase_enum = cls._resolve_enum(referencia)
 
         if clase_enum is None: return None
-        if valor is None or str(valor).strip().lower() in ['', 'nan', 'none', '0', '0.0']: return None
+        if not isinstance(clase_enum, type):
+            # Diccionario externo registrado para el campo: no es un Enum
+            return None
+        if valor is None or str(valor).strip().lower() in VALORES_SIN_CODIGO:
+            return None
+
+        indice = get_enum_index(clase_enum)
 
         # 1. Verificar si el valor ya es el código final del Enum
-        # Intentamos casteo flotante primero por si viene de Pandas como 1.0 en vez de 1
+        # Intentamos casteo flotante primero por si viene de Pandas como 1.0
+        # en vez de 1
         try:
             val_num = float(valor)
             if val_num.is_integer():
                 val_int = int(val_num)
-                if val_int in [m.value for m in clase_enum]:
+                if indice.has_value(val_int):
                     return val_int
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             pass
 
         # Si el Enum usa valores string también validamos
-        if valor in [m.value for m in clase_enum]:
+        if indice.has_value(valor):
             return valor
 
-        # 2. Si no es el código directo, buscamos por la descripción o el nombre del Enum
-        texto = str(valor).strip().lower()
-        for m in clase_enum:
-            if (hasattr(m, 'description') and str(m.description).lower() == texto) or m.name.lower() == texto:
-                return m.value
-                
-        return None
+        # 2. Si no es el código directo, buscamos por la descripción o el
+        # nombre del Enum
+        return indice.lookup_text(valor)
+
+    @classmethod
+    def _translation_expr(
+        cls, campo: str, clase_enum: type, tipo_entrada: pl.DataType
+    ) -> pl.Expr:
+        """
+        Expresión que traduce una columna de dominio a códigos, con las mismas
+        reglas de ``get_enum_code`` pero sin pasar por Python: se normaliza el
+        texto, se interpreta como número ("1.0" -> 1) y se cruza contra el
+        marco de búsqueda del Enum. Sirve igual para DataFrame y LazyFrame.
+        """
+        indice = get_enum_index(clase_enum)
+        dtype = indice.dtype
+        columna = pl.col(campo)
+        texto = columna.cast(pl.Utf8).str.strip_chars()
+
+        # 1. Vacíos y ceros explícitos no tienen código
+        sin_codigo = texto.str.to_lowercase().is_in(VALORES_SIN_CODIGO)
+        traduccion = pl.when(columna.is_null() | sin_codigo).then(None)
+
+        # 2. Valores que ya son el código del Enum; los numéricos admiten
+        # textos "1.0"
+        if dtype == pl.Utf8:
+            if _is_text_dtype(tipo_entrada):
+                codigos = pl.Series(indice.codes, dtype=pl.Utf8).implode()
+                es_codigo = columna.cast(pl.Utf8).is_in(codigos)
+                traduccion = traduccion.when(es_codigo).then(columna.cast(pl.Utf8))
+        else:
+            numero = texto.cast(pl.Float64, strict=False)
+            es_codigo = (numero % 1 == 0) & numero.is_in(indice.integer_codes)
+            # Cast no estricto: NaN/inf quedan fuera por la máscara, pero algunas
+            # versiones de Polars evalúan el cast sobre toda la columna
+            traduccion = traduccion.when(es_codigo).then(
+                numero.cast(dtype, strict=False)
+            )
+            if dtype == pl.Float64 and tipo_entrada.is_numeric():
+                codigos = pl.Series(indice.codes, dtype=pl.Float64).implode()
+                es_codigo = columna.cast(pl.Float64).is_in(codigos)
+                traduccion = traduccion.when(es_codigo).then(columna.cast(pl.Float64))
+
+        # 3. Descripción o nombre del miembro contra el marco de búsqueda
+        marco = indice.lookup_frame()
+        por_texto = normalize_key_expr(texto).replace_strict(
+            marco['clave'], marco['codigo'], default=None, return_dtype=dtype
+        )
+        return traduccion.otherwise(por_texto).alias(campo)
 
     @classmethod
-    def translate_data(cls, df: Union[pl.DataFrame, pd.DataFrame, gpd.GeoDataFrame]) -> Any:
+    def translate_data(
+        cls,
+        df: Union[pl.DataFrame, pl.LazyFrame, "pd.DataFrame", "gpd.GeoDataFrame"],
+        como_polars: bool = False,
+    ) -> Any:
         """
         Traducción vectorizada de alta velocidad. Mapea valores de texto 
-        o nombres de Enum a sus códigos numéricos respectivos.
+        o nombres de Enum a sus códigos numéricos respectivos. Con un
+        ``pl.LazyFrame`` devuelve otro LazyFrame: la traducción queda en el plan.
+
+        Pandas y GeoPandas se convierten una vez a Polars a través de Arrow
+        (geometría en WKB, ver ``core.frames``) y se traducen con las mismas
+        expresiones. Con ``como_polars=True`` se devuelve ese DataFrame de
+        Polars; si no, la capa vuelve al tipo de entrada.
         """
-        dominios = cls.get_domains()
-        columnas_disponibles = set(df.columns)
-        
-        # --- CASO A: POLARS (MÁXIMA VELOCIDAD EN RUST) ---
-        if isinstance(df, pl.DataFrame):
-            expresiones = []
-            for campo, clase_enum in dominios.items():
-                if campo not in columnas_disponibles or not isinstance(clase_enum, type):
-                    continue
-                
-                # 1. Detectar tipo nativo del Enum para el casting final
-                ejemplo = next(iter(clase_enum)).value
-                dtype = pl.Int64 if isinstance(ejemplo, int) else pl.Float64
-                
-                # 2. Pre-calcular mapeo solo para valores únicos presentes
-                unique_vals = df.get_column(campo).drop_nulls().unique().to_list()
-                mapping = {v: cls.get_enum_code(v, campo) for v in unique_vals}
-                
-                # 3. Construir expresión vectorizada
-                expr = (
-                    pl.col(campo)
-                    .replace_strict(mapping, default=pl.col(campo))
-                    .cast(dtype)
-                    .alias(campo)
-                )
-                expresiones.append(expr)
-            
-            return df.with_columns(expresiones) if expresiones else df
+        with measure(cls, "traduccion"):
+            # --- CASO A: POLARS (MÁXIMA VELOCIDAD EN RUST) ---
+            if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+                return cls._translate_frame(df)
+
+            # --- CASO B: PANDAS / GEOPANDAS (VÍA ARROW) ---
+            traducido = cls._translate_frame(to_polars_frame(df))
+            if como_polars:
+                return traducido
+            nombre_geom = getattr(df, "_geometry_column_name", None)
+            if nombre_geom in df.columns:
+                return to_geodataframe(traducido, df.crs, nombre_geom, indice=df.index)
+            return to_geodataframe(traducido, columna=None, indice=df.index)
 
-        # --- CASO B: PANDAS / GEOPANDAS ---
-        else:
-            df_out = df.copy()
-            
-            # Limpieza universal preventiva: Convertir NaN a None clásico de Python.
-            # Esto evita que Pandas convierta columnas enteramente a float64.
-            df_out = df_out.replace({np.nan: None})
-            
-            for campo, clase_enum in dominios.items():
-                if campo not in columnas_disponibles or not isinstance(clase_enum, type):
-                    continue
-                
-                unique_vals = df_out[campo].dropna().unique()
-                mapping = {v: cls.get_enum_code(v, campo) for v in unique_vals}
-                
-                # Reemplazo vectorizado en Pandas
-                df_out[campo] = df_out[campo].replace(mapping)
-                
-                # Intento de casteo a numérico si el Enum es numérico
-                ejemplo = next(iter(clase_enum)).value
-                if isinstance(ejemplo, int):
-                    # Forzamos tipo entero que soporta Nulls en Pandas
-                    df_out[campo] = pd.to_numeric(df_out[campo], errors='coerce').astype('Int64')
-                elif isinstance(ejemplo, float):
-                    df_out[campo] = pd.to_numeric(df_out[campo], errors='coerce')
-                    
-            return df_out
+    @classmethod
+    def _translate_frame(cls, df: Union[pl.DataFrame, pl.LazyFrame]) -> Any:
+        """Aplica las expresiones de traducción de dominios a una capa de Polars."""
+        dominios = cls.get_domains()
+        esquema = df.collect_schema()
+        expresiones = [
+            cls._translation_expr(campo, clase_enum, esquema[campo])
+            for campo, clase_enum in dominios.items()
+            if campo in esquema and isinstance(clase_enum, type)
+        ]
+        return df.with_columns(expresiones) if expresiones else df
 
     @classmethod
-    def translate_code_to_text(cls, df: Union[pl.DataFrame, pd.DataFrame, gpd.GeoDataFrame]) -> Any:
+    def translate_code_to_text(
+        cls,
+        df: Union[pl.DataFrame, pl.LazyFrame, "pd.DataFrame", "gpd.GeoDataFrame"],
+        categorias: bool = False,
+    ) -> Any:
         """
         Traducción inversa vectorizada. Mapea códigos numéricos a sus 
-        textos descriptivos oficiales (o nombres de Enum) para facilitar el análisis humano.
+        textos descriptivos oficiales (o nombres de Enum) para facilitar el
+        análisis humano.
+        Acepta ``pl.LazyFrame`` (devuelve un LazyFrame).
+
+        Con ``categorias=True`` cada columna de dominio sale como ``pl.Enum``
+        (``category`` en Pandas) con todos los textos del dominio como
+        categorías: un entero pequeño por fila en lugar de una copia del texto.
+        En ese modo los códigos que no pertenecen al dominio quedan nulos.
         """
         dominios = cls.get_domains()
-        columnas_disponibles = set(df.columns)
         
         # --- CASO A: POLARS ---
-        if isinstance(df, pl.DataFrame):
+        if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+            columnas_disponibles = set(df.collect_schema().names())
             expresiones = []
             for campo, clase_enum in dominios.items():
-                if campo not in columnas_disponibles or not isinstance(clase_enum, type):
+                es_enum = isinstance(clase_enum, type)
+                if campo not in columnas_disponibles or not es_enum:
                     continue
                 
                 # Obtenemos el diccionario {código: texto}
                 mapping = cls.domain(campo)
                 if not mapping:
                     continue
+                if categorias:
+                    expresiones.append(cls._category_expr(campo, mapping))
+                    continue
                     
-                # Convertimos las llaves a string para evitar conflictos de tipado estricto en Polars 
-                # (una columna no puede tener ints y strings al mismo tiempo durante el replace)
-                mapping_str = {str(k): str(v) for k, v in mapping.items() if pd.notnull(k)}
+                # Convertimos las llaves a string para evitar conflictos de tipado
+                # estricto en Polars (una columna no puede tener ints y strings al
+                # mismo tiempo durante el replace)
+                mapping_str = {
+                    str(k): str(v) for k, v in mapping.items() if not _is_null_code(k)
+                }
                 
                 expr = (
                     pl.col(campo).cast(pl.Utf8)  # Castear la columna original a texto
-                    .replace(mapping_str, default=pl.col(campo).cast(pl.Utf8))
+                    .replace_strict(
+                        mapping_str,
+                        default=pl.col(campo).cast(pl.Utf8),
+                        return_dtype=pl.Utf8,
+                    )
                     .alias(campo)
                 )
                 expresiones.append(expr)
@@ -228,104 +495,311 @@ class BaseEV(BaseModel):
 
         # --- CASO B: PANDAS / GEOPANDAS ---
         else:
+            import pandas as pd
+
+            columnas_disponibles = set(df.columns)
             df_out = df.copy()
             
             for campo, clase_enum in dominios.items():
-                if campo not in columnas_disponibles or not isinstance(clase_enum, type):
+                es_enum = isinstance(clase_enum, type)
+                if campo not in columnas_disponibles or not es_enum:
                     continue
                 
                 mapping = cls.domain(campo)
                 if not mapping:
                     continue
+                if categorias:
+                    textos = cls._category_texts(mapping)
+                    df_out[campo] = pd.Categorical(
+                        df_out[campo].map(mapping), categories=textos
+                    )
+                    continue
                 
-                # 'map' traduce usando el diccionario. Deja 'NaN' en los valores que no encuentre.
+                # 'map' traduce usando el diccionario. Deja 'NaN' en los valores
+                # que no encuentre.
                 serie_mapeada = df_out[campo].map(mapping)
-                # 'fillna' permite conservar el valor numérico original en caso de que un valor no existiese en el Enum
+                # 'fillna' permite conservar el valor numérico original en caso de
+                # que un valor no existiese en el Enum
                 df_out[campo] = serie_mapeada.fillna(df_out[campo])
                     
             return df_out
 
+    @staticmethod
+    def _category_texts(mapping: Dict[Any, str]) -> List[str]:
+        """Textos del dominio sin repetir, en orden de declaración (categorías)."""
+        return list(dict.fromkeys(str(texto) for texto in mapping.values()))
+
+    @classmethod
+    def _category_expr(cls, campo: str, mapping: Dict[Any, str]) -> pl.Expr:
+        """Expresión código -> texto con tipo ``pl.Enum`` del dominio completo."""
+        codigos = [k for k in mapping if not _is_null_code(k)]
+        textos = [str(mapping[k]) for k in codigos]
+        # Los códigos numéricos se comparan como float: 311 y 311.0 son el
+        # mismo código
+        if all(isinstance(k, (int, float)) for k in codigos):
+            columna = pl.col(campo).cast(pl.Float64, strict=False)
+            codigos = [float(k) for k in codigos]
+        else:
+            columna, codigos = pl.col(campo).cast(pl.Utf8), [str(k) for k in codigos]
+        tipo = pl.Enum(cls._category_texts(mapping))
+        return columna.replace_strict(
+            codigos, textos, default=None, return_dtype=tipo
+        ).alias(campo)
+
     @classmethod
     def domain(cls, nombre_campo: str) -> Dict[Any, str]:
-        if nombre_campo in cls._dominios_externos: return cls._dominios_externos[nombre_campo]
-        doms = cls.get_domains()
-        if nombre_campo in doms and isinstance(doms[nombre_campo], type):
-            val = doms[nombre_campo]
-            return {m.value: (m.description if hasattr(m, 'description') else m.name) for m in val}
+        if nombre_campo in cls._dominios_externos:
+            return cls._dominios_externos[nombre_campo]
+        clase_enum = cls._domain_index()['campos'].get(nombre_campo)
+        if isinstance(clase_enum, type):
+            return dict(get_enum_index(clase_enum).descripciones)
         return {}
 
     # --- 2. EXTRACCIÓN SIMPLE ---
     @classmethod
-    def extract(cls, df: Union[pl.DataFrame, pd.DataFrame, gpd.GeoDataFrame]):
+    def session(
+        cls, df: Union[pl.DataFrame, "pd.DataFrame", "gpd.GeoDataFrame"], **opciones
+    ):
+        """
+        Abre una sesión de validación (``core.session.ValidationRun``) que es
+        dueña de ``df``: no guarda estado en la clase y puede correr en
+        paralelo con otras sesiones del mismo modelo.
+        """
+        from geoanla.core.session import ValidationRun
+        return ValidationRun(cls, df, **opciones)
+
+    @classmethod
+    def extract(cls, df: Union[pl.DataFrame, "pd.DataFrame", "gpd.GeoDataFrame"]):
+        """
+        API legada: guarda ``df`` en la clase para ``validate_data``. Para
+        procesos largos o concurrentes use ``session``; ``release_data``
+        libera el DataFrame guardado.
+        """
         cls._data = df
-        columnas_df = set(df.columns)
-        campos_modelo = set(cls.model_fields.keys())
-        print(f"\n--- 🛠️ Fase de Extracción: {cls.__name__} ---")
-        print(f"📥 Tipo de datos detectado: {type(df).__name__}")
-        faltantes = list(campos_modelo - columnas_df)
-        if faltantes:
-          print(f"⚠️ Columnas faltantes: {faltantes}")
-        else:
-          print(f"✅ Estructura íntegra. {len(campos_modelo)} columnas listas.")
-          print(f"📋 Campos del modelo: {cls.model_fields.keys()}")
-        return {"faltantes": faltantes}
+        return cls.session(df).extract()
 
-    # --- 3. VALIDACIÓN HÍBRIDA (CORREGIDA) ---
     @classmethod
-    def validate_data(cls, offset: int = 0):
-        if cls._data is None:
-            raise ValueError(f"❌ No hay datos en {cls.__name__}.")
+    def release_data(cls):
+        """Libera el DataFrame guardado por ``extract``."""
+        cls._data = None
 
+    # --- 3. VALIDACIÓN HÍBRIDA (CORREGIDA) ---
+    @classmethod
+    def _validate_rows(
+        cls,
+        df: Union[pl.DataFrame, "pd.DataFrame", "gpd.GeoDataFrame"],
+        offset: int = 0,
+        indices: Optional[List[int]] = None,
+        con_indice: bool = False,
+        inicio: int = 0,
+        tabla_errores: Optional[ErrorTable] = None,
+        volcar: bool = True
+    ):
+        """
+        Validación fila a fila con Pydantic. Si se pasan ``indices`` solo se
+        validan esas filas (conservando su número de fila original). Con
+        ``con_indice`` cada resultado se devuelve como tupla (indice, dict).
+        ``inicio`` es la posición global de la primera fila cuando ``df`` es
+        un trozo de una capa mayor (validación en paralelo o por lotes).
+        Si se pasa ``tabla_errores`` los errores se acumulan allí (formato
+        largo) en lugar de en la lista de diccionarios. Con ``volcar=False``
+        no se hace ``model_dump()``: cada válido es su posición global.
+        Con el modelo instrumentado se miden las fases "pydantic" (filas
+        validadas y rechazadas) y "pydantic.volcado" (``model_dump()``).
+        """
         validos, errores = [], []
-        print(f"🚀 Validando {len(cls._data)} registros...")
+        medicion = active_instrumentation(cls)
+        inicio_filas, segundos_volcado, rechazadas = time.perf_counter(), 0.0, 0
 
         # Iterador Adaptativo
         iterator = []
-        if isinstance(cls._data, pl.DataFrame):
-            iterator = enumerate(cls._data.iter_rows(named=True))
-        elif isinstance(cls._data, (pd.DataFrame, gpd.GeoDataFrame)):
-            df_temp = cls._data.where(pd.notnull(cls._data), None)
-            iterator = enumerate(df_temp.to_dict('records'))
+        if isinstance(df, pl.DataFrame):
+            subconjunto = df if indices is None else df.gather(indices)
+            # Geometría WKB (capas convertidas con ``core.frames``): se
+            # decodifica en bloque
+            iterator = decode_geometry(subconjunto).iter_rows(named=True)
+        elif is_pandas_frame(df):
+            import pandas as pd
+
+            subconjunto = df if indices is None else df.iloc[indices]
+            # Las columnas de texto de Pandas 3 (dtype str) conservan NaN en
+            # where(): se pasan a object para que los nulos lleguen como None,
+            # igual que en Pandas 2
+            textos = {
+                c: object for c, t in subconjunto.dtypes.items()
+                if isinstance(t, pd.StringDtype)
+            }
+            df_temp = subconjunto.astype(textos).where(pd.notnull(subconjunto), None)
+            iterator = df_temp.to_dict('records')
         else:
-            raise TypeError(f"Tipo de datos {type(cls._data)} no soportado.")
+            raise TypeError(f"Tipo de datos {type(df)} no soportado.")
 
-        for index, datos_fila in iterator:
+        posiciones = range(len(df)) if indices is None else indices
+        for posicion, datos_fila in zip(posiciones, iterator):
+            index = posicion + inicio
             datos_fila = {k: v for k, v in datos_fila.items() if v is not None}
-            id_piezas = [str(datos_fila.get(c)) for c in ['ID_MUEST', 'ID_MUES_PT', 'EXPEDIENTE'] if datos_fila.get(c)]
-            identificador = " ".join(id_piezas) if id_piezas else f"Registro {index}"
+            identificador = build_row_identifier(datos_fila, index)
 
             try:
                 objeto = cls(**datos_fila)
-                validos.append(objeto.model_dump())
+                if medicion is not None and volcar:
+                    inicio_volcado = time.perf_counter()
+                    resultado = objeto.model_dump()
+                    segundos_volcado += time.perf_counter() - inicio_volcado
+                else:
+                    resultado = objeto.model_dump() if volcar else index
+                validos.append((posicion, resultado) if con_indice else resultado)
             except ValidationError as e:
-                # Extraemos el mensaje de forma segura. Los errores de @model_validator no tienen 'loc'
+                rechazadas += 1
+                # Extraemos el mensaje de forma segura. Los errores de
+                # @model_validator no tienen 'loc'
                 error_info = {"Fila": index + offset, "ID": identificador}
                 for err in e.errors():
-                    campo = err['loc'][0] if 'loc' in err and len(err['loc']) > 0 else 'Registro/Modelo'
-                    error_info[campo] = err['msg']
-                
-                errores.append(error_info)
-
-        print("\n" + "="*50 + f"\n📊 RESULTADO FINAL - {cls.__name__}\n" + "="*50)
-        print(f"✅ Aprobados: {len(validos)}\n❌ Rechazados: {len(errores)}")
+                    if 'loc' in err and len(err['loc']) > 0:
+                        campo = err['loc'][0]
+                    else:
+                        campo = 'Registro/Modelo'
+                    if tabla_errores is not None:
+                        tabla_errores.add(
+                            index + offset, identificador, campo, err['type'],
+                            err['msg'], err.get('input'),
+                        )
+                    else:
+                        error_info[campo] = err['msg']
+
+                if tabla_errores is not None:
+                    continue
 
-        if errores:
-            try: from IPython.display import display; display(pd.DataFrame(errores))
-            except: print(errores)
-        else: print("\n🎉 ¡Todo perfecto!")
+                errores.append((posicion, error_info) if con_indice else error_info)
+
+        if medicion is not None:
+            filas = len(validos) + rechazadas
+            segundos = time.perf_counter() - inicio_filas
+            medicion.record(
+                cls.__name__, TIPO_FASE, "pydantic",
+                segundos - segundos_volcado, filas, rechazadas,
+            )
+            if volcar and validos:
+                medicion.record(
+                    cls.__name__, TIPO_FASE, "pydantic.volcado",
+                    segundos_volcado, len(validos),
+                )
+        return validos, errores
 
+    @classmethod
+    def validate_data(
+        cls,
+        offset: int = 0,
+        columnar: bool = False,
+        paralelo: bool = False,
+        tamano_lote: Optional[int] = None,
+        num_procesos: Optional[int] = None,
+        formato_errores: str = "dicts",
+        formato_validos: str = "dicts",
+        almacen: Optional[str] = None,
+        max_errores: Optional[int] = None,
+        max_errores_campo: Optional[int] = None,
+        detener_primer_error: bool = False,
+        muestra: Optional[float] = None,
+        estratos: Optional[str] = None,
+        confianza: float = 0.95,
+        semilla: Optional[int] = None
+    ):
+        """
+        Valida los datos extraídos. Con ``columnar=True`` las restricciones
+        de los campos se evalúan como un plan de expresiones Polars y solo
+        las filas que lo requieren pasan por Pydantic (ver ``core.columnar``).
+        Con ``paralelo=True`` las filas se reparten en lotes de
+        ``tamano_lote`` entre ``num_procesos`` procesos (ver ``core.parallel``).
+        Con ``formato_errores="tabla"`` los errores se devuelven como una
+        ``ErrorTable`` en formato largo (ver ``core.errors``).
+        ``formato_validos`` evita los ``model_dump()`` por fila: "mascara" e
+        "indices" devuelven arreglos NumPy sobre ``_data``; "polars" y
+        "geodataframe" una tabla tipada con los valores del modelo.
+        Con ``almacen`` (ruta SQLite) solo se validan las filas nuevas o
+        modificadas desde la última entrega (ver ``core.incremental``).
+        Para un triaje rápido (ver ``core.triage``), ``max_errores``,
+        ``max_errores_campo`` y ``detener_primer_error`` detienen la
+        validación al agotar el presupuesto de errores, y ``muestra`` (filas
+        o fracción, estratificada por la columna ``estratos``) valida una
+        muestra y estima la tasa de error con su intervalo de ``confianza``
+        (en las métricas de la sesión).
+        Es un atajo sobre ``session`` que lee el DataFrame de ``extract``.
+        """
+        if cls._data is None:
+            raise ValueError(f"❌ No hay datos en {cls.__name__}.")
+        sesion = cls.session(
+            cls._data, offset=offset, columnar=columnar, paralelo=paralelo,
+            tamano_lote=tamano_lote, num_procesos=num_procesos,
+            formato_errores=formato_errores, formato_validos=formato_validos,
+            almacen=almacen, max_errores=max_errores,
+            max_errores_campo=max_errores_campo,
+            detener_primer_error=detener_primer_error, muestra=muestra,
+            estratos=estratos, confianza=confianza, semilla=semilla
+        )
+        # Los resultados pasan al llamador; la sesión no conserva referencias
+        with sesion:
+            return sesion.run()
+
+    # --- 4. INSTRUMENTACIÓN ---
+    @classmethod
+    def enable_instrumentation(
+        cls, medicion: Optional[Instrumentation] = None
+    ) -> Instrumentation:
+        """
+        Activa la medición de llamadas, fallos y tiempo de cada validador de
+        campo y de modelo, de los gemelos columnares y de las fases (lectura,
+        traducción, validación, formato) del modelo y sus subclases. Devuelve
+        la ``core.instrumentation.Instrumentation`` donde se acumulan (se
+        puede pasar una para compartirla entre modelos).
+        """
+        from geoanla.core.instrumentation import enable
+        return enable(cls, medicion)
 
-        return validos, errores
+    @classmethod
+    def disable_instrumentation(cls):
+        """Restaura los validadores originales del modelo y sus subclases."""
+        from geoanla.core.instrumentation import disable
+        disable(cls)
 
 
 # ==========================================
 # CLASE BASE 2: Componente Geográfico (Simplificada)
 # ==========================================
 class BaseEV_Geo(BaseEV):
-    model_config = ConfigDict(arbitrary_types_allowed=True, use_enum_values=True, populate_by_name=True)
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, use_enum_values=True, populate_by_name=True
+    )
     geometry: Any = Field(..., description="Atributo geométrico oficial")
+    # Tipos ``geom_type`` admitidos (None = sin restricción), aceptación de
+    # geometrías vacías, exigencia de validez topológica y textos propios del
+    # modelo ("tipo", "vacia", "topologia"; ver ``core.geometry``)
+    GEOMETRIAS_PERMITIDAS: ClassVar[Optional[Tuple[str, ...]]] = None
+    ADMITIR_VACIAS: ClassVar[bool] = False
+    VALIDAR_TOPOLOGIA: ClassVar[bool] = False
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {}
+
+    @field_validator('geometry')
+    @classmethod
+    def validate_allowed_geometry(cls, v):
+        """Valida tipo, vacío y topología con la rutina de la etapa en bloque."""
+        mensaje = cls.geometry_errors([v])[0]
+        if mensaje:
+            raise ValueError(mensaje)
+        return v
+
+    @classmethod
+    def geometry_errors(cls, geometrias: List[Any]) -> List[Optional[str]]:
+        """Mensaje de error de cada geometría según lo que declara el modelo."""
+        return geometry_errors(
+            geometrias,
+            cls.GEOMETRIAS_PERMITIDAS,
+            validar_topologia=cls.VALIDAR_TOPOLOGIA,
+            admitir_vacias=cls.ADMITIR_VACIAS,
+            mensajes=cls.MENSAJES_GEOMETRIA,
+        )
 
     # Ya no necesitas extract_gdf obligatoriamente, pero lo dejamos por compatibilidad
     @classmethod
-    def extract_gdf(cls, gdf: gpd.GeoDataFrame):
+    def extract_gdf(cls, gdf: "gpd.GeoDataFrame"):
         return cls.extract(gdf)
\ No newline at end of file
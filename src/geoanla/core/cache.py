@@ -0,0 +1,270 @@
+"""
+Caché en disco de las partes serializables de los planes de validación.
+
+Cada proceso que valida recorre las anotaciones, restricciones y miembros de
+Enum de sus modelos para armar el plan columnar (``core.columnar``), los
+índices de los dominios (``catalog.registry.EnumIndex``) y el mapa de campos
+de dominio de cada modelo (``BaseEV.get_domains``). ``build_plan_cache``
+compila los modelos del paquete y guarda en un archivo versionado todo lo
+que no son funciones:
+
+- ``planes``: las reglas de cada campo (tipo, alias, obligatoriedad, valor
+  por defecto, restricciones de ``Field``, códigos del dominio, si es una
+  geometría que se valida en bloque), los campos que van a Pydantic y los
+  validadores de modelo activos;
+- ``indices``: las tablas de búsqueda de cada Enum (código, descripción y
+  nombre normalizados);
+- ``dominios``: los campos de cada modelo cuya anotación es un Enum.
+
+En los procesos siguientes (p. ej. los trabajadores de ``core.parallel``)
+esas partes se leen del archivo y solo se vuelven a armar las funciones:
+los modelos de un campo de los ``field_validator``, la validación en bloque
+de la geometría y los validadores de modelo. Cada entrada se deserializa en
+su primer uso, de modo que leer el plan de un modelo no importa los
+dominios de los demás.
+
+La versión combina el código fuente y los datos del paquete ``geoanla``,
+las versiones de Python, Polars, Pydantic y pydantic-core y
+``VERSION_CACHE``: un archivo de otra versión se ignora. La carpeta es la de
+``GEOANLA_CACHE`` o, si no está definida, ``geoanla`` dentro de la caché del
+usuario (``XDG_CACHE_HOME`` o ``~/.cache``); ``GEOANLA_CACHE=""`` o
+``set_cache_dir(None)`` la desactivan. El archivo usa ``pickle`` y solo debe
+abrirse con archivos generados por esta misma librería.
+
+Ejemplo (una vez por instalación o tras actualizar la librería)::
+
+    from geoanla.core.cache import build_plan_cache
+    build_plan_cache()
+"""
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import pkgutil
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+import polars as pl
+import pydantic
+import pydantic_core
+
+# Se incrementa a mano cuando cambia la forma de lo que se guarda
+VERSION_CACHE = 1
+
+# Variable de entorno con la carpeta de la caché (vacía la desactiva)
+VARIABLE_CACHE = "GEOANLA_CACHE"
+
+# Secciones del archivo, una por tipo de objeto derivado
+SECCIONES = ("planes", "indices", "dominios")
+
+# Archivos del paquete que entran en la versión
+EXTENSIONES_VERSION = (".py", ".csv")
+
+PREFIJO_ARCHIVO = "planes-"
+
+_RAIZ_PAQUETE = Path(__file__).resolve().parents[1]
+
+_NO_DEFINIDA = object()
+_carpeta: Any = _NO_DEFINIDA
+_contenido: Optional[Dict[str, Dict[str, bytes]]] = None
+_version: Optional[str] = None
+_CANDADO = threading.Lock()
+
+
+# ==========================================
+# 1. UBICACIÓN Y VERSIÓN
+# ==========================================
+
+def _default_dir() -> Optional[Path]:
+    """Carpeta de ``GEOANLA_CACHE`` o la de la caché del usuario."""
+    valor = os.environ.get(VARIABLE_CACHE)
+    if valor is not None:
+        return Path(valor).expanduser() if valor else None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "geoanla"
+
+
+def cache_dir() -> Optional[Path]:
+    """Carpeta de la caché, o None si está desactivada."""
+    global _carpeta
+    if _carpeta is _NO_DEFINIDA:
+        _carpeta = _default_dir()
+    return _carpeta
+
+
+def set_cache_dir(carpeta: Optional[Union[str, Path]]):
+    """
+    Cambia la carpeta de la caché (None la desactiva). Lo ya leído se
+    descarta; los planes e índices ya armados en el proceso se conservan.
+    """
+    global _carpeta, _contenido
+    with _CANDADO:
+        _carpeta = None if carpeta is None else Path(carpeta)
+        _contenido = None
+
+
+def cache_version() -> str:
+    """
+    Huella del paquete: código fuente y datos de ``geoanla``, versiones de
+    Python, Polars, Pydantic y pydantic-core y ``VERSION_CACHE``.
+    """
+    global _version
+    if _version is None:
+        firma = hashlib.sha256("|".join([
+            f"cache {VERSION_CACHE}",
+            f"python {sys.version_info[:3]}",
+            f"polars {pl.__version__}",
+            f"pydantic {pydantic.VERSION}",
+            f"pydantic-core {pydantic_core.__version__}",
+        ]).encode())
+        for ruta in sorted(_RAIZ_PAQUETE.rglob("*")):
+            if ruta.suffix in EXTENSIONES_VERSION and "__pycache__" not in ruta.parts:
+                firma.update(ruta.relative_to(_RAIZ_PAQUETE).as_posix().encode())
+                firma.update(ruta.read_bytes())
+        _version = firma.hexdigest()
+    return _version
+
+
+def cache_path() -> Optional[Path]:
+    """Archivo de la caché para la versión actual, o None si está desactivada."""
+    carpeta = cache_dir()
+    if carpeta is None:
+        return None
+    return carpeta / f"{PREFIJO_ARCHIVO}{cache_version()[:16]}.pickle"
+
+
+# ==========================================
+# 2. LECTURA POR ENTRADA
+# ==========================================
+
+def _key(clase: type) -> Optional[str]:
+    """Clave de una clase importable (las definidas en funciones no se guardan)."""
+    if "<locals>" in clase.__qualname__:
+        return None
+    return f"{clase.__module__}:{clase.__qualname__}"
+
+
+def _read(ruta: Optional[Path]) -> Dict[str, Dict[str, bytes]]:
+    """Contenido del archivo si existe y es de la versión actual."""
+    if ruta is None or not ruta.exists():
+        return {}
+    try:
+        with open(ruta, "rb") as archivo:
+            contenido = pickle.load(archivo)
+    except Exception:
+        # Un archivo dañado o a medio escribir equivale a no tener caché
+        return {}
+    if not isinstance(contenido, dict) or contenido.get("version") != cache_version():
+        return {}
+    return {s: dict(contenido.get(s, {})) for s in SECCIONES}
+
+
+def _content() -> Dict[str, Dict[str, bytes]]:
+    """Contenido del archivo de la caché, leído una sola vez por proceso."""
+    global _contenido
+    if _contenido is None:
+        with _CANDADO:
+            if _contenido is None:
+                _contenido = _read(cache_path())
+    return _contenido
+
+
+def load_cached(seccion: str, clase: type) -> Optional[Any]:
+    """
+    Entrada de ``clase`` en una sección de la caché (``"planes"``,
+    ``"indices"`` o ``"dominios"``), o None si no está guardada.
+    """
+    clave = _key(clase)
+    if clave is None:
+        return None
+    datos = _content().get(seccion, {}).get(clave)
+    if datos is None:
+        return None
+    try:
+        return pickle.loads(datos)
+    except Exception:
+        return None
+
+
+def discard_cached(seccion: str, clase: type):
+    """Descarta la entrada de ``clase`` en este proceso (p. ej. si cambia)."""
+    clave = _key(clase)
+    if clave is not None:
+        _content().get(seccion, {}).pop(clave, None)
+
+
+# ==========================================
+# 3. CONSTRUCCIÓN DEL ARCHIVO
+# ==========================================
+
+def _package_models() -> List[Type]:
+    """Todas las clases BaseEV de ``geoanla.models``."""
+    import geoanla.models as paquete
+    from geoanla.core.base import BaseEV
+
+    modelos = []
+    for modulo in pkgutil.iter_modules(paquete.__path__):
+        contenido = importlib.import_module(f"geoanla.models.{modulo.name}")
+        for _, clase in inspect.getmembers(contenido, inspect.isclass):
+            if issubclass(clase, BaseEV) and clase.__module__ == contenido.__name__:
+                modelos.append(clase)
+    return modelos
+
+
+def _dump(seccion: Dict[str, bytes], clase: type, dato: Any):
+    """Guarda ``dato`` serializado; lo que no se puede serializar se omite."""
+    clave = _key(clase)
+    if clave is None:
+        return
+    try:
+        seccion[clave] = pickle.dumps(dato, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        pass
+
+
+def build_plan_cache(modelos: Optional[Iterable[Type]] = None) -> Optional[Path]:
+    """
+    Compila los planes, índices de dominio y mapas de dominios de
+    ``modelos`` (por defecto, todos los de ``geoanla.models``) y los escribe
+    en el archivo de la versión actual, reemplazando los de otras versiones.
+
+    Returns:
+        Ruta del archivo, o None si la caché está desactivada.
+    """
+    from geoanla.catalog.registry import catalog_domains, get_enum_index
+    from geoanla.core.columnar import compile_plan, plan_spec
+
+    ruta = cache_path()
+    if ruta is None:
+        return None
+
+    modelos = _package_models() if modelos is None else list(modelos)
+    contenido: Dict[str, Any] = {s: {} for s in SECCIONES}
+    enums = list(catalog_domains().values())
+    for modelo in modelos:
+        _dump(contenido["planes"], modelo, plan_spec(compile_plan(modelo)))
+        dominios = modelo._annotated_domains()
+        _dump(contenido["dominios"], modelo, dominios)
+        enums.extend(dominios.values())
+    for clase_enum in dict.fromkeys(enums):
+        _dump(contenido["indices"], clase_enum, get_enum_index(clase_enum).state())
+
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_name(f"{ruta.name}.{os.getpid()}.tmp")
+    with open(temporal, "wb") as archivo:
+        pickle.dump(
+            {"version": cache_version(), **contenido}, archivo,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(temporal, ruta)
+    for anterior in ruta.parent.glob(f"{PREFIJO_ARCHIVO}*.pickle"):
+        if anterior != ruta:
+            anterior.unlink(missing_ok=True)
+
+    global _contenido
+    with _CANDADO:
+        _contenido = {s: dict(contenido[s]) for s in SECCIONES}
+    return ruta
@@ -0,0 +1,1537 @@
+"""
+Motor de validación columnar para modelos BaseEV.
+
+Compila una sola vez las restricciones declaradas en ``model_fields``
+(obligatoriedad, ``max_length``/``min_length``, ``ge``/``le``/``gt``/``lt``,
+dominios Enum, fechas, enteros y flotantes) en un plan de expresiones Polars.
+Al evaluarse, el plan devuelve en una sola pasada una máscara por fila y por
+campo con el tipo y el mensaje de error (mismos textos que produce Pydantic).
+
+Los campos con ``field_validator`` se validan por diccionario: cada valor
+distinto de la columna pasa una sola vez por un modelo de un solo campo y el
+resultado se une con las filas. La geometría de los modelos BaseEV_Geo se
+revisa en bloque con shapely (ver ``core.geometry``). Los validadores de
+modelo ('after') se ejecutan sobre instancias armadas con los valores ya
+validados.
+
+Las filas cuyo resultado no puede determinarse de forma columnar (p. ej.
+textos que no parecen números) o cuyos campos no se pueden compilar se
+delegan a Pydantic fila a fila.
+
+Un ``pl.LazyFrame`` se proyecta a las columnas que usa el modelo y se
+ejecuta en streaming, validando lote a lote (ver ``validate_lazy``).
+"""
+import heapq
+import inspect
+import math
+import threading
+import types
+from dataclasses import dataclass, field, fields
+from datetime import date
+from enum import Enum
+from typing import (
+    Annotated, Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union,
+    get_args, get_origin,
+)
+
+import annotated_types
+import numpy as np
+import polars as pl
+from pydantic import (
+    AfterValidator, BeforeValidator, PlainValidator, ValidationError, WrapValidator,
+    create_model,
+)
+from pydantic_core import PydanticCustomError
+
+from geoanla.catalog.registry import get_enum_index
+from geoanla.core.cache import discard_cached, load_cached
+from geoanla.core.errors import ErrorTable
+from geoanla.core.frames import decode_geometry, geometry_values
+from geoanla.core.instrumentation import measure, timed_batch
+
+# Validador universal de BaseEV que no hace nada si el modelo no declara CAMPO_LEYENDA
+VALIDADOR_LEYENDA = "validate_legend_nomenclature"
+
+COLUMNA_INDETERMINADO = "__indeterminado__"
+
+# Validador de BaseEV_Geo que tiene equivalente en bloque (``geometry_errors``)
+VALIDADOR_GEOMETRIA = "validate_allowed_geometry"
+
+# Prefijo de las columnas auxiliares que resuelven los campos con validadores
+PREFIJO_UNICO = "__unico__"
+
+# Tipos de regla cuyo resultado se precalcula en columnas auxiliares
+TIPOS_AUXILIARES = ("unico", "geometria")
+
+VALIDADORES_FUNCIONALES = {
+    "before": BeforeValidator,
+    "after": AfterValidator,
+    "plain": PlainValidator,
+    "wrap": WrapValidator,
+}
+
+TIPOS_ENTEROS = (
+    pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64
+)
+TIPOS_FLOTANTES = (pl.Float32, pl.Float64)
+
+MENSAJE_REQUERIDO = "Field required"
+MENSAJE_TEXTO = "Input should be a valid string"
+MENSAJE_ENTERO_FRACCION = (
+    "Input should be a valid integer, got a number with a fractional part"
+)
+MENSAJE_FECHA_HORA = (
+    "Datetimes provided to dates should have zero time - e.g. be exact dates"
+)
+MENSAJE_ENTERO_TAMANO = (
+    "Unable to parse input string as an integer, exceeded maximum size"
+)
+
+# Textos que Pydantic lee como entero en un Enum de enteros
+# ("401", " -3 ", "4_01", "401.00")
+PATRON_ENTERO = r"^[+-]?[0-9]+(_[0-9]+)*(\.0+)?$"
+
+# Formatos de salida de las filas válidas y su representación interna por trozo:
+# diccionarios, posiciones globales o tabla Polars con la columna COLUMNA_FILA
+FORMATOS_VALIDOS = {
+    "dicts": "dicts",
+    "mascara": "posiciones",
+    "indices": "posiciones",
+    "polars": "tabla",
+    "geodataframe": "tabla",
+}
+COLUMNA_FILA = "__fila__"
+
+# Filas por lote al validar un LazyFrame
+TAMANO_LOTE_DIFERIDO = 50_000
+
+
+@dataclass
+class FieldRule:
+    """Restricciones compiladas de un campo del modelo."""
+    nombre: str
+    alias: Optional[str]
+    por_nombre: bool
+    tipo: str
+    requerido: bool
+    por_defecto: Any = None
+    restricciones: List[Any] = field(default_factory=list)
+    clase_enum: Optional[Type[Enum]] = None
+    valores_enum: List[Any] = field(default_factory=list)
+    modelo_campo: Optional[Type] = None
+    validador_lote: Optional[Callable] = None
+
+    def resolve_column(self, columnas: set) -> Optional[str]:
+        """Devuelve la columna del DataFrame que alimenta el campo (alias primero)."""
+        if self.alias and self.alias in columnas:
+            return self.alias
+        if (self.por_nombre or not self.alias) and self.nombre in columnas:
+            return self.nombre
+        return None
+
+    @property
+    def loc(self) -> str:
+        """Ubicación que reporta Pydantic cuando el campo no viene en los datos."""
+        return self.alias or self.nombre
+
+    def auxiliary(self, sufijo: str) -> str:
+        """Columna auxiliar de un campo con validadores ("msg", "tipo", ...)."""
+        return f"{PREFIJO_UNICO}{self.nombre}_{sufijo}"
+
+
+@dataclass
+class ValidationPlan:
+    """Plan de validación columnar derivado de un modelo."""
+    modelo: Type
+    reglas: List[FieldRule]
+    campos_no_compilables: List[str]
+    validadores_modelo: List[str]
+    compilable: bool = True
+    usar_valores_enum: bool = False
+    validadores_instancia: Dict[str, Callable] = field(default_factory=dict)
+    validadores_columnares: Dict[str, Callable] = field(default_factory=dict)
+
+    @property
+    def requires_pydantic(self) -> bool:
+        """Indica si las filas que superan la etapa columnar van a Pydantic."""
+        if self.campos_no_compilables:
+            return True
+        return bool(self.validadores_modelo) and not self.validadores_instancia
+
+    @property
+    def requires_model_validation(self) -> bool:
+        """Indica si las filas aprobadas solo pasan por los validadores de modelo."""
+        return not self.requires_pydantic and bool(self.validadores_instancia)
+
+
+# Campos de FieldRule que guarda la caché en disco (las funciones se rearman)
+CAMPOS_REGLA_FUNCIONES = ("modelo_campo", "validador_lote")
+CAMPOS_REGLA_CACHE = tuple(
+    f.name for f in fields(FieldRule) if f.name not in CAMPOS_REGLA_FUNCIONES
+)
+
+_PLANES: Dict[Type, ValidationPlan] = {}
+_CANDADO_PLANES = threading.Lock()
+
+
+# ==========================================
+# 1. COMPILACIÓN DEL PLAN
+# ==========================================
+
+def _unwrap_optional(anotacion: Any) -> Any:
+    """Quita ``Optional[...]`` de una anotación; None si es una unión real."""
+    origen = get_origin(anotacion)
+    if origen in (Union, types.UnionType):
+        argumentos = [a for a in get_args(anotacion) if a is not type(None)]
+        return argumentos[0] if len(argumentos) == 1 else None
+    return anotacion
+
+
+def _classify_type(anotacion: Any) -> Optional[str]:
+    """Clasifica la anotación en uno de los tipos que sabe compilar el motor."""
+    if anotacion is Any:
+        return "any"
+    if isinstance(anotacion, type):
+        if issubclass(anotacion, Enum):
+            return "enum"
+        if anotacion is bool:
+            return None
+        if anotacion is str:
+            return "str"
+        if anotacion is int:
+            return "int"
+        if anotacion is float:
+            return "float"
+        if anotacion is date:
+            return "date"
+    return None
+
+
+def _validators_by_field(modelo: Type) -> set:
+    """Campos que tienen ``field_validator`` propios (no compilables)."""
+    decoradores = modelo.__pydantic_decorators__
+    campos = set()
+    for dec in decoradores.field_validators.values():
+        campos.update(dec.info.fields)
+    if "*" in campos:
+        campos = set(modelo.model_fields)
+    return campos
+
+
+def _field_validators(modelo: Type, nombre: str) -> list:
+    """Decoradores ``field_validator`` de un campo, en orden de definición."""
+    return [
+        dec for dec in modelo.__pydantic_decorators__.field_validators.values()
+        if nombre in dec.info.fields or "*" in dec.info.fields
+    ]
+
+
+def _geometry_validator(modelo: Type, nombre: str, info: Any) -> Optional[Callable]:
+    """
+    Devuelve la validación en bloque de la geometría si el único validador
+    del campo es el de BaseEV_Geo y el campo admite cualquier objeto.
+    """
+    decoradores = _field_validators(modelo, nombre)
+    if [dec.cls_var_name for dec in decoradores] != [VALIDADOR_GEOMETRIA]:
+        return None
+    if _unwrap_optional(info.annotation) is not Any:
+        return None
+    validador = getattr(modelo, "geometry_errors", None)
+    return None if validador is None else timed_batch(modelo, validador)
+
+
+def _build_field_model(modelo: Type, nombre: str, info: Any) -> Optional[Type]:
+    """
+    Construye un modelo de un solo campo con la anotación, las restricciones
+    y los ``field_validator`` del campo original, para validar valores
+    distintos de forma aislada. Devuelve None si algún validador depende de
+    otros campos (recibe ``info``) o si el campo guarda objetos arbitrarios.
+    """
+    if _unwrap_optional(info.annotation) is Any:
+        return None
+
+    funcionales = []
+    for dec in _field_validators(modelo, nombre):
+        clase = VALIDADORES_FUNCIONALES.get(dec.info.mode)
+        parametros = inspect.signature(dec.func).parameters
+        esperados = 2 if dec.info.mode == "wrap" else 1
+        if clase is None or len(parametros) != esperados:
+            return None
+        funcionales.append(clase(dec.func))
+
+    anotacion = Annotated[(info.annotation, *funcionales)]
+    return create_model(
+        f"{modelo.__name__}_{nombre}",
+        __config__=modelo.model_config,
+        **{nombre: (anotacion, info)},
+    )
+
+
+def _active_model_validators(modelo: Type) -> List[str]:
+    """Validadores de modelo que realmente actúan sobre las filas del modelo."""
+    activos = []
+    for nombre in modelo.__pydantic_decorators__.model_validators:
+        if nombre == VALIDADOR_LEYENDA and (
+            not getattr(modelo, "CAMPO_LEYENDA", None)
+            or "NOMENCLAT" not in modelo.model_fields
+        ):
+            continue
+        activos.append(nombre)
+    return activos
+
+
+def _instance_validators(modelo: Type, nombres: List[str]) -> Dict[str, Callable]:
+    """
+    Funciones de los validadores de modelo en modo 'after', en el orden en
+    que Pydantic las ejecuta. Si alguno es 'before' o 'wrap' devuelve un
+    dict vacío: esas filas necesitan la validación completa de Pydantic.
+    """
+    decoradores = modelo.__pydantic_decorators__.model_validators
+    funciones = {}
+    for nombre in nombres:
+        dec = decoradores[nombre]
+        if dec.info.mode != "after":
+            return {}
+        funciones[nombre] = dec.func
+    return funciones
+
+
+def _columnar_validators(modelo: Type, nombres: List[str]) -> Dict[str, Callable]:
+    """
+    Gemelos vectorizados declarados en ``VALIDADORES_COLUMNARES`` del modelo
+    para sus validadores de modelo activos.
+    """
+    gemelos = getattr(modelo, "VALIDADORES_COLUMNARES", {})
+    return {
+        nombre: timed_batch(modelo, getattr(modelo, gemelos[nombre]))
+        for nombre in nombres if nombre in gemelos
+    }
+
+
+def _compile_plan(modelo: Type) -> ValidationPlan:
+    """Compila las restricciones de ``model_fields`` en un plan nuevo."""
+    config = modelo.model_config
+    con_validador = _validators_by_field(modelo)
+    reglas, no_compilables = [], []
+
+    for nombre, info in modelo.model_fields.items():
+        alias = info.validation_alias
+        if alias is not None and not isinstance(alias, str):
+            no_compilables.append(nombre)
+            continue
+
+        anotacion = _unwrap_optional(info.annotation)
+        tipo = _classify_type(anotacion)
+        restricciones = list(info.metadata)
+        soportadas = all(
+            isinstance(r, (annotated_types.MaxLen, annotated_types.MinLen,
+                           annotated_types.Ge, annotated_types.Le,
+                           annotated_types.Gt, annotated_types.Lt))
+            for r in restricciones
+        )
+        modelo_campo = validador_lote = None
+        if nombre in con_validador:
+            validador_lote = _geometry_validator(modelo, nombre, info)
+            if validador_lote is not None:
+                # Geometría: tipo, vacío y topología en bloque con shapely
+                tipo = "geometria"
+            else:
+                # Con validadores propios: cada valor distinto se valida una vez
+                modelo_campo = _build_field_model(modelo, nombre, info)
+                tipo = "unico" if modelo_campo is not None else None
+        if tipo is None or (tipo not in TIPOS_AUXILIARES and not soportadas):
+            no_compilables.append(nombre)
+            continue
+
+        if info.is_required():
+            por_defecto = None
+        else:
+            por_defecto = info.get_default(call_default_factory=True)
+        regla = FieldRule(
+            nombre=nombre,
+            alias=alias,
+            por_nombre=bool(config.get("populate_by_name")),
+            tipo=tipo,
+            requerido=info.is_required(),
+            por_defecto=por_defecto,
+            restricciones=restricciones,
+            modelo_campo=modelo_campo,
+            validador_lote=validador_lote,
+        )
+        if isinstance(anotacion, type) and issubclass(anotacion, Enum):
+            regla.clase_enum = anotacion
+            regla.valores_enum = get_enum_index(anotacion).codes
+        reglas.append(regla)
+
+    return ValidationPlan(
+        modelo=modelo,
+        reglas=reglas,
+        campos_no_compilables=no_compilables,
+        validadores_modelo=_active_model_validators(modelo),
+        compilable=not config.get("strict") and config.get("extra") != "forbid",
+        usar_valores_enum=bool(config.get("use_enum_values")),
+    )
+
+
+def plan_spec(plan: ValidationPlan) -> Dict[str, Any]:
+    """
+    Partes del plan que no son funciones (las que guarda ``core.cache``):
+    reglas sin ``CAMPOS_REGLA_FUNCIONES``, campos no compilables,
+    validadores de modelo activos y opciones de la configuración.
+    """
+    return {
+        "reglas": [
+            {nombre: getattr(regla, nombre) for nombre in CAMPOS_REGLA_CACHE}
+            for regla in plan.reglas
+        ],
+        "campos_no_compilables": list(plan.campos_no_compilables),
+        "validadores_modelo": list(plan.validadores_modelo),
+        "compilable": plan.compilable,
+        "usar_valores_enum": plan.usar_valores_enum,
+    }
+
+
+def _plan_from_spec(modelo: Type, spec: Dict[str, Any]) -> ValidationPlan:
+    """
+    Plan a partir de sus partes guardadas en la caché en disco: solo se
+    rearman los modelos de un campo y la validación de la geometría.
+    """
+    reglas = []
+    for datos in spec["reglas"]:
+        regla = FieldRule(**datos)
+        info = modelo.model_fields[regla.nombre]
+        if regla.tipo == "geometria":
+            regla.validador_lote = _geometry_validator(modelo, regla.nombre, info)
+        elif regla.tipo == "unico":
+            regla.modelo_campo = _build_field_model(modelo, regla.nombre, info)
+        reglas.append(regla)
+    return ValidationPlan(
+        modelo=modelo,
+        reglas=reglas,
+        campos_no_compilables=spec["campos_no_compilables"],
+        validadores_modelo=spec["validadores_modelo"],
+        compilable=spec["compilable"],
+        usar_valores_enum=spec["usar_valores_enum"],
+    )
+
+
+def compile_plan(modelo: Type) -> ValidationPlan:
+    """
+    Compila (una sola vez por clase) las restricciones de ``model_fields``
+    en un plan de validación columnar. Si la caché en disco tiene el plan
+    del modelo (ver ``core.cache``) solo se arman sus funciones.
+    """
+    plan = _PLANES.get(modelo)
+    if plan is not None:
+        return plan
+
+    with _CANDADO_PLANES:
+        plan = _PLANES.get(modelo)
+        if plan is not None:
+            return plan
+
+        spec = load_cached("planes", modelo)
+        if spec is not None:
+            plan = _plan_from_spec(modelo, spec)
+        else:
+            plan = _compile_plan(modelo)
+        plan.validadores_instancia = _instance_validators(
+            modelo, plan.validadores_modelo
+        )
+        plan.validadores_columnares = _columnar_validators(
+            modelo, plan.validadores_modelo
+        )
+        _PLANES[modelo] = plan
+        return plan
+
+
+def invalidate_plan(modelo: Type):
+    """
+    Descarta el plan compilado del modelo y su entrada de la caché en disco
+    en este proceso (p. ej. al cambiar sus validadores).
+    """
+    with _CANDADO_PLANES:
+        _PLANES.pop(modelo, None)
+        discard_cached("planes", modelo)
+
+
+# ==========================================
+# 2. EXPRESIONES POR CAMPO
+# ==========================================
+
+def _format_number(valor: Any) -> str:
+    """Formatea límites numéricos igual que Pydantic (100.0 -> '100')."""
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return str(valor)
+
+
+def _expected_values(valores: List[Any]) -> str:
+    """Replica el listado 'a, b or c' que usa Pydantic en errores de Enum."""
+    textos = [repr(v) for v in valores]
+    if len(textos) == 1:
+        return textos[0]
+    return ", ".join(textos[:-1]) + " or " + textos[-1]
+
+
+def _constraint_checks(
+    regla: FieldRule, valor: pl.Expr
+) -> List[Tuple[pl.Expr, str, str]]:
+    """Convierte las restricciones de ``Field`` en condiciones de error."""
+    chequeos = []
+    for r in regla.restricciones:
+        if isinstance(r, annotated_types.MaxLen):
+            unidad = "character" if r.max_length == 1 else "characters"
+            chequeos.append((
+                valor.str.len_chars() > r.max_length, "string_too_long",
+                f"String should have at most {r.max_length} {unidad}",
+            ))
+        elif isinstance(r, annotated_types.MinLen):
+            unidad = "character" if r.min_length == 1 else "characters"
+            chequeos.append((
+                valor.str.len_chars() < r.min_length, "string_too_short",
+                f"String should have at least {r.min_length} {unidad}",
+            ))
+        elif isinstance(r, annotated_types.Ge):
+            chequeos.append((
+                valor < r.ge, "greater_than_equal",
+                f"Input should be greater than or equal to {_format_number(r.ge)}",
+            ))
+        elif isinstance(r, annotated_types.Gt):
+            chequeos.append((
+                valor <= r.gt, "greater_than",
+                f"Input should be greater than {_format_number(r.gt)}",
+            ))
+        elif isinstance(r, annotated_types.Le):
+            chequeos.append((
+                valor > r.le, "less_than_equal",
+                f"Input should be less than or equal to {_format_number(r.le)}",
+            ))
+        elif isinstance(r, annotated_types.Lt):
+            chequeos.append((
+                valor >= r.lt, "less_than",
+                f"Input should be less than {_format_number(r.lt)}",
+            ))
+    return chequeos
+
+
+def _field_expressions(
+    regla: FieldRule, columna: str, dtype: pl.DataType
+) -> Tuple[List[Tuple[pl.Expr, str, str]], pl.Expr, pl.Expr]:
+    """
+    Construye, para un campo presente en el DataFrame, la lista ordenada de
+    chequeos (condición, tipo, mensaje), la condición de indeterminación y la
+    expresión del valor ya convertido al tipo del modelo.
+    """
+    col = pl.col(columna)
+    presente = col.is_not_null()
+    falso = pl.lit(False)
+    chequeos: List[Tuple[pl.Expr, str, str]] = []
+    indeterminado = falso
+    valor = col
+
+    if regla.tipo == "unico":
+        indeterminado = pl.col(regla.auxiliary("indeterminado"))
+        return [], indeterminado, pl.col(regla.auxiliary("valor"))
+
+    if regla.tipo == "geometria":
+        return [], pl.col(regla.auxiliary("indeterminado")), col
+
+    if dtype == pl.Null:
+        return [], falso, pl.lit(None)
+
+    if regla.tipo == "any":
+        return [], falso, col
+
+    es_texto = dtype in (pl.Utf8, pl.Categorical) or isinstance(
+        dtype, (pl.Categorical, pl.Enum)
+    )
+    es_numerico = dtype in TIPOS_ENTEROS or dtype in TIPOS_FLOTANTES
+
+    if regla.tipo == "str":
+        # Las longitudes solo se miden sobre texto: con otro tipo de columna
+        # cada valor presente ya es un error de tipo o queda para Pydantic
+        if es_texto:
+            valor = col.cast(pl.Utf8)
+            chequeos += _constraint_checks(regla, valor)
+        elif dtype == pl.Object:
+            indeterminado = presente
+        else:
+            chequeos.append((presente, "string_type", MENSAJE_TEXTO))
+
+    elif regla.tipo == "int":
+        if dtype in TIPOS_ENTEROS:
+            valor = col.cast(pl.Int64)
+        elif dtype in TIPOS_FLOTANTES:
+            indeterminado = col.is_nan() | col.is_infinite()
+            chequeos.append(
+                ((col % 1) != 0, "int_from_float", MENSAJE_ENTERO_FRACCION)
+            )
+            valor = pl.when(indeterminado).then(None).otherwise(col).cast(pl.Int64)
+        elif es_texto:
+            valor = col.cast(pl.Utf8).str.strip_chars().cast(pl.Int64, strict=False)
+            indeterminado = presente & valor.is_null()
+        else:
+            indeterminado = presente
+        chequeos += _constraint_checks(regla, valor)
+
+    elif regla.tipo == "float":
+        if es_numerico:
+            valor = col.cast(pl.Float64)
+        elif es_texto:
+            valor = col.cast(pl.Utf8).str.strip_chars().cast(pl.Float64, strict=False)
+        else:
+            indeterminado = presente
+        if es_numerico or es_texto:
+            indeterminado = presente & (valor.is_null() | valor.is_nan())
+        chequeos += _constraint_checks(regla, valor)
+
+    elif regla.tipo == "date":
+        if dtype == pl.Date:
+            valor = col
+        elif isinstance(dtype, pl.Datetime):
+            chequeos.append((
+                col.dt.time() != pl.time(0), "date_from_datetime_inexact",
+                MENSAJE_FECHA_HORA,
+            ))
+            valor = col.cast(pl.Date)
+        elif es_texto:
+            texto = col.cast(pl.Utf8)
+            valor = pl.when(texto.str.contains(r"^\d{4}-\d{2}-\d{2}$")).then(
+                texto.str.strptime(pl.Date, "%Y-%m-%d", strict=False)
+            )
+            indeterminado = presente & valor.is_null()
+        else:
+            indeterminado = presente
+
+    elif regla.tipo == "enum":
+        ejemplo = regla.valores_enum[0] if regla.valores_enum else None
+        mensaje = f"Input should be {_expected_values(regla.valores_enum)}"
+        if isinstance(ejemplo, str):
+            if es_texto:
+                valor = col.cast(pl.Utf8)
+                indice = get_enum_index(regla.clase_enum)
+                validos = indice.value_series(pl.Utf8).implode()
+                chequeos.append((~valor.is_in(validos), "enum", mensaje))
+            elif dtype == pl.Object:
+                indeterminado = presente
+            else:
+                chequeos.append((presente, "enum", mensaje))
+        else:
+            if es_numerico:
+                numero = col.cast(pl.Float64)
+            elif es_texto and isinstance(ejemplo, int):
+                # Pydantic solo acepta textos enteros; los que no caben en 64 bits
+                # tienen su propio mensaje
+                texto = col.cast(pl.Utf8).str.strip_chars()
+                es_entero = texto.str.contains(PATRON_ENTERO)
+                digitos = texto.str.replace(r"\.0+$", "")
+                digitos = digitos.str.replace_all("_", "", literal=True)
+                entero = digitos.cast(pl.Int64, strict=False)
+                chequeos.append((
+                    es_entero & entero.is_null(), "int_parsing_size",
+                    MENSAJE_ENTERO_TAMANO,
+                ))
+                chequeos.append((presente & ~es_entero, "enum", mensaje))
+                numero = entero.cast(pl.Float64)
+            elif es_texto:
+                texto = col.cast(pl.Utf8).str.strip_chars()
+                numero = texto.cast(pl.Float64, strict=False)
+                indeterminado = presente & numero.is_null()
+            else:
+                numero = pl.lit(None, dtype=pl.Float64)
+                indeterminado = presente
+            # implode: se busca en la lista de valores, no elemento a elemento
+            indice = get_enum_index(regla.clase_enum)
+            validos = indice.value_series(pl.Float64).implode()
+            chequeos.append((~numero.is_in(validos), "enum", mensaje))
+            valor = numero.cast(pl.Int64) if isinstance(ejemplo, int) else numero
+
+    return chequeos, indeterminado, valor
+
+
+# ==========================================
+# 3. EVALUACIÓN DEL PLAN
+# ==========================================
+
+def _unique_outcomes(regla: FieldRule, columna: str, serie: pl.Series) -> pl.DataFrame:
+    """
+    Valida con el modelo de un solo campo cada valor distinto de la columna
+    y devuelve una tabla (valor, mensaje, tipo, valor convertido,
+    indeterminado) para unirla con las filas.
+    """
+    distintos = serie.unique(maintain_order=True)
+    mensajes, tipos, valores, indeterminados = [], [], [], []
+    for valor in distintos.to_list():
+        mensaje = tipo = convertido = None
+        indeterminado = False
+        if isinstance(valor, float) and math.isnan(valor):
+            # NaN depende del motor de origen (Pandas lo descarta): decide Pydantic
+            indeterminado = True
+        else:
+            try:
+                entrada = {} if valor is None else {columna: valor}
+                instancia = regla.modelo_campo.model_validate(entrada)
+                convertido = getattr(instancia, regla.nombre)
+                if isinstance(convertido, Enum):
+                    convertido = convertido.value
+            except ValidationError as e:
+                errores = e.errors()
+                if len(errores) == 1:
+                    mensaje, tipo = errores[0]["msg"], errores[0]["type"]
+                else:
+                    indeterminado = True
+        mensajes.append(mensaje)
+        tipos.append(tipo)
+        valores.append(convertido)
+        indeterminados.append(indeterminado)
+
+    try:
+        serie_valores = pl.Series(regla.auxiliary("valor"), valores, strict=False)
+    except Exception:
+        # Valores convertidos que Polars no sabe tipar: las filas van a Pydantic
+        serie_valores = pl.Series(regla.auxiliary("valor"), [None] * len(valores))
+        indeterminados = [True] * len(valores)
+
+    return pl.DataFrame([
+        distintos,
+        pl.Series(regla.auxiliary("msg"), mensajes, dtype=pl.Utf8),
+        pl.Series(regla.auxiliary("tipo"), tipos, dtype=pl.Utf8),
+        serie_valores,
+        pl.Series(regla.auxiliary("indeterminado"), indeterminados, dtype=pl.Boolean),
+    ])
+
+
+def _geometry_outcomes(regla: FieldRule, serie: pl.Series) -> pl.DataFrame:
+    """
+    Revisa toda la columna de geometrías con la validación en bloque del
+    modelo y devuelve las columnas auxiliares (mensaje, tipo, indeterminado).
+    """
+    valores = serie.to_list()
+    nulos = [v is None for v in valores]
+    # NaN depende del motor de origen (Pandas lo descarta): decide Pydantic
+    indeterminados = [isinstance(v, float) and math.isnan(v) for v in valores]
+    revisar = [
+        i for i in range(len(valores)) if not nulos[i] and not indeterminados[i]
+    ]
+
+    mensajes: List[Optional[str]] = [None] * len(valores)
+    tipos: List[Optional[str]] = [None] * len(valores)
+    resultados = regla.validador_lote([valores[i] for i in revisar])
+    for i, mensaje in zip(revisar, resultados):
+        if mensaje:
+            mensajes[i], tipos[i] = f"Value error, {mensaje}", "value_error"
+    if regla.requerido:
+        for i in (i for i, nulo in enumerate(nulos) if nulo):
+            mensajes[i], tipos[i] = MENSAJE_REQUERIDO, "missing"
+
+    return pl.DataFrame([
+        pl.Series(regla.auxiliary("msg"), mensajes, dtype=pl.Utf8),
+        pl.Series(regla.auxiliary("tipo"), tipos, dtype=pl.Utf8),
+        pl.Series(regla.auxiliary("indeterminado"), indeterminados, dtype=pl.Boolean),
+    ])
+
+
+def prepare_frame(plan: ValidationPlan, df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Agrega las columnas auxiliares de los campos con ``field_validator``:
+    cada valor distinto se valida una sola vez y el resultado se une con
+    las filas; la geometría se revisa en bloque. Es idempotente.
+    """
+    columnas = set(df.columns)
+    auxiliares = []
+    for regla in plan.reglas:
+        if regla.tipo not in TIPOS_AUXILIARES or regla.auxiliary("msg") in columnas:
+            continue
+        columna = regla.resolve_column(columnas)
+        if columna is None:
+            continue
+        if regla.tipo == "geometria":
+            auxiliares.append(_geometry_outcomes(regla, df.get_column(columna)))
+            continue
+        if df.schema[columna] == pl.Object:
+            auxiliares.append(pl.DataFrame([
+                pl.Series(regla.auxiliary("msg"), [None] * df.height, dtype=pl.Utf8),
+                pl.Series(regla.auxiliary("tipo"), [None] * df.height, dtype=pl.Utf8),
+                pl.Series(regla.auxiliary("valor"), [None] * df.height),
+                pl.Series(regla.auxiliary("indeterminado"), [True] * df.height),
+            ]))
+            continue
+        resultados = _unique_outcomes(regla, columna, df.get_column(columna))
+        unido = df.select(columna).join(
+            resultados, on=columna, how="left", nulls_equal=True, maintain_order="left"
+        )
+        auxiliares.append(unido.drop(columna).with_columns(
+            pl.col(regla.auxiliary("indeterminado")).fill_null(True)
+        ))
+    return pl.concat([df, *auxiliares], how="horizontal") if auxiliares else df
+
+
+def evaluate_plan(
+    plan: ValidationPlan, df: pl.DataFrame
+) -> Tuple[pl.DataFrame, List[str]]:
+    """
+    Evalúa el plan sobre un DataFrame de Polars en una sola pasada.
+
+    Returns:
+        Tuple con la máscara de errores (columnas ``msg_i``/``tipo_i`` por
+        campo compilado más ``__indeterminado__``) y la ubicación (loc) que
+        corresponde a cada campo compilado.
+    """
+    df = prepare_frame(plan, df)
+    columnas = set(df.columns)
+    esquema = df.schema
+    expresiones, locs = [], []
+    indeterminados = []
+
+    for i, regla in enumerate(plan.reglas):
+        columna = regla.resolve_column(columnas)
+        if columna is not None and regla.tipo in TIPOS_AUXILIARES:
+            locs.append(columna)
+            expresiones += [
+                pl.col(regla.auxiliary("msg")).alias(f"msg_{i}"),
+                pl.col(regla.auxiliary("tipo")).alias(f"tipo_{i}"),
+            ]
+            indeterminados.append(pl.col(regla.auxiliary("indeterminado")))
+            continue
+        if columna is None:
+            locs.append(regla.loc)
+            if regla.requerido:
+                mensaje, tipo = pl.lit(MENSAJE_REQUERIDO), pl.lit("missing")
+            else:
+                mensaje, tipo = pl.lit(None, pl.Utf8), pl.lit(None, pl.Utf8)
+            expresiones += [mensaje.alias(f"msg_{i}"), tipo.alias(f"tipo_{i}")]
+            continue
+
+        locs.append(columna)
+        chequeos, indeterminado, _ = _field_expressions(
+            regla, columna, esquema[columna]
+        )
+        if regla.requerido:
+            requerido = (pl.col(columna).is_null(), "missing", MENSAJE_REQUERIDO)
+            chequeos = [requerido] + chequeos
+
+        mensaje = pl.lit(None, pl.Utf8)
+        tipo = pl.lit(None, pl.Utf8)
+        for condicion, codigo, texto in reversed(chequeos):
+            condicion = condicion.fill_null(False)
+            mensaje = pl.when(condicion).then(pl.lit(texto)).otherwise(mensaje)
+            tipo = pl.when(condicion).then(pl.lit(codigo)).otherwise(tipo)
+        expresiones += [mensaje.alias(f"msg_{i}"), tipo.alias(f"tipo_{i}")]
+        indeterminados.append(indeterminado.fill_null(False))
+
+    if indeterminados:
+        indeterminado_total = pl.any_horizontal(indeterminados)
+    else:
+        indeterminado_total = pl.lit(False)
+    expresiones.append(indeterminado_total.alias(COLUMNA_INDETERMINADO))
+    # with_columns difunde los literales al alto del DataFrame (select no); un
+    # marco sin columnas no tiene alto en Polars 1.x y daría una fila de más
+    nombres = [e.meta.output_name() for e in expresiones]
+    return df.with_columns(expresiones).select(nombres).head(df.height), locs
+
+
+def dump_frame(
+    plan: ValidationPlan, df: pl.DataFrame, volcado: bool = False
+) -> pl.DataFrame:
+    """
+    Construye el equivalente columnar de ``model_dump()``: una columna por
+    campo del modelo, con el valor convertido o el valor por defecto. Con
+    ``volcado`` se omiten los campos con ``exclude=True``, como en el volcado
+    real; sin él se conservan todos (para armar instancias).
+    """
+    df = prepare_frame(plan, df)
+    columnas = set(df.columns)
+    esquema = df.schema
+    expresiones = []
+    for regla in plan.reglas:
+        columna = regla.resolve_column(columnas)
+        if columna is None:
+            expresiones.append(pl.lit(regla.por_defecto).alias(regla.nombre))
+            continue
+        _, _, valor = _field_expressions(regla, columna, esquema[columna])
+        expresiones.append(valor.alias(regla.nombre))
+    orden = [
+        n for n, info in plan.modelo.model_fields.items()
+        if n in {r.nombre for r in plan.reglas} and not (volcado and info.exclude)
+    ]
+    return df.with_columns(expresiones).select(orden)
+
+
+# ==========================================
+# 4. VALIDACIÓN COMPLETA (CONTRATO validos, errores)
+# ==========================================
+
+def column_names(df: Any) -> List[str]:
+    """Nombres de columna de cualquier DataFrame (sin ejecutar un LazyFrame)."""
+    if isinstance(df, pl.LazyFrame):
+        return df.collect_schema().names()
+    return list(df.columns)
+
+
+def frame_height(df: Any) -> int:
+    """Número de filas; en un LazyFrame es una consulta de conteo (``pl.len``)."""
+    if isinstance(df, pl.LazyFrame):
+        return df.select(pl.len()).collect().item()
+    return len(df)
+
+
+def model_columns(
+    plan: ValidationPlan, columnas: List[str], identificadores: bool = True
+) -> List[str]:
+    """
+    Columnas de ``columnas`` que lee el modelo (campos y alias, más las
+    identificadoras si se piden), en su orden. Si el plan no es compilable o
+    algún alias no es un texto se devuelven todas.
+    """
+    from geoanla.core.base import COLUMNAS_IDENTIFICADOR
+
+    if not plan.compilable:
+        # extra='forbid' u otras configuraciones que miran todas las columnas
+        return list(columnas)
+    usadas = set(COLUMNAS_IDENTIFICADOR) if identificadores else set()
+    for nombre, info in plan.modelo.model_fields.items():
+        alias = info.validation_alias
+        if alias is not None and not isinstance(alias, str):
+            return list(columnas)
+        usadas.update(c for c in (nombre, alias) if c)
+    return [c for c in columnas if c in usadas]
+
+
+def project_frame(plan: ValidationPlan, lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Reduce un LazyFrame a las columnas que lee el modelo (campos, alias e
+    identificadores) para que el escaneo lea solo esas columnas.
+    """
+    columnas = lf.collect_schema().names()
+    usadas = model_columns(plan, columnas)
+    return lf if len(usadas) == len(columnas) else lf.select(usadas)
+
+
+def iter_chunks(df: Any, tamano_lote: int) -> Iterator[Tuple[int, Any]]:
+    """
+    Recorre ``df`` en trozos contiguos de ``tamano_lote`` filas. Un LazyFrame
+    se ejecuta con el motor de streaming y solo un lote vive en memoria.
+
+    Yields:
+        Tuple (inicio, trozo) con la posición global de la primera fila.
+    """
+    if isinstance(df, pl.LazyFrame):
+        inicio = 0
+        for trozo in df.collect_batches(chunk_size=tamano_lote, engine="streaming"):
+            yield inicio, trozo
+            inicio += trozo.height
+        return
+    for inicio in range(0, len(df), tamano_lote):
+        if isinstance(df, pl.DataFrame):
+            yield inicio, df.slice(inicio, tamano_lote)
+        else:
+            yield inicio, df.iloc[inicio:inicio + tamano_lote]
+
+
+def _to_polars(df: Any) -> pl.DataFrame:
+    """
+    Convierte la entrada a Polars. La geometría de GeoPandas viaja como
+    columna ``Object`` porque Arrow no sabe representar objetos shapely; la
+    geometría WKB de una capa de Polars (``core.frames``) se decodifica en bloque.
+    """
+    if isinstance(df, pl.DataFrame):
+        return decode_geometry(df)
+    nombre_geom = getattr(df, "_geometry_column_name", None)
+    if nombre_geom not in df.columns:
+        return pl.from_pandas(df, nan_to_null=False)
+    df_pl = pl.from_pandas(df.drop(columns=[nombre_geom]), nan_to_null=False)
+    geometrias = pl.Series(nombre_geom, list(df[nombre_geom]), dtype=pl.Object)
+    return df_pl.with_columns(geometrias)
+
+
+def _error_records(
+    plan: ValidationPlan,
+    df_pl: pl.DataFrame,
+    mascara: pl.DataFrame,
+    locs: List[str],
+    indices: List[int],
+    offset: int,
+    inicio: int = 0,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Arma los diccionarios de error (contrato legado) desde la máscara."""
+    if not indices:
+        return []
+    ids = _row_identifiers(df_pl, indices, inicio)
+    mensajes = mascara.select(f"msg_{i}" for i in range(len(locs)))
+    mensajes = mensajes.gather(indices).rows()
+
+    registros = []
+    for indice, identificador, fila_msg in zip(indices, ids, mensajes):
+        posicion = indice + inicio
+        error_info = {"Fila": posicion + offset, "ID": identificador}
+        for loc, mensaje in zip(locs, fila_msg):
+            if mensaje is not None:
+                error_info[loc] = mensaje
+        registros.append((indice, error_info))
+    return registros
+
+
+def _row_identifiers(
+    df_pl: pl.DataFrame, indices: List[int], inicio: int = 0
+) -> List[str]:
+    """Identificadores legibles (``build_row_identifier``) de las filas indicadas."""
+    from geoanla.core.base import COLUMNAS_IDENTIFICADOR, build_row_identifier
+
+    columnas_id = [c for c in COLUMNAS_IDENTIFICADOR if c in df_pl.columns]
+    if columnas_id:
+        ids = df_pl.select(columnas_id).gather(indices).to_dicts()
+    else:
+        ids = [{}] * len(indices)
+    return [
+        build_row_identifier(fila_id, indice + inicio)
+        for indice, fila_id in zip(indices, ids)
+    ]
+
+
+def identifier_expr(esquema: Dict[str, pl.DataType], posicion: pl.Expr) -> pl.Expr:
+    """
+    Versión vectorizada de ``build_row_identifier``: une con espacios los
+    valores "verdaderos" de las columnas identificadoras o, si no hay
+    ninguno, devuelve ``Registro {posicion}``.
+    """
+    from geoanla.core.base import COLUMNAS_IDENTIFICADOR
+
+    piezas = []
+    for columna in COLUMNAS_IDENTIFICADOR:
+        if columna not in esquema:
+            continue
+        col = pl.col(columna)
+        dtype = esquema[columna]
+        if dtype == pl.Utf8:
+            verdadero = col != ""
+        elif dtype in TIPOS_ENTEROS or dtype in TIPOS_FLOTANTES:
+            verdadero = col != 0
+        elif dtype == pl.Boolean:
+            verdadero = col
+        else:
+            verdadero = col.is_not_null()
+        piezas.append(pl.when(verdadero.fill_null(False)).then(col.cast(pl.Utf8)))
+
+    respaldo = pl.lit("Registro ") + posicion.cast(pl.Utf8)
+    if not piezas:
+        return respaldo
+    unido = pl.concat_str(piezas, separator=" ", ignore_nulls=True)
+    return pl.when(unido.fill_null("") == "").then(respaldo).otherwise(unido)
+
+
+def _fill_error_table(
+    tabla_errores: ErrorTable,
+    df_pl: pl.DataFrame,
+    mascara: pl.DataFrame,
+    locs: List[str],
+    indices: List[int],
+    offset: int,
+    inicio: int = 0,
+):
+    """Vuelca los errores de la máscara a la tabla larga sin pasar por Python."""
+    if not indices:
+        return
+    posicion = pl.col("__pos__") + inicio
+    base = pl.concat(
+        [
+            df_pl.with_row_index("__pos__").select(
+                (posicion + offset).alias("row"),
+                identifier_expr(df_pl.schema, posicion).alias("id"),
+            ),
+            mascara,
+        ],
+        how="horizontal",
+    ).gather(indices)
+
+    largo = pl.concat(
+        [
+            base.select(
+                "row", "id",
+                pl.lit(loc).alias("field"),
+                pl.col(f"tipo_{i}").alias("error_code"),
+                pl.col(f"msg_{i}").alias("message"),
+                _error_value(df_pl, loc, indices).alias("value"),
+            ).filter(pl.col("message").is_not_null())
+            for i, loc in enumerate(locs)
+        ],
+        how="vertical",
+    )
+    tabla_errores.append_frame(largo)
+
+
+def _error_value(df_pl: pl.DataFrame, loc: str, indices: List[int]) -> pl.Expr:
+    """
+    Entrada de la columna ``loc`` como texto, para separar la plantilla del
+    mensaje en la tabla de errores (nula si la columna no es escalar).
+    """
+    dtype = df_pl.schema.get(loc)
+    if dtype is None or not (dtype.is_numeric() or dtype in (pl.Utf8, pl.Categorical)):
+        return pl.lit(None, pl.Utf8)
+    return pl.lit(df_pl.get_column(loc).gather(indices).cast(pl.Utf8))
+
+
+def _valid_records(
+    plan: ValidationPlan, df_pl: pl.DataFrame, indices: List[int], volcado: bool = True
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Arma los ``model_dump()`` de las filas válidas sin instanciar el modelo.
+    Con ``volcado=False`` conserva los campos excluidos del volcado.
+    """
+    if not indices:
+        return []
+    dump = dump_frame(plan, df_pl.gather(indices), volcado).to_dicts()
+
+    if not plan.usar_valores_enum:
+        for regla in plan.reglas:
+            if regla.clase_enum is not None:
+                miembros = get_enum_index(regla.clase_enum).por_valor
+                for fila in dump:
+                    if fila[regla.nombre] is not None:
+                        fila[regla.nombre] = miembros[fila[regla.nombre]]
+    return list(zip(indices, dump))
+
+
+def records_frame(
+    registros: List[Dict[str, Any]], posiciones: List[int]
+) -> pl.DataFrame:
+    """
+    Convierte ``model_dump()`` de Pydantic en tabla Polars con su posición
+    global. Los miembros Enum se reemplazan por su valor.
+    """
+    if not registros:
+        return pl.DataFrame({COLUMNA_FILA: []}, schema={COLUMNA_FILA: pl.Int64})
+    filas = [
+        {k: (v.value if isinstance(v, Enum) else v) for k, v in registro.items()}
+        for registro in registros
+    ]
+    tabla = _drop_objects(pl.from_dicts(filas, infer_schema_length=None))
+    filas_globales = pl.Series(COLUMNA_FILA, posiciones, dtype=pl.Int64)
+    if not tabla.width:
+        return filas_globales.to_frame()
+    return tabla.with_columns(filas_globales)
+
+
+def _drop_objects(tabla: pl.DataFrame) -> pl.DataFrame:
+    """
+    Quita las columnas ``Object`` (geometría): no se pueden serializar entre
+    procesos y ``format_valid_rows`` las toma del DataFrame original.
+    """
+    return tabla.select(c for c, t in tabla.schema.items() if t != pl.Object)
+
+
+def _valid_frame(
+    plan: ValidationPlan, df_pl: pl.DataFrame, indices: List[int], inicio: int = 0
+) -> pl.DataFrame:
+    """Equivalente de ``_valid_records`` en formato tabla, sin objetos por fila."""
+    if not indices:
+        return pl.DataFrame({COLUMNA_FILA: []}, schema={COLUMNA_FILA: pl.Int64})
+    filas = pl.Series(COLUMNA_FILA, [i + inicio for i in indices], dtype=pl.Int64)
+    volcado = _drop_objects(dump_frame(plan, df_pl.gather(indices), volcado=True))
+    return volcado.with_columns(filas) if volcado.width else filas.to_frame()
+
+
+def concat_valid_frames(tablas: List[pl.DataFrame]) -> pl.DataFrame:
+    """Une tablas de válidos (de trozos o motores distintos) en orden de fila."""
+    tablas = [t for t in tablas if t.height]
+    if not tablas:
+        return pl.DataFrame({COLUMNA_FILA: []}, schema={COLUMNA_FILA: pl.Int64})
+    tabla = pl.concat(tablas, how="diagonal_relaxed")
+    return tabla.sort(COLUMNA_FILA, maintain_order=True)
+
+
+def format_valid_rows(
+    modelo: Type, df: Any, validos: Any, formato_validos: str
+) -> Any:
+    """
+    Entrega las filas válidas en el formato pedido a ``validate_data``.
+
+    Args:
+        modelo: Clase BaseEV validada.
+        df: DataFrame original completo.
+        validos: Resultado interno (diccionarios, posiciones o tabla).
+        formato_validos: "dicts", "mascara" (arreglo booleano sobre ``df``),
+            "indices" (posiciones de ``df``), "polars" (tabla tipada con los
+            valores del modelo) o "geodataframe" (igual, con la geometría
+            original).
+    """
+    if formato_validos == "dicts":
+        return validos
+    if formato_validos == "indices":
+        return np.asarray(validos, dtype=np.int64)
+    if formato_validos == "mascara":
+        mascara = np.zeros(frame_height(df), dtype=bool)
+        mascara[np.asarray(validos, dtype=np.int64)] = True
+        return mascara
+
+    # Los campos que no viajan en la tabla (geometría) se toman del original
+    posiciones = validos.get_column(COLUMNA_FILA).to_numpy()
+    faltantes = {}
+    columnas = set(column_names(df))
+    for nombre, info in modelo.model_fields.items():
+        alias = info.validation_alias
+        columna = alias if isinstance(alias, str) else nombre
+        if nombre not in validos.columns and columna in columnas:
+            faltantes[nombre] = columna
+
+    if formato_validos == "polars":
+        # La geometría WKB se entrega tal cual; los objetos shapely como ``Object``
+        extra = [
+            pl.Series(
+                nombre,
+                _take(df, columna, posiciones),
+                dtype=_source_dtype(df, columna),
+            )
+            for nombre, columna in faltantes.items()
+        ]
+        tabla = validos.drop(COLUMNA_FILA).with_columns(extra)
+        return tabla.select(c for c in modelo.model_fields if c in tabla.columns)
+
+    import geopandas as gpd
+
+    nombre_geom = faltantes.get("geometry")
+    if nombre_geom is None:
+        raise ValueError(
+            f"❌ {modelo.__name__}: 'geodataframe' requiere datos con geometría."
+        )
+    atributos = validos.drop(COLUMNA_FILA).to_pandas()
+    return gpd.GeoDataFrame(
+        atributos,
+        geometry=geometry_values(_take(df, nombre_geom, posiciones)),
+        crs=getattr(df, "crs", None),
+    )
+
+
+def _source_dtype(df: Any, columna: str) -> pl.DataType:
+    """Tipo con el que una columna sin volcado pasa a la tabla de válidos."""
+    es_polars = isinstance(df, (pl.DataFrame, pl.LazyFrame))
+    if es_polars and df.collect_schema()[columna] == pl.Binary:
+        return pl.Binary
+    return pl.Object
+
+
+def _take(df: Any, columna: str, posiciones: np.ndarray) -> list:
+    """Extrae los valores de una columna en las posiciones dadas (Polars o Pandas)."""
+    if isinstance(df, pl.LazyFrame):
+        valores = df.select(pl.col(columna).gather(posiciones)).collect()
+        return valores.to_series().to_list()
+    if isinstance(df, pl.DataFrame):
+        return df.get_column(columna).gather(posiciones).to_list()
+    return list(df[columna].iloc[posiciones])
+
+
+def _model_error(excepcion: Exception) -> Optional[Tuple[str, str]]:
+    """Tipo y mensaje con que Pydantic reporta la excepción de un validador."""
+    if isinstance(excepcion, ValidationError):
+        return None
+    if isinstance(excepcion, PydanticCustomError):
+        return excepcion.type, excepcion.message()
+    if isinstance(excepcion, ValueError):
+        return "value_error", f"Value error, {excepcion}"
+    if isinstance(excepcion, AssertionError):
+        return "assertion_error", f"Assertion failed, {excepcion}"
+    return None
+
+
+def _constructor(modelo: Type) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Devuelve una función que instancia el modelo con valores ya validados
+    (todos sus campos) sin pasar por el validador. Equivale a
+    ``model_construct`` sin su costo por fila.
+    """
+    inmutables = (type(None), str, int, float, bool, tuple, frozenset)
+    privados = {n: a.get_default() for n, a in modelo.__private_attributes__.items()}
+    if not all(isinstance(v, inmutables) for v in privados.values()):
+        return lambda valores: modelo.model_construct(**valores)
+
+    total_campos = len(modelo.model_fields)
+    asignar = object.__setattr__
+
+    def construir(valores: Dict[str, Any]) -> Any:
+        if len(valores) != total_campos:
+            return modelo.model_construct(**valores)
+        instancia = modelo.__new__(modelo)
+        asignar(instancia, "__dict__", dict(valores))
+        asignar(instancia, "__pydantic_fields_set__", set(valores))
+        asignar(instancia, "__pydantic_extra__", None)
+        asignar(
+            instancia, "__pydantic_private__", dict(privados) if privados else None
+        )
+        return instancia
+
+    return construir
+
+
+def _model_validator_rows(
+    plan: ValidationPlan,
+    df_pl: pl.DataFrame,
+    indices: List[int],
+    offset: int,
+    inicio: int = 0,
+    tabla_errores: Optional[ErrorTable] = None,
+) -> Tuple[List[int], List[Tuple[int, Dict[str, Any]]], List[int]]:
+    """
+    Ejecuta solo los validadores de modelo sobre filas cuyos campos ya fueron
+    validados, en el orden de Pydantic (el primero que falla gana). Los que
+    tienen gemelo vectorizado se evalúan sobre toda la tabla de valores; el
+    resto, sobre instancias armadas sin repetir la validación de cada campo.
+
+    Returns:
+        Tuple (aprobados, errores, pendientes). ``pendientes`` son filas cuyo
+        validador lanzó una excepción que no se sabe traducir; van a Pydantic.
+    """
+    aprobados, errores, pendientes = [], [], []
+    if not indices:
+        return aprobados, errores, pendientes
+
+    valores = dump_frame(plan, df_pl.gather(indices))
+    mensajes = {
+        nombre: [
+            None if m is None else f"Value error, {m}"
+            for m in funcion(valores).to_list()
+        ]
+        for nombre, funcion in plan.validadores_columnares.items()
+    }
+    por_fila = [n for n in plan.validadores_instancia if n not in mensajes]
+
+    rechazos = []
+    if not por_fila:
+        for k, indice in enumerate(indices):
+            mensaje = next(
+                (mensajes[n][k] for n in plan.validadores_instancia if mensajes[n][k]),
+                None,
+            )
+            if mensaje is None:
+                aprobados.append(indice)
+            else:
+                rechazos.append((indice, ("value_error", mensaje)))
+    else:
+        construir = _constructor(plan.modelo)
+        registros = _valid_records(plan, df_pl, indices, volcado=False)
+        for k, (indice, volcado) in enumerate(registros):
+            instancia = construir(volcado)
+            try:
+                error = None
+                for nombre, validador in plan.validadores_instancia.items():
+                    if nombre in mensajes:
+                        if mensajes[nombre][k]:
+                            error = ("value_error", mensajes[nombre][k])
+                            break
+                    else:
+                        validador(instancia)
+            except Exception as e:
+                error = _model_error(e)
+                if error is None:
+                    pendientes.append(indice)
+                    continue
+            if error is None:
+                aprobados.append(indice)
+            else:
+                rechazos.append((indice, error))
+
+    identificadores = _row_identifiers(df_pl, [i for i, _ in rechazos], inicio)
+    for (indice, (codigo, mensaje)), identificador in zip(rechazos, identificadores):
+        fila = indice + inicio + offset
+        if tabla_errores is not None:
+            tabla_errores.add(fila, identificador, "Registro/Modelo", codigo, mensaje)
+        else:
+            errores.append((
+                indice,
+                {"Fila": fila, "ID": identificador, "Registro/Modelo": mensaje},
+            ))
+    return aprobados, errores, pendientes
+
+
+def classify_rows(
+    plan: ValidationPlan, mascara: pl.DataFrame, locs: List[str]
+) -> Dict[str, List[int]]:
+    """
+    Reparte las filas según el resultado de la máscara: ``error`` (rechazo
+    columnar), ``validos`` (aprobadas sin Pydantic), ``modelo`` (aprobadas
+    que solo esperan los validadores de modelo) y ``pydantic``
+    (indeterminadas o pendientes de validadores no compilables).
+    """
+    columnas_msg = [pl.col(f"msg_{i}").is_not_null() for i in range(len(locs))]
+    con_error = pl.any_horizontal(columnas_msg) if columnas_msg else pl.lit(False)
+    indeterminado = pl.col(COLUMNA_INDETERMINADO)
+    # Pydantic también reporta los errores de los campos no compilables: con
+    # ellos, las filas rechazadas necesitan la validación completa
+    error = "pydantic" if plan.campos_no_compilables else "error"
+    if plan.requires_pydantic:
+        aprobada = "pydantic"
+    elif plan.requires_model_validation:
+        aprobada = "modelo"
+    else:
+        aprobada = "validos"
+    destino = (
+        pl.when(indeterminado).then(pl.lit("pydantic"))
+        .when(con_error).then(pl.lit(error))
+        .otherwise(pl.lit(aprobada))
+    )
+    clasificacion = mascara.select(
+        pl.int_range(pl.len()).alias("pos"), destino.alias("destino")
+    )
+    return {
+        clave: clasificacion.filter(pl.col("destino") == clave)
+        .get_column("pos")
+        .to_list()
+        for clave in ("error", "validos", "modelo", "pydantic")
+    }
+
+
+def validate_frame(
+    modelo: Type,
+    df: Any,
+    offset: int = 0,
+    inicio: int = 0,
+    tabla_errores: Optional[ErrorTable] = None,
+    formato_validos: str = "dicts",
+) -> Tuple[Any, List[Dict]]:
+    """
+    Valida un DataFrame con el motor columnar respetando el contrato
+    ``(validos, errores)`` de ``BaseEV.validate_data``.
+
+    Args:
+        modelo: Clase BaseEV contra la que se valida.
+        df: DataFrame de Polars, Pandas o GeoPandas, o ``pl.LazyFrame``
+            (se valida por lotes en streaming, ver ``validate_lazy``).
+        offset: Desplazamiento que se suma al número de fila reportado.
+        inicio: Posición global de la primera fila si ``df`` es un trozo.
+        tabla_errores: Si se pasa, los errores se acumulan allí y la lista
+            de errores devuelta queda vacía.
+        formato_validos: Uno de ``FORMATOS_VALIDOS``. Fuera de "dicts" los
+            válidos salen como posiciones globales o como tabla Polars (con
+            ``COLUMNA_FILA``) y ``format_valid_rows`` les da la forma final.
+
+    Returns:
+        Tuple (validos, errores) en el orden original de las filas.
+    """
+    if isinstance(df, pl.LazyFrame):
+        return validate_lazy(
+            modelo, df, offset, tabla_errores, formato_validos, columnar=True
+        )
+
+    modo = FORMATOS_VALIDOS[formato_validos]
+    plan = compile_plan(modelo)
+    try:
+        df_pl = _to_polars(df) if plan.compilable else None
+    except Exception:
+        # Columnas con objetos mixtos que Arrow no sabe convertir
+        df_pl = None
+    if df_pl is None:
+        return validate_rows_as(modelo, df, offset, inicio, tabla_errores, modo)
+
+    with measure(modelo, "columnar.plan"):
+        df_pl = prepare_frame(plan, df_pl)
+        mascara, locs = evaluate_plan(plan, df_pl)
+        grupos = classify_rows(plan, mascara, locs)
+
+    if tabla_errores is not None:
+        _fill_error_table(
+            tabla_errores, df_pl, mascara, locs, grupos["error"], offset, inicio
+        )
+        errores = []
+    else:
+        errores = _error_records(
+            plan, df_pl, mascara, locs, grupos["error"], offset, inicio
+        )
+
+    with measure(modelo, "columnar.validadores_modelo"):
+        aprobados, errores_modelo, pendientes = _model_validator_rows(
+            plan, df_pl, grupos["modelo"], offset, inicio, tabla_errores
+        )
+    errores = list(heapq.merge(errores, errores_modelo, key=lambda par: par[0]))
+    idx_pydantic = sorted(grupos["pydantic"] + pendientes)
+    idx_validos = sorted(grupos["validos"] + aprobados)
+
+    validos_py, errores_py = [], []
+    if idx_pydantic:
+        with measure(modelo, "columnar.pydantic"):
+            validos_py, errores_py = modelo._validate_rows(
+                df, offset, indices=idx_pydantic, con_indice=True, inicio=inicio,
+                tabla_errores=tabla_errores, volcar=modo != "posiciones"
+            )
+        errores = list(heapq.merge(errores, errores_py, key=lambda par: par[0]))
+    errores = [e for _, e in errores]
+
+    if modo == "tabla":
+        with measure(modelo, "columnar.volcado"):
+            tabla_py = records_frame(
+                [v for _, v in validos_py], [i + inicio for i, _ in validos_py]
+            )
+            tabla_columnar = _valid_frame(plan, df_pl, idx_validos, inicio)
+            validos = concat_valid_frames([tabla_columnar, tabla_py])
+        return validos, errores
+    if modo == "posiciones":
+        validos = [(i, i + inicio) for i in idx_validos]
+    else:
+        with measure(modelo, "columnar.volcado"):
+            validos = _valid_records(plan, df_pl, idx_validos)
+    validos = list(heapq.merge(validos, validos_py, key=lambda par: par[0]))
+    return [v for _, v in validos], errores
+
+
+def validate_rows_as(
+    modelo: Type,
+    df: Any,
+    offset: int = 0,
+    inicio: int = 0,
+    tabla_errores: Optional[ErrorTable] = None,
+    modo: str = "dicts",
+) -> Tuple[Any, List[Dict]]:
+    """
+    Validación fila a fila con Pydantic entregando los válidos en la
+    representación interna ``modo`` ("dicts", "posiciones" o "tabla").
+    """
+    if isinstance(df, pl.LazyFrame):
+        formato = next(f for f, m in FORMATOS_VALIDOS.items() if m == modo)
+        return validate_lazy(
+            modelo, df, offset, tabla_errores, formato, columnar=False
+        )
+
+    validos, errores = modelo._validate_rows(
+        df, offset, con_indice=modo == "tabla", inicio=inicio,
+        tabla_errores=tabla_errores, volcar=modo != "posiciones"
+    )
+    if modo == "tabla":
+        validos = records_frame(
+            [v for _, v in validos], [i + inicio for i, _ in validos]
+        )
+        errores = [e for _, e in errores]
+    return validos, errores
+
+
+def validate_lazy(
+    modelo: Type,
+    lf: pl.LazyFrame,
+    offset: int = 0,
+    tabla_errores: Optional[ErrorTable] = None,
+    formato_validos: str = "dicts",
+    columnar: bool = True,
+    tamano_lote: int = TAMANO_LOTE_DIFERIDO,
+) -> Tuple[Any, List[Dict]]:
+    """
+    Valida un ``pl.LazyFrame`` sin materializarlo completo: el plan se
+    proyecta a las columnas del modelo y se ejecuta en streaming; cada lote
+    se valida con el motor elegido y los resultados se unen en orden.
+    """
+    modo = FORMATOS_VALIDOS[formato_validos]
+    validos, errores = [], []
+    proyectado = project_frame(compile_plan(modelo), lf)
+    for inicio, trozo in iter_chunks(proyectado, tamano_lote):
+        if columnar:
+            validos_trozo, errores_trozo = validate_frame(
+                modelo, trozo, offset, inicio, tabla_errores, formato_validos
+            )
+        else:
+            validos_trozo, errores_trozo = validate_rows_as(
+                modelo, trozo, offset, inicio, tabla_errores, modo
+            )
+        if modo == "tabla":
+            validos.append(validos_trozo)
+        else:
+            validos.extend(validos_trozo)
+        errores.extend(errores_trozo)
+    if modo == "tabla":
+        validos = concat_valid_frames(validos)
+    return validos, errores
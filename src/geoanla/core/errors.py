@@ -0,0 +1,266 @@
+"""
+Tabla columnar de errores de validación.
+
+En lugar de un diccionario por fila con una llave dinámica por campo, los
+errores se guardan en formato largo (una fila por error) con las columnas
+``row``, ``id``, ``field``, ``error_code``, ``message_id`` y ``value``. Los
+textos de los mensajes se internan como plantillas: el valor de la fila que
+aparece en el mensaje (p. ej. "El código 999 no es válido") se reemplaza por
+``MARCA_VALOR`` y se guarda aparte en ``value``, de modo que cada plantilla
+distinta se guarda una sola vez y las filas solo referencian su identificador.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import polars as pl
+
+# Filas acumuladas en listas de Python antes de volcarlas a un bloque Polars
+TAMANO_BUFFER = 100_000
+
+ESQUEMA_ERRORES = {
+    "row": pl.Int64,
+    "id": pl.Utf8,
+    "field": pl.Categorical,
+    "error_code": pl.Categorical,
+    "message_id": pl.UInt32,
+    "value": pl.Utf8,
+}
+
+# Lugar que ocupa el valor de la fila dentro de una plantilla de mensaje
+MARCA_VALOR = "{valor}"
+
+# Prefijo con que Pydantic reporta los ``ValueError`` de los validadores del
+# modelo: solo esos mensajes llevan el valor de la fila (``f"... {v} ..."``)
+PREFIJO_VALIDADOR = "Value error, "
+
+
+def split_message(mensaje: str, valor: Any) -> Tuple[str, Optional[str]]:
+    """
+    Separa un mensaje en plantilla y valor. Solo en los mensajes de los
+    validadores propios (``PREFIJO_VALIDADOR``) el valor, como texto, se
+    reemplaza por ``MARCA_VALOR`` si aparece una sola vez como palabra
+    completa (sin letras, dígitos ni decimales pegados). En otro caso, también
+    si es ambiguo, la plantilla es el mensaje completo.
+    """
+    if not isinstance(valor, (str, int, float)) or MARCA_VALOR in mensaje:
+        return mensaje, None
+    texto = str(valor)
+    if not texto.strip() or not mensaje.startswith(PREFIJO_VALIDADOR):
+        return mensaje, None
+    patron = rf"(?<![\w.]){re.escape(texto)}(?!\w|\.\w)"
+    plantilla, reemplazos = re.subn(patron, lambda _: MARCA_VALOR, mensaje)
+    if reemplazos != 1:
+        return mensaje, None
+    return plantilla, texto
+
+
+def render_message(plantilla: str, valor: Optional[str]) -> str:
+    """Inverso de ``split_message``."""
+    return plantilla if valor is None else plantilla.replace(MARCA_VALOR, valor)
+
+
+class ErrorTable:
+    """
+    Acumulador compacto de errores en formato largo.
+
+    Se llena fila a fila con ``add`` (motor Pydantic) o por bloques con
+    ``append_frame`` (motor columnar) y se consulta como DataFrame de Polars.
+    """
+
+    def __init__(self):
+        self._mensajes: Dict[str, int] = {}
+        self._bloques: List[pl.DataFrame] = []
+        self._filas: List[int] = []
+        self._ids: List[str] = []
+        self._campos: List[str] = []
+        self._codigos: List[str] = []
+        self._mensaje_ids: List[int] = []
+        self._valores: List[Optional[str]] = []
+
+    # --- 1. CONSTRUCCIÓN ---
+
+    def intern(self, mensaje: str) -> int:
+        """Devuelve el id de una plantilla de mensaje, registrándola si es nueva."""
+        mensaje_id = self._mensajes.get(mensaje)
+        if mensaje_id is None:
+            mensaje_id = len(self._mensajes)
+            self._mensajes[mensaje] = mensaje_id
+        return mensaje_id
+
+    def add(
+        self, fila: int, identificador: str, campo: str, codigo: str, mensaje: str,
+        valor: Any = None,
+    ):
+        """Registra un error individual; ``valor`` es la entrada que lo causó."""
+        plantilla, texto = split_message(mensaje, valor)
+        self._filas.append(fila)
+        self._ids.append(identificador)
+        self._campos.append(str(campo))
+        self._codigos.append(codigo)
+        self._mensaje_ids.append(self.intern(plantilla))
+        self._valores.append(texto)
+        if len(self._filas) >= TAMANO_BUFFER:
+            self._flush()
+
+    def append_frame(self, errores: pl.DataFrame):
+        """
+        Agrega un bloque de errores con columnas ``row``, ``id``, ``field``,
+        ``error_code``, ``message`` (texto) y, opcionalmente, ``value`` (la
+        entrada como texto), internando las plantillas de los mensajes.
+        """
+        if errores.height == 0:
+            return
+        if "value" in errores.columns:
+            # Cada par (mensaje, valor) distinto se separa una sola vez
+            errores = errores.with_columns(pl.col("value").cast(pl.Utf8))
+            pares = errores.select("message", "value").unique(maintain_order=True)
+            separados = [split_message(m, v) for m, v in pares.iter_rows()]
+            pares = pares.with_columns(
+                pl.Series("__plantilla__", [p for p, _ in separados], dtype=pl.Utf8),
+                pl.Series("__valor__", [v for _, v in separados], dtype=pl.Utf8),
+            )
+            errores = errores.join(
+                pares, on=["message", "value"], how="left",
+                nulls_equal=True, maintain_order="left",
+            )
+            plantilla, valor = pl.col("__plantilla__"), pl.col("__valor__")
+        else:
+            plantilla, valor = pl.col("message"), pl.lit(None, pl.Utf8)
+        bloque = errores.select(
+            pl.col("row").cast(pl.Int64),
+            pl.col("id").cast(pl.Utf8),
+            pl.col("field").cast(pl.Utf8).cast(pl.Categorical),
+            pl.col("error_code").cast(pl.Utf8).cast(pl.Categorical),
+            plantilla.alias("message_id"),
+            valor.alias("value"),
+        )
+        plantillas = bloque.get_column("message_id").unique(maintain_order=True)
+        mapeo = {m: self.intern(m) for m in plantillas.to_list()}
+        self._bloques.append(bloque.with_columns(
+            pl.col("message_id").replace_strict(mapeo, return_dtype=pl.UInt32)
+        ))
+
+    def extend(self, otra: "ErrorTable"):
+        """Une otra tabla (p. ej. de un trabajador) re-internando sus mensajes."""
+        otra._flush()
+        remapeo = {i: self.intern(m) for m, i in otra._mensajes.items()}
+        self._flush()
+        for bloque in otra._bloques:
+            self._bloques.append(bloque.with_columns(
+                pl.col("message_id").replace_strict(remapeo, return_dtype=pl.UInt32)
+            ))
+
+    def _flush(self):
+        """Vuelca el buffer de Python a un bloque Polars."""
+        if not self._filas:
+            return
+        self._bloques.append(pl.DataFrame(
+            {
+                "row": self._filas,
+                "id": self._ids,
+                "field": self._campos,
+                "error_code": self._codigos,
+                "message_id": self._mensaje_ids,
+                "value": self._valores,
+            },
+            schema=ESQUEMA_ERRORES,
+        ))
+        self._filas, self._ids, self._campos, self._codigos = [], [], [], []
+        self._mensaje_ids, self._valores = [], []
+
+    # --- 2. CONSULTA ---
+
+    def __len__(self) -> int:
+        """Número de errores (no de filas rechazadas)."""
+        return self.to_polars().height
+
+    @property
+    def messages(self) -> pl.DataFrame:
+        """Catálogo de plantillas de mensaje internadas (con ``MARCA_VALOR``)."""
+        return pl.DataFrame(
+            {
+                "message_id": list(self._mensajes.values()),
+                "message": list(self._mensajes.keys()),
+            },
+            schema={"message_id": pl.UInt32, "message": pl.Utf8},
+        )
+
+    def to_polars(self, con_mensajes: bool = False) -> pl.DataFrame:
+        """
+        Devuelve la tabla larga ordenada por fila. Con ``con_mensajes`` se
+        agrega la columna ``message`` con el texto completo de cada error.
+        """
+        self._flush()
+        if self._bloques:
+            tabla = pl.concat(self._bloques, how="vertical")
+            tabla = tabla.sort("row", maintain_order=True)
+            # Se compacta en un solo bloque para no reordenar en cada consulta
+            self._bloques = [tabla]
+        else:
+            tabla = pl.DataFrame(schema=ESQUEMA_ERRORES)
+        if con_mensajes:
+            tabla = tabla.join(
+                self.messages, on="message_id", how="left", maintain_order="left"
+            ).with_columns(
+                pl.when(pl.col("value").is_not_null())
+                .then(pl.col("message").str.replace_all(
+                    MARCA_VALOR, pl.col("value").fill_null(""), literal=True
+                ))
+                .otherwise(pl.col("message"))
+                .alias("message")
+            )
+        return tabla
+
+    def rejected_rows(self) -> int:
+        """Número de filas con al menos un error."""
+        return self.to_polars().get_column("row").n_unique()
+
+    def summary_by_field(self) -> pl.DataFrame:
+        """Conteo de errores y filas afectadas por campo."""
+        return (
+            self.to_polars()
+            .group_by("field")
+            .agg(pl.len().alias("errores"), pl.col("row").n_unique().alias("filas"))
+            .sort("errores", descending=True)
+        )
+
+    def summary_by_code(self) -> pl.DataFrame:
+        """Conteo de errores por tipo de error y campo."""
+        return (
+            self.to_polars()
+            .group_by("error_code", "field")
+            .agg(pl.len().alias("errores"))
+            .sort("errores", descending=True)
+        )
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Reconstruye el formato legado: un diccionario por fila rechazada."""
+        registros: List[Dict[str, Any]] = []
+        mensajes = {i: m for m, i in self._mensajes.items()}
+        actual: Optional[Dict[str, Any]] = None
+        for fila, identificador, campo, mensaje_id, valor in self.to_polars().select(
+            "row", "id", "field", "message_id", "value"
+        ).iter_rows():
+            if actual is None or actual["Fila"] != fila:
+                actual = {"Fila": fila, "ID": identificador}
+                registros.append(actual)
+            actual[campo] = render_message(mensajes[mensaje_id], valor)
+        return registros
+
+    # --- 3. EXPORTACIÓN ---
+
+    def write_parquet(self, ruta: str, con_mensajes: bool = True):
+        """Exporta la tabla a Parquet directamente desde la memoria Arrow."""
+        self.to_polars(con_mensajes=con_mensajes).write_parquet(ruta)
+
+    def write_excel(self, ruta: str, con_mensajes: bool = True):
+        """Exporta la tabla a Excel (requiere ``xlsxwriter``)."""
+        self.to_polars(con_mensajes=con_mensajes).write_excel(ruta)
+
+    @classmethod
+    def concat(cls, tablas: Iterable["ErrorTable"]) -> "ErrorTable":
+        """Une varias tablas en una nueva."""
+        resultado = cls()
+        for tabla in tablas:
+            resultado.extend(tabla)
+        return resultado
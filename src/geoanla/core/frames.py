@@ -0,0 +1,140 @@
+"""
+Conversión de capas entre GeoPandas y Polars.
+
+Una capa de Pandas o GeoPandas se convierte una sola vez, a través de Arrow,
+en atributos de Polars más una columna de geometría en WKB (``pl.Binary``):
+no se pasa por columnas ``object`` ni por el reemplazo NaN -> None. La
+traducción y la validación trabajan sobre ese DataFrame; la geometría se
+decodifica a objetos shapely en bloque solo donde un validador la necesita y
+la capa vuelve a GeoPandas únicamente cuando se pide.
+
+Pandas, pyarrow y shapely se importan dentro de las funciones que los usan:
+importar un modelo no los carga y ``is_pandas_frame`` responde sin importar
+Pandas (si nadie lo importó, ningún objeto puede ser un DataFrame suyo).
+"""
+import sys
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+import polars as pl
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Nombre del campo de geometría de ``BaseEV_Geo``
+COLUMNA_GEOMETRIA = "geometry"
+
+TIPOS_ENTEROS_POLARS = (
+    pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64
+)
+
+
+def is_pandas_frame(df: Any) -> bool:
+    """True si ``df`` es un DataFrame de Pandas o GeoPandas (sin importar Pandas)."""
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(df, pd.DataFrame)
+
+
+def _series_to_polars(serie: "pd.Series") -> pl.Series:
+    """
+    Convierte una columna de Pandas con NaN como nulo. Las columnas ``object``
+    con tipos mezclados (3, "Bosque", 2.0), que Arrow no sabe tipar, llegan
+    como texto.
+    """
+    import pyarrow as pa
+
+    try:
+        return pl.from_pandas(serie, nan_to_null=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        valores = serie.astype(object).where(serie.notna(), None).tolist()
+        return pl.Series(str(serie.name), valores, strict=False)
+
+
+def to_polars_frame(df: "pd.DataFrame") -> pl.DataFrame:
+    """
+    Convierte un DataFrame de Pandas o GeoPandas a Polars a través de Arrow.
+
+    Los NaN de los atributos pasan a nulos y la geometría activa queda como
+    columna ``pl.Binary`` en WKB con su mismo nombre. El índice de Pandas se
+    descarta.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import shapely
+
+    nombre_geom = getattr(df, "_geometry_column_name", None)
+    atributos = df.drop(columns=[nombre_geom]) if nombre_geom in df.columns else df
+    try:
+        tabla = pl.from_pandas(pd.DataFrame(atributos), nan_to_null=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        tabla = pl.DataFrame(
+            [_series_to_polars(atributos[c]) for c in atributos.columns]
+        )
+
+    if nombre_geom not in df.columns:
+        return tabla
+    wkb = shapely.to_wkb(np.asarray(df[nombre_geom].array, dtype=object))
+    return tabla.with_columns(pl.Series(nombre_geom, wkb.tolist(), dtype=pl.Binary))
+
+
+def decode_geometry(
+    df: pl.DataFrame, columna: str = COLUMNA_GEOMETRIA
+) -> pl.DataFrame:
+    """
+    Decodifica en bloque la columna WKB a objetos shapely (``pl.Object``).
+    Un WKB ilegible queda como nulo. Si la columna no es ``pl.Binary`` no
+    hace nada.
+    """
+    if df.schema.get(columna) != pl.Binary:
+        return df
+    import shapely
+
+    wkb = df.get_column(columna).to_numpy()
+    geometrias = shapely.from_wkb(wkb, on_invalid="ignore")
+    return df.with_columns(pl.Series(columna, list(geometrias), dtype=pl.Object))
+
+
+def geometry_values(valores: list) -> np.ndarray:
+    """Geometrías shapely a partir de objetos shapely o de WKB."""
+    arreglo = np.empty(len(valores), dtype=object)
+    arreglo[:] = valores
+    if any(isinstance(v, (bytes, bytearray)) for v in valores):
+        import shapely
+
+        return shapely.from_wkb(arreglo, on_invalid="ignore")
+    return arreglo
+
+
+def to_geodataframe(
+    df: pl.DataFrame,
+    crs: Optional[Any] = None,
+    columna: Optional[str] = COLUMNA_GEOMETRIA,
+    indice: Optional["pd.Index"] = None,
+) -> "pd.DataFrame":
+    """
+    Vuelve a GeoPandas una capa de Polars (geometría en WKB u objetos).
+    Sin columna de geometría devuelve un DataFrame de Pandas. Los enteros con
+    nulos quedan como ``Int64`` de Pandas en lugar de pasar a float.
+
+    Args:
+        df: Capa de Polars.
+        crs: Sistema de referencia de la geometría.
+        columna: Nombre de la columna de geometría (None si la capa no tiene).
+        indice: Índice de Pandas a restaurar (el de la capa original).
+    """
+    import geopandas as gpd
+
+    atributos = df.drop(columna) if columna in df.columns else df
+    salida = atributos.to_pandas()
+    for nombre, dtype in atributos.schema.items():
+        if dtype in TIPOS_ENTEROS_POLARS and atributos.get_column(nombre).null_count():
+            salida[nombre] = salida[nombre].astype("Int64")
+    if indice is not None:
+        salida.index = indice
+
+    if columna not in df.columns:
+        return salida
+    geometrias = geometry_values(df.get_column(columna).to_list())
+    serie = gpd.GeoSeries(geometrias, index=salida.index, crs=crs)
+    salida.insert(df.columns.index(columna), columna, serie)
+    return gpd.GeoDataFrame(salida, geometry=columna, crs=crs)
@@ -0,0 +1,116 @@
+"""
+Validación de geometrías en bloque con las funciones vectorizadas de shapely 2.
+
+Cada modelo geográfico declara una sola vez los tipos de geometría que
+admite (``GEOMETRIAS_PERMITIDAS``), si acepta geometrías vacías
+(``ADMITIR_VACIAS``), si exige validez topológica (``VALIDAR_TOPOLOGIA``) y,
+si lo necesita, sus propios textos (``MENSAJES_GEOMETRIA``). La comprobación
+de tipo, vacío y validez topológica se hace con ``get_type_id``,
+``is_empty``, ``is_valid`` e ``is_valid_reason`` sobre toda la columna; el
+validador por fila de Pydantic llama a la misma función con una sola
+geometría. shapely se importa en la primera revisión, no al importar los
+modelos.
+"""
+from typing import Any, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+# Nombre de ``geom_type`` -> identificador de ``shapely.get_type_id``
+# (``shapely.GeometryType``)
+TIPOS_GEOMETRIA = {
+    "Point": 0,
+    "LineString": 1,
+    "LinearRing": 2,
+    "Polygon": 3,
+    "MultiPoint": 4,
+    "MultiLineString": 5,
+    "MultiPolygon": 6,
+    "GeometryCollection": 7,
+}
+NOMBRES_GEOMETRIA = {int(v): k for k, v in TIPOS_GEOMETRIA.items()}
+
+MENSAJE_NO_GEOMETRIA = "Se requiere geometría {permitidas}, se recibió {recibido}"
+MENSAJE_TIPO_GEOMETRIA = (
+    "Geometría inválida. Se espera {permitidas}, se recibió: {recibido}"
+)
+MENSAJE_GEOMETRIA_VACIA = "La geometría está vacía."
+MENSAJE_TOPOLOGIA = "Geometría no válida: {razon}"
+
+# Claves de ``MENSAJES_GEOMETRIA`` con las que un modelo reemplaza los textos
+# por defecto. "tipo" cubre tanto los valores que no son geometría como los
+# tipos no admitidos y recibe ``permitidas``, ``tipo`` (``geom_type``, o el
+# tipo de Python si no es geometría) y ``clase`` (``type(valor)``).
+CLAVES_MENSAJE = ("tipo", "vacia", "topologia")
+
+
+def geometry_errors(
+    geometrias: Sequence[Any],
+    permitidas: Optional[Sequence[str]],
+    validar_topologia: bool = False,
+    admitir_vacias: bool = False,
+    mensajes: Optional[Mapping[str, str]] = None,
+) -> List[Optional[str]]:
+    """
+    Revisa un bloque de geometrías en el orden tipo -> vacía -> topología.
+
+    Args:
+        geometrias: Objetos shapely (o cualquier otro valor recibido).
+        permitidas: Nombres ``geom_type`` admitidos (None: no se revisa nada).
+        validar_topologia: Exige además ``is_valid`` (informa ``is_valid_reason``).
+        admitir_vacias: Acepta geometrías vacías del tipo admitido.
+        mensajes: Textos propios del modelo (ver ``CLAVES_MENSAJE``).
+
+    Returns:
+        Lista con el mensaje de error de cada geometría (None si es correcta).
+    """
+    errores: List[Optional[str]] = [None] * len(geometrias)
+    if not permitidas or not errores:
+        return errores
+    import shapely
+
+    mensajes = mensajes or {}
+    valores = np.empty(len(geometrias), dtype=object)
+    valores[:] = list(geometrias)
+    es_geometria = shapely.is_geometry(valores)
+    geometrias_ok = np.where(es_geometria, valores, None)
+    tipos = shapely.get_type_id(geometrias_ok)
+
+    descripcion = " o ".join(permitidas)
+    ids_permitidos = [int(TIPOS_GEOMETRIA[t]) for t in permitidas]
+    tipo_invalido = es_geometria & ~np.isin(tipos, ids_permitidos)
+    con_tipo = es_geometria & ~tipo_invalido
+    vacias = con_tipo & shapely.is_empty(geometrias_ok)
+    vacia = np.zeros(len(valores), dtype=bool) if admitir_vacias else vacias
+    invalida = np.zeros(len(valores), dtype=bool)
+    if validar_topologia:
+        invalida = con_tipo & ~vacias & ~shapely.is_valid(geometrias_ok)
+
+    plantilla_tipo = mensajes.get("tipo")
+    for i in np.flatnonzero(~es_geometria):
+        clase = type(valores[i])
+        if plantilla_tipo:
+            errores[i] = plantilla_tipo.format(
+                permitidas=descripcion, tipo=str(clase), clase=clase
+            )
+        else:
+            errores[i] = MENSAJE_NO_GEOMETRIA.format(
+                permitidas=descripcion, recibido=clase
+            )
+    for i in np.flatnonzero(tipo_invalido):
+        nombre = NOMBRES_GEOMETRIA[tipos[i]]
+        if plantilla_tipo:
+            errores[i] = plantilla_tipo.format(
+                permitidas=descripcion, tipo=nombre, clase=type(valores[i])
+            )
+        else:
+            errores[i] = MENSAJE_TIPO_GEOMETRIA.format(
+                permitidas=descripcion, recibido=nombre
+            )
+    for i in np.flatnonzero(vacia):
+        errores[i] = mensajes.get("vacia", MENSAJE_GEOMETRIA_VACIA)
+    posiciones = np.flatnonzero(invalida)
+    plantilla_topologia = mensajes.get("topologia", MENSAJE_TOPOLOGIA)
+    razones = shapely.is_valid_reason(geometrias_ok[posiciones])
+    for i, razon in zip(posiciones, razones):
+        errores[i] = plantilla_topologia.format(razon=razon)
+    return errores
@@ -0,0 +1,385 @@
+"""
+Revalidación incremental con un almacén local de resultados.
+
+Cada fila se resume en una huella de 128 bits (dos ``hash_rows`` de Polars
+con semillas distintas) calculada sobre las columnas que lee el modelo, con
+la geometría en WKB. El almacén (SQLite) guarda, por versión del modelo y
+huella, el resultado de la fila: su ``model_dump()`` si fue válida o la lista
+de errores (campo, código, mensaje) si no. Cuando se vuelve a entregar la
+misma capa con pocos cambios solo se validan las filas nuevas o modificadas;
+las demás reutilizan su resultado y la salida es la misma de una validación
+completa (``Fila`` e ``ID`` se recalculan con la posición actual).
+
+La versión combina el código fuente del modelo, de sus clases base, de sus
+dominios y de los módulos del motor que deciden el resultado de una fila
+(``MODULOS_MOTOR``), las versiones de Polars (el hash de filas no es
+estable entre versiones), Pydantic y pydantic-core, ``VERSION_MOTOR`` y el
+esquema de las columnas: cualquier cambio invalida los resultados
+guardados. El almacén usa ``pickle`` y solo debe abrirse con
+archivos generados por esta misma librería.
+
+Ejemplo::
+
+    with CoberturaTierra.session(capa, almacen="resultados.sqlite") as sesion:
+        validos, errores = sesion.run()
+"""
+import hashlib
+import importlib
+import pickle
+import sqlite3
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+import polars as pl
+import pydantic
+import pydantic_core
+import shapely
+
+from geoanla.core.columnar import (
+    FORMATOS_VALIDOS, _take, _to_polars, compile_plan, identifier_expr, model_columns,
+    project_frame, records_frame,
+)
+from geoanla.core.errors import ErrorTable
+from geoanla.core.frames import COLUMNA_GEOMETRIA, geometry_values
+
+# Filas por sentencia al consultar o escribir el almacén
+TAMANO_LOTE_ALMACEN = 50_000
+
+# Huella de fila: dos hash de 64 bits con semillas distintas
+SEMILLAS_HUELLA = (0, 1)
+
+# Se incrementa a mano cuando cambia la forma de decidir o guardar un
+# resultado sin que cambie el código de los módulos de la huella
+VERSION_MOTOR = 1
+
+# Módulos del motor que deciden el resultado de una fila, además de los del modelo
+MODULOS_MOTOR = (
+    "geoanla.core.columnar",
+    "geoanla.core.frames",
+    "geoanla.core.geometry",
+    "geoanla.core.incremental",
+    "geoanla.catalog.hierarchy",
+    "geoanla.catalog.registry",
+)
+
+Validador = Callable[[Any], Tuple[List[Dict[str, Any]], ErrorTable]]
+
+
+# ==========================================
+# 1. ALMACÉN DE RESULTADOS
+# ==========================================
+
+class ResultStore:
+    """
+    Almacén SQLite de resultados por (versión, huella de fila).
+
+    Args:
+        ruta: Archivo SQLite (se crea si no existe). ``":memory:"`` sirve
+            para un almacén temporal.
+    """
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self._candado = threading.Lock()
+        with self._conexion:
+            self._conexion.execute(
+                "CREATE TABLE IF NOT EXISTS resultados ("
+                " version TEXT NOT NULL, h1 INTEGER NOT NULL, h2 INTEGER NOT NULL,"
+                " valido INTEGER NOT NULL, contenido BLOB NOT NULL,"
+                " PRIMARY KEY (version, h1, h2)) WITHOUT ROWID"
+            )
+
+    def lookup(
+        self, version: str, h1: np.ndarray, h2: np.ndarray
+    ) -> Dict[Tuple[int, int], Tuple[bool, bytes]]:
+        """Resultados guardados de las huellas: {(h1, h2): (valido, contenido)}."""
+        encontrados = {}
+        with self._candado:
+            cursor = self._conexion.cursor()
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS consulta (h1 INTEGER, h2 INTEGER)"
+            )
+            cursor.execute("DELETE FROM consulta")
+            for i in range(0, len(h1), TAMANO_LOTE_ALMACEN):
+                lote = slice(i, i + TAMANO_LOTE_ALMACEN)
+                cursor.executemany(
+                    "INSERT INTO consulta VALUES (?, ?)",
+                    zip(h1[lote].tolist(), h2[lote].tolist()),
+                )
+            cursor.execute(
+                "SELECT r.h1, r.h2, r.valido, r.contenido FROM resultados r"
+                " JOIN (SELECT DISTINCT h1, h2 FROM consulta) c"
+                " ON r.h1 = c.h1 AND r.h2 = c.h2"
+                " WHERE r.version = ?",
+                (version,),
+            )
+            for a, b, valido, contenido in cursor:
+                encontrados[(a, b)] = (bool(valido), contenido)
+            cursor.execute("DELETE FROM consulta")
+        return encontrados
+
+    def save(self, version: str, filas: List[Tuple[int, int, bool, bytes]]):
+        """Guarda (o reemplaza) resultados ``(h1, h2, valido, contenido)``."""
+        with self._candado, self._conexion:
+            self._conexion.executemany(
+                "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?)",
+                (
+                    (version, a, b, int(valido), contenido)
+                    for a, b, valido, contenido in filas
+                ),
+            )
+
+    def purge(self, version: Optional[str] = None):
+        """Borra todo o, con ``version``, los resultados de las demás versiones."""
+        with self._candado, self._conexion:
+            if version is None:
+                self._conexion.execute("DELETE FROM resultados")
+            else:
+                self._conexion.execute(
+                    "DELETE FROM resultados WHERE version != ?", (version,)
+                )
+
+    def close(self):
+        with self._candado:
+            self._conexion.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# ==========================================
+# 2. VERSIÓN DEL MODELO Y HUELLAS DE FILA
+# ==========================================
+
+@lru_cache(maxsize=None)
+def model_version(modelo: Type) -> str:
+    """
+    Huella del código que decide el resultado de una fila: módulos del modelo,
+    de sus clases base, de sus dominios y del motor (``MODULOS_MOTOR``), más
+    las versiones de Polars, Pydantic y pydantic-core y ``VERSION_MOTOR``.
+    """
+    modulos = {
+        c.__module__ for c in modelo.__mro__ if c.__module__.startswith("geoanla")
+    }
+    modulos.update(
+        e.__module__ for e in modelo.get_domains().values() if isinstance(e, type)
+    )
+    modulos.update(MODULOS_MOTOR)
+    firma = hashlib.sha256("|".join([
+        f"{modelo.__module__}.{modelo.__qualname__}",
+        f"motor {VERSION_MOTOR}",
+        f"polars {pl.__version__}",
+        f"pydantic {pydantic.VERSION}",
+        f"pydantic-core {pydantic_core.__version__}",
+    ]).encode())
+    for nombre in sorted(modulos):
+        modulo = sys.modules.get(nombre) or importlib.import_module(nombre)
+        ruta = getattr(modulo, "__file__", None)
+        if ruta:
+            with open(ruta, "rb") as archivo:
+                firma.update(archivo.read())
+    return firma.hexdigest()
+
+
+def row_fingerprints(
+    modelo: Type, df: pl.DataFrame
+) -> Optional[Tuple[str, np.ndarray, np.ndarray]]:
+    """
+    Huellas de las filas de ``df`` sobre las columnas que lee el modelo.
+
+    Returns:
+        Tuple (version, h1, h2) con la versión que incluye el esquema de las
+        columnas, o None si no hay columnas del modelo o alguna no se puede
+        resumir (objetos que no son geometrías).
+    """
+    columnas = model_columns(compile_plan(modelo), df.columns, identificadores=False)
+    tabla = df.select(columnas)
+    if not tabla.width:
+        return None
+    if tabla.schema.get(COLUMNA_GEOMETRIA) == pl.Object:
+        geometrias = geometry_values(tabla.get_column(COLUMNA_GEOMETRIA).to_list())
+        try:
+            wkb = shapely.to_wkb(geometrias)
+        except (TypeError, shapely.errors.GEOSException):
+            return None
+        tabla = tabla.with_columns(
+            pl.Series(COLUMNA_GEOMETRIA, wkb.tolist(), dtype=pl.Binary)
+        )
+    if any(t == pl.Object for t in tabla.schema.values()):
+        return None
+
+    esquema = ",".join(f"{c}:{t}" for c, t in tabla.schema.items())
+    version = hashlib.sha256(f"{model_version(modelo)}|{esquema}".encode()).hexdigest()
+    # SQLite guarda enteros con signo: los hash sin signo se reinterpretan como int64
+    h1, h2 = (
+        tabla.hash_rows(seed=s).to_numpy().view(np.int64) for s in SEMILLAS_HUELLA
+    )
+    return version, h1, h2
+
+
+# ==========================================
+# 3. VALIDACIÓN INCREMENTAL
+# ==========================================
+
+def _pending_frame(df: Any, posiciones: List[int]) -> Any:
+    """Subconjunto de ``df`` con las filas que hay que validar."""
+    if isinstance(df, pl.DataFrame):
+        return df.gather(posiciones)
+    return df.iloc[posiciones]
+
+
+def validate_incremental(
+    modelo: Type,
+    df: Any,
+    almacen: ResultStore,
+    validar: Validador,
+    offset: int = 0,
+    formato_errores: str = "dicts",
+    formato_validos: str = "dicts",
+) -> Optional[Tuple[Any, Any, int]]:
+    """
+    Valida solo las filas sin resultado guardado y reutiliza el resto.
+
+    Args:
+        modelo: Clase BaseEV contra la que se valida.
+        df: DataFrame de Polars, Pandas o GeoPandas, o ``pl.LazyFrame`` (se
+            materializa proyectado a las columnas del modelo).
+        almacen: Almacén de resultados.
+        validar: Función que valida un subconjunto de ``df`` y devuelve los
+            válidos como diccionarios y los errores como ``ErrorTable`` (con
+            la posición dentro del subconjunto como ``row``).
+        offset: Desplazamiento que se suma al número de fila reportado.
+        formato_errores: "dicts" (legado) o "tabla" (``ErrorTable``).
+        formato_validos: Ver ``core.columnar.FORMATOS_VALIDOS``.
+
+    Returns:
+        Tuple (validos, errores, reutilizadas) con el contrato de
+        ``core.columnar.validate_frame``, o None si las filas no se pueden
+        resumir (se debe validar de forma completa).
+    """
+    if isinstance(df, pl.LazyFrame):
+        df = project_frame(compile_plan(modelo), df).collect()
+    try:
+        # La geometría WKB de Polars se resume tal cual, sin decodificarla
+        df_pl = df if isinstance(df, pl.DataFrame) else _to_polars(df)
+    except Exception:
+        return None
+    huellas = row_fingerprints(modelo, df_pl)
+    if huellas is None:
+        return None
+    version, h1, h2 = huellas
+
+    # 1. Resultados guardados y filas pendientes
+    guardados = almacen.lookup(version, h1, h2)
+    claves = list(zip(h1.tolist(), h2.tolist()))
+    pendientes = [i for i, clave in enumerate(claves) if clave not in guardados]
+    resultados: Dict[int, Tuple[bool, Any]] = {}
+
+    # 2. Validación de las filas nuevas o modificadas
+    con_geometria = any(
+        r.tipo == "geometria" and r.nombre == COLUMNA_GEOMETRIA
+        for r in compile_plan(modelo).reglas
+    )
+    if pendientes:
+        validos, tabla = validar(_pending_frame(df, pendientes))
+        # (campo, código, mensaje, valor) de cada error; el valor permite volver
+        # a separar la plantilla al cargar los resultados guardados
+        errores_por_fila: Dict[int, List[Tuple[str, str, str, Optional[str]]]] = {}
+        for fila, *error in tabla.to_polars(con_mensajes=True).select(
+            "row", "field", "error_code", "message", "value"
+        ).iter_rows():
+            errores_por_fila.setdefault(fila, []).append(tuple(error))
+
+        nuevos = []
+        iterador_validos = iter(validos)
+        for j, posicion in enumerate(pendientes):
+            if j in errores_por_fila:
+                resultados[posicion] = (False, errores_por_fila[j])
+                contenido = pickle.dumps(errores_por_fila[j])
+                nuevos.append((*claves[posicion], False, contenido))
+                continue
+            registro = next(iterador_validos)
+            resultados[posicion] = (True, registro)
+            # La geometría no se guarda: se toma de la capa actual (misma huella,
+            # mismo WKB)
+            guardado = registro
+            if con_geometria and COLUMNA_GEOMETRIA in registro:
+                guardado = {**registro, COLUMNA_GEOMETRIA: None}
+            nuevos.append((*claves[posicion], True, pickle.dumps(guardado)))
+        almacen.save(version, nuevos)
+
+    # 3. Salida en el orden original de las filas
+    modo = FORMATOS_VALIDOS[formato_validos]
+    posiciones_validas, posiciones_error = [], []
+    for i, clave in enumerate(claves):
+        valido = resultados[i][0] if i in resultados else guardados[clave][0]
+        (posiciones_validas if valido else posiciones_error).append(i)
+
+    def cargar(i: int) -> Any:
+        if i in resultados:
+            return resultados[i][1]
+        return pickle.loads(guardados[claves[i]][1])
+
+    ids = (
+        df_pl.with_row_index("__pos__")
+        .select(identifier_expr(df_pl.schema, pl.col("__pos__")))
+        .to_series().gather(posiciones_error).to_list()
+    )
+    if formato_errores == "tabla":
+        errores: Any = ErrorTable()
+        filas, identificadores, campos = [], [], []
+        codigos, mensajes, valores = [], [], []
+        for posicion, identificador in zip(posiciones_error, ids):
+            for campo, codigo, mensaje, valor in cargar(posicion):
+                filas.append(posicion + offset)
+                identificadores.append(identificador)
+                campos.append(campo)
+                codigos.append(codigo)
+                mensajes.append(mensaje)
+                valores.append(valor)
+        errores.append_frame(pl.DataFrame(
+            {
+                "row": filas, "id": identificadores, "field": campos,
+                "error_code": codigos, "message": mensajes, "value": valores,
+            },
+            schema={
+                "row": pl.Int64, "id": pl.Utf8, "field": pl.Utf8,
+                "error_code": pl.Utf8, "message": pl.Utf8, "value": pl.Utf8,
+            },
+        ))
+    else:
+        errores = []
+        for posicion, identificador in zip(posiciones_error, ids):
+            error_info = {"Fila": posicion + offset, "ID": identificador}
+            for campo, _, mensaje, _ in cargar(posicion):
+                error_info[campo] = mensaje
+            errores.append(error_info)
+
+    if modo == "posiciones":
+        validos_salida: Any = posiciones_validas
+    else:
+        registros = [cargar(i) for i in posiciones_validas]
+        reutilizados = [
+            j for j, i in enumerate(posiciones_validas) if i not in resultados
+        ]
+        if con_geometria and reutilizados:
+            geometrias = []
+            if COLUMNA_GEOMETRIA in df_pl.columns:
+                posiciones = np.asarray([posiciones_validas[j] for j in reutilizados])
+                geometrias = _take(df, COLUMNA_GEOMETRIA, posiciones)
+            for j, geometria in zip(reutilizados, geometry_values(geometrias)):
+                if COLUMNA_GEOMETRIA in registros[j]:
+                    registros[j][COLUMNA_GEOMETRIA] = geometria
+        if modo == "dicts":
+            validos_salida = registros
+        else:
+            validos_salida = records_frame(registros, posiciones_validas)
+
+    return validos_salida, errores, len(claves) - len(pendientes)
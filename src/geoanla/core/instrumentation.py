@@ -0,0 +1,313 @@
+"""
+Instrumentación opcional de los modelos BaseEV.
+
+Al activarla en un modelo (``Modelo.enable_instrumentation()``) cada
+``field_validator`` y ``model_validator`` de Pydantic se envuelve con un
+medidor que cuenta llamadas, fallos (excepciones) y tiempo acumulado, y el
+esquema del modelo se reconstruye para usar las funciones envueltas. Los
+gemelos vectorizados del motor columnar y las fases de una validación
+(lectura, traducción, validación, formato y las etapas del motor columnar)
+se registran en la misma ``Instrumentation``. Cada fase se registra desde
+un solo lugar: el ``model_dump()`` de la validación por fila es
+"pydantic.volcado", el armado de válidos del motor columnar es
+"columnar.volcado" (ambos dentro de "validacion") y la conversión al
+formato de salida de la sesión es "formato".
+
+Sin activar no queda nada envuelto: los validadores son las funciones
+originales y las fases solo consultan un diccionario vacío.
+
+Los trabajadores de ``core.parallel`` corren en otros procesos y no se
+instrumentan; allí solo se mide la fase de validación completa.
+
+Ejemplo::
+
+    medicion = CoberturaTierra.enable_instrumentation()
+    CoberturaTierra.session(gdf, columnar=True).run()
+    medicion.to_polars()
+    medicion.write_parquet("tiempos.parquet")
+    CoberturaTierra.disable_instrumentation()
+"""
+import contextlib
+import dataclasses
+import functools
+import json
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple, Type
+
+import polars as pl
+
+# Tipos de registro
+TIPO_CAMPO = "campo"
+TIPO_MODELO = "modelo"
+TIPO_COLUMNAR = "columnar"
+TIPO_FASE = "fase"
+
+ESQUEMA_MEDICIONES = {
+    "modelo": pl.Utf8,
+    "tipo": pl.Utf8,
+    "nombre": pl.Utf8,
+    "llamadas": pl.Int64,
+    "fallos": pl.Int64,
+    "segundos": pl.Float64,
+}
+
+
+@dataclasses.dataclass
+class ValidatorStat:
+    """
+    Medición acumulada de un validador o de una fase.
+
+    Atributos:
+        modelo: Nombre de la clase BaseEV.
+        tipo: "campo", "modelo", "columnar" (gemelo vectorizado) o "fase".
+        nombre: Nombre del validador o de la fase.
+        llamadas: Veces que se ejecutó (filas evaluadas en un gemelo vectorizado).
+        fallos: Ejecuciones que rechazaron el valor o la fila.
+        segundos: Tiempo de reloj acumulado.
+    """
+    modelo: str
+    tipo: str
+    nombre: str
+    llamadas: int = 0
+    fallos: int = 0
+    segundos: float = 0.0
+
+    @property
+    def segundos_por_llamada(self) -> float:
+        return self.segundos / self.llamadas if self.llamadas else 0.0
+
+
+class Instrumentation:
+    """Acumulador de mediciones por (modelo, tipo, nombre), seguro entre hilos."""
+
+    def __init__(self):
+        self._mediciones: Dict[Tuple[str, str, str], ValidatorStat] = {}
+        self._candado = threading.Lock()
+
+    # --- 1. REGISTRO ---
+
+    def record(
+        self,
+        modelo: str,
+        tipo: str,
+        nombre: str,
+        segundos: float,
+        llamadas: int = 1,
+        fallos: int = 0,
+    ):
+        """Suma una o varias ejecuciones a la medición correspondiente."""
+        clave = (modelo, tipo, nombre)
+        with self._candado:
+            medicion = self._mediciones.get(clave)
+            if medicion is None:
+                medicion = ValidatorStat(modelo, tipo, nombre)
+                self._mediciones[clave] = medicion
+            medicion.llamadas += llamadas
+            medicion.fallos += fallos
+            medicion.segundos += segundos
+
+    @contextlib.contextmanager
+    def phase(self, modelo: str, nombre: str, llamadas: int = 1):
+        """Mide el bloque ``with`` como una fase del modelo."""
+        inicio = time.perf_counter()
+        fallo = 1
+        try:
+            yield
+            fallo = 0
+        finally:
+            segundos = time.perf_counter() - inicio
+            self.record(modelo, TIPO_FASE, nombre, segundos, llamadas, fallo)
+
+    def reset(self):
+        """Descarta las mediciones acumuladas."""
+        with self._candado:
+            self._mediciones.clear()
+
+    # --- 2. CONSULTA Y EXPORTACIÓN ---
+
+    def stats(self) -> List[ValidatorStat]:
+        """Mediciones ordenadas por tiempo acumulado (la más costosa primero)."""
+        with self._candado:
+            mediciones = [dataclasses.replace(m) for m in self._mediciones.values()]
+        return sorted(mediciones, key=lambda m: m.segundos, reverse=True)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [
+            {**dataclasses.asdict(m), "segundos_por_llamada": m.segundos_por_llamada}
+            for m in self.stats()
+        ]
+
+    def to_polars(self) -> pl.DataFrame:
+        """Tabla de mediciones con el tiempo medio por llamada."""
+        tabla = pl.DataFrame(
+            [dataclasses.asdict(m) for m in self.stats()], schema=ESQUEMA_MEDICIONES
+        )
+        return tabla.with_columns(
+            (pl.col("segundos") / pl.col("llamadas"))
+            .fill_nan(0.0).alias("segundos_por_llamada")
+        )
+
+    def to_json(self, ruta: Optional[str] = None) -> str:
+        """
+        Mediciones como JSON; si se indica ``ruta`` también se escriben en el
+        archivo.
+        """
+        texto = json.dumps(self.to_dicts(), ensure_ascii=False, indent=2)
+        if ruta is not None:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+        return texto
+
+    def write_parquet(self, ruta: str):
+        """Exporta las mediciones a Parquet."""
+        self.to_polars().write_parquet(ruta)
+
+
+# ==========================================
+# ACTIVACIÓN POR MODELO
+# ==========================================
+
+# Modelo -> instrumentación activa; vacío mientras nadie instrumenta
+_ACTIVAS: Dict[type, Instrumentation] = {}
+# Modelo -> decoradores originales (validadores de campo, de modelo) para restaurarlos
+_ORIGINALES: Dict[type, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+_CANDADO_ACTIVACION = threading.Lock()
+
+
+def active(modelo: type) -> Optional[Instrumentation]:
+    """Instrumentación activa del modelo, o None (el caso normal, sin costo)."""
+    return _ACTIVAS.get(modelo) if _ACTIVAS else None
+
+
+def measure(modelo: type, nombre: str, llamadas: int = 1) -> ContextManager:
+    """Mide una fase del modelo si está instrumentado; si no, no hace nada."""
+    medicion = _ACTIVAS.get(modelo) if _ACTIVAS else None
+    if medicion is None:
+        return contextlib.nullcontext()
+    return medicion.phase(modelo.__name__, nombre, llamadas)
+
+
+def _timed(
+    funcion: Callable, medicion: Instrumentation, modelo: str, tipo: str, nombre: str
+) -> Callable:
+    """
+    Envuelve un validador; ``functools.wraps`` conserva la firma que
+    inspecciona Pydantic.
+    """
+    @functools.wraps(funcion)
+    def medido(*args, **kwargs):
+        inicio = time.perf_counter()
+        fallo = 1
+        try:
+            resultado = funcion(*args, **kwargs)
+            fallo = 0
+            return resultado
+        finally:
+            segundos = time.perf_counter() - inicio
+            medicion.record(modelo, tipo, nombre, segundos, 1, fallo)
+    return medido
+
+
+def timed_batch(modelo: type, funcion: Callable) -> Callable:
+    """
+    Envuelve un gemelo vectorizado (recibe todas las filas y devuelve un
+    mensaje por fila) si el modelo está instrumentado: cuenta como llamadas
+    las filas evaluadas y como fallos las filas con mensaje.
+    """
+    medicion = active(modelo)
+    if medicion is None:
+        return funcion
+
+    @functools.wraps(funcion)
+    def medido(valores):
+        inicio = time.perf_counter()
+        mensajes = funcion(valores)
+        segundos = time.perf_counter() - inicio
+        lista = mensajes.to_list() if isinstance(mensajes, pl.Series) else mensajes
+        medicion.record(
+            modelo.__name__, TIPO_COLUMNAR, funcion.__name__, segundos,
+            len(lista), sum(1 for m in lista if m),
+        )
+        return mensajes
+    return medido
+
+
+def _instrumented_models(modelo: type) -> List[type]:
+    """El modelo y todas sus subclases."""
+    modelos, pendientes = [], [modelo]
+    while pendientes:
+        actual = pendientes.pop()
+        if actual not in modelos:
+            modelos.append(actual)
+            pendientes.extend(actual.__subclasses__())
+    return modelos
+
+
+def _refresh(modelo: type):
+    """Hace que Pydantic y el motor columnar tomen los validadores actuales."""
+    from geoanla.core.columnar import invalidate_plan
+
+    invalidate_plan(modelo)
+    # Un modelo aún no construido tomará los validadores cuando Pydantic lo complete
+    if modelo.__dict__.get("__pydantic_complete__", False):
+        modelo.model_rebuild(force=True)
+
+
+def enable(
+    modelo: Type, medicion: Optional[Instrumentation] = None
+) -> Instrumentation:
+    """
+    Instrumenta el modelo y sus subclases. Si ya lo estaban se reemplaza la
+    instrumentación por ``medicion`` (o por una nueva).
+    """
+    medicion = medicion if medicion is not None else Instrumentation()
+    with _CANDADO_ACTIVACION:
+        for clase in _instrumented_models(modelo):
+            _restore(clase)
+            decoradores = clase.__pydantic_decorators__
+            campos = dict(decoradores.field_validators)
+            modelos = dict(decoradores.model_validators)
+            _ORIGINALES[clase] = (campos, modelos)
+            for nombre, dec in campos.items():
+                medido = _timed(
+                    dec.func, medicion, clase.__name__, TIPO_CAMPO, nombre
+                )
+                decoradores.field_validators[nombre] = dataclasses.replace(
+                    dec, func=medido
+                )
+            for nombre, dec in modelos.items():
+                medido = _timed(
+                    dec.func, medicion, clase.__name__, TIPO_MODELO, nombre
+                )
+                decoradores.model_validators[nombre] = dataclasses.replace(
+                    dec, func=medido
+                )
+            _ACTIVAS[clase] = medicion
+            _refresh(clase)
+    return medicion
+
+
+def _restore(clase: type) -> bool:
+    """
+    Devuelve a la clase sus validadores originales (True si estaba
+    instrumentada).
+    """
+    originales = _ORIGINALES.pop(clase, None)
+    _ACTIVAS.pop(clase, None)
+    if originales is None:
+        return False
+    decoradores = clase.__pydantic_decorators__
+    decoradores.field_validators.clear()
+    decoradores.field_validators.update(originales[0])
+    decoradores.model_validators.clear()
+    decoradores.model_validators.update(originales[1])
+    return True
+
+
+def disable(modelo: Type):
+    """Quita la instrumentación del modelo y de sus subclases."""
+    with _CANDADO_ACTIVACION:
+        for clase in _instrumented_models(modelo):
+            if _restore(clase):
+                _refresh(clase)
@@ -0,0 +1,158 @@
+"""
+Validación en paralelo con un pool de procesos reutilizable.
+
+El DataFrame se parte en trozos de filas contiguas que se validan en
+procesos trabajadores. Los resultados se unen en el orden original de las
+filas, de modo que ``Fila`` e ``ID`` coinciden con una validación secuencial.
+
+Un ``pl.LazyFrame`` se proyecta a las columnas del modelo y se lee en
+streaming: solo unos pocos lotes (los que están en proceso) viven en
+memoria a la vez.
+
+El pool es de nivel de módulo y se reutiliza entre capas: cada trabajador
+importa los modelos y compila sus esquemas/planes una sola vez. Los
+procesos se crean con 'spawn', por lo que los scripts que lo usen deben
+proteger su punto de entrada con ``if __name__ == "__main__":``.
+"""
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, Tuple, Type
+
+import polars as pl
+
+from geoanla.core.columnar import (
+    FORMATOS_VALIDOS, compile_plan, concat_valid_frames, iter_chunks, project_frame,
+    validate_frame, validate_rows_as,
+)
+from geoanla.core.errors import ErrorTable
+from geoanla.core.frames import is_pandas_frame
+
+TAMANO_LOTE_DEFECTO = 50_000
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_PROCESOS: int = 0
+_CANDADO_POOL = threading.Lock()
+
+
+def _init_worker():
+    """Inicializador de cada trabajador: precarga el núcleo de validación."""
+    import geoanla.core.base  # noqa: F401
+
+
+def get_pool(num_procesos: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Devuelve el pool compartido, creándolo si no existe o si cambió el
+    número de procesos solicitado.
+    """
+    global _POOL, _POOL_PROCESOS
+    num_procesos = num_procesos or os.cpu_count() or 1
+
+    with _CANDADO_POOL:
+        if _POOL is not None and _POOL_PROCESOS == num_procesos:
+            return _POOL
+        if _POOL is not None:
+            _POOL.shutdown(wait=True)
+        # 'spawn' evita heredar los hilos de Polars en un fork
+        contexto = multiprocessing.get_context("spawn")
+        _POOL = ProcessPoolExecutor(
+            max_workers=num_procesos, mp_context=contexto, initializer=_init_worker
+        )
+        _POOL_PROCESOS = num_procesos
+        return _POOL
+
+
+def shutdown_pool():
+    """Libera los procesos del pool compartido."""
+    global _POOL, _POOL_PROCESOS
+    with _CANDADO_POOL:
+        if _POOL is not None:
+            _POOL.shutdown(wait=True)
+        _POOL, _POOL_PROCESOS = None, 0
+
+
+def _validate_chunk(
+    modelo: Type, trozo: Any, offset: int, inicio: int, columnar: bool,
+    formato_errores: str = "dicts", formato_validos: str = "dicts"
+) -> Tuple[Any, Any]:
+    """Tarea ejecutada en el trabajador: valida un trozo de la capa."""
+    tabla = ErrorTable() if formato_errores == "tabla" else None
+    if columnar:
+        validos, errores = validate_frame(
+            modelo, trozo, offset, inicio=inicio, tabla_errores=tabla,
+            formato_validos=formato_validos,
+        )
+    else:
+        validos, errores = validate_rows_as(
+            modelo, trozo, offset, inicio, tabla, FORMATOS_VALIDOS[formato_validos]
+        )
+    return validos, (tabla if tabla is not None else errores)
+
+
+def validate_parallel(
+    modelo: Type,
+    df: Any,
+    offset: int = 0,
+    columnar: bool = False,
+    tamano_lote: int = TAMANO_LOTE_DEFECTO,
+    num_procesos: Optional[int] = None,
+    formato_errores: str = "dicts",
+    formato_validos: str = "dicts",
+) -> Tuple[Any, Any]:
+    """
+    Valida ``df`` en paralelo y une los resultados en el orden original.
+
+    Args:
+        modelo: Clase BaseEV definida a nivel de módulo (debe poder importarse
+            desde los trabajadores).
+        df: DataFrame de Polars, Pandas o GeoPandas, o ``pl.LazyFrame``.
+        offset: Desplazamiento que se suma al número de fila reportado.
+        columnar: Usa el motor columnar dentro de cada trabajador.
+        tamano_lote: Número de filas por trozo.
+        num_procesos: Procesos del pool (por defecto, todos los núcleos).
+        formato_errores: "dicts" (legado) o "tabla" (``ErrorTable``).
+        formato_validos: Ver ``core.columnar.FORMATOS_VALIDOS``.
+
+    Returns:
+        Tuple (validos, errores) idéntica a la validación secuencial.
+    """
+    if isinstance(df, pl.LazyFrame):
+        df = project_frame(compile_plan(modelo), df)
+    elif not (isinstance(df, pl.DataFrame) or is_pandas_frame(df)):
+        raise TypeError(f"Tipo de datos {type(df)} no soportado.")
+    elif len(df) <= tamano_lote:
+        return _validate_chunk(
+            modelo, df, offset, 0, columnar, formato_errores, formato_validos
+        )
+
+    pool = get_pool(num_procesos)
+    # Trozos en vuelo acotados: la lectura avanza al ritmo de los trabajadores
+    max_en_vuelo = 2 * (num_procesos or os.cpu_count() or 1)
+    futuros = deque()
+    validos = []
+    errores = ErrorTable() if formato_errores == "tabla" else []
+
+    def unir(futuro):
+        validos_trozo, errores_trozo = futuro.result()
+        if isinstance(validos_trozo, pl.DataFrame):
+            validos.append(validos_trozo)
+        else:
+            validos.extend(validos_trozo)
+        errores.extend(errores_trozo)
+
+    # Los futuros se recorren en el orden de envío: la unión es determinista
+    for inicio, trozo in iter_chunks(df, tamano_lote):
+        futuros.append(pool.submit(
+            _validate_chunk, modelo, trozo, offset, inicio, columnar,
+            formato_errores, formato_validos,
+        ))
+        if len(futuros) >= max_en_vuelo:
+            unir(futuros.popleft())
+    while futuros:
+        unir(futuros.popleft())
+
+    if FORMATOS_VALIDOS[formato_validos] == "tabla":
+        validos = concat_valid_frames(validos)
+    return validos, errores
@@ -0,0 +1,410 @@
+"""
+Sesiones de validación.
+
+Un ``ValidationRun`` es dueño del DataFrame de entrada, de la configuración,
+de las métricas y de los resultados de una validación. No guarda nada en la
+clase del modelo, de modo que varias sesiones del mismo modelo pueden correr
+a la vez en hilos o tareas asíncronas, y al cerrarse (o al salir del bloque
+``with``) libera sus referencias de forma determinista.
+
+Ejemplo::
+
+    with ValidationRun(CoberturaTierra, gdf, columnar=True) as sesion:
+        validos, errores = sesion.run()
+"""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from geoanla.core.columnar import (
+    FORMATOS_VALIDOS, column_names, format_valid_rows, frame_height, validate_frame,
+    validate_rows_as,
+)
+from geoanla.core.errors import ErrorTable
+from geoanla.core.instrumentation import measure
+
+FORMATOS_ERRORES = ("dicts", "tabla")
+
+
+@dataclass
+class RunConfig:
+    """
+    Configuración de una sesión de validación.
+
+    Atributos:
+        offset: Desplazamiento que se suma al número de fila reportado.
+        columnar: Usa el motor columnar (ver ``core.columnar``).
+        paralelo: Reparte las filas entre procesos (ver ``core.parallel``).
+        tamano_lote: Filas por trozo en la validación en paralelo.
+        num_procesos: Procesos del pool (por defecto, todos los núcleos).
+        formato_errores: "dicts" (legado) o "tabla" (``ErrorTable``).
+        formato_validos: Ver ``core.columnar.FORMATOS_VALIDOS``.
+        verbose: Imprime el reporte de extracción y el resumen final.
+        almacen: Archivo SQLite de resultados por fila; si se indica, solo se
+            validan las filas nuevas o modificadas (ver ``core.incremental``).
+        max_errores: Detiene la validación al llegar a este número de filas
+            rechazadas (ver ``core.triage``).
+        max_errores_campo: Detiene la validación cuando un campo acumula
+            este número de filas con error.
+        detener_primer_error: Detiene la validación en la primera fila
+            rechazada (equivale a ``max_errores=1``).
+        muestra: Valida solo una muestra (número de filas, o fracción menor
+            que 1 o ``1.0`` para toda la capa) y estima la tasa de error.
+        estratos: Columna por la que se estratifica la muestra.
+        confianza: Nivel de confianza del intervalo de la estimación.
+        semilla: Semilla del muestreo (muestras reproducibles).
+    """
+    offset: int = 0
+    columnar: bool = False
+    paralelo: bool = False
+    tamano_lote: Optional[int] = None
+    num_procesos: Optional[int] = None
+    formato_errores: str = "dicts"
+    formato_validos: str = "dicts"
+    verbose: bool = True
+    almacen: Optional[str] = None
+    max_errores: Optional[int] = None
+    max_errores_campo: Optional[int] = None
+    detener_primer_error: bool = False
+    muestra: Optional[float] = None
+    estratos: Optional[str] = None
+    confianza: float = 0.95
+    semilla: Optional[int] = None
+
+    def __post_init__(self):
+        if self.formato_errores not in FORMATOS_ERRORES:
+            raise ValueError(
+                f"❌ formato_errores '{self.formato_errores}' no soportado."
+            )
+        if self.formato_validos not in FORMATOS_VALIDOS:
+            raise ValueError(
+                f"❌ formato_validos '{self.formato_validos}' no soportado."
+            )
+        for nombre in ("max_errores", "max_errores_campo"):
+            valor = getattr(self, nombre)
+            if valor is not None and valor < 1:
+                raise ValueError(f"❌ {nombre} debe ser mayor o igual a 1.")
+        if self.detener_primer_error:
+            self.max_errores = 1
+        if self.muestra is not None and self.muestra <= 0:
+            raise ValueError(
+                "❌ muestra debe ser un número de filas o una fracción positiva."
+            )
+        if self.estratos is not None and self.muestra is None:
+            raise ValueError("❌ estratos requiere indicar una muestra.")
+        if not 0 < self.confianza < 1:
+            raise ValueError("❌ confianza debe estar entre 0 y 1.")
+        if self.presupuesto and self.muestra is not None:
+            raise ValueError(
+                "❌ El presupuesto de errores y el muestreo no se combinan."
+            )
+        if self.almacen and (self.presupuesto or self.muestra is not None):
+            raise ValueError(
+                "❌ El almacén incremental no se combina con el presupuesto ni con "
+                "el muestreo."
+            )
+
+    @property
+    def presupuesto(self) -> bool:
+        """True si hay un presupuesto de errores (parada temprana)."""
+        return self.max_errores is not None or self.max_errores_campo is not None
+
+
+@dataclass
+class RunMetrics:
+    """
+    Métricas de una sesión: conteos y tiempos por fase (segundos).
+    ``reutilizados`` cuenta las filas resueltas con el almacén incremental;
+    ``revisados`` las filas validadas (menos que ``registros`` si la
+    validación se detuvo o fue por muestreo) y ``estimacion`` guarda la
+    tasa de error estimada del muestreo (``core.triage.ErrorRateEstimate``).
+    """
+    registros: int = 0
+    aprobados: int = 0
+    rechazados: int = 0
+    reutilizados: int = 0
+    revisados: int = 0
+    detenida: bool = False
+    motor: str = ""
+    tiempos: Dict[str, float] = field(default_factory=dict)
+    estimacion: Optional[Any] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Métricas planas, listas para un log o una tabla."""
+        return {
+            "registros": self.registros,
+            "aprobados": self.aprobados,
+            "rechazados": self.rechazados,
+            "reutilizados": self.reutilizados,
+            "revisados": self.revisados,
+            "detenida": self.detenida,
+            "motor": self.motor,
+            **{f"segundos_{fase}": s for fase, s in self.tiempos.items()},
+            **(self.estimacion.as_dict() if self.estimacion is not None else {}),
+        }
+
+
+class ValidationRun:
+    """
+    Validación de una capa contra un modelo BaseEV con estado propio.
+
+    Args:
+        modelo: Clase BaseEV contra la que se valida.
+        df: DataFrame de Polars, Pandas o GeoPandas, o ``pl.LazyFrame`` (se
+            proyecta a las columnas del modelo y se valida por lotes en
+            streaming).
+        config: Configuración completa; si se omite se arma con ``opciones``.
+        **opciones: Campos de ``RunConfig`` (``columnar=True``, ...).
+    """
+
+    def __init__(
+        self, modelo: Type, df: Any, config: Optional[RunConfig] = None, **opciones
+    ):
+        if df is None:
+            raise ValueError(f"❌ No hay datos en {modelo.__name__}.")
+        self.modelo = modelo
+        self.config = config if config is not None else RunConfig(**opciones)
+        self.metricas = RunMetrics()
+        self.validos: Any = None
+        self.errores: Any = None
+        self._df = df
+        self._candado = threading.Lock()
+        self._cerrada = False
+
+    # --- 1. CICLO DE VIDA ---
+
+    @property
+    def df(self) -> Any:
+        """DataFrame de entrada (None después de ``close``)."""
+        return self._df
+
+    @property
+    def closed(self) -> bool:
+        return self._cerrada
+
+    def close(self):
+        """Libera el DataFrame de entrada y los resultados que guarda la sesión."""
+        with self._candado:
+            self._df = None
+            self.validos = None
+            self.errores = None
+            self._cerrada = True
+
+    def __enter__(self) -> "ValidationRun":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self) -> "ValidationRun":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def _active_frame(self) -> Any:
+        if self._cerrada:
+            raise ValueError(f"❌ La sesión de {self.modelo.__name__} ya fue cerrada.")
+        return self._df
+
+    # --- 2. EXTRACCIÓN ---
+
+    def extract(self) -> Dict[str, List[str]]:
+        """Reporta las columnas del modelo que no vienen en los datos."""
+        df = self._active_frame()
+        campos_modelo = set(self.modelo.model_fields.keys())
+        faltantes = list(campos_modelo - set(column_names(df)))
+        if self.config.verbose:
+            print(f"\n--- 🛠️ Fase de Extracción: {self.modelo.__name__} ---")
+            print(f"📥 Tipo de datos detectado: {type(df).__name__}")
+            if faltantes:
+                print(f"⚠️ Columnas faltantes: {faltantes}")
+            else:
+                print(f"✅ Estructura íntegra. {len(campos_modelo)} columnas listas.")
+                print(f"📋 Campos del modelo: {self.modelo.model_fields.keys()}")
+        return {"faltantes": faltantes}
+
+    # --- 3. VALIDACIÓN ---
+
+    def run(self) -> Tuple[Any, Any]:
+        """
+        Valida la capa y guarda el resultado en ``validos``/``errores``.
+
+        Returns:
+            Tuple (validos, errores) en los formatos de la configuración.
+        """
+        with self._candado:
+            df = self._active_frame()
+            config = self.config
+            self.metricas.registros = frame_height(df)
+            self.metricas.revisados = self.metricas.registros
+            if config.verbose:
+                print(f"🚀 Validando {self.metricas.registros} registros...")
+
+            inicio = time.perf_counter()
+            with measure(self.modelo, "validacion"):
+                validos, errores = self._validate(df)
+            fin_validacion = time.perf_counter()
+            with measure(self.modelo, "formato"):
+                validos = format_valid_rows(
+                    self.modelo, df, validos, config.formato_validos
+                )
+
+            if isinstance(errores, ErrorTable):
+                self.metricas.rechazados = errores.rejected_rows()
+            else:
+                self.metricas.rechazados = len(errores)
+            if config.formato_validos == "mascara":
+                self.metricas.aprobados = int(validos.sum())
+            else:
+                self.metricas.aprobados = len(validos)
+            self.metricas.tiempos["validacion"] = fin_validacion - inicio
+            self.metricas.tiempos["formato"] = time.perf_counter() - fin_validacion
+
+            self.validos, self.errores = validos, errores
+            if config.verbose:
+                self.report()
+            return validos, errores
+
+    async def run_async(self) -> Tuple[Any, Any]:
+        """
+        Versión asíncrona de ``run``: valida en un hilo sin bloquear el bucle
+        de eventos.
+        """
+        return await asyncio.to_thread(self.run)
+
+    def _validate(self, df: Any) -> Tuple[Any, Any]:
+        """
+        Despacha al motor elegido, pasando antes por el almacén incremental,
+        el presupuesto de errores o el muestreo si la configuración los pide.
+        """
+        config = self.config
+        if config.presupuesto or config.muestra is not None:
+            return self._triage(df)
+        if config.almacen:
+            from geoanla.core.incremental import ResultStore, validate_incremental
+
+            def validar(pendientes: Any) -> Tuple[Any, Any]:
+                return self._run_engine(pendientes, 0, "tabla", "dicts")
+
+            with ResultStore(config.almacen) as almacen:
+                resultado = validate_incremental(
+                    self.modelo, df, almacen, validar, config.offset,
+                    config.formato_errores, config.formato_validos
+                )
+            if resultado is not None:
+                validos, errores, self.metricas.reutilizados = resultado
+                self.metricas.motor = f"incremental/{self.metricas.motor or '-'}"
+                return validos, errores
+        return self._run_engine(
+            df, config.offset, config.formato_errores, config.formato_validos
+        )
+
+    def _triage(self, df: Any) -> Tuple[Any, Any]:
+        """
+        Validación parcial: parada temprana por presupuesto o muestreo con
+        estimación.
+        """
+        from geoanla.core import triage
+
+        config = self.config
+        if config.muestra is not None:
+            def validar(muestra: Any) -> Tuple[Any, Any]:
+                return self._run_engine(
+                    muestra, 0, config.formato_errores, config.formato_validos
+                )
+
+            validos, errores, estimacion = triage.validate_sample(
+                df, validar, config.muestra, config.estratos, config.semilla,
+                config.confianza, config.offset,
+                FORMATOS_VALIDOS[config.formato_validos]
+            )
+            self.metricas.revisados = estimacion.muestra
+            self.metricas.estimacion = estimacion
+            self.metricas.motor = f"muestra/{self.metricas.motor}"
+            return validos, errores
+
+        presupuesto = triage.ErrorBudget(config.max_errores, config.max_errores_campo)
+        validos, errores, self.metricas.revisados = triage.validate_with_budget(
+            self.modelo, df, presupuesto, config.offset, config.columnar,
+            config.formato_errores, config.formato_validos
+        )
+        self.metricas.detenida = self.metricas.revisados < self.metricas.registros
+        motor = "columnar" if config.columnar else "pydantic"
+        self.metricas.motor = f"presupuesto/{motor}"
+        return validos, errores
+
+    def _run_engine(
+        self, df: Any, offset: int, formato_errores: str, formato_validos: str
+    ) -> Tuple[Any, Any]:
+        """
+        Valida ``df`` con el motor de la configuración (pydantic, columnar o
+        paralelo).
+        """
+        config = self.config
+        tabla = ErrorTable() if formato_errores == "tabla" else None
+
+        if config.paralelo:
+            from geoanla.core.parallel import TAMANO_LOTE_DEFECTO, validate_parallel
+            self.metricas.motor = "paralelo"
+            return validate_parallel(
+                self.modelo, df, offset, columnar=config.columnar,
+                tamano_lote=config.tamano_lote or TAMANO_LOTE_DEFECTO,
+                num_procesos=config.num_procesos,
+                formato_errores=formato_errores, formato_validos=formato_validos
+            )
+        if config.columnar:
+            self.metricas.motor = "columnar"
+            validos, errores = validate_frame(
+                self.modelo, df, offset, tabla_errores=tabla,
+                formato_validos=formato_validos
+            )
+        else:
+            self.metricas.motor = "pydantic"
+            validos, errores = validate_rows_as(
+                self.modelo, df, offset, tabla_errores=tabla,
+                modo=FORMATOS_VALIDOS[formato_validos]
+            )
+        return validos, (tabla if tabla is not None else errores)
+
+    # --- 4. REPORTE ---
+
+    def report(self):
+        """Imprime el resumen de la última validación."""
+        errores = self.errores
+        linea = "=" * 50
+        print(f"\n{linea}\n📊 RESULTADO FINAL - {self.modelo.__name__}\n{linea}")
+        print(f"✅ Aprobados: {self.metricas.aprobados}")
+        print(f"❌ Rechazados: {self.metricas.rechazados}")
+        if self.metricas.reutilizados:
+            print(f"♻️ Reutilizados del almacén: {self.metricas.reutilizados}")
+        if self.metricas.detenida:
+            print(f"⛔ Presupuesto de errores agotado: se revisaron "
+                  f"{self.metricas.revisados} de {self.metricas.registros} registros.")
+        estimacion = self.metricas.estimacion
+        if estimacion is not None:
+            print(f"🎲 Muestra: {estimacion.muestra} de {estimacion.poblacion} "
+                  "registros")
+            print(f"📈 Tasa de error estimada: {estimacion.tasa:.2%} "
+                  f"(IC {estimacion.confianza:.0%}: {estimacion.inferior:.2%} - "
+                  f"{estimacion.superior:.2%}) "
+                  f"≈ {estimacion.rechazados_estimados} registros rechazados")
+
+        if self.metricas.rechazados and isinstance(errores, ErrorTable):
+            resumen = errores.summary_by_field()
+            try:
+                from IPython.display import display
+                display(resumen)
+            except Exception:
+                print(resumen)
+        elif self.metricas.rechazados:
+            try:
+                import pandas as pd
+                from IPython.display import display
+                display(pd.DataFrame(errores))
+            except Exception:
+                print(errores)
+        else:
+            print("\n🎉 ¡Todo perfecto!")
@@ -0,0 +1,472 @@
+"""
+Triaje rápido de capas grandes.
+
+Dos maneras de responder "¿la capa está mal?" sin validar cada fila:
+
+* **Presupuesto de errores**: la capa se valida en trozos crecientes y la
+  validación se detiene en la fila en que se agota el presupuesto
+  (``max_errores`` filas rechazadas o ``max_errores_campo`` filas con error
+  en un mismo campo). Agotar el presupuesto de un campo detiene toda la
+  validación, no solo la de ese campo. El resultado es idéntico al de una
+  validación completa de las filas ``0..corte``.
+* **Muestreo**: se valida una muestra aleatoria (o estratificada por una
+  columna, con asignación proporcional) y se estima la tasa de filas
+  rechazadas de la capa con su intervalo de confianza.
+"""
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type
+
+import numpy as np
+import polars as pl
+
+from geoanla.core.columnar import (
+    COLUMNA_FILA, FORMATOS_VALIDOS, compile_plan, concat_valid_frames, frame_height,
+    iter_chunks, project_frame, validate_frame, validate_rows_as,
+)
+from geoanla.core.errors import ErrorTable
+
+# Trozos del modo presupuesto: el primero es pequeño para que una capa muy
+# dañada se detenga enseguida y se duplican hasta el máximo
+TAMANO_TROZO_INICIAL = 1_000
+TAMANO_TROZO_MAXIMO = 50_000
+
+# Etiqueta del estrato de las filas con la columna de estratos nula
+ESTRATO_NULO = "∅"
+
+
+# ==========================================
+# 1. PRESUPUESTO DE ERRORES
+# ==========================================
+
+@dataclass
+class ErrorBudget:
+    """
+    Presupuesto de errores de una validación con parada temprana.
+
+    Atributos:
+        max_errores: Filas rechazadas admitidas antes de detenerse.
+        max_errores_campo: Filas con error en un mismo campo admitidas antes
+            de detenerse.
+    """
+    max_errores: Optional[int] = None
+    max_errores_campo: Optional[int] = None
+    rechazadas: int = 0
+    por_campo: Counter = field(default_factory=Counter)
+
+    def consume(self, errores: Any) -> Optional[int]:
+        """
+        Descuenta los errores de un trozo (en orden de fila) y devuelve la
+        ``Fila`` en la que se agotó el presupuesto, o None si aún alcanza.
+        """
+        for fila, campos in _rejected_fields(errores):
+            self.rechazadas += 1
+            self.por_campo.update(campos)
+            if self.max_errores is not None and self.rechazadas >= self.max_errores:
+                return fila
+            if self.max_errores_campo is not None and any(
+                self.por_campo[c] >= self.max_errores_campo for c in campos
+            ):
+                return fila
+        return None
+
+
+def _rejected_fields(errores: Any) -> Iterator[Tuple[int, set]]:
+    """Filas rechazadas (``Fila``) con sus campos con error, en orden de fila."""
+    if isinstance(errores, ErrorTable):
+        pares = errores.to_polars().select("row", pl.col("field").cast(pl.Utf8))
+        agrupado = pares.group_by("row", maintain_order=True).agg(
+            pl.col("field").unique()
+        )
+        for fila, campos in agrupado.iter_rows():
+            yield fila, set(campos)
+        return
+    for error in errores:
+        yield error["Fila"], {c for c in error if c not in ("Fila", "ID")}
+
+
+def _growing_chunks(
+    df: Any, inicial: int, maximo: int
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Recorre ``df`` en trozos contiguos que empiezan en ``inicial`` filas y se
+    duplican hasta ``maximo``. Un LazyFrame se lee en streaming y sus lotes se
+    agrupan hasta completar cada trozo.
+    """
+    if isinstance(df, pl.LazyFrame):
+        inicio, tamano, pendientes, filas = 0, inicial, [], 0
+        for _, lote in iter_chunks(df, inicial):
+            pendientes.append(lote)
+            filas += lote.height
+            if filas >= tamano:
+                yield inicio, pl.concat(pendientes)
+                inicio, pendientes = inicio + filas, []
+                tamano, filas = min(2 * tamano, maximo), 0
+        if pendientes:
+            yield inicio, pl.concat(pendientes)
+        return
+
+    inicio, tamano, total = 0, inicial, len(df)
+    while inicio < total:
+        if isinstance(df, pl.DataFrame):
+            yield inicio, df.slice(inicio, tamano)
+        else:
+            yield inicio, df.iloc[inicio:inicio + tamano]
+        inicio += tamano
+        tamano = min(2 * tamano, maximo)
+
+
+def _head(trozo: Any, filas: int) -> Any:
+    """Primeras ``filas`` filas de un trozo de Polars o Pandas."""
+    if isinstance(trozo, pl.DataFrame):
+        return trozo.head(filas)
+    return trozo.iloc[:filas]
+
+
+def validate_with_budget(
+    modelo: Type,
+    df: Any,
+    presupuesto: ErrorBudget,
+    offset: int = 0,
+    columnar: bool = False,
+    formato_errores: str = "dicts",
+    formato_validos: str = "dicts",
+    tamano_inicial: int = TAMANO_TROZO_INICIAL,
+    tamano_maximo: int = TAMANO_TROZO_MAXIMO,
+) -> Tuple[Any, Any, int]:
+    """
+    Valida ``df`` por trozos crecientes hasta agotar ``presupuesto``.
+
+    El trozo en que se agota se vuelve a validar recortado a la fila del
+    corte, de modo que válidos y errores cubren exactamente las filas
+    revisadas. Los trozos se validan en este proceso (columnar o Pydantic).
+
+    Returns:
+        Tuple (validos, errores, revisados) con los válidos en la
+        representación interna de ``formato_validos`` y el número de filas
+        revisadas.
+    """
+    modo = FORMATOS_VALIDOS[formato_validos]
+    if isinstance(df, pl.LazyFrame):
+        df = project_frame(compile_plan(modelo), df)
+
+    def validar(trozo: Any, inicio: int) -> Tuple[Any, Any]:
+        tabla = ErrorTable() if formato_errores == "tabla" else None
+        if columnar:
+            validos, errores = validate_frame(
+                modelo, trozo, offset, inicio, tabla, formato_validos
+            )
+        else:
+            validos, errores = validate_rows_as(
+                modelo, trozo, offset, inicio, tabla, modo
+            )
+        return validos, (tabla if tabla is not None else errores)
+
+    validos, errores = [], (ErrorTable() if formato_errores == "tabla" else [])
+    revisados = 0
+    for inicio, trozo in _growing_chunks(df, tamano_inicial, tamano_maximo):
+        validos_trozo, errores_trozo = validar(trozo, inicio)
+        corte = presupuesto.consume(errores_trozo)
+        if corte is not None:
+            filas = corte - offset - inicio + 1
+            validos_trozo, errores_trozo = validar(_head(trozo, filas), inicio)
+        if modo == "tabla":
+            validos.append(validos_trozo)
+        else:
+            validos.extend(validos_trozo)
+        errores.extend(errores_trozo)
+        if corte is not None:
+            revisados = corte - offset + 1
+            break
+        revisados = inicio + frame_height(trozo)
+
+    if modo == "tabla":
+        validos = concat_valid_frames(validos)
+    return validos, errores, revisados
+
+
+# ==========================================
+# 2. MUESTREO Y ESTIMACIÓN
+# ==========================================
+
+@dataclass
+class ErrorRateEstimate:
+    """
+    Tasa de filas rechazadas estimada a partir de una muestra.
+
+    Atributos:
+        poblacion: Filas de la capa.
+        muestra: Filas validadas.
+        rechazados: Filas rechazadas en la muestra.
+        tasa: Tasa estimada de filas rechazadas en la capa.
+        inferior: Cota inferior del intervalo de confianza.
+        superior: Cota superior del intervalo de confianza.
+        confianza: Nivel de confianza del intervalo (0.95 = 95 %).
+        estratos: Por estrato (si la muestra es estratificada): población,
+            muestra, rechazados y tasa.
+    """
+    poblacion: int
+    muestra: int
+    rechazados: int
+    tasa: float
+    inferior: float
+    superior: float
+    confianza: float
+    estratos: Optional[Dict[Any, Dict[str, Any]]] = None
+
+    @property
+    def rechazados_estimados(self) -> int:
+        """Filas rechazadas esperadas en toda la capa."""
+        return round(self.tasa * self.poblacion)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Estimación plana (sin el detalle por estrato)."""
+        return {
+            "poblacion": self.poblacion,
+            "muestra": self.muestra,
+            "rechazados_muestra": self.rechazados,
+            "tasa_error": self.tasa,
+            "tasa_inferior": self.inferior,
+            "tasa_superior": self.superior,
+            "confianza": self.confianza,
+        }
+
+    def strata_frame(self) -> pl.DataFrame:
+        """Detalle por estrato como tabla (vacía si el muestreo fue simple)."""
+        if not self.estratos:
+            return pl.DataFrame()
+        return pl.DataFrame(
+            [{"estrato": str(e), **d} for e, d in self.estratos.items()]
+        )
+
+
+def sample_size(muestra: float, poblacion: int) -> int:
+    """
+    Filas a validar: ``muestra`` es una fracción de la capa si es menor que 1
+    o el float ``1.0`` (toda la capa); si no, un número de filas.
+    """
+    if muestra < 1 or (isinstance(muestra, float) and muestra == 1):
+        return min(poblacion, max(1, math.ceil(muestra * poblacion)))
+    return min(int(muestra), poblacion)
+
+
+def _strata_positions(df: Any, columna: str) -> Dict[Any, np.ndarray]:
+    """
+    Posiciones de cada estrato de ``columna`` (los nulos forman su propio
+    estrato).
+    """
+    if isinstance(df, pl.LazyFrame):
+        serie = df.select(columna).collect().to_series()
+    elif isinstance(df, pl.DataFrame):
+        serie = df.get_column(columna)
+    else:
+        valores = df[columna].astype(object).where(df[columna].notna(), None)
+        serie = pl.Series(columna, valores.tolist(), strict=False)
+    grupos = (
+        serie.alias("estrato").to_frame().with_row_index("pos")
+        .group_by("estrato", maintain_order=True).agg(pl.col("pos"))
+    )
+    return {
+        (ESTRATO_NULO if estrato is None else estrato):
+            np.asarray(posiciones, dtype=np.int64)
+        for estrato, posiciones in grupos.iter_rows()
+    }
+
+
+def sample_positions(
+    df: Any,
+    muestra: float,
+    estratos: Optional[str] = None,
+    semilla: Optional[int] = None,
+) -> Tuple[np.ndarray, Dict[Any, Tuple[int, np.ndarray]]]:
+    """
+    Elige las filas a validar.
+
+    Sin ``estratos`` es un muestreo aleatorio simple sin reemplazo; con
+    ``estratos`` cada valor de la columna recibe una parte proporcional a su
+    tamaño (al menos una fila).
+
+    Returns:
+        Tuple (posiciones ordenadas, {estrato: (tamaño, posiciones elegidas)}).
+    """
+    generador = np.random.default_rng(semilla)
+    poblacion = frame_height(df)
+    total = sample_size(muestra, poblacion)
+    if estratos is None:
+        elegidas = np.sort(generador.choice(poblacion, size=total, replace=False))
+        return elegidas, {None: (poblacion, elegidas)}
+
+    asignacion = {}
+    for estrato, posiciones in _strata_positions(df, estratos).items():
+        proporcional = round(total * len(posiciones) / poblacion)
+        tamano = min(len(posiciones), max(1, proporcional))
+        elegidas = generador.choice(posiciones, size=tamano, replace=False)
+        asignacion[estrato] = (len(posiciones), np.sort(elegidas))
+    elegidas = np.sort(np.concatenate([p for _, p in asignacion.values()]))
+    return elegidas, asignacion
+
+
+def take_rows(df: Any, posiciones: np.ndarray) -> Any:
+    """Filas ``posiciones`` de ``df`` (un LazyFrame se filtra en streaming)."""
+    if isinstance(df, pl.LazyFrame):
+        marca = "__posicion__"
+        return (
+            df.with_row_index(marca)
+            .filter(pl.col(marca).is_in(pl.Series(posiciones, dtype=pl.UInt32)))
+            .drop(marca).collect(engine="streaming")
+        )
+    if isinstance(df, pl.DataFrame):
+        return df.gather(posiciones)
+    return df.iloc[posiciones]
+
+
+def _wilson_bounds(tasa: float, n_efectivo: float, z: float) -> Tuple[float, float]:
+    """Intervalo de Wilson para una proporción con ``n_efectivo`` observaciones."""
+    if math.isinf(n_efectivo):
+        return tasa, tasa
+    z2 = z * z
+    denominador = 1 + z2 / n_efectivo
+    centro = (tasa + z2 / (2 * n_efectivo)) / denominador
+    varianza = tasa * (1 - tasa) / n_efectivo + z2 / (4 * n_efectivo ** 2)
+    margen = z * math.sqrt(varianza) / denominador
+    # El intervalo contiene siempre la tasa (se evita el redondeo en 0 y 1)
+    return max(0.0, min(tasa, centro - margen)), min(1.0, max(tasa, centro + margen))
+
+
+def estimate_error_rate(
+    asignacion: Dict[Any, Tuple[int, np.ndarray]],
+    rechazadas: np.ndarray,
+    confianza: float = 0.95,
+) -> ErrorRateEstimate:
+    """
+    Estima la tasa de filas rechazadas de la capa.
+
+    La tasa es la media de las tasas de cada estrato ponderada por su tamaño.
+    El intervalo es el de Wilson con el tamaño de muestra efectivo del diseño
+    (varianza estratificada con corrección por población finita): con un
+    solo estrato es el intervalo de Wilson del muestreo simple y, si se
+    validó toda la capa, se reduce a la tasa observada.
+
+    Args:
+        asignacion: Resultado de ``sample_positions``.
+        rechazadas: Posiciones rechazadas dentro de la muestra.
+        confianza: Nivel de confianza del intervalo.
+    """
+    poblacion = sum(tamano for tamano, _ in asignacion.values())
+    detalle, tasa, varianza, muestra, rechazados = {}, 0.0, 0.0, 0, 0
+    for estrato, (tamano, posiciones) in asignacion.items():
+        n = len(posiciones)
+        k = int(np.isin(posiciones, rechazadas).sum())
+        tasa_estrato = k / n
+        peso = tamano / poblacion
+        tasa += peso * tasa_estrato
+        dispersion = tasa_estrato * (1 - tasa_estrato) / max(n - 1, 1)
+        varianza += peso ** 2 * (1 - n / tamano) * dispersion
+        muestra, rechazados = muestra + n, rechazados + k
+        detalle[estrato] = {
+            "poblacion": tamano, "muestra": n, "rechazados": k, "tasa": tasa_estrato
+        }
+
+    fraccion = muestra / poblacion
+    if 0 < tasa < 1 and varianza > 0:
+        n_efectivo = tasa * (1 - tasa) / varianza
+    elif fraccion < 1:
+        # Sin varianza observada (tasa 0 o 1): diseño equivalente al simple
+        n_efectivo = muestra / (1 - fraccion)
+    else:
+        n_efectivo = math.inf
+    z = NormalDist().inv_cdf((1 + confianza) / 2)
+    inferior, superior = _wilson_bounds(tasa, n_efectivo, z)
+    return ErrorRateEstimate(
+        poblacion=poblacion, muestra=muestra, rechazados=rechazados, tasa=tasa,
+        inferior=inferior, superior=superior, confianza=confianza,
+        estratos=None if list(detalle) == [None] else detalle,
+    )
+
+
+def relocate_results(
+    validos: Any, errores: Any, posiciones: np.ndarray, offset: int, modo: str
+) -> Tuple[Any, Any]:
+    """
+    Pasa los resultados de validar la muestra (filas 0..n-1, sin offset) a
+    las posiciones de la capa: ``Fila``, identificadores "Registro N" de
+    respaldo y posiciones de los válidos.
+    """
+    if modo == "posiciones":
+        validos = posiciones[np.asarray(validos, dtype=np.int64)].tolist()
+    elif modo == "tabla":
+        filas = validos.get_column(COLUMNA_FILA).to_numpy()
+        validos = validos.with_columns(
+            pl.Series(COLUMNA_FILA, posiciones[filas], dtype=pl.Int64)
+        )
+
+    if isinstance(errores, ErrorTable):
+        largo = errores.to_polars(con_mensajes=True)
+        locales = largo.get_column("row").to_numpy()
+        globales = pl.Series("global", posiciones[locales], dtype=pl.Int64)
+        largo = largo.with_columns(globales).select(
+            (pl.col("global") + offset).alias("row"),
+            pl.when(pl.col("id") == pl.lit("Registro ") + pl.col("row").cast(pl.Utf8))
+            .then(pl.lit("Registro ") + pl.col("global").cast(pl.Utf8))
+            .otherwise(pl.col("id")).alias("id"),
+            "field", "error_code", "message", "value",
+        )
+        errores = ErrorTable()
+        errores.append_frame(largo)
+        return validos, errores
+
+    reubicados = []
+    for error in errores:
+        local = error["Fila"]
+        global_ = int(posiciones[local])
+        error = {**error, "Fila": global_ + offset}
+        if error["ID"] == f"Registro {local}":
+            error["ID"] = f"Registro {global_}"
+        reubicados.append(error)
+    return validos, reubicados
+
+
+def rejected_positions(errores: Any, offset: int) -> np.ndarray:
+    """Posiciones (sin offset) de las filas rechazadas."""
+    if isinstance(errores, ErrorTable):
+        filas = errores.to_polars().get_column("row").unique().to_numpy()
+    else:
+        filas = np.asarray([e["Fila"] for e in errores], dtype=np.int64)
+    return filas - offset
+
+
+def validate_sample(
+    df: Any,
+    validar: Callable[[Any], Tuple[Any, Any]],
+    muestra: float,
+    estratos: Optional[str] = None,
+    semilla: Optional[int] = None,
+    confianza: float = 0.95,
+    offset: int = 0,
+    modo: str = "dicts",
+) -> Tuple[Any, Any, ErrorRateEstimate]:
+    """
+    Valida una muestra de ``df`` y estima la tasa de error de la capa.
+
+    Args:
+        df: Capa completa (Polars, Pandas, GeoPandas o LazyFrame).
+        validar: Valida un DataFrame con el motor de la sesión (sin offset)
+            y devuelve (validos, errores) en la representación interna.
+        muestra: Filas a validar o fracción de la capa (< 1, o ``1.0``).
+        estratos: Columna por la que se estratifica la muestra.
+        semilla: Semilla del generador (muestras reproducibles).
+        confianza: Nivel de confianza del intervalo.
+        offset: Desplazamiento que se suma al número de fila reportado.
+        modo: Representación interna de los válidos (``FORMATOS_VALIDOS``).
+
+    Returns:
+        Tuple (validos, errores, estimacion) con filas y posiciones de la capa.
+    """
+    posiciones, asignacion = sample_positions(df, muestra, estratos, semilla)
+    validos, errores = validar(take_rows(df, posiciones))
+    validos, errores = relocate_results(validos, errores, posiciones, offset, modo)
+    rechazadas = rejected_positions(errores, offset)
+    estimacion = estimate_error_rate(asignacion, rechazadas, confianza)
+    return validos, errores, estimacion
@@ -1,8 +1,19 @@
 from datetime import date
-from typing import Optional, ClassVar, Set, Any
+from typing import Optional, ClassVar, Dict, FrozenSet, Tuple, Any
+import numpy as np
+import polars as pl
 from pydantic import Field, ConfigDict, field_validator, model_validator
-from shapely.geometry import Point
 from geoanla.core.base import BaseEV_Geo
+from geoanla.catalog.registry import clc_codes
+from geoanla.catalog.hierarchy import (
+    MENSAJE_NOMENCLATURA_CLC,
+    NIVELES_CLC,
+    as_level_matrix,
+    detail_codes,
+    hierarchy_breaks,
+    hierarchy_message,
+    nomenclature_mismatches,
+)
 from geoanla.catalog import (
     Dom_Amenaza,
     Dom_Apendice,
@@ -41,6 +52,10 @@ class PuntoMuestreoFlora(BaseEV_Geo):
     )
 
     CAMPO_LEYENDA: ClassVar[str] = "N_COBERT"
+    GEOMETRIAS_PERMITIDAS: ClassVar[Tuple[str, ...]] = ("Point",)
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        "tipo": "Se requiere objeto Point, se recibió {clase}",
+    }
 
     # === INFORMACIÓN ADMINISTRATIVA ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20)
@@ -79,18 +94,11 @@ class PuntoMuestreoFlora(BaseEV_Geo):
     COTA: float = Field(...)
     COOR_ESTE: float = Field(...)
     COOR_NORTE: float = Field(...)
-    geometry: Point = Field(...)
+    geometry: Any = Field(...)
 
     # --- VALIDACIONES ESPECIALES ---
 
-    _valores_validos: ClassVar[Set[int]] = {
-        int(item.value)
-        for dom in [
-            Dom_CateCober, Dom_SubcatCober, Dom_Clas_Cober,
-            Dom_Subclas_Cober, Dom_Nivel5_Cober, Dom_Nivel6_Cober
-        ]
-        for item in dom
-    }
+    _valores_validos: ClassVar[FrozenSet[int]] = clc_codes()
 
     @field_validator('NOMENCLAT')
     @classmethod
@@ -100,16 +108,6 @@ class PuntoMuestreoFlora(BaseEV_Geo):
             raise ValueError(f"El código {v} no es una cobertura válida CLC.")
         return v
 
-    @field_validator('geometry')
-    @classmethod
-    def validate_point_geometry(cls, v):
-        """Valida que la geometría sea un punto no vacío."""
-        if not isinstance(v, Point):
-            raise ValueError(f"Se requiere objeto Point, se recibió {type(v)}")
-        if v.is_empty:
-            raise ValueError("La geometría está vacía.")
-        return v
-
 
 class PuntoMuestreoVeda(BaseEV_Geo):
     """
@@ -123,6 +121,11 @@ class PuntoMuestreoVeda(BaseEV_Geo):
     )
 
     CAMPO_LEYENDA: ClassVar[str] = "N_COBERT"
+    GEOMETRIAS_PERMITIDAS: ClassVar[Tuple[str, ...]] = ("Point",)
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        "tipo": "Se requiere Point, se recibió {clase}",
+        "vacia": "La geometría de la veda no puede estar vacía.",
+    }
 
     # === BLOQUE 1: INFORMACIÓN ADMINISTRATIVA ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20)
@@ -155,18 +158,11 @@ class PuntoMuestreoVeda(BaseEV_Geo):
     # === BLOQUE 7: GEOMETRÍA ===
     COOR_ESTE: float = Field(..., validation_alias="ESTE")
     COOR_NORTE: float = Field(..., validation_alias="NORTE")
-    geometry: Point = Field(...)
+    geometry: Any = Field(...)
 
     # --- VALIDACIONES ESPECIALES ---
 
-    _valores_validos: ClassVar[Set[int]] = {
-        int(item.value)
-        for dom in [
-            Dom_CateCober, Dom_SubcatCober, Dom_Clas_Cober,
-            Dom_Subclas_Cober, Dom_Nivel5_Cober, Dom_Nivel6_Cober
-        ]
-        for item in dom
-    }
+    _valores_validos: ClassVar[FrozenSet[int]] = clc_codes()
 
     @field_validator('NOMENCLAT')
     @classmethod
@@ -176,16 +172,6 @@ class PuntoMuestreoVeda(BaseEV_Geo):
             raise ValueError(f"El código {v} no es una cobertura CLC válida.")
         return v
 
-    @field_validator('geometry')
-    @classmethod
-    def validate_geometry(cls, v):
-        """Valida la geometría del punto de veda."""
-        if not isinstance(v, Point):
-            raise ValueError(f"Se requiere Point, se recibió {type(v)}")
-        if v.is_empty:
-            raise ValueError("La geometría de la veda no puede estar vacía.")
-        return v
-
 
 class CoberturaTierra(BaseEV_Geo):
     """
@@ -198,6 +184,11 @@ class CoberturaTierra(BaseEV_Geo):
     )
 
     CAMPO_LEYENDA: ClassVar[str] = "OBSERV"
+    VALIDADORES_COLUMNARES: ClassVar[Dict[str, str]] = {
+        **BaseEV_Geo.VALIDADORES_COLUMNARES,
+        'validate_consistent_nomenclature': 'consistent_nomenclature_errors',
+        'validate_coherent_hierarchy': 'coherent_hierarchy_errors',
+    }
 
     # === IDENTIFICACIÓN ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20)
@@ -234,47 +225,66 @@ class CoberturaTierra(BaseEV_Geo):
     @model_validator(mode='after')
     def validate_consistent_nomenclature(self):
         """Valida consistencia entre NOMENCLAT y niveles detallados."""
-        niveles = [
-            self.N6_COBERT, self.N5_COBERT, self.N4_COBERT, self.N3_COBERT
-        ]
-        nivel_detalle = next((n for n in niveles if n is not None), None)
-
-        if nivel_detalle is not None and int(nivel_detalle) != self.NOMENCLAT:
-            raise ValueError(
-                f"La NOMENCLAT ({self.NOMENCLAT}) debe coincidir con el "
-                f"nivel reportado ({int(nivel_detalle)})"
-            )
+        fila = self._clc_levels()
+        if nomenclature_mismatches(fila, self.NOMENCLAT)[0]:
+            raise ValueError(MENSAJE_NOMENCLATURA_CLC.format(
+                codigo=self.NOMENCLAT, nivel=int(detail_codes(fila)[0])
+            ))
         return self
 
     @model_validator(mode='after')
     def validate_coherent_hierarchy(self):
         """Valida que la jerarquía CLC sea coherente."""
-        n1 = str(int(self.N1_COBERT))
-        n2 = str(int(self.N2_COBERT))
-        n3 = str(int(self.N3_COBERT))
-
-        if not n2.startswith(n1):
-            raise ValueError(f"Nivel 2 ({n2}) incoherente con Nivel 1 ({n1})")
-        if not n3.startswith(n2):
-            raise ValueError(f"Nivel 3 ({n3}) incoherente con Nivel 2 ({n2})")
-
-        if self.N4_COBERT is not None:
-            n4 = str(int(self.N4_COBERT))
-            if not n4.startswith(n3):
-                raise ValueError(f"Nivel 4 ({n4}) incoherente")
-
-            if self.N5_COBERT is not None:
-                n5 = str(int(self.N5_COBERT))
-                if not n5.startswith(n4):
-                    raise ValueError(f"Nivel 5 ({n5}) incoherente")
-
-                if self.N6_COBERT is not None:
-                    n6 = str(int(self.N6_COBERT))
-                    if not n6.startswith(n5):
-                        raise ValueError(f"Nivel 6 ({n6}) incoherente")
-
+        fila = self._clc_levels()
+        nivel = hierarchy_breaks(fila)[0]
+        if nivel:
+            raise ValueError(hierarchy_message(fila[0], nivel))
         return self
 
+    def _clc_levels(self) -> np.ndarray:
+        """Niveles N1..N6 de la fila como matriz (1, 6)."""
+        return as_level_matrix([[getattr(self, n) for n in NIVELES_CLC]])
+
+    # --- GEMELOS VECTORIZADOS (motor columnar) ---
+
+    @classmethod
+    def _clc_level_frame(cls, df: pl.DataFrame) -> np.ndarray:
+        """Niveles N1..N6 de toda la tabla como matriz (n, 6)."""
+        columnas = [
+            df.get_column(n).cast(pl.Float64).to_numpy() if n in df.columns
+            else np.full(df.height, np.nan)
+            for n in NIVELES_CLC
+        ]
+        return np.column_stack(columnas) if columnas else np.empty((df.height, 0))
+
+    @classmethod
+    def consistent_nomenclature_errors(cls, df: pl.DataFrame) -> pl.Series:
+        """Gemelo vectorizado de ``validate_consistent_nomenclature``."""
+        mensajes = [None] * df.height
+        if 'NOMENCLAT' not in df.columns:
+            return pl.Series("nomenclatura", mensajes, dtype=pl.Utf8)
+        niveles = cls._clc_level_frame(df)
+        nomenclat = df.get_column('NOMENCLAT').to_numpy()
+        detalle = detail_codes(niveles)
+        for i in np.flatnonzero(nomenclature_mismatches(niveles, nomenclat)):
+            mensajes[i] = MENSAJE_NOMENCLATURA_CLC.format(
+                codigo=nomenclat[i], nivel=int(detalle[i])
+            )
+        return pl.Series("nomenclatura", mensajes, dtype=pl.Utf8)
+
+    @classmethod
+    def coherent_hierarchy_errors(cls, df: pl.DataFrame) -> pl.Series:
+        """
+        Gemelo vectorizado de ``validate_coherent_hierarchy``: primer nivel
+        incoherente por fila.
+        """
+        mensajes = [None] * df.height
+        niveles = cls._clc_level_frame(df)
+        quiebres = hierarchy_breaks(niveles)
+        for i in np.flatnonzero(quiebres):
+            mensajes[i] = hierarchy_message(niveles[i], quiebres[i])
+        return pl.Series("jerarquia", mensajes, dtype=pl.Utf8)
+
 
 class PuntoMuestreoFauna(BaseEV_Geo):
     """
@@ -288,6 +298,11 @@ class PuntoMuestreoFauna(BaseEV_Geo):
     )
 
     CAMPO_LEYENDA: ClassVar[str] = "N_COBERT"
+    GEOMETRIAS_PERMITIDAS: ClassVar[Tuple[str, ...]] = ("Point",)
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        "tipo": "Debe ser Punto (Point), se recibió: {clase}",
+        "vacia": "La geometría no puede estar vacía.",
+    }
 
     # === BLOQUE 1: INFORMACIÓN ADMINISTRATIVA ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20)
@@ -323,17 +338,10 @@ class PuntoMuestreoFauna(BaseEV_Geo):
     COTA: float = Field(...)
     COOR_ESTE: float = Field(...)
     COOR_NORTE: float = Field(...)
-    geometry: Point = Field(...)
+    geometry: Any = Field(...)
 
 
-    _valores_validos: ClassVar[Set[int]] = {
-        int(item.value)
-        for dom in [
-            Dom_CateCober, Dom_SubcatCober, Dom_Clas_Cober,
-            Dom_Subclas_Cober, Dom_Nivel5_Cober, Dom_Nivel6_Cober
-        ]
-        for item in dom
-    }
+    _valores_validos: ClassVar[FrozenSet[int]] = clc_codes()
 
     @field_validator('NOMENCLAT')
     @classmethod
@@ -343,16 +351,6 @@ class PuntoMuestreoFauna(BaseEV_Geo):
             raise ValueError(f"El código {v} no es válido.")
         return v
 
-    @field_validator('geometry')
-    @classmethod
-    def validate_geometry_type(cls, v):
-        """Valida que sea objeto Point."""
-        if not isinstance(v, Point):
-            raise ValueError(f"Debe ser Punto (Point), se recibió: {type(v)}")
-        if v.is_empty:
-            raise ValueError("La geometría no puede estar vacía.")
-        return v
-
 
 class TransectoMuestreoFauna(BaseEV_Geo):
     """
@@ -365,6 +363,13 @@ class TransectoMuestreoFauna(BaseEV_Geo):
     )
 
     CAMPO_LEYENDA: ClassVar[str] = "N_COBERT"
+    GEOMETRIAS_PERMITIDAS: ClassVar[Tuple[str, ...]] = (
+        "LineString", "MultiLineString"
+    )
+    ADMITIR_VACIAS: ClassVar[bool] = True
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        "tipo": "Geometría inválida se recibió: {tipo}"
+    }
 
     # === IDENTIFICACIÓN ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20)
@@ -406,15 +411,6 @@ class TransectoMuestreoFauna(BaseEV_Geo):
 
     # === VALIDACIONES ===
 
-    @field_validator('geometry')
-    @classmethod
-    def validate_geometry(cls, v):
-        """Valida que la geometría sea LineString."""
-        tipo = v.geom_type if hasattr(v, 'geom_type') else str(type(v))
-        if 'LineString' not in tipo:
-             raise ValueError(f"Geometría inválida se recibió: {tipo}")
-        return v
-
     @model_validator(mode='after')
     def validate_elevation_consistency(self):
         """Valida que la cota máxima sea mayor o igual a la mínima."""
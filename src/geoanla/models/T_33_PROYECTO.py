@@ -1,9 +1,8 @@
 from datetime import date
-from typing import Optional, Union
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 
 from pydantic import ConfigDict, Field, field_validator
-from shapely.geometry import LineString, MultiLineString, Polygon, MultiPolygon
 
 
 from geoanla.catalog import Dom_Sector
@@ -38,6 +37,12 @@ class AreaProyecto(BaseEV_Geo):
         populate_by_name=True
     )
 
+    GEOMETRIAS_PERMITIDAS: ClassVar[Tuple[str, ...]] = ("Polygon", "MultiPolygon")
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        "tipo": "Se esperaba un objeto Polygon o MultiPolygon, se recibió {clase}",
+        "vacia": "La geometría del área no puede estar vacía.",
+    }
+
     # === INFORMACIÓN ADMINISTRATIVA ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20, description="Número de expediente asignado por la ANLA")
     NUM_ACT_AD: Optional[str] = Field(None, max_length=20, description="Número de la resolución o acto administrativo")
@@ -57,7 +62,7 @@ class AreaProyecto(BaseEV_Geo):
     AREA_ha: float = Field(..., description="Área en hectáreas (ha) de cada uno de los polígonos")
 
     # === GEOMETRÍA ===
-    geometry: Union[Polygon, MultiPolygon] = Field(...)
+    geometry: Any = Field(...)
 
     # --- VALIDACIONES ---
 
@@ -69,17 +74,6 @@ class AreaProyecto(BaseEV_Geo):
             raise ValueError(f"El área (AREA_ha) debe ser mayor a 0, se recibió {v}")
         return v
 
-    @field_validator('geometry')
-    @classmethod
-    def validate_polygon_geometry(cls, v):
-        """Valida que la geometría sea un Polygon o MultiPolygon válido y no esté vacía."""
-        if not isinstance(v, (Polygon, MultiPolygon)):
-            raise ValueError(f"Se esperaba un objeto Polygon o MultiPolygon, se recibió {type(v)}")
-        
-        if v.is_empty:
-            raise ValueError("La geometría del área no puede estar vacía.")
-            
-        return v
 
 class AreaSolicitadaSustraer(BaseEV_Geo):
     model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
@@ -122,6 +116,16 @@ class LineaProyecto(BaseEV_Geo):
         populate_by_name=True
     )
 
+    GEOMETRIAS_PERMITIDAS: ClassVar[Tuple[str, ...]] = (
+        "LineString", "MultiLineString"
+    )
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        "tipo": (
+            "Se esperaba un objeto LineString o MultiLineString, se recibió {clase}"
+        ),
+        "vacia": "La geometría de la línea no puede estar vacía.",
+    }
+
     # === INFORMACIÓN ADMINISTRATIVA ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20, description="Número de expediente asignado por la ANLA")
     NUM_ACT_AD: Optional[str] = Field(None, max_length=20, description="Número de la resolución o acto administrativo")
@@ -141,7 +145,7 @@ class LineaProyecto(BaseEV_Geo):
     LONGITUD_m: float = Field(..., description="Longitud en metros (m) de cada una de las líneas")
 
     # === GEOMETRÍA ===
-    geometry: Union[LineString, MultiLineString] = Field(...)
+    geometry: Any = Field(...)
 
     # --- VALIDACIONES ---
 
@@ -153,17 +157,6 @@ class LineaProyecto(BaseEV_Geo):
             raise ValueError(f"La longitud (LONGITUD_m) debe ser mayor a 0, se recibió {v}")
         return v
 
-    @field_validator('geometry')
-    @classmethod
-    def validate_line_geometry(cls, v):
-        """Valida que la geometría sea un LineString o MultiLineString válido y no esté vacía."""
-        if not isinstance(v, (LineString, MultiLineString)):
-            raise ValueError(f"Se esperaba un objeto LineString o MultiLineString, se recibió {type(v)}")
-        
-        if v.is_empty:
-            raise ValueError("La geometría de la línea no puede estar vacía.")
-            
-        return v
 
 class Zodmes(BaseEV_Geo):
     model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
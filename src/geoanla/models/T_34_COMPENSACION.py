@@ -1,6 +1,6 @@
 from datetime import date
-from typing import Optional, Any
-from pydantic import Field, ConfigDict, field_validator, model_validator
+from typing import Optional, Any, ClassVar, Dict, Tuple
+from pydantic import Field, ConfigDict, model_validator
 from geoanla.core.base import BaseEV_Geo
 from geoanla.catalog import (
     Dom_CAR,
@@ -22,6 +22,12 @@ class Compens_OTAutorPG(BaseEV_Geo):
         populate_by_name=True
     )
 
+    GEOMETRIAS_PERMITIDAS: ClassVar[Tuple[str, ...]] = ("Polygon", "MultiPolygon")
+    ADMITIR_VACIAS: ClassVar[bool] = True
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        "tipo": "Geometría inválida. Se espera Polígono, se recibió: {tipo}",
+    }
+
     # === INFORMACIÓN ADMINISTRATIVA ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20)
     OPERADOR: str = Field(..., max_length=100)
@@ -55,17 +61,6 @@ class Compens_OTAutorPG(BaseEV_Geo):
     # VALIDACIONES DE NEGOCIO (REGLAS ANLA)
     # ==========================================
 
-    @field_validator('geometry')
-    @classmethod
-    def validate_geometry(cls, v):
-        """Valida que la geometría sea un Polígono o MultiPolígono."""
-        tipo = v.geom_type if hasattr(v, 'geom_type') else str(type(v))
-        if 'Polygon' not in tipo:
-             raise ValueError(
-                 f"Geometría inválida. Se espera Polígono, se recibió: {tipo}"
-             )
-        return v
-
     @model_validator(mode='after')
     def validate_other_activity_condition(self) -> 'Compens_OTAutorPG':
         """
@@ -102,6 +97,12 @@ class OtraCompensacion(BaseEV_Geo):
         populate_by_name=True
     )
 
+    GEOMETRIAS_PERMITIDAS: ClassVar[Tuple[str, ...]] = ("Polygon", "MultiPolygon")
+    ADMITIR_VACIAS: ClassVar[bool] = True
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        "tipo": "Geometría inválida. Se espera Polígono, se recibió: {tipo}",
+    }
+
     # === INFORMACIÓN ADMINISTRATIVA ===
     EXPEDIENTE: Optional[str] = Field(None, max_length=20)
     OPERADOR: str = Field(..., max_length=100)
@@ -145,17 +146,6 @@ class OtraCompensacion(BaseEV_Geo):
     # VALIDACIONES LÓGICAS Y ESPACIALES
     # ==========================================
 
-    @field_validator('geometry')
-    @classmethod
-    def validate_geometry(cls, v):
-        """Asegura que el Feature Class sea exclusivamente tipo Polígono."""
-        tipo = v.geom_type if hasattr(v, 'geom_type') else str(type(v))
-        if 'Polygon' not in tipo:
-             raise ValueError(
-                 f"Geometría inválida. Se espera Polígono, se recibió: {tipo}"
-             )
-        return v
-
     @model_validator(mode='after')
     def validate_other_conditional_fields(self) -> 'OtraCompensacion':
         """
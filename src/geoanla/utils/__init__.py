@@ -1,5 +1,52 @@
-from .geo import batch_elevation_lookup
-from .validators import validate_gdb_layer, cross_validator_entities
-from .search import search_corine_land_cover, search_occurrences_gbif, search_uicn_api, search_cites_api
+from typing import TYPE_CHECKING
 
-__all__ = ["batch_elevation_lookup", "validate_gdb_layer", "cross_validator_entities", "search_corine_land_cover", "search_occurrences_gbif", "search_uicn_api", "search_cites_api"]
+# Cada función se importa de su submódulo en el primer acceso: importar
+# geoanla.utils no carga pyogrio, GeoPandas ni los clientes de las APIs.
+_EXPORTACIONES = {
+    "batch_elevation_lookup": "geo",
+    "validate_gdb_layer": "validators",
+    "validate_gdb_layer_batches": "validators",
+    "cross_validator_entities": "validators",
+    "search_corine_land_cover": "search",
+    "resolve_corine_legends": "search",
+    "search_occurrences_gbif": "search",
+    "search_uicn_api": "search",
+    "search_cites_api": "search",
+}
+
+if TYPE_CHECKING:
+    from .geo import batch_elevation_lookup
+    from .validators import (
+        validate_gdb_layer, validate_gdb_layer_batches, cross_validator_entities
+    )
+    from .search import (
+        search_corine_land_cover, resolve_corine_legends, search_occurrences_gbif,
+        search_uicn_api, search_cites_api,
+    )
+
+
+def __getattr__(nombre):
+    modulo = _EXPORTACIONES.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    from importlib import import_module
+    valor = getattr(import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTACIONES))
+
+
+__all__ = [
+    "batch_elevation_lookup",
+    "validate_gdb_layer",
+    "validate_gdb_layer_batches",
+    "cross_validator_entities",
+    "search_corine_land_cover",
+    "resolve_corine_legends",
+    "search_occurrences_gbif",
+    "search_uicn_api",
+    "search_cites_api",
+]
@@ -1,15 +1,16 @@
-import requests
 import time
-import pandas as pd
-import geopandas as gpd
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
 
 def batch_elevation_lookup(
-    gdf_puntos: gpd.GeoDataFrame,
+    gdf_puntos: "gpd.GeoDataFrame",
     tamano_lote: int = 50,
     tiempo_espera: float = 0.5,
     crs_origen: str = "EPSG:9377"
-) -> gpd.GeoDataFrame:
+) -> "gpd.GeoDataFrame":
     """
     Consulta la API de Open Elevation para obtener la cota (elevación)
     de un GeoDataFrame de puntos.
@@ -23,6 +24,8 @@ def batch_elevation_lookup(
     Returns:
         GeoDataFrame con una nueva columna 'COTA' (o actualizada).
     """
+    import requests
+
     df_copia = gdf_puntos.copy()
 
     # 1. Asegurar CRS y proyectar a WGS84 para la API
@@ -1,56 +1,60 @@
 import os
-import requests
-from dotenv import load_dotenv
-from typing import Optional, Union, List, Dict
-from pygbif import occurrences
-
-# Cargar variables de entorno (por si el usuario tiene un .env local)
-load_dotenv()
-from pygbif import occurrences
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, Union, List, Dict
 
 # Importar los dominios desde el catálogo oficial
-from geoanla.catalog.corineland import (
-    Dom_CateCober,
-    Dom_SubcatCober,
-    Dom_Clas_Cober,
-    Dom_Subclas_Cober,
-    Dom_Nivel5_Cober,
-    Dom_Nivel6_Cober
-)
 from geoanla.catalog.domains import Dom_Amenaza, Dom_Apendice
 
+if TYPE_CHECKING:
+    import polars as pl
+
+# requests, pygbif y python-dotenv se importan en la primera consulta a un
+# servicio: importar geoanla.utils no los carga ni lee el .env. El catálogo
+# CLC y su índice de trigramas (Polars) se cargan en la primera búsqueda.
+
+
+@lru_cache(maxsize=None)
+def _load_environment():
+    """
+    Carga las variables de entorno del .env local (una sola vez, al pedir un
+    token).
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _token(nombre: str) -> Optional[str]:
+    _load_environment()
+    return os.getenv(nombre)
+
 def search_corine_land_cover(
     NOMENCLAT: Optional[Union[int, float]] = None,
-    q: Optional[str] = None
+    q: Optional[str] = None,
+    limite: int = 5,
+    minimo: float = 0.4
 ) -> List[Dict[str, Union[float, str]]]:
     """
-    Busca en el catálogo de Corine Land Cover por código (NOMENCLAT) o por texto (q).
+    Busca en el catálogo de Corine Land Cover por código (NOMENCLAT) o por
+    texto (q).
     
-    :param NOMENCLAT: [int/float] Código numérico de la cobertura (e.g., 111, 311.0).
-    :param q: [str] Palabra clave o frase para buscar en las leyendas.
+    :param NOMENCLAT: [int/float] Código numérico de la cobertura (e.g., 111,
+        311.0).
+    :param q: [str] Palabra clave o frase para buscar en las leyendas (sin
+        importar tildes ni mayúsculas). Un texto vacío o en blanco devuelve
+        todas las leyendas del catálogo.
+    :param limite: [int] Máximo de coincidencias difusas cuando no hay
+        coincidencias directas.
+    :param minimo: [float] Similitud mínima (0..1) de las coincidencias difusas.
     :return: Una lista de diccionarios con las coincidencias encontradas.
     """
-    # Recopilar todos los dominios oficiales
-    dominios = [
-        Dom_CateCober,
-        Dom_SubcatCober,
-        Dom_Clas_Cober,
-        Dom_Subclas_Cober,
-        Dom_Nivel5_Cober,
-        Dom_Nivel6_Cober
-    ]
-    
-    # Crear un diccionario maestro
-    catalogo = {}
-    for dominio in dominios:
-        for item in dominio:
-            if item.description:
-                catalogo[item.value] = item.description
+    # Catálogo e índice de trigramas compartidos del registro de dominios
+    from geoanla.catalog.registry import clc_catalog, clc_legend_index
 
     resultados = []
 
     # 1. Búsqueda por NOMENCLAT exacto
     if NOMENCLAT is not None:
+        catalogo = clc_catalog()
         try:
             codigo = float(NOMENCLAT)
             if codigo in catalogo:
@@ -64,29 +68,84 @@ def search_corine_land_cover(
     
     # 2. Búsqueda por texto (q)
     if q is not None:
-        q_lower = q.lower().strip()
-        
-        # Primero buscar coincidencias parciales directas (substring)
-        for cod, desc in catalogo.items():
-            if q_lower in desc.lower():
-                resultados.append({
-                    "NOMENCLAT": cod,
-                    "leyenda": desc
-                })
-        
-        # Si no hay coincidencias directas, buscar por similitud usando difflib
-        if not resultados:
-            descripciones_inv = {desc: cod for cod, desc in catalogo.items()}
-            # get_close_matches recibe (word, possibilities, n, cutoff)
-            matches = difflib.get_close_matches(q, descripciones_inv.keys(), n=5, cutoff=0.4)
-            for match in matches:
-                resultados.append({
-                    "NOMENCLAT": descripciones_inv[match],
-                    "leyenda": match
-                })
+        indice = clc_legend_index()
+
+        # Primero las coincidencias parciales directas (substring), en orden
+        # del catálogo; la cadena vacía está contenida en todas las leyendas
+        if not q.strip():
+            posiciones = list(range(len(indice)))
+        else:
+            posiciones = indice.contains(q)
+
+        # Si no hay coincidencias directas, las más similares primero
+        if not posiciones:
+            similares = indice.search(q, limite=limite, minimo=minimo)
+            posiciones = [p for p, _ in similares]
+
+        for p in posiciones:
+            resultados.append({
+                "NOMENCLAT": float(indice.codigos[p]),
+                "leyenda": indice.textos[p]
+            })
                 
     return resultados
 
+
+def resolve_corine_legends(valores: Any, minimo: float = 0.6) -> "pl.DataFrame":
+    """
+    Resuelve en una sola llamada los textos de una columna de leyendas
+    (N_COBERT, OBSERV...) contra el catálogo CLC. Cada valor único se busca
+    una sola vez: primero la coincidencia exacta sin importar tildes,
+    mayúsculas ni puntuación y, si no hay, la más similar.
+
+    :param valores: [Serie de Polars o Pandas, lista o arreglo] Textos a
+        resolver.
+    :param minimo: [float] Similitud mínima (0..1) para aceptar una
+        coincidencia difusa.
+    :return: DataFrame de Polars con una fila por texto único: texto,
+        NOMENCLAT, leyenda, puntaje y coincidencia ("exacta", "difusa" o nulo
+        si no se resolvió). Para limpiar una capa basta un join por el
+        texto::
+
+            tabla = resolve_corine_legends(df["N_COBERT"])
+            df = df.join(tabla, left_on="N_COBERT", right_on="texto", how="left")
+    """
+    import polars as pl
+    from geoanla.catalog.registry import clc_legend_index
+
+    indice = clc_legend_index()
+    if isinstance(valores, pl.Series):
+        serie = valores
+    else:
+        serie = pl.Series("texto", valores, strict=False)
+    unicos = (
+        serie.cast(pl.Utf8, strict=False).drop_nulls()
+        .unique(maintain_order=True).to_list()
+    )
+
+    filas = []
+    for texto in unicos:
+        mejor = indice.best(texto, minimo)
+        if mejor is None:
+            filas.append((texto, None, None, None, None))
+            continue
+        posicion, puntaje = mejor
+        tipo = "exacta" if puntaje == 1.0 else "difusa"
+        filas.append((
+            texto, float(indice.codigos[posicion]), indice.textos[posicion],
+            puntaje, tipo,
+        ))
+
+    return pl.DataFrame(
+        filas,
+        schema={
+            "texto": pl.Utf8, "NOMENCLAT": pl.Float64, "leyenda": pl.Utf8,
+            "puntaje": pl.Float64, "coincidencia": pl.Utf8,
+        },
+        orient="row",
+    )
+
+
 def search_occurrences_gbif(nombre_original: Optional[str] = None) -> Dict[str, Optional[str]]:
     """
     Busca la jerarquía taxonómica completa en GBIF a partir del nombre original.
@@ -97,6 +156,8 @@ def search_occurrences_gbif(nombre_original: Optional[str] = None) -> Dict[str,
     if not isinstance(nombre_original, str) or not nombre_original.strip():
         return {"ESPECIE_GBIF": "NO ENCONTRADO"}
         
+    from pygbif import occurrences
+
     try:
         response = occurrences.search(q=nombre_original, limit=1)
 
@@ -144,7 +205,9 @@ def search_uicn_api(nombre_cientifico: Optional[str] = None) -> Dict[str, str]:
     genus = parts[0]
     species = parts[1]
     
-    token = os.getenv("UICN_API_TOKEN")
+    import requests
+
+    token = _token("UICN_API_TOKEN")
     if not token:
         # En vez de romper ejecución masiva, devolvemos error claro.
         return {"SIGLA_UICN_API": "ERROR_TOKEN", "CATEG_UICN": "Sin Token en .env"}
@@ -225,7 +288,9 @@ def search_cites_api(nombre_cientifico: Optional[str] = None) -> Dict[str, str]:
     if not isinstance(nombre_cientifico, str) or not nombre_cientifico.strip():
         return {"SIGLA_CITES_API": "NC", "CATEG_CITES": Dom_Apendice.NO_APLICA.description}
     
-    token = os.getenv("CITES_API_TOKEN")
+    import requests
+
+    token = _token("CITES_API_TOKEN")
     if not token:
         return {"SIGLA_CITES_API": "ERROR_TOKEN", "CATEG_CITES": "Sin Token en .env"}
 
@@ -1,23 +1,42 @@
 import geopandas as gpd
 import numpy as np
 import polars as pl
-from typing import Optional, Dict, Any, Tuple, Type
+import pyarrow as pa
+from pyogrio.errors import DataLayerError, DataSourceError
+from typing import Optional, Dict, Any, Iterator, Tuple, Type
+
+from geoanla.core.frames import COLUMNA_GEOMETRIA, to_geodataframe
+from geoanla.core.instrumentation import measure
+from geoanla.core.triage import relocate_results
+
+# Número de elementos por lote en la lectura en streaming de capas
+TAMANO_LOTE_CAPA = 50_000
 
 
 def validate_gdb_layer(
     clase_modelo: Type,
     ruta_archivo_gdb: str,
-    correcciones_leyenda: Optional[Dict[str, str]] = None
+    correcciones_leyenda: Optional[Dict[str, str]] = None,
+    geopandas: bool = True,
+    almacen: Optional[str] = None
 ) -> Tuple[Any, Any, Any]:
     """
     Validates a geographic or tabular layer from a Geodatabase
     using a provided Pydantic model.
 
+    La capa se lee una sola vez como Arrow y se valida en Polars (geometría
+    en WKB, ver ``core.frames``); solo se convierte a GeoPandas al final si
+    ``geopandas`` es True.
+
     Args:
         clase_modelo (Type): The Pydantic model class to validate against.
         ruta_archivo_gdb (str): Path to the Geodatabase file.
         correcciones_leyenda (Optional[Dict[str, str]]): Dictionary for
             legend corrections.
+        geopandas (bool): Devuelve la capa como GeoDataFrame (si es False,
+            como DataFrame de Polars con la geometría en WKB).
+        almacen (Optional[str]): Archivo SQLite de resultados; en entregas
+            repetidas solo se validan las filas nuevas o modificadas.
 
     Returns:
         Tuple containing detected errors, validated records, and the GDF.
@@ -30,39 +49,167 @@ def validate_gdb_layer(
 
     print(f"➜ Procesando: {nombre_capa}...")
     try:
-        capa_gdb = gpd.read_file(ruta_archivo_gdb, layer=nombre_capa)
-    except (FileNotFoundError, ValueError) as error_lectura:
+        with measure(clase_modelo, "lectura"):
+            capa, crs = read_layer(ruta_archivo_gdb, nombre_capa)
+    except (
+        FileNotFoundError, ValueError, DataSourceError, DataLayerError
+    ) as error_lectura:
         print(f"⚠️ Error leyendo la capa '{nombre_capa}': {error_lectura}")
         return None, None, None
 
+    capa = _prepare_layer(capa, nombre_capa, correcciones_leyenda)
+
+    # Extracción y validación en una sesión propia: la capa no queda en la clase
+    with clase_modelo.session(capa, almacen=almacen) as sesion:
+        sesion.extract()
+        registros, errores = sesion.run()
+
+    print("✅ Completado.\n")
+    return errores, registros, to_geodataframe(capa, crs) if geopandas else capa
+
+
+def read_layer(
+    ruta_archivo_gdb: str, nombre_capa: str
+) -> Tuple[pl.DataFrame, Optional[str]]:
+    """
+    Lee una capa completa a través de Arrow (pyogrio) sin pasar por GeoPandas.
+
+    Returns:
+        Tuple (capa, crs) con los atributos en Polars, la geometría WKB en la
+        columna ``geometry`` y el sistema de referencia de la capa.
+    """
+    from pyogrio import read_arrow
+
+    meta, tabla = read_arrow(ruta_archivo_gdb, layer=nombre_capa)
+    return _arrow_to_polars(tabla, meta), meta.get('crs')
+
+
+def _arrow_to_polars(tabla: Any, meta: Dict[str, Any]) -> pl.DataFrame:
+    """
+    Tabla o lote Arrow de pyogrio -> Polars, con la geometría WKB como
+    ``geometry``.
+    """
+    nombre_geom = meta.get('geometry_name') or 'wkb_geometry'
+    if nombre_geom in tabla.schema.names:
+        wkb = tabla.column(nombre_geom).cast(pa.binary())
+        tabla = tabla.drop_columns([nombre_geom]).append_column(COLUMNA_GEOMETRIA, wkb)
+    return pl.from_arrow(tabla)
+
+
+def _prepare_layer(
+    capa: pl.DataFrame,
+    nombre_capa: str,
+    correcciones_leyenda: Optional[Dict[str, str]] = None
+) -> pl.DataFrame:
+    """
+    Renombra columnas y corrige leyendas (los nulos ya llegan como nulos
+    desde Arrow).
+    """
     # 1. Renombrar columnas
-    capa_gdb = capa_gdb.rename(
-        columns={'AREA_HA': 'AREA_ha', 'LONGITUD_M': 'LONGITUD_m'}
+    capa = capa.rename(
+        {'AREA_HA': 'AREA_ha', 'LONGITUD_M': 'LONGITUD_m'}, strict=False
     )
 
     # 2. Corregir leyendas de cobertura
     if correcciones_leyenda:
-        if 'N_COBERT' in capa_gdb.columns:
-            capa_gdb['N_COBERT'] = capa_gdb['N_COBERT'].replace(
-                correcciones_leyenda
-            )
-
+        columnas = ['N_COBERT']
         # 2.1 Corregir leyendas en OBSERV *solo* para CoberturaTierra
-        if 'OBSERV' in capa_gdb.columns and nombre_capa == 'CoberturaTierra':
-            capa_gdb['OBSERV'] = capa_gdb['OBSERV'].replace(
-                correcciones_leyenda
-            )
+        if nombre_capa == 'CoberturaTierra':
+            columnas.append('OBSERV')
+        capa = capa.with_columns(
+            pl.col(c).replace(correcciones_leyenda)
+            for c in columnas if c in capa.columns
+        )
+    return capa
+
+
+def iter_layer_batches(
+    ruta_archivo_gdb: str,
+    nombre_capa: str,
+    tamano_lote: int = TAMANO_LOTE_CAPA,
+    geopandas: bool = True
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Lee una capa por lotes de tamaño fijo a través del flujo Arrow de pyogrio.
+
+    Solo un lote vive en memoria a la vez; la geometría llega como WKB y se
+    decodifica lote a lote. Con ``geopandas=False`` cada lote se entrega como
+    DataFrame de Polars con la geometría WKB en la columna ``geometry``.
+
+    Yields:
+        Tuple (inicio, lote) con la posición global de la primera fila del
+        lote y el lote como GeoDataFrame (o DataFrame de Polars).
+    """
+    from pyogrio.raw import open_arrow
 
-    # 3. Reemplazar NaN con None
-    cols_atributos = [col for col in capa_gdb.columns if col != 'geometry']
-    capa_gdb[cols_atributos] = capa_gdb[cols_atributos].replace({np.nan: None})
+    inicio = 0
+    with open_arrow(
+        ruta_archivo_gdb, layer=nombre_capa, batch_size=tamano_lote, use_pyarrow=True
+    ) as (meta, lector):
+        for lote_arrow in lector:
+            lote = _arrow_to_polars(pa.Table.from_batches([lote_arrow]), meta)
+            if geopandas:
+                lote = to_geodataframe(lote, meta.get('crs'))
+            yield inicio, lote
+            inicio += len(lote)
 
-    # Extracción y validación
-    extraccion = clase_modelo.extract(capa_gdb)
-    registros, errores = clase_modelo.validate_data()
+
+def validate_gdb_layer_batches(
+    clase_modelo: Type,
+    ruta_archivo_gdb: str,
+    correcciones_leyenda: Optional[Dict[str, str]] = None,
+    tamano_lote: int = TAMANO_LOTE_CAPA,
+    columnar: bool = False,
+    formato_errores: str = "dicts",
+    formato_validos: str = "dicts",
+    almacen: Optional[str] = None
+) -> Iterator[Tuple[Any, Any, int]]:
+    """
+    Validación en streaming de una capa de la Geodatabase.
+
+    Cada lote se lee, se valida en su propia sesión (``clase_modelo.session``)
+    y se entrega antes de leer el siguiente, de modo que la memoria pico
+    queda acotada por ``tamano_lote`` y no por el número de elementos de la
+    capa. Los números de ``Fila``, los identificadores "Registro N" de
+    respaldo y las posiciones de ``formato_validos="indices"`` son de la
+    capa; la máscara de ``"mascara"`` es la del lote.
+
+    Args:
+        clase_modelo (Type): Clase del modelo Pydantic contra la que se valida.
+        ruta_archivo_gdb (str): Ruta a la Geodatabase.
+        correcciones_leyenda (Optional[Dict[str, str]]): Correcciones de leyenda.
+        tamano_lote (int): Número de elementos por lote.
+        columnar (bool): Usa el motor columnar para validar cada lote.
+        formato_errores (str): "dicts" (legado) o "tabla" (``ErrorTable``).
+        formato_validos (str): Ver ``core.columnar.FORMATOS_VALIDOS``.
+        almacen (Optional[str]): Archivo SQLite de resultados; en entregas
+            repetidas solo se validan las filas nuevas o modificadas.
+
+    Yields:
+        Tuple (validos, errores, inicio) por cada lote.
+    """
+    nombre_capa = clase_modelo.__name__
+    print(f"➜ Procesando por lotes: {nombre_capa}...")
+
+    lotes = iter_layer_batches(
+        ruta_archivo_gdb, nombre_capa, tamano_lote, geopandas=False
+    )
+    for inicio, lote in lotes:
+        print(f"   Procesando lote {inicio} a {inicio + len(lote)}...")
+        lote = _prepare_layer(lote, nombre_capa, correcciones_leyenda)
+        with clase_modelo.session(
+            lote, verbose=False, columnar=columnar, formato_errores=formato_errores,
+            formato_validos=formato_validos, almacen=almacen,
+        ) as sesion:
+            validos, errores = sesion.run()
+        # Fila, "Registro N" e índices pasan de la posición en el lote a la de la capa
+        posiciones = np.arange(inicio, inicio + len(lote))
+        modo = "posiciones" if formato_validos == "indices" else "dicts"
+        validos, errores = relocate_results(validos, errores, posiciones, 0, modo)
+        del lote
+        yield validos, errores, inicio
 
     print("✅ Completado.\n")
-    return errores, registros, capa_gdb
 
 
 # 1. Diccionario de Relaciones Directas (Padre -> Hijos)
@@ -0,0 +1,121 @@
+"""Caché en disco de planes, índices y mapas de dominios (``core.cache``)."""
+import pickle
+
+import pytest
+
+from benchmarks.synthetic import find_model, generate_layer, model_catalog
+from geoanla.catalog.registry import EnumIndex, get_enum_index
+from geoanla.core import cache, columnar
+from geoanla.core.columnar import (
+    _compile_plan, _plan_from_spec, compile_plan, invalidate_plan, plan_spec,
+)
+
+
+@pytest.fixture
+def carpeta(tmp_path):
+    anterior = cache.cache_dir()
+    cache.set_cache_dir(tmp_path)
+    yield tmp_path
+    cache.set_cache_dir(anterior)
+
+
+def _functions(plan):
+    """Qué funciones tiene el plan (no son comparables entre compilaciones)."""
+    return (
+        [(r.modelo_campo is None, r.validador_lote is None) for r in plan.reglas],
+        list(plan.validadores_instancia),
+        list(plan.validadores_columnares),
+    )
+
+
+def test_cached_parts_match_a_fresh_compile(carpeta):
+    modelos = list(model_catalog().values())
+    ruta = cache.build_plan_cache(modelos)
+    assert ruta.parent == carpeta
+    assert list(carpeta.iterdir()) == [ruta]
+
+    cache.set_cache_dir(carpeta)
+    for modelo in modelos:
+        spec = cache.load_cached("planes", modelo)
+        assert spec is not None, modelo.__name__
+        fresco = _compile_plan(modelo)
+        guardado = _plan_from_spec(modelo, spec)
+        assert plan_spec(guardado) == plan_spec(fresco)
+        assert _functions(guardado)[0] == _functions(fresco)[0]
+
+        dominios = cache.load_cached("dominios", modelo)
+        assert dominios == modelo._annotated_domains()
+        for clase_enum in dominios.values():
+            estado = cache.load_cached("indices", clase_enum)
+            indice, nuevo = EnumIndex(clase_enum, estado), EnumIndex(clase_enum)
+            assert indice.state() == nuevo.state()
+            assert indice.por_valor == nuevo.por_valor
+            assert indice.valores == nuevo.valores
+
+
+@pytest.mark.parametrize("nombre", ["CoberturaTierra", "PuntoMuestreoFauna"])
+def test_validation_from_cache_matches(carpeta, nombre):
+    modelo = find_model(nombre)
+    capa = generate_layer(modelo, 120, fraccion_invalida=0.3, semilla=4)
+    invalidate_plan(modelo)
+    esperados = modelo.session(capa, verbose=False).run()
+    fresco = compile_plan(modelo)
+
+    cache.build_plan_cache([modelo])
+    cache.set_cache_dir(carpeta)
+    columnar._PLANES.pop(modelo)
+    guardado = compile_plan(modelo)
+    assert guardado is not fresco
+    assert _functions(guardado) == _functions(fresco)
+
+    validos, errores = modelo.session(capa, verbose=False).run()
+    assert validos == esperados[0]
+    assert errores == esperados[1]
+    invalidate_plan(modelo)
+
+
+def test_other_versions_are_ignored(carpeta, monkeypatch):
+    modelo = find_model("CoberturaTierra")
+    ruta = cache.build_plan_cache([modelo])
+    assert cache.load_cached("planes", modelo) is not None
+
+    # Un archivo con el nombre de la versión actual pero otra versión dentro
+    with open(ruta, "rb") as archivo:
+        contenido = pickle.load(archivo)
+    contenido["version"] = "otra"
+    with open(ruta, "wb") as archivo:
+        pickle.dump(contenido, archivo)
+    cache.set_cache_dir(carpeta)
+    assert cache.load_cached("planes", modelo) is None
+
+    # Al cambiar la versión cambia el archivo: el anterior se reemplaza
+    cache.build_plan_cache([modelo])
+    monkeypatch.setattr(cache, "_version", "f" * 64)
+    cache.set_cache_dir(carpeta)
+    assert cache.load_cached("planes", modelo) is None
+    nueva = cache.build_plan_cache([modelo])
+    assert nueva != ruta and list(carpeta.iterdir()) == [nueva]
+
+
+def test_damaged_or_disabled_cache_compiles_as_usual(carpeta):
+    modelo = find_model("CoberturaTierra")
+    ruta = cache.build_plan_cache([modelo])
+    ruta.write_bytes(b"no es un pickle")
+    cache.set_cache_dir(carpeta)
+    assert cache.load_cached("planes", modelo) is None
+
+    cache.set_cache_dir(None)
+    assert cache.cache_path() is None
+    assert cache.build_plan_cache([modelo]) is None
+    for clase_enum in modelo._annotated_domains().values():
+        assert cache.load_cached("indices", clase_enum) is None
+        assert get_enum_index(clase_enum).valores
+
+
+def test_invalidate_plan_drops_the_cached_entry(carpeta):
+    modelo = find_model("CoberturaTierra")
+    cache.build_plan_cache([modelo])
+    invalidate_plan(modelo)
+    assert cache.load_cached("planes", modelo) is None
+    assert cache.load_cached("dominios", modelo) is not None
+    assert compile_plan(modelo).reglas
@@ -0,0 +1,136 @@
+"""Equivalencia entre el motor columnar y la validación fila a fila de Pydantic."""
+from typing import Optional
+
+import geopandas as gpd
+import numpy as np
+import polars as pl
+import pytest
+from pydantic import ConfigDict, Field
+
+from benchmarks.synthetic import generate_layer, model_catalog
+from geoanla.catalog.domains import Dom_Dieta
+from geoanla.core.base import BaseEV
+from geoanla.core.columnar import validate_frame, validate_lazy
+
+
+def _por_fila(errores: list) -> list:
+    return sorted(errores, key=lambda e: e["Fila"])
+
+
+def assert_equivalent(modelo, df: pl.DataFrame, offset: int = 0):
+    """Mismos válidos y mismos errores (en cualquier orden) por ambos caminos."""
+    esperado = modelo._validate_rows(df, offset)
+    obtenido = validate_frame(modelo, df, offset)
+    assert obtenido[0] == esperado[0]
+    assert _por_fila(obtenido[1]) == _por_fila(esperado[1])
+    return esperado
+
+
+def _synthetic(nombre: str) -> pl.DataFrame:
+    modelo = model_catalog()[nombre]
+    return generate_layer(modelo, 40, fraccion_invalida=0.25, semilla=0)
+
+
+# Modelos con columnas: cubren validadores de campo (únicos + join), leyendas
+# CLC, geometrías (tipo y vacías) y los validadores de modelo
+MODELOS = sorted(n for n, m in model_catalog().items() if m.model_fields)
+
+
+@pytest.mark.parametrize("nombre", MODELOS)
+def test_synthetic_layer_matches_pydantic(nombre):
+    assert_equivalent(model_catalog()[nombre], _synthetic(nombre), offset=2)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize(
+    "nombre", ["CoberturaTierra", "PuntoMuestreoFlora", "AreaProyecto"]
+)
+def test_lazy_batches_match_single_pass(nombre, columnar):
+    modelo, capa = model_catalog()[nombre], _synthetic(nombre)
+    esperado = modelo._validate_rows(capa, 2)
+    # Lotes pequeños y de tamaño que no divide la capa
+    obtenido = validate_lazy(modelo, capa.lazy(), 2, columnar=columnar, tamano_lote=7)
+    assert obtenido[0] == esperado[0]
+    assert _por_fila(obtenido[1]) == _por_fila(esperado[1])
+
+
+class Dieta(BaseEV):
+    model_config = ConfigDict(use_enum_values=True)
+    DIETA: Optional[Dom_Dieta] = None
+
+
+@pytest.mark.parametrize("valores", [
+    pytest.param(
+        ["401", " 402 ", "401.0", "401.00", "4_01", "+403", "00401", "\t405\n"],
+        id="enteros",
+    ),
+    pytest.param(
+        ["99999999999999999999999", "9" * 400, "9223372036854775808",
+         "-9223372036854775809", "99999999999999999999999.00"],
+        id="fuera-de-rango",
+    ),
+    pytest.param(
+        ["401.", "1e0", "401.5", "abc", "", "inf", "nan", "-0", "4__01", "_401",
+         "９", "٤٠١"],
+        id="no-enteros",
+    ),
+])
+def test_integer_enum_text_matches_pydantic(valores):
+    df = pl.DataFrame({"DIETA": valores + [None]})
+    assert_equivalent(Dieta, df)
+
+
+class Codigo(BaseEV):
+    CODIGO: Optional[str] = Field(None, min_length=2, max_length=4)
+
+
+@pytest.mark.parametrize("valores", [
+    pytest.param([1, 12345, None], id="enteros"),
+    pytest.param([1.5, None, 2.0], id="flotantes"),
+    pytest.param([True, None, False], id="booleanos"),
+])
+def test_length_limits_on_non_text_columns(valores):
+    # Con otro tipo de columna no se mide la longitud: solo hay error de tipo
+    errores = assert_equivalent(Codigo, pl.DataFrame({"CODIGO": valores}))[1]
+    assert {e["CODIGO"] for e in errores} == {"Input should be a valid string"}
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize(
+    "nombre", ["CoberturaTierra", "PuntoMuestreoFlora", "MuestreoFaunaResultadosTB"]
+)
+def test_valid_row_formats_select_the_dict_rows(nombre, columnar):
+    modelo = model_catalog()[nombre]
+    capa = generate_layer(modelo, 50, fraccion_invalida=0.4, semilla=5)
+
+    def validos(formato):
+        return modelo.session(
+            capa, verbose=False, columnar=columnar, formato_validos=formato
+        ).run()[0]
+
+    dicts, indices = validos("dicts"), validos("indices")
+    assert 0 < len(indices) < capa.height
+    # Las posiciones son exactamente las filas que dan esos diccionarios
+    filas = capa[indices.tolist()]
+    assert modelo.session(filas, verbose=False).run() == (dicts, [])
+    mascara = validos("mascara")
+    assert mascara.dtype == np.bool_ and len(mascara) == capa.height
+    assert np.flatnonzero(mascara).tolist() == indices.tolist()
+
+    tabla = validos("polars")
+    assert tabla.columns == list(dicts[0])
+    campos = [c for c in tabla.columns if c != "geometry"]
+    assert tabla.select(campos).to_dicts() == [
+        {c: d[c] for c in campos} for d in dicts
+    ]
+    if "geometry" not in modelo.model_fields:
+        return
+    assert tabla["geometry"].to_list() == capa["geometry"][indices.tolist()].to_list()
+    capa_geo = validos("geodataframe")
+    assert capa_geo.geometry.geom_equals(
+        gpd.GeoSeries([d["geometry"] for d in dicts])
+    ).all()
+    # Los atributos son los de la tabla de Polars, pasados a Pandas
+    assert capa_geo.drop(columns="geometry").equals(
+        tabla.select(campos).to_pandas()
+    )
@@ -0,0 +1,96 @@
+"""Tabla de errores: plantillas internadas y valores en su propia columna."""
+import polars as pl
+import pytest
+
+from geoanla.core.errors import MARCA_VALOR, ErrorTable, render_message, split_message
+
+
+def _mensaje(codigo) -> str:
+    return f"Value error, El código {codigo} no es una cobertura válida CLC."
+
+
+def test_add_interns_template_and_keeps_value():
+    tabla = ErrorTable()
+    for fila, codigo in enumerate([999, 998, 999, 7]):
+        tabla.add(
+            fila, f"Registro {fila}", "NOMENCLAT", "value_error",
+            _mensaje(codigo), codigo,
+        )
+    tabla.add(4, "Registro 4", "N1_COBERT", "enum", "Input should be 1 or 2", "abc")
+
+    assert tabla.messages.get_column("message").to_list() == [
+        _mensaje(MARCA_VALOR), "Input should be 1 or 2"
+    ]
+    valores = tabla.to_polars().get_column("value").to_list()
+    assert valores == ["999", "998", "999", "7", None]
+    mensajes = tabla.to_polars(con_mensajes=True).get_column("message").to_list()
+    assert mensajes == [
+        _mensaje(999), _mensaje(998), _mensaje(999), _mensaje(7),
+        "Input should be 1 or 2",
+    ]
+
+
+def test_append_frame_matches_add():
+    codigos = [999, 998, None, 5]
+    mensajes = [
+        _mensaje(999), _mensaje(998), "Field required", f"literal {MARCA_VALOR} 5"
+    ]
+    por_fila = ErrorTable()
+    for fila, (codigo, mensaje) in enumerate(zip(codigos, mensajes)):
+        por_fila.add(fila, "id", "NOMENCLAT", "value_error", mensaje, codigo)
+    bloque = ErrorTable()
+    bloque.append_frame(pl.DataFrame({
+        "row": range(4), "id": ["id"] * 4, "field": ["NOMENCLAT"] * 4,
+        "error_code": ["value_error"] * 4, "message": mensajes,
+        "value": [None if c is None else str(c) for c in codigos],
+    }))
+
+    assert bloque.to_records() == por_fila.to_records()
+    assert bloque.messages.equals(por_fila.messages)
+    unidas = ErrorTable.concat([por_fila, bloque])
+    assert unidas.messages.height == por_fila.messages.height
+
+
+@pytest.mark.parametrize("mensaje, valor, plantilla", [
+    # Mensajes de Pydantic: el valor nunca se separa
+    ("Input should be a valid string", "a", "Input should be a valid string"),
+    ("Input should be greater than 0", 0, "Input should be greater than 0"),
+    # Validadores propios: solo la palabra completa
+    ("Value error, Valor fuera de rango: 1 (máximo 10)", "1",
+     f"Value error, Valor fuera de rango: {MARCA_VALOR} (máximo 10)"),
+    ("Value error, Se recibió 7 en 7.5", 7,
+     f"Value error, Se recibió {MARCA_VALOR} en 7.5"),
+    ("Value error, Se recibió 1.0", 1, "Value error, Se recibió 1.0"),
+    ("Value error, La clase a no existe", "a",
+     f"Value error, La clase {MARCA_VALOR} no existe"),
+    # Ambiguo: el valor también es parte fija del mensaje
+    ("Value error, Debe ser mayor a 0, se recibió 0", 0,
+     "Value error, Debe ser mayor a 0, se recibió 0"),
+    ("Value error, La clase a no existe", "á", "Value error, La clase a no existe"),
+    ("Value error, Código '-3' inválido", -3,
+     f"Value error, Código '{MARCA_VALOR}' inválido"),
+    ("Value error, Sin valor", " ", "Value error, Sin valor"),
+])
+def test_split_message_only_replaces_whole_values(mensaje, valor, plantilla):
+    obtenida, texto = split_message(mensaje, valor)
+    assert obtenida == plantilla
+    assert texto == (None if plantilla == mensaje else str(valor))
+    assert render_message(obtenida, texto) == mensaje
+
+
+def test_same_rule_shares_one_template_for_short_values():
+    tabla = ErrorTable()
+    valores = ["2", "a", "7", "1", "a"]
+    for fila, valor in enumerate(valores):
+        tabla.add(
+            fila, "id", "CLASE", "value_error",
+            f"Value error, La clase {valor} no existe (1 de 10)", valor,
+        )
+    assert tabla.messages.get_column("message").to_list() == [
+        f"Value error, La clase {MARCA_VALOR} no existe (1 de 10)",
+        "Value error, La clase 1 no existe (1 de 10)",
+    ]
+    mensajes = tabla.to_polars(con_mensajes=True).get_column("message").to_list()
+    assert mensajes == [
+        f"Value error, La clase {v} no existe (1 de 10)" for v in valores
+    ]
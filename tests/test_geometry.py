@@ -0,0 +1,188 @@
+"""Revisión de tipo, vacío y topología de las geometrías (``core.geometry``)."""
+from typing import ClassVar, Dict
+
+import polars as pl
+import pytest
+import shapely
+from pydantic import ValidationError
+from shapely.geometry import LineString, Point, Polygon
+
+from benchmarks.synthetic import find_model, generate_layer
+from geoanla.core.frames import decode_geometry
+from geoanla.core.geometry import geometry_errors
+from geoanla.models.T_33_PROYECTO import AreaProyecto
+
+CUADRADO = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+# Polígono en "corbatín": bien tipado y no vacío, pero se cruza a sí mismo
+CORBATIN = Polygon([(0, 0), (2, 2), (2, 0), (0, 2)])
+LINEA = LineString([(0, 0), (1, 1)])
+PUNTO = Point(0, 0)
+AUTOINTERSECCION = "Geometría no válida: Self-intersection[1 1]"
+
+
+class AreaProyectoTopologica(AreaProyecto):
+    VALIDAR_TOPOLOGIA: ClassVar[bool] = True
+
+
+class AreaProyectoTopologicaPropia(AreaProyecto):
+    VALIDAR_TOPOLOGIA: ClassVar[bool] = True
+    MENSAJES_GEOMETRIA: ClassVar[Dict[str, str]] = {
+        **AreaProyecto.MENSAJES_GEOMETRIA,
+        "topologia": "El área se cruza a sí misma ({razon})",
+    }
+
+
+def test_default_messages():
+    errores = geometry_errors(
+        [CUADRADO, PUNTO, Polygon(), CORBATIN, "texto", None],
+        ("Polygon", "MultiPolygon"),
+    )
+    assert errores == [
+        None,
+        "Geometría inválida. Se espera Polygon o MultiPolygon, se recibió: Point",
+        "La geometría está vacía.",
+        None,
+        "Se requiere geometría Polygon o MultiPolygon, se recibió <class 'str'>",
+        "Se requiere geometría Polygon o MultiPolygon, se recibió "
+        "<class 'NoneType'>",
+    ]
+
+
+def test_topology_and_empty_options():
+    geometrias = [CUADRADO, CORBATIN, Polygon()]
+    assert geometry_errors(
+        geometrias, ("Polygon",), validar_topologia=True
+    ) == [None, AUTOINTERSECCION, "La geometría está vacía."]
+    # Una vacía admitida no se revisa topológicamente
+    assert geometry_errors(
+        geometrias, ("Polygon",), validar_topologia=True, admitir_vacias=True
+    ) == [None, AUTOINTERSECCION, None]
+
+
+def test_without_allowed_types_nothing_is_checked():
+    assert geometry_errors([PUNTO, "texto", Polygon()], None) == [None] * 3
+    assert geometry_errors([], ("Point",)) == []
+
+
+def test_custom_messages():
+    mensajes = {
+        "tipo": "{tipo} no es {permitidas} ({clase.__name__})",
+        "vacia": "vacía",
+        "topologia": "topología: {razon}",
+    }
+    errores = geometry_errors(
+        [LINEA, 7, Polygon(), CORBATIN], ("Polygon",),
+        validar_topologia=True, mensajes=mensajes,
+    )
+    assert errores == [
+        "LineString no es Polygon (LineString)",
+        "<class 'int'> no es Polygon (int)",
+        "vacía",
+        "topología: Self-intersection[1 1]",
+    ]
+
+
+# Mensaje de cada fila con: tipo equivocado, vacía, "corbatín" o su
+# equivalente no válido y una geometría correcta. Sin topología activa en
+# ningún modelo del paquete, la geometría no válida pasa.
+CASOS = {
+    "AreaProyecto": (
+        [PUNTO, Polygon(), CORBATIN, CUADRADO],
+        [
+            "Value error, Se esperaba un objeto Polygon o MultiPolygon, se "
+            "recibió <class 'shapely.geometry.point.Point'>",
+            "Value error, La geometría del área no puede estar vacía.",
+            None,
+            None,
+        ],
+    ),
+    "OtraCompensacion": (
+        [PUNTO, Polygon(), CORBATIN, CUADRADO],
+        [
+            "Value error, Geometría inválida. Se espera Polígono, se recibió: "
+            "Point",
+            None,
+            None,
+            None,
+        ],
+    ),
+    "LineaProyecto": (
+        [PUNTO, LineString(), LineString([(0, 0), (0, 0)]), LINEA],
+        [
+            "Value error, Se esperaba un objeto LineString o MultiLineString, "
+            "se recibió <class 'shapely.geometry.point.Point'>",
+            "Value error, La geometría de la línea no puede estar vacía.",
+            None,
+            None,
+        ],
+    ),
+    "TransectoMuestreoFauna": (
+        [PUNTO, LineString(), LINEA],
+        ["Value error, Geometría inválida se recibió: Point", None, None],
+    ),
+    "PuntoMuestreoFlora": (
+        [LINEA, Point(), PUNTO],
+        [
+            "Value error, Se requiere objeto Point, se recibió "
+            "<class 'shapely.geometry.linestring.LineString'>",
+            "Value error, La geometría está vacía.",
+            None,
+        ],
+    ),
+    "PuntoMuestreoVeda": (
+        [CUADRADO, Point(), PUNTO],
+        [
+            "Value error, Se requiere Point, se recibió "
+            "<class 'shapely.geometry.polygon.Polygon'>",
+            "Value error, La geometría de la veda no puede estar vacía.",
+            None,
+        ],
+    ),
+}
+
+
+def _geometry_messages(modelo, geometrias, columnar):
+    capa = generate_layer(modelo, len(geometrias), semilla=0).with_columns(
+        geometry=pl.Series(shapely.to_wkb(geometrias))
+    )
+    _, errores = modelo.session(capa, verbose=False, columnar=columnar).run()
+    por_fila = {e["Fila"]: e.get("geometry") for e in errores}
+    return [por_fila.get(i) for i in range(len(geometrias))]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("nombre", sorted(CASOS))
+def test_model_messages(nombre, columnar):
+    geometrias, esperados = CASOS[nombre]
+    modelo = find_model(nombre)
+    assert _geometry_messages(modelo, geometrias, columnar) == esperados
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("modelo, mensaje", [
+    (AreaProyectoTopologica, AUTOINTERSECCION),
+    (AreaProyectoTopologicaPropia, "El área se cruza a sí misma "
+                                   "(Self-intersection[1 1])"),
+])
+def test_topology_when_the_model_enables_it(modelo, mensaje, columnar):
+    geometrias = [CORBATIN, Polygon(), CUADRADO]
+    assert _geometry_messages(modelo, geometrias, columnar) == [
+        f"Value error, {mensaje}",
+        "Value error, La geometría del área no puede estar vacía.",
+        None,
+    ]
+
+
+@pytest.mark.parametrize("nombre", ["AreaProyecto", "PuntoMuestreoFlora"])
+def test_non_geometry_input_reports_the_model_message(nombre):
+    # La anotación es Any: un valor que no es geometría llega al validador
+    # del modelo en lugar de fallar con el ``is_instance_of`` de Pydantic
+    modelo = find_model(nombre)
+    fila = decode_geometry(generate_layer(modelo, 1, semilla=0)).row(0, named=True)
+    with pytest.raises(ValidationError) as error:
+        modelo.model_validate({**fila, "geometry": "texto"})
+
+    errores = [e for e in error.value.errors() if e["loc"] == ("geometry",)]
+    assert [e["type"] for e in errores] == ["value_error"]
+    assert errores[0]["msg"] == "Value error, " + modelo.geometry_errors(["texto"])[0]
+    assert "<class 'str'>" in errores[0]["msg"]
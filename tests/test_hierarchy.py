@@ -0,0 +1,125 @@
+"""Árbol CLC precalculado (``catalog.hierarchy.ClcTree``)."""
+import numpy as np
+import polars as pl
+import pytest
+
+from geoanla.catalog.corineland import DOMINIOS_CLC
+from geoanla.catalog.hierarchy import clc_tree
+
+ARBOL = clc_tree()
+CODIGOS = sorted(ARBOL.niveles)
+# Valores que no son un código del árbol
+DESCONOCIDOS = [99, 0, -3, 311.5, float("nan"), None, "abc", "311x"]
+
+
+def _prefix_parent(codigo):
+    """Padre por definición: el código un dígito más corto, un nivel arriba."""
+    nivel = ARBOL.niveles[codigo]
+    padre = codigo // 10
+    return padre if ARBOL.niveles.get(padre) == nivel - 1 else None
+
+
+def test_tree_covers_the_six_domains():
+    esperados = {int(m.value) for dominio in DOMINIOS_CLC for m in dominio}
+    assert set(CODIGOS) == esperados
+    assert {ARBOL.level(c) for c in CODIGOS} == {1, 2, 3, 4, 5, 6}
+
+
+def test_scalar_queries_match_their_definition():
+    for codigo in CODIGOS:
+        padre = _prefix_parent(codigo)
+        assert ARBOL.parent(codigo) == padre
+        cadena = []
+        while padre is not None:
+            cadena.insert(0, padre)
+            padre = _prefix_parent(padre)
+        assert ARBOL.ancestors(codigo) == tuple(cadena)
+
+        debajo = [c for c in CODIGOS if codigo in ARBOL.ancestors(c)]
+        assert sorted(ARBOL.descendants(codigo)) == debajo
+        assert all(ARBOL.is_ancestor(codigo, c) for c in debajo)
+        assert ARBOL.children(codigo) == tuple(
+            c for c in ARBOL.descendants(codigo) if ARBOL.parent(c) == codigo
+        )
+
+
+def test_known_branch():
+    assert ARBOL.parent(311121) == 31112
+    assert ARBOL.ancestors(311121) == (3, 31, 311, 3111, 31112)
+    assert ARBOL.ancestors(3) == () and ARBOL.parent(3) is None
+    assert ARBOL.children(3) == (31, 32, 33)
+    # Preorden: cada código seguido de su rama completa
+    assert ARBOL.descendants(311) == (
+        3111, 31111, 31112, 311121, 311122, 311123, 3112, 31121, 31122
+    )
+    assert ARBOL.descendants(311121) == ()
+    # Entero, decimal entero, texto y miembro Enum son el mismo código
+    miembro = next(m for m in DOMINIOS_CLC[2] if int(m.value) == 311)
+    for codigo in (311, 311.0, "311", " 311 ", miembro):
+        assert ARBOL.parent(codigo) == 31
+        assert codigo in ARBOL
+
+
+@pytest.mark.parametrize("codigo", DESCONOCIDOS)
+def test_unknown_codes(codigo):
+    assert codigo not in ARBOL
+    assert ARBOL.level(codigo) is None
+    assert ARBOL.parent(codigo) is None
+    assert ARBOL.ancestors(codigo) == ()
+    assert ARBOL.children(codigo) == ()
+    assert ARBOL.descendants(codigo) == ()
+    assert not ARBOL.is_ancestor(codigo, 311)
+    assert not ARBOL.is_ancestor(3, codigo)
+
+
+def test_vectorized_queries_match_the_scalar_ones():
+    valores = CODIGOS + [99, 0, 311.5, float("nan"), None]
+    niveles = ARBOL.levels(valores)
+    padres = ARBOL.parents(valores)
+    linaje = ARBOL.lineage(valores)
+    for i, codigo in enumerate(valores):
+        nivel = ARBOL.level(codigo)
+        assert niveles[i] == (nivel or 0)
+        padre = ARBOL.parent(codigo)
+        assert np.isnan(padres[i]) if padre is None else padres[i] == padre
+        cadena = ARBOL.ancestors(codigo) + ((codigo,) if nivel else ())
+        for k in range(1, 7):
+            agregado = ARBOL.rollup([codigo], k)[0]
+            esperado = cadena[k - 1] if k <= len(cadena) else None
+            if esperado is None:
+                assert np.isnan(agregado) and np.isnan(linaje[i, k - 1])
+            else:
+                assert agregado == linaje[i, k - 1] == esperado
+
+
+def test_rollup_and_descendants_of_a_column():
+    columna = pl.Series([311121, 311, 31, 3, None, 99, 32, 311.0], dtype=pl.Float64)
+    agregado = ARBOL.rollup(columna, 2)
+    # El nivel 1 es menos detallado que el 2: queda NaN, como nulos y desconocidos
+    assert np.isnan(agregado[3:6]).all()
+    assert np.delete(agregado, [3, 4, 5]).tolist() == [31, 31, 31, 32, 31]
+
+    assert ARBOL.is_descendant(columna, 31).tolist() == [
+        True, True, False, False, False, False, False, True
+    ]
+    assert ARBOL.is_descendant(columna, 3).tolist() == [
+        True, True, True, False, False, False, True, True
+    ]
+    # Con un ancestro desconocido o nulo ninguna fila cae debajo
+    for ancestro in (99, float("nan"), None):
+        assert not ARBOL.is_descendant(columna, ancestro).any()
+    for ancestro in CODIGOS[::7]:
+        esperado = [ARBOL.is_ancestor(ancestro, c) for c in CODIGOS]
+        assert ARBOL.is_descendant(CODIGOS, ancestro).tolist() == esperado
+
+
+def test_frame_matches_the_tree():
+    tabla = ARBOL.frame()
+    assert tabla.height == len(ARBOL)
+    fila = tabla.filter(pl.col("NOMENCLAT") == 311121).row(0, named=True)
+    assert fila == {
+        "NOMENCLAT": 311121, "NIVEL": 6, "PADRE": 31112, "N1_COBERT": 3,
+        "N2_COBERT": 31, "N3_COBERT": 311, "N4_COBERT": 3111,
+        "N5_COBERT": 31112, "N6_COBERT": 311121,
+    }
+    assert tabla.filter(pl.col("NIVEL") == 1)["PADRE"].null_count() == 5
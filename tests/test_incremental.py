@@ -0,0 +1,65 @@
+"""Revalidación incremental (``core.incremental``)."""
+import sys
+
+import polars as pl
+import pytest
+
+from benchmarks.synthetic import find_model, generate_layer
+from geoanla.core import incremental
+from geoanla.core.incremental import model_version
+
+
+@pytest.fixture
+def modelo():
+    model_version.cache_clear()
+    yield find_model("CoberturaTierra")
+    model_version.cache_clear()
+
+
+def test_model_version_follows_engine_version(modelo, monkeypatch):
+    anterior = model_version(modelo)
+    monkeypatch.setattr(incremental, "VERSION_MOTOR", incremental.VERSION_MOTOR + 1)
+    model_version.cache_clear()
+    assert model_version(modelo) != anterior
+
+
+@pytest.mark.parametrize("nombre", incremental.MODULOS_MOTOR)
+def test_model_version_follows_engine_modules(modelo, monkeypatch, tmp_path, nombre):
+    anterior = model_version(modelo)
+    modulo = sys.modules[nombre]
+    editado = tmp_path / "editado.py"
+    editado.write_bytes(open(modulo.__file__, "rb").read() + b"\n# regla editada\n")
+    monkeypatch.setattr(modulo, "__file__", str(editado))
+    model_version.cache_clear()
+    assert model_version(modelo) != anterior
+
+
+def _records(resultado):
+    validos, errores = resultado
+    errores = errores.to_records() if hasattr(errores, "to_records") else errores
+    return validos, errores
+
+
+@pytest.mark.parametrize("formato_errores", ["dicts", "tabla"])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_incremental_runs_match_full_runs(modelo, tmp_path, columnar, formato_errores):
+    capa = generate_layer(modelo, 60, fraccion_invalida=0.25, semilla=0)
+    opciones = dict(
+        verbose=False, offset=2, columnar=columnar, formato_errores=formato_errores
+    )
+    almacen = str(tmp_path / "resultados.sqlite")
+    # Tercera pasada: una de cada siete filas pierde su código
+    editada = capa.with_columns(
+        pl.when(pl.int_range(pl.len()) % 7 == 0)
+        .then(None)
+        .otherwise(pl.col("NOMENCLAT"))
+        .alias("NOMENCLAT")
+    )
+
+    for entrada, reutilizados in [(capa, 0), (capa, capa.height), (editada, None)]:
+        completa = modelo.session(entrada, **opciones).run()
+        sesion = modelo.session(entrada, almacen=almacen, **opciones)
+        assert _records(sesion.run()) == _records(completa)
+        if reutilizados is not None:
+            assert sesion.metricas.reutilizados == reutilizados
+    assert 0 < sesion.metricas.reutilizados < capa.height
@@ -0,0 +1,26 @@
+"""Fases registradas por ``core.instrumentation`` durante una sesión."""
+import pytest
+
+from benchmarks.synthetic import find_model, generate_layer
+from geoanla.core.instrumentation import TIPO_FASE
+
+
+@pytest.fixture
+def modelo():
+    modelo = find_model("CoberturaTierra")
+    yield modelo
+    modelo.disable_instrumentation()
+
+
+@pytest.mark.parametrize("columnar, volcado", [
+    (False, "pydantic.volcado"),
+    (True, "columnar.volcado"),
+])
+def test_each_phase_has_its_own_name(modelo, columnar, volcado):
+    capa = generate_layer(modelo, 50, fraccion_invalida=0.2, semilla=0)
+    medicion = modelo.enable_instrumentation()
+    modelo.session(capa, columnar=columnar).run()
+
+    fases = {s.nombre for s in medicion.stats() if s.tipo == TIPO_FASE}
+    assert {"validacion", "formato", volcado} <= fases
+    assert "volcado" not in fases
@@ -0,0 +1,50 @@
+"""Gemelo vectorizado de ``validate_legend_nomenclature`` frente al de fila."""
+import polars as pl
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from geoanla.models.T_20_BIOTICO_CONTI_COSTE import CoberturaTierra
+
+CAMPO = CoberturaTierra.CAMPO_LEYENDA
+TEXTOS = ["Tejido urbano continuo", "otra cosa", " bosque denso ", None, "x", "x", "x"]
+CODIGOS = {
+    "texto": pl.Series(["111", " 111 ", "111.0", "3_11", "abc", None, "311"]),
+    "decimal": pl.Series([111.0, 111.0, 111.5, float("nan"), 311.0, None, 3.0]),
+    "entero": pl.Series([111, 111, 311, 311, 3, None, 999]),
+}
+
+
+def _row_messages(codigos: list, textos: list) -> list:
+    """Lo que reporta el validador por fila tras la conversión de Pydantic."""
+    campos = CoberturaTierra.model_fields
+    adaptadores = [TypeAdapter(campos[c].annotation) for c in ("NOMENCLAT", CAMPO)]
+    mensajes = []
+    for valores in zip(codigos, textos):
+        try:
+            codigo, texto = (
+                a.validate_python(v) for a, v in zip(adaptadores, valores)
+            )
+        except ValidationError:
+            mensajes.append(None)
+            continue
+        instancia = CoberturaTierra.model_construct(
+            **{"NOMENCLAT": codigo, CAMPO: texto}
+        )
+        try:
+            instancia.validate_legend_nomenclature()
+            mensajes.append(None)
+        except ValueError as e:
+            mensajes.append(str(e))
+    return mensajes
+
+
+@pytest.mark.parametrize("tipo_texto", [pl.Utf8, pl.Categorical])
+@pytest.mark.parametrize("tipo_codigo", sorted(CODIGOS))
+def test_legend_errors_match_row_validator(tipo_codigo, tipo_texto):
+    codigos = CODIGOS[tipo_codigo]
+    textos = pl.Series(TEXTOS, dtype=tipo_texto)
+    df = pl.DataFrame({"NOMENCLAT": codigos, CAMPO: textos})
+
+    esperado = _row_messages(codigos.to_list(), TEXTOS)
+    assert any(esperado)
+    assert CoberturaTierra.legend_nomenclature_errors(df).to_list() == esperado
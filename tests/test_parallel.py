@@ -0,0 +1,81 @@
+"""Equivalencia de la validación en paralelo (``core.parallel``) con la secuencial."""
+import polars as pl
+import pytest
+
+from benchmarks.synthetic import generate_layer, model_catalog
+from geoanla.core import parallel
+from geoanla.core.parallel import get_pool, shutdown_pool, validate_parallel
+
+# Trozos de 7 filas repartidos en 2 procesos: la unión cruza varios trozos
+OPCIONES = {"offset": 2, "tamano_lote": 7, "num_procesos": 2}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pool():
+    yield
+    shutdown_pool()
+
+
+def _capa(nombre: str) -> pl.DataFrame:
+    modelo = model_catalog()[nombre]
+    return generate_layer(modelo, 40, fraccion_invalida=0.3, semilla=1)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("nombre", ["CoberturaTierra", "AreaProyecto"])
+def test_parallel_session_matches_sequential(nombre, columnar):
+    modelo, capa = model_catalog()[nombre], _capa(nombre)
+    esperado = modelo.session(capa, verbose=False, offset=2, columnar=columnar).run()
+
+    sesion = modelo.session(
+        capa, verbose=False, paralelo=True, columnar=columnar, **OPCIONES
+    )
+    validos, errores = sesion.run()
+    assert sesion.metricas.motor == "paralelo"
+    assert (validos, errores) == esperado
+    # Unión en el orden de las filas, no en el de llegada de los trozos
+    filas = [e["Fila"] for e in errores]
+    assert filas == sorted(filas) and errores
+
+
+@pytest.mark.parametrize("formato_validos", ["indices", "polars"])
+def test_parallel_tables_keep_row_order(formato_validos):
+    modelo, capa = model_catalog()["CoberturaTierra"], _capa("CoberturaTierra")
+    opciones = {"formato_errores": "tabla", "formato_validos": formato_validos}
+    validos, errores = modelo.session(
+        capa, verbose=False, offset=2, columnar=True, **opciones
+    ).run()
+    validos_p, errores_p = modelo.session(
+        capa, verbose=False, paralelo=True, columnar=True, **opciones, **OPCIONES
+    ).run()
+
+    if formato_validos == "polars":
+        assert validos_p.equals(validos)
+    else:
+        assert list(validos_p) == list(validos)
+    # Los ids de plantilla dependen del orden de internado: se comparan los textos
+    esperados = errores.to_polars(con_mensajes=True).drop("message_id")
+    assert errores_p.to_polars(con_mensajes=True).drop("message_id").equals(esperados)
+
+
+def test_pool_is_reused_between_layers():
+    modelo = model_catalog()["CoberturaTierra"]
+    validate_parallel(modelo, _capa("CoberturaTierra"), **OPCIONES)
+    primero = parallel._POOL
+    assert primero is not None and get_pool(2) is primero
+
+    validate_parallel(modelo, _capa("CoberturaTierra").head(30), **OPCIONES)
+    assert parallel._POOL is primero
+
+    # Otro número de procesos reemplaza el pool
+    assert get_pool(1) is not primero
+    assert parallel._POOL_PROCESOS == 1
+
+
+def test_small_layer_skips_the_pool():
+    shutdown_pool()
+    modelo = model_catalog()["CoberturaTierra"]
+    capa = _capa("CoberturaTierra").head(5)
+    resultado = validate_parallel(modelo, capa, **OPCIONES)
+    assert parallel._POOL is None
+    assert resultado == modelo.session(capa, verbose=False, offset=2).run()
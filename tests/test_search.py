@@ -0,0 +1,13 @@
+"""Búsqueda en el catálogo CLC (``utils.search``)."""
+import pytest
+
+from geoanla.catalog.registry import clc_catalog
+from geoanla.utils.search import search_corine_land_cover
+
+
+@pytest.mark.parametrize("q", ["", "   ", "\t\n"])
+def test_blank_query_returns_whole_catalog(q):
+    resultados = search_corine_land_cover(q=q)
+    catalogo = clc_catalog()
+    assert [r["NOMENCLAT"] for r in resultados] == list(catalogo)
+    assert all(r["leyenda"] == catalogo[r["NOMENCLAT"]] for r in resultados)
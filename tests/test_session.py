@@ -0,0 +1,134 @@
+"""Ciclo de vida y concurrencia de las sesiones (``core.session``)."""
+import asyncio
+import sys
+import threading
+
+import pytest
+
+from benchmarks.synthetic import find_model, generate_layer
+from geoanla.core.session import RunConfig, ValidationRun
+
+MODELO = find_model("CoberturaTierra")
+CAPA = generate_layer(MODELO, 60, fraccion_invalida=0.3, semilla=3)
+
+
+def _expected(**opciones):
+    return MODELO.session(CAPA, verbose=False, **opciones).run()
+
+
+def test_close_releases_the_frame_and_results():
+    sesion = ValidationRun(MODELO, CAPA, verbose=False)
+    validos, errores = sesion.run()
+    assert sesion.validos is validos and sesion.errores is errores
+
+    sesion.close()
+    assert sesion.closed
+    assert sesion.df is None and sesion.validos is None and sesion.errores is None
+    # Las métricas siguen disponibles después de cerrar
+    assert sesion.metricas.registros == CAPA.height
+    with pytest.raises(ValueError, match="ya fue cerrada"):
+        sesion.run()
+    with pytest.raises(ValueError, match="ya fue cerrada"):
+        sesion.extract()
+    sesion.close()
+
+
+def test_context_manager_closes_on_exit():
+    with ValidationRun(MODELO, CAPA, verbose=False, columnar=True) as sesion:
+        assert not sesion.closed
+        resultado = sesion.run()
+    assert sesion.closed and sesion.df is None
+    assert resultado == _expected(columnar=True)
+
+    # También se cierra si el bloque termina con una excepción
+    with pytest.raises(RuntimeError):
+        with ValidationRun(MODELO, CAPA, verbose=False) as sesion:
+            raise RuntimeError
+    assert sesion.closed
+
+
+def test_async_context_manager_and_run_async():
+    async def validar():
+        async with ValidationRun(MODELO, CAPA, verbose=False) as sesion:
+            resultado = await sesion.run_async()
+        return sesion, resultado
+
+    sesion, resultado = asyncio.run(validar())
+    assert sesion.closed
+    assert resultado == _expected()
+    assert sesion.metricas.motor == "pydantic"
+
+
+def test_concurrent_run_async_sessions_keep_their_own_results():
+    configuraciones = [
+        {"offset": 0},
+        {"offset": 2, "columnar": True},
+        {"offset": 5, "formato_validos": "indices"},
+    ]
+
+    async def validar():
+        sesiones = [
+            MODELO.session(CAPA, verbose=False, **opciones)
+            for opciones in configuraciones
+        ]
+        resultados = await asyncio.gather(*(s.run_async() for s in sesiones))
+        return sesiones, resultados
+
+    sesiones, resultados = asyncio.run(validar())
+    for opciones, sesion, (validos, errores) in zip(
+        configuraciones, sesiones, resultados
+    ):
+        esperados = _expected(**opciones)
+        assert list(validos) == list(esperados[0])
+        assert errores == esperados[1]
+        assert sesion.metricas.rechazados == len(errores)
+
+
+def test_two_threads_share_one_model():
+    configuraciones = [{"offset": 1}, {"offset": 7, "columnar": True}]
+    resultados = [None] * len(configuraciones)
+    barrera = threading.Barrier(len(configuraciones))
+
+    def validar(i):
+        sesion = MODELO.session(CAPA, verbose=False, **configuraciones[i])
+        barrera.wait()
+        resultados[i] = (sesion.run(), sesion.metricas.motor)
+
+    hilos = [
+        threading.Thread(target=validar, args=(i,))
+        for i in range(len(configuraciones))
+    ]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert resultados[0] == (_expected(offset=1), "pydantic")
+    assert resultados[1] == (_expected(offset=7, columnar=True), "columnar")
+    filas = [{e["Fila"] for e in r[0][1]} for r in resultados]
+    assert {f + 6 for f in filas[0]} == filas[1]
+
+
+@pytest.mark.parametrize("formato_errores, impreso", [
+    ("dicts", "{'Fila': "),
+    ("tabla", "│ field "),
+])
+def test_report_prints_when_ipython_is_missing(
+    monkeypatch, capsys, formato_errores, impreso
+):
+    # Sin IPython el resumen se imprime en lugar de mostrarse
+    monkeypatch.setitem(sys.modules, "IPython.display", None)
+    sesion = MODELO.session(CAPA, formato_errores=formato_errores)
+    sesion.run()
+    salida = capsys.readouterr().out
+    assert f"❌ Rechazados: {sesion.metricas.rechazados}" in salida
+    assert impreso in salida
+
+
+def test_invalid_config_is_rejected():
+    with pytest.raises(ValueError, match="formato_errores"):
+        RunConfig(formato_errores="csv")
+    with pytest.raises(ValueError, match="no se combina"):
+        RunConfig(almacen="resultados.sqlite", max_errores=3)
+    with pytest.raises(ValueError, match="No hay datos"):
+        ValidationRun(MODELO, None)
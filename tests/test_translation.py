@@ -0,0 +1,248 @@
+"""
+Traducción de dominios con expresiones de Polars frente al camino anterior
+(un diccionario valor -> código armado con ``get_enum_code``).
+"""
+import math
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+from shapely.geometry import LineString, Point
+
+from benchmarks.synthetic import find_model, model_catalog
+from geoanla.catalog.registry import get_enum_index
+
+# Un campo por cada Enum del catálogo (códigos Int64, Float64 y de texto)
+CAMPOS = {}
+for _modelo in model_catalog().values():
+    for _campo, _clase in _modelo.get_domains().items():
+        if isinstance(_clase, type):
+            CAMPOS.setdefault(_clase.__name__, (_modelo, _campo))
+
+SIN_CODIGO = ["", "0", "0.0", "nan", "None", " NONE ", "zzz", "1e0", "-0", None]
+
+
+def _missing(valor) -> bool:
+    return valor is None or valor is pd.NA or (
+        isinstance(valor, float) and math.isnan(valor)
+    )
+
+
+def _same(obtenidos: list, esperados: list):
+    assert len(obtenidos) == len(esperados)
+    for obtenido, esperado in zip(obtenidos, esperados):
+        if _missing(esperado):
+            assert _missing(obtenido), (obtenido, esperado)
+        else:
+            assert obtenido == esperado, (obtenido, esperado)
+
+
+def _old_codes(modelo, campo: str, valores: list) -> list:
+    """Camino anterior: diccionario de los valores únicos -> ``get_enum_code``."""
+    mapping = {
+        v: modelo.get_enum_code(v, campo) for v in valores if not _missing(v)
+    }
+    return [None if _missing(v) else mapping[v] for v in valores]
+
+
+def _old_texts(modelo, campo: str, valores: list, categorias: bool) -> list:
+    """Camino anterior de ``translate_code_to_text`` con ``domain``."""
+    mapping = modelo.domain(campo)
+    salida = []
+    for v in valores:
+        if _missing(v):
+            salida.append(None)
+        elif v in mapping:
+            salida.append(str(mapping[v]))
+        else:
+            # Sin categorías el código desconocido se conserva como texto
+            salida.append(None if categorias else str(v))
+    return salida
+
+
+def _texts(campo: str) -> list:
+    """Códigos, descripciones y nombres escritos de varias formas."""
+    modelo, columna = CAMPOS[campo]
+    indice = get_enum_index(modelo.get_domains()[columna])
+    valores = []
+    for codigo, miembro in indice.por_valor.items():
+        descripcion = indice.descripciones[codigo]
+        valores += [
+            str(codigo), f" {codigo} ", descripcion, descripcion.upper(),
+            f"  {descripcion.lower()}", miembro.name.lower(),
+        ]
+        if not isinstance(codigo, str) and float(codigo).is_integer():
+            valores += [f"{float(codigo)}", str(int(codigo))]
+    return valores + SIN_CODIGO
+
+
+@pytest.mark.parametrize("campo", sorted(CAMPOS))
+def test_translation_expr_matches_get_enum_code_on_text(campo):
+    modelo, columna = CAMPOS[campo]
+    valores = _texts(campo)
+    df = pl.DataFrame({columna: pl.Series(valores, dtype=pl.Utf8)})
+    traducido = modelo.translate_data(df)
+    indice = get_enum_index(modelo.get_domains()[columna])
+    assert traducido.schema[columna] == indice.dtype
+    _same(traducido[columna].to_list(), _old_codes(modelo, columna, valores))
+
+
+@pytest.mark.parametrize("campo", sorted(
+    c for c, (m, col) in CAMPOS.items()
+    if get_enum_index(m.get_domains()[col]).dtype != pl.Utf8
+))
+@pytest.mark.parametrize("tipo", [pl.Int64, pl.Float64])
+def test_translation_expr_matches_get_enum_code_on_numbers(campo, tipo):
+    modelo, columna = CAMPOS[campo]
+    indice = get_enum_index(modelo.get_domains()[columna])
+    valores = [c for c in indice.codes if float(c).is_integer()]
+    valores += [0, 99999, None]
+    if tipo == pl.Float64:
+        valores += [c + 0.5 for c in valores[:2]] + [float("nan"), float("inf")]
+    serie = pl.Series(valores, dtype=tipo, strict=False)
+    # Con LazyFrame la traducción queda en el plan y da lo mismo
+    traducido = modelo.translate_data(pl.LazyFrame({columna: serie})).collect()
+    _same(traducido[columna].to_list(), _old_codes(modelo, columna, serie.to_list()))
+
+
+def _transects() -> gpd.GeoDataFrame:
+    """Capa con códigos Int64 con nulos, textos con NaN/None y geometría."""
+    modelo = find_model("TransectoMuestreoFauna")
+    dominios = modelo.get_domains()
+    transecto = get_enum_index(dominios["T_TRANSEC"])
+    estacional = get_enum_index(dominios["ESTACIONAL"])
+    seco = estacional.descripciones[estacional.codes[0]]
+    return gpd.GeoDataFrame(
+        {
+            "T_TRANSEC": pd.array(
+                [transecto.codes[0], None, transecto.codes[1], 0, 999, None],
+                dtype="Int64",
+            ),
+            "ESTACIONAL": [
+                seco.upper(), np.nan, None, str(estacional.codes[1]), "zzz", "0"
+            ],
+            "OBSERVAC": ["a", None, "b", np.nan, "c", "d"],
+            "LONGITUD": [1.5, np.nan, 2.0, None, 3.0, 4.0],
+        },
+        geometry=[LineString([(0, 0), (1, i)]) for i in range(6)],
+        crs="EPSG:3116",
+        index=[10, 11, 12, 13, 14, 15],
+    )
+
+
+def test_pandas_round_trip_matches_the_dict_path():
+    modelo = find_model("TransectoMuestreoFauna")
+    capa = _transects()
+    traducido = modelo.translate_data(capa)
+
+    assert isinstance(traducido, gpd.GeoDataFrame)
+    assert traducido.crs == capa.crs
+    assert traducido.index.tolist() == capa.index.tolist()
+    assert traducido.geometry.geom_equals(capa.geometry).all()
+    # Códigos enteros con nulos en Int64 de Pandas; decimales en float64
+    assert str(traducido["T_TRANSEC"].dtype) == "Int64"
+    assert traducido["ESTACIONAL"].dtype == np.float64
+    for campo in ("T_TRANSEC", "ESTACIONAL"):
+        _same(
+            traducido[campo].tolist(),
+            _old_codes(modelo, campo, capa[campo].tolist()),
+        )
+    # Las columnas que no son de dominio no cambian
+    _same(traducido["OBSERVAC"].tolist(), capa["OBSERVAC"].tolist())
+    _same(traducido["LONGITUD"].tolist(), capa["LONGITUD"].tolist())
+
+    # ``como_polars`` entrega el mismo resultado con la geometría en WKB
+    polars = modelo.translate_data(capa, como_polars=True)
+    assert polars.schema["T_TRANSEC"] == pl.Int64
+    assert polars.schema["geometry"] == pl.Binary
+    for campo in ("T_TRANSEC", "ESTACIONAL"):
+        _same(polars[campo].to_list(), traducido[campo].tolist())
+
+
+def test_pandas_text_domain_and_points():
+    modelo = find_model("PuntoMuestreoFauna")
+    municipio = get_enum_index(modelo.get_domains()["MUNICIPIO"])
+    codigo = municipio.codes[0]
+    valores = [codigo, municipio.descripciones[codigo].upper(), None, "zzz"]
+    capa = gpd.GeoDataFrame(
+        {"MUNICIPIO": valores},
+        geometry=[Point(i, i) for i in range(4)], crs="EPSG:4326",
+    )
+    traducido = modelo.translate_data(capa)
+    _same(
+        traducido["MUNICIPIO"].tolist(), _old_codes(modelo, "MUNICIPIO", valores)
+    )
+    assert traducido.geometry.geom_equals(capa.geometry).all()
+
+    # Un DataFrame de Pandas sin geometría vuelve como DataFrame de Pandas
+    plano = modelo.translate_data(pd.DataFrame({"MUNICIPIO": valores}))
+    assert type(plano) is pd.DataFrame
+    _same(plano["MUNICIPIO"].tolist(), traducido["MUNICIPIO"].tolist())
+
+
+def _codes(campo: str) -> pl.Series:
+    """Códigos del dominio más un código nulo, cero y uno desconocido."""
+    modelo, columna = CAMPOS[campo]
+    indice = get_enum_index(modelo.get_domains()[columna])
+    if indice.dtype == pl.Utf8:
+        return pl.Series(indice.codes + [None, "0", "zzz"], dtype=pl.Utf8)
+    return pl.Series(indice.codes + [None, 0, 99999], dtype=indice.dtype)
+
+
+@pytest.mark.parametrize("campo", sorted(CAMPOS))
+@pytest.mark.parametrize("categorias", [False, True])
+def test_code_to_text_matches_domain_mapping(campo, categorias):
+    modelo, columna = CAMPOS[campo]
+    codigos = _codes(campo)
+    df = pl.DataFrame({columna: codigos})
+    traducido = modelo.translate_code_to_text(df, categorias=categorias)
+
+    esperados = _old_texts(modelo, columna, codigos.to_list(), categorias)
+    if categorias:
+        textos = list(dict.fromkeys(modelo.domain(columna).values()))
+        assert traducido.schema[columna] == pl.Enum(textos)
+        obtenidos = traducido[columna].cast(pl.Utf8).to_list()
+    else:
+        assert traducido.schema[columna] == pl.Utf8
+        obtenidos = traducido[columna].to_list()
+    # Un código decimal desconocido queda como "99999.0", igual que antes
+    assert obtenidos == esperados
+
+
+@pytest.mark.parametrize("campo", ["T_TRANSEC", "ESTACIONAL"])
+def test_category_codes_compare_as_numbers(campo):
+    # 301 y 301.0 son el mismo código, venga la columna entera o decimal
+    modelo = find_model("TransectoMuestreoFauna")
+    indice = get_enum_index(modelo.get_domains()[campo])
+    enteros = pl.Series([int(c) for c in indice.codes], dtype=pl.Int64)
+    resultados = [
+        modelo.translate_code_to_text(
+            pl.DataFrame({campo: enteros.cast(tipo)}), categorias=True
+        )[campo].cast(pl.Utf8).to_list()
+        for tipo in (pl.Int64, pl.Float64, pl.Utf8)
+    ]
+    assert resultados[0] == resultados[1] == resultados[2]
+    assert resultados[0] == [indice.descripciones[c] for c in indice.codes]
+
+
+def test_pandas_categories_match_the_domain():
+    modelo = find_model("TransectoMuestreoFauna")
+    traducido = modelo.translate_data(_transects())
+    categorias = modelo.translate_code_to_text(traducido, categorias=True)
+    textos = modelo.translate_code_to_text(traducido)
+
+    assert isinstance(categorias, gpd.GeoDataFrame)
+    for campo in ("T_TRANSEC", "ESTACIONAL"):
+        serie = categorias[campo]
+        assert isinstance(serie.dtype, pd.CategoricalDtype)
+        dominio = list(dict.fromkeys(modelo.domain(campo).values()))
+        assert serie.cat.categories.tolist() == dominio
+        _same(
+            serie.astype(object).tolist(),
+            _old_texts(modelo, campo, traducido[campo].tolist(), True),
+        )
+        # Con los códigos del dominio ambos modos dan el mismo texto
+        _same(serie.astype(object).tolist(), textos[campo].tolist())
+    assert categorias.geometry.geom_equals(traducido.geometry).all()
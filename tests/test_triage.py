@@ -0,0 +1,177 @@
+"""Parada temprana por presupuesto de errores y muestreo de ``core.triage``."""
+from typing import Optional
+
+import numpy as np
+import polars as pl
+import pytest
+from pydantic import Field
+
+from geoanla.core.base import BaseEV
+from geoanla.core.triage import (
+    ErrorBudget, estimate_error_rate, sample_positions, sample_size,
+    validate_with_budget,
+)
+
+
+class Parcela(BaseEV):
+    CODIGO: str = Field(..., max_length=3)
+    AREA: float = Field(..., ge=0)
+    GRUPO: Optional[str] = None
+
+
+# Fila 1: CODIGO; filas 2 y 3: AREA; fila 5: CODIGO y AREA; fila 7: CODIGO
+CAPA = pl.DataFrame({
+    "CODIGO": ["A1", "LARGO", "B2", "C3", "D4", "LARGO", "E5", "LARGO", "F6"],
+    "AREA": [1.0, 2.0, -1.0, -2.0, 3.0, -3.0, 4.0, 5.0, 6.0],
+})
+OFFSET = 2
+
+
+def _rows(errores):
+    return [e["Fila"] - OFFSET for e in errores]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("opciones, revisados, rechazadas", [
+    # Tercera fila rechazada
+    ({"max_errores": 3}, 4, [1, 2, 3]),
+    # AREA llega a 2 filas en la fila 3: se detiene toda la validación,
+    # aunque CODIGO solo tenga una
+    ({"max_errores_campo": 2}, 4, [1, 2, 3]),
+    # CODIGO llega a 3 filas en la fila 7; AREA a 3 en la fila 5
+    ({"max_errores_campo": 3}, 6, [1, 2, 3, 5]),
+    ({"detener_primer_error": True}, 2, [1]),
+])
+def test_budget_stops_at_the_row_that_exhausts_it(
+    columnar, opciones, revisados, rechazadas
+):
+    sesion = Parcela.session(
+        CAPA, verbose=False, offset=OFFSET, columnar=columnar, **opciones
+    )
+    validos, errores = sesion.run()
+
+    assert _rows(errores) == rechazadas
+    assert len(validos) == revisados - len(rechazadas)
+    assert sesion.metricas.revisados == revisados
+    assert sesion.metricas.registros == CAPA.height
+    assert sesion.metricas.detenida
+
+    # Igual que validar completas las filas revisadas
+    completa = Parcela.session(
+        CAPA.head(revisados), verbose=False, offset=OFFSET, columnar=columnar
+    )
+    assert (validos, errores) == completa.run()
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_budget_that_is_never_exhausted_reviews_every_row(columnar):
+    sesion = Parcela.session(
+        CAPA, verbose=False, offset=OFFSET, columnar=columnar, max_errores=10
+    )
+    resultado = sesion.run()
+    assert sesion.metricas.revisados == CAPA.height
+    assert not sesion.metricas.detenida
+    completa = Parcela.session(CAPA, verbose=False, offset=OFFSET, columnar=columnar)
+    assert resultado == completa.run()
+
+
+def test_budget_exhausted_on_the_last_row_is_not_a_stop():
+    sesion = Parcela.session(CAPA.head(8), verbose=False, max_errores=5)
+    sesion.run()
+    assert sesion.metricas.revisados == 8
+    assert not sesion.metricas.detenida
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_cut_inside_a_later_chunk(columnar):
+    # Trozos de 2, 4 y 8 filas: el corte cae dentro del segundo
+    presupuesto = ErrorBudget(max_errores=3)
+    validos, errores, revisados = validate_with_budget(
+        Parcela, CAPA, presupuesto, OFFSET, columnar, tamano_inicial=2
+    )
+    assert revisados == 4
+    assert _rows(errores) == [1, 2, 3]
+    assert [v["CODIGO"] for v in validos] == ["A1"]
+    assert presupuesto.rechazadas == 3
+
+
+@pytest.mark.parametrize("muestra, poblacion, filas", [
+    (1, 100, 1),
+    (30, 100, 30),
+    (500, 100, 100),
+    (0.25, 100, 25),
+    (0.001, 100, 1),
+    (1.0, 100, 100),
+    (1.0, 0, 0),
+    (5.0, 100, 5),
+])
+def test_sample_size(muestra, poblacion, filas):
+    assert sample_size(muestra, poblacion) == filas
+
+
+def test_whole_layer_sample_has_no_uncertainty():
+    capa = CAPA.with_columns(GRUPO=pl.Series(["a", "b", "a"] * 3))
+    sesion = Parcela.session(capa, verbose=False, muestra=1.0, semilla=0)
+    _, errores = sesion.run()
+    estimacion = sesion.metricas.estimacion
+    assert sesion.metricas.revisados == estimacion.muestra == CAPA.height
+    assert estimacion.rechazados == len(errores) == 5
+    assert estimacion.inferior == estimacion.tasa == estimacion.superior == 5 / 9
+
+
+def test_wilson_bounds_of_a_simple_sample():
+    # 20 de 100 filas, 3 rechazadas: n efectivo = (n - 1) / (1 - n / N) = 23.75
+    asignacion = {None: (100, np.arange(0, 100, 5))}
+    estimacion = estimate_error_rate(asignacion, np.array([0, 5, 10, 11]))
+    assert (estimacion.muestra, estimacion.rechazados) == (20, 3)
+    assert estimacion.tasa == pytest.approx(0.15)
+    assert estimacion.inferior == pytest.approx(0.0568634, abs=1e-6)
+    assert estimacion.superior == pytest.approx(0.3405950, abs=1e-6)
+    assert estimacion.estratos is None
+
+
+def test_wilson_bounds_of_a_stratified_sample():
+    # Estrato A: 1 de 10 (60 filas); B: 5 de 10 (40 filas). Tasa ponderada
+    # 0.6 * 0.1 + 0.4 * 0.5 = 0.26 y n efectivo 0.26 * 0.74 / 0.0063 = 30.4
+    asignacion = {
+        "A": (60, np.arange(0, 60, 6)),
+        "B": (40, np.arange(60, 100, 4)),
+    }
+    estimacion = estimate_error_rate(
+        asignacion, np.array([0, 60, 64, 68, 72, 76])
+    )
+    assert estimacion.tasa == pytest.approx(0.26)
+    assert estimacion.inferior == pytest.approx(0.1375294, abs=1e-6)
+    assert estimacion.superior == pytest.approx(0.4363536, abs=1e-6)
+    assert estimacion.estratos["A"] == {
+        "poblacion": 60, "muestra": 10, "rechazados": 1, "tasa": 0.1
+    }
+    assert estimacion.estratos["B"]["tasa"] == 0.5
+
+
+def test_seeded_stratified_session_is_reproducible():
+    capa = pl.DataFrame({
+        "CODIGO": ["A1"] * 300,
+        "AREA": [-1.0 if i % 4 == 0 else 1.0 for i in range(300)],
+        "GRUPO": ["norte"] * 200 + ["sur"] * 90 + [None] * 10,
+    })
+
+    def correr():
+        sesion = Parcela.session(
+            capa, verbose=False, muestra=0.1, estratos="GRUPO", semilla=7,
+            formato_validos="indices",
+        )
+        validos, errores = sesion.run()
+        return list(validos), errores, sesion.metricas.estimacion
+
+    validos, errores, estimacion = correr()
+    assert correr() == (validos, errores, estimacion)
+
+    assert {e: d["muestra"] for e, d in estimacion.estratos.items()} == {
+        "norte": 20, "sur": 9, "∅": 1
+    }
+    posiciones, _ = sample_positions(capa, 0.1, "GRUPO", 7)
+    assert sorted(validos + [e["Fila"] for e in errores]) == posiciones.tolist()
+    esperadas = sum(1 for p in posiciones if p % 4 == 0)
+    assert estimacion.rechazados == len(errores) == esperadas
+    assert estimacion.inferior <= estimacion.tasa <= estimacion.superior
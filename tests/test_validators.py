@@ -0,0 +1,71 @@
+"""Validación de capas leídas de una GeoPackage (``utils.validators``)."""
+import sqlite3
+from contextlib import closing
+
+import polars as pl
+import pytest
+
+from benchmarks.synthetic import find_model, generate_layer, write_dataset
+from geoanla.utils.validators import (
+    read_layer, validate_gdb_layer, validate_gdb_layer_batches,
+)
+
+NOMBRE = "CoberturaTierra"
+
+
+@pytest.fixture(scope="module")
+def ruta(tmp_path_factory):
+    capa = generate_layer(find_model(NOMBRE), 45, fraccion_invalida=0.3, semilla=2)
+    # Sin EXPEDIENTE el identificador es el de respaldo ("Registro N")
+    capa = capa.with_columns(
+        pl.when(pl.int_range(pl.len()) % 3 == 0).then(None)
+        .otherwise(pl.col("EXPEDIENTE")).alias("EXPEDIENTE")
+    )
+    carpeta = tmp_path_factory.mktemp("capas")
+    return write_dataset({NOMBRE: capa}, str(carpeta / "capas"), "gpkg")
+
+
+def _batches(ruta, **opciones):
+    lotes = list(validate_gdb_layer_batches(
+        find_model(NOMBRE), ruta, tamano_lote=10, **opciones
+    ))
+    assert [inicio for _, _, inicio in lotes] == [0, 10, 20, 30, 40]
+    return lotes
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_batches_match_the_whole_layer(ruta, columnar):
+    errores, validos, _ = validate_gdb_layer(find_model(NOMBRE), ruta, geopandas=False)
+    assert any(e["ID"].startswith("Registro ") for e in errores)
+
+    lotes = _batches(ruta, columnar=columnar)
+    assert [v for validos_lote, _, _ in lotes for v in validos_lote] == validos
+    assert [e for _, errores_lote, _ in lotes for e in errores_lote] == errores
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_batches_with_error_table_and_indices(ruta, columnar):
+    modelo = find_model(NOMBRE)
+    capa, _ = read_layer(ruta, NOMBRE)
+    opciones = {
+        "columnar": columnar, "formato_errores": "tabla", "formato_validos": "indices"
+    }
+    validos, errores = modelo.session(capa, verbose=False, **opciones).run()
+
+    lotes = _batches(ruta, **opciones)
+    assert [i for validos_lote, _, _ in lotes for i in validos_lote] == list(validos)
+    por_lotes = pl.concat([
+        e.to_polars(con_mensajes=True).drop("message_id") for _, e, _ in lotes
+    ])
+    assert por_lotes.equals(errores.to_polars(con_mensajes=True).drop("message_id"))
+
+
+def test_batches_use_the_incremental_store(ruta, tmp_path):
+    almacen = str(tmp_path / "resultados.sqlite")
+    primera = _batches(ruta, almacen=almacen)
+    with closing(sqlite3.connect(almacen)) as conexion:
+        guardadas = conexion.execute("SELECT COUNT(*) FROM resultados").fetchone()
+    assert guardadas == (45,)
+    # La segunda entrega reutiliza cada fila y da el mismo resultado
+    assert _batches(ruta, almacen=almacen) == primera
+    assert primera == _batches(ruta)